@@ -126,7 +126,15 @@ from .exceptions import (
 )
 
 # Import the main write functions
-from .plugin import generate_interactive_svg, write, write_advanced
+from .plugin import (
+    BatchManifest,
+    ShardLayout,
+    generate_interactive_svg,
+    write,
+    write_advanced,
+    write_archive,
+    write_pack,
+)
 from .shapes.factory import (
     create_shape_renderer,
     get_shape_factory,
@@ -170,6 +178,10 @@ __all__ = [
     "write",
     "write_advanced",
     "generate_interactive_svg",
+    "BatchManifest",
+    "ShardLayout",
+    "write_archive",
+    "write_pack",
     # Constants module
     "constants",
     # Core classes
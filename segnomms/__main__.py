@@ -0,0 +1,7 @@
+"""Allow running the command-line tool with ``python -m segnomms``."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
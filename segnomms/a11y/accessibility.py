@@ -94,6 +94,11 @@ class AccessibilityConfig(BaseModel):
     include_pattern_labels: bool = Field(
         default=True, description="Add labels to QR patterns (finder, timing, etc.)"
     )
+    compact_mode: bool = Field(
+        default=False,
+        description="Apply ARIA semantics to the root and pattern groups only, "
+        "skipping per-module IDs, attributes and registry entries",
+    )
 
     # Screen reader optimization
     optimize_for_screen_readers: bool = Field(
@@ -302,11 +307,18 @@ class AccessibilityEnhancer:
 
     def enhance_module_element(
         self, element: Any, row: int, col: int, module_type: str = "data"
-    ) -> ElementAccessibility:
-        """Enhance a QR module element with accessibility features."""
+    ) -> Optional[ElementAccessibility]:
+        """Enhance a QR module element with accessibility features.
+
+        Returns ``None`` in compact mode, where modules are left untouched.
+        """
         if not self.config.enabled:
             return ElementAccessibility(element_id=f"module-{row}-{col}")
 
+        if self.config.compact_mode:
+            # Semantics live on the enclosing pattern group; nothing is allocated per module
+            return None
+
         # Generate ID
         element_id = self.id_generator.generate_module_id(row, col, module_type)
 
@@ -344,6 +356,9 @@ class AccessibilityEnhancer:
         if not self.config.enabled:
             return ElementAccessibility(element_id=f"{pattern_type}-{index}")
 
+        if self.config.compact_mode:
+            return self._enhance_compact_pattern_group(group_element, pattern_type, index)
+
         # Generate ID
         element_id = self.id_generator.generate_pattern_id(pattern_type, index)
 
@@ -374,6 +389,40 @@ class AccessibilityEnhancer:
 
         return accessibility
 
+    def _enhance_compact_pattern_group(
+        self, group_element: Any, pattern_type: str, module_count: int
+    ) -> ElementAccessibility:
+        """Enhance a pattern group in compact mode.
+
+        Uses a deterministic ``{prefix}-{pattern_type}`` ID that bypasses the
+        ID generator and summarizes the group's modules in its label, so that
+        individual modules need no annotations of their own.
+        """
+        element_id = f"{self.config.id_prefix}-{pattern_type}"
+
+        accessibility = ElementAccessibility(
+            element_id=element_id,
+            aria_role=ARIARole.GROUP.value if self.config.enable_aria else None,
+        )
+
+        if self.config.include_pattern_labels:
+            labels = {
+                "finder": "Finder patterns",
+                "timing": "Timing patterns",
+                "alignment": "Alignment patterns",
+                "format": "Format information",
+                "version": "Version information",
+                "data": "Data modules",
+                "quiet": "Quiet zone",
+            }
+            label = labels.get(pattern_type, f"{pattern_type.title()} pattern")
+            accessibility.aria_label = f"{label} ({module_count} modules)"
+
+        self._apply_accessibility_attributes(group_element, accessibility)
+        self.element_registry[element_id] = accessibility
+
+        return accessibility
+
     def create_description_element(self, parent_element: Any, description: str, ref_id: str) -> str:
         """Create a description element and return its ID."""
         import xml.etree.ElementTree as ET
@@ -402,6 +451,7 @@ class AccessibilityEnhancer:
                 "screen_reader_optimization": self.config.optimize_for_screen_readers,
                 "pattern_labels": self.config.include_pattern_labels,
                 "module_labels": self.config.include_module_labels,
+                "compact_mode": self.config.compact_mode,
             },
             "id_statistics": {
                 "prefix": self.config.id_prefix,
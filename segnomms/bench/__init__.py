@@ -0,0 +1,59 @@
+"""Reproducible benchmark suite for SegnoMMS.
+
+Runs a matrix of QR versions 1-40 and Micro QR, every registered shape,
+and merge, cluster, frame, centerpiece, accessibility and interactivity
+variants, timing each case end to end and per rendering phase. Runs are
+stored as JSON baselines keyed by a machine fingerprint and later runs
+are compared with a one-sided Mann-Whitney test to gate regressions.
+
+Key Components:
+
+    :func:`build_cases`: Build the benchmark case matrix
+    :func:`run_suite`: Run cases and collect a :class:`BenchmarkRun`
+    :func:`compare_runs`: Compare a run with a baseline
+
+Example:
+    Record a baseline, then check later changes against it::
+
+        python -m segnomms.bench --update-baseline
+        python -m segnomms.bench            # exits 1 on regressions
+
+    Or from Python::
+
+        from segnomms.bench import build_cases, compare_runs, load_baseline, run_suite
+
+        run = run_suite(build_cases("quick", pattern="v40/*"))
+        baseline = load_baseline(".benchmarks")
+        if baseline:
+            regressions = [c for c in compare_runs(baseline, run) if c.regression]
+"""
+
+from .baseline import (
+    CaseComparison,
+    compare_runs,
+    load_baseline,
+    machine_fingerprint,
+    machine_info,
+    mann_whitney_greater,
+    save_baseline,
+)
+from .cases import VARIANTS, BenchmarkCase, build_cases
+from .runner import BenchmarkRun, CaseResult, measure_case, run_case, run_suite
+
+__all__ = [
+    "BenchmarkCase",
+    "BenchmarkRun",
+    "CaseResult",
+    "CaseComparison",
+    "VARIANTS",
+    "build_cases",
+    "measure_case",
+    "run_case",
+    "run_suite",
+    "compare_runs",
+    "load_baseline",
+    "save_baseline",
+    "machine_info",
+    "machine_fingerprint",
+    "mann_whitney_greater",
+]
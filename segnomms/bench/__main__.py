@@ -0,0 +1,88 @@
+"""Run the benchmark suite: ``python -m segnomms.bench``.
+
+Exits with status 1 when a significant regression against the stored
+baseline for this machine is detected.
+"""
+
+import argparse
+import logging
+import sys
+from typing import Optional, Sequence
+
+from .baseline import compare_runs, load_baseline, save_baseline
+from .cases import VARIANTS, build_cases
+from .runner import CaseResult, run_suite
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the benchmark command-line parser."""
+    parser = argparse.ArgumentParser(prog="python -m segnomms.bench", description="Run SegnoMMS benchmarks.")
+    parser.add_argument("--profile", choices=("quick", "full"), default="quick", help="Case matrix size")
+    parser.add_argument("-k", "--filter", help="Glob matched against case names, e.g. 'v40/*/frame'")
+    parser.add_argument("--variant", action="append", choices=sorted(VARIANTS), help="Restrict variants")
+    parser.add_argument("--repeats", type=int, default=7, help="Measured repetitions per case")
+    parser.add_argument("--warmup", type=int, default=1, help="Warmup repetitions per case")
+    parser.add_argument("--baseline-dir", default=".benchmarks", help="Directory of per-machine baselines")
+    parser.add_argument("--update-baseline", action="store_true", help="Store this run as the baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Minimum relative slowdown to fail on")
+    parser.add_argument("--alpha", type=float, default=0.01, help="Significance level of the regression test")
+    parser.add_argument("--output", help="Also write the run as JSON to this file")
+    parser.add_argument("--phases", action="store_true", help="Print per-phase medians for each case")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run benchmarks and gate on regressions.
+
+    Returns:
+        ``0`` if no regression was found, ``1`` otherwise
+    """
+    args = build_parser().parse_args(argv)
+    # Rendering warnings (e.g. small symbols in a frame) are expected for some cases
+    logging.basicConfig(level=logging.ERROR)
+    cases = build_cases(args.profile, args.filter, args.variant)
+    if not cases:
+        print("No benchmark cases selected", file=sys.stderr)
+        return 2
+
+    def report(result: CaseResult) -> None:
+        if result.error:
+            print(f"{result.name:44} FAILED {result.error}")
+            return
+        line = f"{result.name:44} {result.median_ms:9.2f} ms"
+        if args.phases:
+            line += "  " + " ".join(f"{phase}={ms:.2f}" for phase, ms in result.phases_ms.items())
+        print(line)
+
+    run = run_suite(cases, repeats=args.repeats, warmup=args.warmup, progress=report)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(run.model_dump_json(indent=2))
+
+    status = 0
+    baseline = load_baseline(args.baseline_dir, run.fingerprint)
+    if baseline is None:
+        print(f"No baseline for machine {run.fingerprint} in {args.baseline_dir}")
+    else:
+        comparisons = compare_runs(baseline, run, threshold=args.threshold, alpha=args.alpha)
+        regressions = [comparison for comparison in comparisons if comparison.regression]
+        print(f"Compared {len(comparisons)} cases with baseline from {baseline.created}")
+        for comparison in regressions:
+            print(
+                f"REGRESSION {comparison.name}: "
+                f"{comparison.baseline_ms:.2f} -> {comparison.current_ms:.2f} ms "
+                f"({comparison.ratio:.2f}x, p={comparison.p_value:.4f})"
+            )
+        if regressions:
+            status = 1
+        else:
+            print("No significant regressions")
+
+    if args.update_baseline:
+        print(f"Baseline written to {save_baseline(run, args.baseline_dir)}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+"""Machine-keyed baselines and statistical regression detection.
+
+Baselines are stored as one JSON file per machine fingerprint, so timings
+are only ever compared with runs recorded on equivalent hardware and the
+same Python version.
+"""
+
+import hashlib
+import json
+import math
+import os
+import platform
+import statistics
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Union
+
+from pydantic import BaseModel, Field
+
+if TYPE_CHECKING:
+    from .runner import BenchmarkRun
+
+
+def _cpu_model() -> str:
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def machine_info() -> Dict[str, str]:
+    """Describe the properties of this machine that affect timings."""
+    return {
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "cpu": _cpu_model(),
+        "cpu_count": str(os.cpu_count() or 1),
+        "python": f"{platform.python_implementation()} {'.'.join(platform.python_version_tuple()[:2])}",
+    }
+
+
+def machine_fingerprint() -> str:
+    """Short stable hash of :func:`machine_info`."""
+    canonical = json.dumps(machine_info(), sort_keys=True).encode("utf-8")
+    return hashlib.sha256(canonical).hexdigest()[:16]
+
+
+def baseline_path(directory: Union[str, Path], fingerprint: Optional[str] = None) -> Path:
+    """Path of the baseline file for a machine fingerprint."""
+    return Path(directory) / f"{fingerprint or machine_fingerprint()}.json"
+
+
+def save_baseline(run: "BenchmarkRun", directory: Union[str, Path]) -> Path:
+    """Store a run as the baseline for its machine.
+
+    Args:
+        run: Benchmark run
+        directory: Baseline directory (created if missing)
+
+    Returns:
+        Path of the written baseline
+    """
+    path = baseline_path(directory, run.fingerprint)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(run.model_dump_json(indent=2), encoding="utf-8")
+    return path
+
+
+def load_baseline(directory: Union[str, Path], fingerprint: Optional[str] = None) -> Optional["BenchmarkRun"]:
+    """Load the baseline for a machine, if one was recorded.
+
+    Args:
+        directory: Baseline directory
+        fingerprint: Machine fingerprint (defaults to this machine)
+
+    Returns:
+        Baseline run or ``None``
+    """
+    from .runner import BenchmarkRun
+
+    path = baseline_path(directory, fingerprint)
+    if not path.exists():
+        return None
+    return BenchmarkRun.model_validate_json(path.read_bytes())
+
+
+def mann_whitney_greater(current: Sequence[float], baseline: Sequence[float]) -> float:
+    """One-sided Mann-Whitney U test that ``current`` is stochastically larger.
+
+    Uses the normal approximation with tie correction, which is adequate
+    for the small, equal-sized samples benchmarks produce.
+
+    Args:
+        current: Current samples
+        baseline: Baseline samples
+
+    Returns:
+        p-value (small values indicate ``current`` is slower)
+    """
+    n1, n2 = len(current), len(baseline)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+
+    ranked = sorted([(value, 0) for value in current] + [(value, 1) for value in baseline])
+    ranks = [0.0] * len(ranked)
+    tie_term = 0.0
+    i = 0
+    while i < len(ranked):
+        j = i
+        while j + 1 < len(ranked) and ranked[j + 1][0] == ranked[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        ties = j - i + 1
+        tie_term += ties**3 - ties
+        i = j + 1
+
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, ranked) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    # Continuity correction
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+class CaseComparison(BaseModel):
+    """Comparison of one case against its baseline.
+
+    Attributes:
+        name: Case name
+        baseline_ms: Baseline median
+        current_ms: Current median
+        ratio: Current median divided by baseline median
+        p_value: One-sided Mann-Whitney p-value for a slowdown
+        regression: Whether the slowdown is significant and above threshold
+    """
+
+    name: str = Field(..., description="Case name")
+    baseline_ms: float = Field(..., description="Baseline median")
+    current_ms: float = Field(..., description="Current median")
+    ratio: float = Field(..., description="Current median divided by baseline median")
+    p_value: float = Field(..., description="One-sided p-value for a slowdown")
+    regression: bool = Field(..., description="Significant slowdown above threshold")
+
+
+def compare_runs(
+    baseline: "BenchmarkRun",
+    current: "BenchmarkRun",
+    threshold: float = 0.10,
+    alpha: float = 0.01,
+) -> List[CaseComparison]:
+    """Compare a run with a baseline case by case.
+
+    A case regresses when its median is more than ``threshold`` slower and
+    the Mann-Whitney test rejects "not slower" at significance ``alpha``.
+    Cases missing from either run or failed in either run are skipped.
+    With ``alpha=0.01`` each side needs at least five samples for any
+    difference to reach significance.
+
+    Args:
+        baseline: Baseline run
+        current: Current run
+        threshold: Minimum relative slowdown to report
+        alpha: Significance level
+
+    Returns:
+        Comparisons sorted by descending slowdown ratio
+    """
+    comparisons = []
+    for name, result in current.results.items():
+        reference = baseline.results.get(name)
+        if reference is None or result.error or reference.error or not reference.samples_ms:
+            continue
+        base_ms = statistics.median(reference.samples_ms)
+        ratio = result.median_ms / base_ms if base_ms > 0 else 1.0
+        p_value = mann_whitney_greater(result.samples_ms, reference.samples_ms)
+        comparisons.append(
+            CaseComparison(
+                name=name,
+                baseline_ms=base_ms,
+                current_ms=result.median_ms,
+                ratio=ratio,
+                p_value=p_value,
+                regression=ratio > 1 + threshold and p_value < alpha,
+            )
+        )
+    return sorted(comparisons, key=lambda comparison: comparison.ratio, reverse=True)
@@ -0,0 +1,107 @@
+"""Benchmark case matrix.
+
+Cases combine a symbol (QR versions 1-40 and Micro QR M1-M4), a module
+shape from the shape factory, and a feature variant. Case names have the
+form ``"<symbol>/<shape>/<variant>"``, e.g. ``"v10/circle/frame"``.
+"""
+
+from fnmatch import fnmatch
+from typing import Any, Dict, List, Literal, Optional, Sequence, Union
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from ..shapes.factory import list_available_shapes
+
+Profile = Literal["quick", "full"]
+
+# Feature variants exercised for every symbol and shape
+VARIANTS: Dict[str, Dict[str, Any]] = {
+    "plain": {},
+    "merge": {"merge": "soft", "connectivity": "8-way"},
+    "cluster": {"enable_phase2": True, "phase2_use_cluster_rendering": True},
+    "frame": {"frame_shape": "circle"},
+    "centerpiece": {"centerpiece_enabled": True, "centerpiece_size": 0.15},
+    "accessibility": {"accessibility_enabled": True, "accessibility_include_module_labels": True},
+    "interactive": {"interactive": True},
+}
+
+QUICK_VERSIONS = (1, 10, 25, 40)
+QUICK_MICRO_VERSIONS = ("M4",)
+QUICK_SHAPES = ("square", "circle", "connected")
+
+# Module size used for all cases (a realistic on-screen size)
+SCALE = 10
+
+QR_CONTENT = "SEGNOMMS BENCH"
+MICRO_CONTENT = "12345"
+
+
+class BenchmarkCase(BaseModel):
+    """A single benchmark scenario.
+
+    Attributes:
+        name: Unique case name
+        version: QR version (1-40) or Micro QR version (``"M1"``-``"M4"``)
+        micro: Whether the symbol is a Micro QR code
+        shape: Module shape
+        variant: Feature variant name
+        options: Rendering kwargs passed to ``RenderingConfig.from_kwargs``
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str = Field(..., description="Unique case name")
+    version: Union[int, str] = Field(..., description="QR or Micro QR version")
+    micro: bool = Field(default=False, description="Whether the symbol is a Micro QR code")
+    shape: str = Field(..., description="Module shape")
+    variant: str = Field(..., description="Feature variant name")
+    options: Dict[str, Any] = Field(default_factory=dict, description="Rendering kwargs")
+
+    @property
+    def content(self) -> str:
+        """Content encoded for this case (fits every version it is used with)."""
+        return MICRO_CONTENT if self.micro else QR_CONTENT
+
+
+def build_cases(
+    profile: Profile = "quick",
+    pattern: Optional[str] = None,
+    variants: Optional[Sequence[str]] = None,
+) -> List[BenchmarkCase]:
+    """Build the benchmark case matrix.
+
+    Args:
+        profile: ``"quick"`` for a representative subset, ``"full"`` for every
+            version, Micro QR version and registered shape
+        pattern: Optional glob matched against case names
+        variants: Optional subset of :data:`VARIANTS` to include
+
+    Returns:
+        Benchmark cases in a stable order
+    """
+    if profile == "full":
+        symbols: List[Any] = [(version, False) for version in range(1, 41)]
+        symbols += [(f"M{version}", True) for version in range(1, 5)]
+        shapes = list_available_shapes()
+    else:
+        symbols = [(version, False) for version in QUICK_VERSIONS]
+        symbols += [(version, True) for version in QUICK_MICRO_VERSIONS]
+        shapes = [shape for shape in QUICK_SHAPES if shape in list_available_shapes()]
+
+    selected_variants = list(variants) if variants else list(VARIANTS)
+
+    cases = []
+    for version, micro in symbols:
+        symbol = version if micro else f"v{version}"
+        for shape in shapes:
+            for variant in selected_variants:
+                name = f"{symbol}/{shape}/{variant}"
+                if pattern and not fnmatch(name, pattern):
+                    continue
+                options = {"scale": SCALE, "shape": shape, **VARIANTS[variant]}
+                cases.append(
+                    BenchmarkCase(
+                        name=name, version=version, micro=micro, shape=shape, variant=variant, options=options
+                    )
+                )
+    return cases
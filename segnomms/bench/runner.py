@@ -0,0 +1,185 @@
+"""Benchmark execution with end-to-end and per-phase timings."""
+
+import functools
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import segno
+from pydantic import BaseModel, Field
+
+from ..config import RenderingConfig
+from ..plugin.rendering import QRCodeRenderer
+from .baseline import machine_fingerprint, machine_info
+from .cases import BenchmarkCase
+
+# Renderer methods timed as individual phases; everything else inside
+# render() (layer setup, animation rules, serialization) is "serialize"
+RENDER_PHASES = {
+    "_apply_centerpiece": "centerpiece",
+    "_create_svg_structure": "structure",
+    "_apply_frame_clipping": "frame",
+    "_detect_islands": "islands",
+    "_render_clusters": "clusters",
+    "_render_individual_modules": "modules",
+    "_enhance_pattern_groups": "accessibility",
+}
+
+
+class CaseResult(BaseModel):
+    """Timings of one benchmark case.
+
+    Attributes:
+        name: Case name
+        samples_ms: End-to-end time of each measured repetition
+        phases_ms: Median time per phase
+        svg_bytes: Size of the rendered SVG
+        error: Error message if the case could not be rendered
+    """
+
+    name: str = Field(..., description="Case name")
+    samples_ms: List[float] = Field(default_factory=list, description="End-to-end sample times")
+    phases_ms: Dict[str, float] = Field(default_factory=dict, description="Median time per phase")
+    svg_bytes: int = Field(default=0, description="Size of the rendered SVG")
+    error: Optional[str] = Field(default=None, description="Error message if the case failed")
+
+    @property
+    def median_ms(self) -> float:
+        """Median end-to-end time."""
+        return statistics.median(self.samples_ms) if self.samples_ms else 0.0
+
+
+class BenchmarkRun(BaseModel):
+    """A complete benchmark run, also used as the stored baseline format.
+
+    Attributes:
+        fingerprint: Machine fingerprint the run was recorded on
+        machine: Machine description
+        created: ISO timestamp
+        segnomms_version: Package version
+        repeats: Measured repetitions per case
+        results: Case results by name
+    """
+
+    fingerprint: str = Field(..., description="Machine fingerprint")
+    machine: Dict[str, str] = Field(default_factory=dict, description="Machine description")
+    created: str = Field(..., description="ISO timestamp")
+    segnomms_version: str = Field(..., description="Package version")
+    repeats: int = Field(..., description="Measured repetitions per case")
+    results: Dict[str, CaseResult] = Field(default_factory=dict, description="Case results by name")
+
+
+def _timed(phases: Dict[str, float], phase: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            phases[phase] = phases.get(phase, 0.0) + (time.perf_counter() - start) * 1000
+
+    return wrapper
+
+
+def measure_case(case: BenchmarkCase) -> Dict[str, float]:
+    """Render a case once and return its phase timings.
+
+    Phases are ``encode`` (segno), ``prepare`` (configuration, degradation
+    and matrix analysis), the renderer phases in :data:`RENDER_PHASES`, and
+    ``serialize``. The ``total`` key holds the end-to-end time.
+
+    Args:
+        case: Benchmark case
+
+    Returns:
+        Milliseconds per phase plus ``total`` and ``svg_bytes``
+    """
+    phases: Dict[str, float] = {}
+
+    start = time.perf_counter()
+    qr = segno.make(
+        case.content, version=case.version, micro=case.micro, error="L" if not case.micro else None
+    )
+    encoded = time.perf_counter()
+    config = RenderingConfig.from_kwargs(**case.options)
+    renderer = QRCodeRenderer(qr, config)
+    prepared = time.perf_counter()
+
+    for method, phase in RENDER_PHASES.items():
+        setattr(renderer, method, _timed(phases, phase, getattr(renderer, method)))
+    svg = renderer.render()
+    finished = time.perf_counter()
+
+    render_ms = (finished - prepared) * 1000
+    phases["encode"] = (encoded - start) * 1000
+    phases["prepare"] = (prepared - encoded) * 1000
+    phases["serialize"] = max(0.0, render_ms - sum(phases.get(p, 0.0) for p in RENDER_PHASES.values()))
+    phases["total"] = (finished - start) * 1000
+    phases["svg_bytes"] = len(svg)
+    return phases
+
+
+def run_case(case: BenchmarkCase, repeats: int = 5, warmup: int = 1) -> CaseResult:
+    """Run one case with warmup and return its statistics.
+
+    Args:
+        case: Benchmark case
+        repeats: Measured repetitions
+        warmup: Unmeasured repetitions run first
+
+    Returns:
+        Case result; failures are recorded in ``error`` instead of raised
+    """
+    try:
+        for _ in range(warmup):
+            measure_case(case)
+        samples = [measure_case(case) for _ in range(max(1, repeats))]
+    except Exception as e:
+        return CaseResult(name=case.name, error=f"{type(e).__name__}: {e}")
+
+    phase_names = [key for key in samples[0] if key not in ("total", "svg_bytes")]
+    return CaseResult(
+        name=case.name,
+        samples_ms=[sample["total"] for sample in samples],
+        phases_ms={
+            phase: statistics.median(sample.get(phase, 0.0) for sample in samples) for phase in phase_names
+        },
+        svg_bytes=int(samples[-1]["svg_bytes"]),
+    )
+
+
+def run_suite(
+    cases: Iterable[BenchmarkCase],
+    repeats: int = 5,
+    warmup: int = 1,
+    progress: Optional[Callable[[CaseResult], None]] = None,
+) -> BenchmarkRun:
+    """Run benchmark cases and collect a :class:`BenchmarkRun`.
+
+    Args:
+        cases: Cases to run
+        repeats: Measured repetitions per case
+        warmup: Unmeasured repetitions per case
+        progress: Optional callback invoked after each case
+
+    Returns:
+        Benchmark run for this machine
+    """
+    from .. import __version__
+
+    results = {}
+    for case in cases:
+        result = run_case(case, repeats, warmup)
+        results[case.name] = result
+        if progress is not None:
+            progress(result)
+
+    return BenchmarkRun(
+        fingerprint=machine_fingerprint(),
+        machine=machine_info(),
+        created=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        segnomms_version=__version__,
+        repeats=repeats,
+        results=results,
+    )
@@ -10,6 +10,8 @@ Key Components:
     :class:`CapabilityManifest`: Complete capability information model
     :func:`get_capability_manifest`: Generate runtime capability manifest
     :func:`get_supported_features`: List specific feature categories
+    :func:`get_capability_manifest_json`: Cached manifest JSON with an ETag
+    :func:`get_config_schema_json`: Cached configuration JSON schema with an ETag
 
 The capability system leverages existing Pydantic models and factory patterns
 to provide accurate, up-to-date feature information without duplication.
@@ -40,13 +42,21 @@ See Also:
 try:
     from .manifest import (  # noqa: F401
         CapabilityManifest,
+        SerializedDocument,
+        clear_capability_cache,
         get_capability_manifest,
+        get_capability_manifest_json,
+        get_config_schema_json,
         get_supported_features,
     )
 
     __all__ = [
         "CapabilityManifest",
+        "SerializedDocument",
+        "clear_capability_cache",
         "get_capability_manifest",
+        "get_capability_manifest_json",
+        "get_config_schema_json",
         "get_supported_features",
     ]
 
@@ -3,9 +3,18 @@
 This module implements the core capability discovery system, providing
 runtime manifest generation that reflects the actual features and bounds
 of the SegnoMMS plugin.
+
+The manifest and the configuration JSON schema are computed once per
+process and kept as pre-serialized JSON with a stable ``ETag``. The cache
+key includes the package version and the shape renderer registry version,
+so registering a custom renderer invalidates the manifest.
 """
 
-from typing import Any, Dict, List, Optional
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
 from pydantic import BaseModel, Field
 
@@ -14,7 +23,9 @@ from ..config import (
     ConnectivityMode,
     MergeStrategy,
     ModuleShape,
+    RenderingConfig,
 )
+from ..shapes.factory import get_shape_factory
 
 
 class FeatureSupport(BaseModel):
@@ -33,6 +44,9 @@ class ShapeCapabilities(BaseModel):
     merge_strategies: List[str] = Field(description="Module merging strategies")
     connectivity_modes: List[str] = Field(description="Neighbor connectivity modes")
     custom_shapes: FeatureSupport = Field(description="Custom shape registration support")
+    custom_renderers: List[str] = Field(
+        default_factory=list, description="Shape types registered with register_custom_renderer"
+    )
 
 
 class FrameCapabilities(BaseModel):
@@ -145,6 +159,7 @@ def _get_shape_capabilities() -> ShapeCapabilities:
         merge_strategies=merge_strategies,
         connectivity_modes=connectivity_modes,
         custom_shapes=FeatureSupport(supported=True, version_added="0.0.0b3", experimental=False),
+        custom_renderers=get_shape_factory().list_custom_types(),
     )
 
 
@@ -269,11 +284,63 @@ def _get_example_configurations() -> Dict[str, Any]:
     }
 
 
+@dataclass(frozen=True)
+class SerializedDocument:
+    """Pre-serialized JSON document.
+
+    Attributes:
+        body: UTF-8 encoded JSON
+        etag: Strong entity tag derived from the body
+    """
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_bytes(cls, body: bytes) -> "SerializedDocument":
+        """Create a document, deriving the ETag from a hash of the body."""
+        return cls(body, f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+T = TypeVar("T")
+
+_CACHE: Dict[str, Tuple[Tuple[Any, ...], Any]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _package_version() -> str:
+    # Import version here to avoid circular imports
+    try:
+        from .. import __version__
+    except ImportError:
+        return "unknown"
+    return __version__
+
+
+def _registry_key() -> Tuple[Any, ...]:
+    factory = get_shape_factory()
+    return (_package_version(), id(factory), factory.registry_version)
+
+
+def _cached(name: str, key: Tuple[Any, ...], build: Callable[[], T]) -> T:
+    """Get a cached value, rebuilding it when its key has changed."""
+    with _CACHE_LOCK:
+        entry = _CACHE.get(name)
+        if entry is not None and entry[0] == key:
+            return entry[1]  # type: ignore[no-any-return]
+    value = build()
+    with _CACHE_LOCK:
+        _CACHE[name] = (key, value)
+    return value
+
+
 def get_capability_manifest() -> CapabilityManifest:
     """Generate complete capability manifest for SegnoMMS plugin.
 
     This function discovers capabilities from the actual implementation,
-    ensuring the manifest accurately reflects current functionality.
+    ensuring the manifest accurately reflects current functionality. The
+    manifest is built once per package version and renderer registry
+    state; each call returns a copy, so callers may modify it freely.
 
     Returns:
         CapabilityManifest: Complete capability information
@@ -283,13 +350,16 @@ def get_capability_manifest() -> CapabilityManifest:
         >>> print(f"Plugin: {manifest.name} v{manifest.version}")
         >>> print(f"Shapes: {len(manifest.features.shapes.module_shapes)}")
     """
+    return _shared_capability_manifest().model_copy(deep=True)
 
-    # Import version here to avoid circular imports
-    try:
-        from .. import __version__
-    except ImportError:
-        __version__ = "unknown"
 
+def _shared_capability_manifest() -> CapabilityManifest:
+    """Get the cached manifest instance; it must not be modified."""
+    return _cached("manifest", _registry_key(), _build_capability_manifest)
+
+
+def _build_capability_manifest() -> CapabilityManifest:
+    """Discover all capabilities (uncached)."""
     features = CapabilityFeatures(
         shapes=_get_shape_capabilities(),
         frames=_get_frame_capabilities(),
@@ -302,7 +372,7 @@ def get_capability_manifest() -> CapabilityManifest:
 
     return CapabilityManifest(
         name="SegnoMMS",
-        version=__version__,
+        version=_package_version(),
         segno_compatibility=[">=1.5.2"],
         python_compatibility=[">=3.8"],
         features=features,
@@ -311,6 +381,46 @@ def get_capability_manifest() -> CapabilityManifest:
     )
 
 
+def get_capability_manifest_json() -> SerializedDocument:
+    """Get the capability manifest as pre-serialized JSON.
+
+    Returns:
+        SerializedDocument: Manifest JSON and its ETag
+
+    Example:
+        >>> document = get_capability_manifest_json()
+        >>> response_headers = {"ETag": document.etag}
+    """
+    return _cached(
+        "manifest_json",
+        _registry_key(),
+        lambda: SerializedDocument.from_bytes(
+            _shared_capability_manifest().model_dump_json().encode("utf-8")
+        ),
+    )
+
+
+def get_config_schema_json() -> SerializedDocument:
+    """Get the :class:`RenderingConfig` JSON schema as pre-serialized JSON.
+
+    Returns:
+        SerializedDocument: Schema JSON and its ETag
+    """
+    return _cached(
+        "schema_json",
+        (_package_version(),),
+        lambda: SerializedDocument.from_bytes(
+            json.dumps(RenderingConfig.json_schema(), sort_keys=True, separators=(",", ":")).encode("utf-8")
+        ),
+    )
+
+
+def clear_capability_cache() -> None:
+    """Drop the cached manifest and schema documents."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
 def get_supported_features(category: str) -> List[str]:
     """Get list of supported features for a specific category.
 
@@ -325,7 +435,7 @@ def get_supported_features(category: str) -> List[str]:
         >>> print(f"Available shapes: {shapes}")
     """
 
-    manifest = get_capability_manifest()
+    manifest = _shared_capability_manifest()
 
     category_map = {
         "shapes": manifest.features.shapes.module_shapes,
@@ -338,4 +448,5 @@ def get_supported_features(category: str) -> List[str]:
         "placement_modes": manifest.features.reserve.placement_modes,
     }
 
-    return category_map.get(category, [])
+    # Copy so callers cannot modify the cached manifest
+    return list(category_map.get(category, []))
@@ -0,0 +1,446 @@
+"""Command-line tool for bulk QR code generation.
+
+Reads payloads from a CSV, JSONL or plain text file (or stdin), renders
+them with a configuration preset or intents, optionally in parallel, and
+writes the SVGs to a directory, a zip or tar.gz archive, or stdout.
+
+Input formats:
+
+* ``jsonl``: one object per line, either an intents request
+  (``{"id": ..., "payload": {...}, "intents": {...}}``) or a bare payload
+  (``{"id": ..., "text": ...}``)
+* ``csv``: a header row naming payload fields (``text``, ``url``, ...) and
+  an optional ``id`` column
+* ``text``: one text payload per line
+
+Example:
+    Render a CSV with the artistic preset on four processes::
+
+        segnomms payloads.csv --preset artistic -j 4 -o codes/
+
+    Render JSONL requests with default intents into a zip archive::
+
+        segnomms requests.jsonl --intents brand.json -o codes.zip
+
+    Spread a large run over nested hash-prefix directories::
+
+        segnomms payloads.csv --preset minimal -j 8 -o codes/ --shard 2
+
+    Stream a tar.gz archive to stdout::
+
+        segnomms payloads.csv --preset minimal -j 4 --archive tar.gz > codes.tar.gz
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    BinaryIO,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
+
+import segno
+
+from .config import RenderingConfig
+from .config.presets import ConfigPresets
+from .intents.models import IntentRequest, IntentsConfig, PayloadConfig
+from .plugin.archive import ARCHIVE_FORMATS, ArchiveFormat, ArchiveWriter
+from .plugin.export import ShardLayout
+
+INPUT_FORMATS = ("auto", "jsonl", "csv", "text")
+
+# Per-process rendering state, set up by _init_worker
+_worker_config: Optional[RenderingConfig] = None
+_worker_intents: Optional[IntentsConfig] = None
+
+
+class JobResult(NamedTuple):
+    """Outcome of rendering one input record."""
+
+    position: int
+    name: str
+    svg: Optional[str]
+    error: Optional[str]
+    elapsed_ms: float
+
+
+def _detect_format(path: str) -> str:
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv":
+        return "csv"
+    if suffix in (".jsonl", ".ndjson", ".json"):
+        return "jsonl"
+    return "text"
+
+
+def read_records(stream: IO[str], input_format: str) -> Iterator[Union[str, Dict[str, Any]]]:
+    """Lazily read raw input records.
+
+    Records are parsed and validated by the workers, so a malformed record
+    fails on its own instead of aborting the whole run.
+
+    Args:
+        stream: Text input stream
+        input_format: ``"jsonl"``, ``"csv"`` or ``"text"``
+
+    Yields:
+        JSON lines (``jsonl``) or field dictionaries (``csv`` and ``text``)
+    """
+    if input_format == "csv":
+        for row in csv.DictReader(stream):
+            yield dict(row)
+    elif input_format == "jsonl":
+        for line in stream:
+            if line.strip():
+                yield line
+    else:
+        for line in stream:
+            text = line.rstrip("\r\n")
+            if text:
+                yield {"text": text}
+
+
+def parse_record(record: Union[str, Dict[str, Any]]) -> IntentRequest:
+    """Build an intent request from a raw input record.
+
+    Args:
+        record: JSON line, or a field dictionary with an optional ``id``
+
+    Returns:
+        Validated intent request
+
+    Raises:
+        ValueError: If the record is not a valid request or payload
+    """
+    if isinstance(record, str):
+        record = json.loads(record)
+        if not isinstance(record, dict):
+            raise ValueError("JSONL records must be objects")
+        if "payload" in record:
+            return IntentRequest.model_validate(record)
+
+    fields = dict(record)
+    request_id = fields.pop("id", None)
+    payload = {key: value for key, value in fields.items() if value not in (None, "")}
+    return IntentRequest(id=str(request_id) if request_id else None, payload=PayloadConfig(**payload))
+
+
+def _init_worker(preset: Optional[str], intents_json: Optional[str]) -> None:
+    """Prepare the shared rendering state once per worker."""
+    global _worker_config, _worker_intents
+
+    from .plugin.rendering import prepare_rendering_config
+
+    _worker_config = prepare_rendering_config(ConfigPresets.custom(preset)) if preset else None
+    _worker_intents = IntentsConfig.model_validate_json(intents_json) if intents_json else None
+
+
+def _render_job(index: int, record: Union[str, Dict[str, Any]]) -> JobResult:
+    """Parse and render one record with the worker's preset or intents."""
+    name = f"qr-{index + 1:06d}"
+    start = time.perf_counter()
+    try:
+        request = parse_record(record)
+        name = request.id or name
+        if _worker_config is not None:
+            from .plugin.rendering import QRCodeRenderer
+
+            qr = segno.make(request.payload.get_content(), error=request.payload.error_correction)
+            svg = QRCodeRenderer(qr, _worker_config, apply_degradation=False).render()
+        else:
+            from .intents.processor import get_intent_processor
+
+            intents = request.intents or _worker_intents
+            svg = get_intent_processor().process_intents(request.payload, intents).svg_content
+    except Exception as e:
+        return JobResult(index, name, None, f"{type(e).__name__}: {e}", (time.perf_counter() - start) * 1000)
+    return JobResult(index, name, svg, None, (time.perf_counter() - start) * 1000)
+
+
+def render_records(
+    records: Iterable[Union[str, Dict[str, Any]]],
+    preset: Optional[str] = None,
+    intents: Optional[IntentsConfig] = None,
+    jobs: int = 1,
+    ordered: bool = True,
+) -> Iterator[JobResult]:
+    """Render records, optionally on a process pool.
+
+    At most four records per worker are in flight, so arbitrarily large
+    inputs are processed in constant memory.
+
+    Args:
+        records: Raw records from :func:`read_records`
+        preset: Preset name; renders via the plugin instead of intents
+        intents: Default intents for requests without their own
+        jobs: Number of worker processes (``1`` renders in-process)
+        ordered: Yield results in input order; otherwise yield them as
+            workers finish, so one slow record does not hold back the rest
+
+    Yields:
+        Job results in input order, or in completion order if not ``ordered``
+    """
+    intents_json = intents.model_dump_json(exclude_none=True) if intents else None
+
+    if jobs <= 1:
+        _init_worker(preset, intents_json)
+        for index, record in enumerate(records):
+            yield _render_job(index, record)
+        return
+
+    executor: Executor = ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=(preset, intents_json))
+    with executor:
+        if not ordered:
+            pending: Set["Future[JobResult]"] = set()
+            for index, record in enumerate(records):
+                if len(pending) >= jobs * 4:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from (future.result() for future in done)
+                pending.add(executor.submit(_render_job, index, record))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in done)
+            return
+
+        queue: Deque["Future[JobResult]"] = deque()
+        for index, record in enumerate(records):
+            if len(queue) >= jobs * 4:
+                yield queue.popleft().result()
+            queue.append(executor.submit(_render_job, index, record))
+        while queue:
+            yield queue.popleft().result()
+
+
+def _archive_format(target: str) -> Optional[ArchiveFormat]:
+    """Detect the archive format from an output file name."""
+    lower = target.lower()
+    if lower.endswith(".zip"):
+        return "zip"
+    if lower.endswith((".tar.gz", ".tgz")):
+        return "tar.gz"
+    return None
+
+
+class _OutputWriter:
+    """Write rendered SVGs to a directory, an archive or stdout."""
+
+    def __init__(
+        self,
+        target: str,
+        archive_format: Optional[ArchiveFormat] = None,
+        shard_layout: Optional[ShardLayout] = None,
+    ) -> None:
+        self.target = target
+        self.shard_layout = shard_layout
+        self._names: Dict[str, int] = {}
+        self._archive: Optional[ArchiveWriter] = None
+        self._stream: Optional[BinaryIO] = None
+        archive_format = archive_format or (_archive_format(target) if target != "-" else None)
+        if archive_format is not None:
+            self.kind = "archive"
+            self._stream = sys.stdout.buffer if target == "-" else open(target, "wb")
+            self._archive = ArchiveWriter(self._stream, archive_format)
+        elif target == "-":
+            self.kind = "stdout"
+        else:
+            self.kind = "directory"
+            Path(target).mkdir(parents=True, exist_ok=True)
+
+    def _filename(self, name: str) -> str:
+        safe = re.sub(r"[^\w.-]", "_", name) or "qr"
+        count = self._names.get(safe, 0)
+        self._names[safe] = count + 1
+        return f"{safe}.svg" if count == 0 else f"{safe}-{count + 1}.svg"
+
+    def write(self, result: JobResult) -> None:
+        assert result.svg is not None
+        if self.kind == "stdout":
+            sys.stdout.write(json.dumps({"id": result.name, "svg": result.svg}) + "\n")
+        elif self._archive is not None:
+            self._archive.add(self._filename(result.name), result.svg)
+        elif self.shard_layout is not None:
+            path = self.shard_layout.resolve_name(self.target, self._filename(result.name))
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(result.svg, encoding="utf-8")
+        else:
+            (Path(self.target) / self._filename(result.name)).write_text(result.svg, encoding="utf-8")
+
+    def close(self) -> None:
+        if self._archive is not None:
+            self._archive.close()
+            assert self._stream is not None
+            if self._stream is sys.stdout.buffer:
+                self._stream.flush()
+            else:
+                self._stream.close()
+        elif self.kind == "stdout":
+            sys.stdout.flush()
+
+
+def _percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    position = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[position]
+
+
+def format_stats(latencies_ms: List[float], errors: int, wall_seconds: float) -> str:
+    """Format throughput and latency statistics for a run.
+
+    Args:
+        latencies_ms: Per-item render latencies
+        errors: Number of failed items
+        wall_seconds: Total wall-clock time
+
+    Returns:
+        Human-readable summary
+    """
+    values = sorted(latencies_ms)
+    total = len(values)
+    throughput = total / wall_seconds if wall_seconds > 0 else 0.0
+    return (
+        f"Rendered {total - errors}/{total} codes in {wall_seconds:.2f}s ({throughput:.1f} codes/s), "
+        f"{errors} failed\n"
+        f"Latency ms: p50={_percentile(values, 0.5):.1f} p95={_percentile(values, 0.95):.1f} "
+        f"p99={_percentile(values, 0.99):.1f} max={(values[-1] if values else 0.0):.1f}"
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+    parser = argparse.ArgumentParser(prog="segnomms", description="Bulk-generate SegnoMMS QR code SVGs.")
+    parser.add_argument("input", nargs="?", default="-", help="Input file, or '-' for stdin (default)")
+    parser.add_argument(
+        "-f", "--format", choices=INPUT_FORMATS, default="auto", help="Input format (default: by extension)"
+    )
+    style = parser.add_mutually_exclusive_group()
+    style.add_argument("-p", "--preset", help="Configuration preset (see --list-presets)")
+    style.add_argument("-i", "--intents", help="JSON file with default intents")
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="Output directory, .zip or .tar.gz archive, or '-' for JSONL on stdout",
+    )
+    parser.add_argument(
+        "--archive",
+        choices=ARCHIVE_FORMATS,
+        help="Write an archive of this format, also to stdout (default: by output extension)",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1, help="Number of worker processes (0: one per CPU)"
+    )
+    parser.add_argument(
+        "--shard",
+        type=int,
+        nargs="?",
+        const=2,
+        metavar="DEPTH",
+        help="Spread directory output over DEPTH levels of hash-prefix subdirectories (default: 2)",
+    )
+    parser.add_argument("-q", "--quiet", action="store_true", help="Do not print statistics")
+    parser.add_argument("--list-presets", action="store_true", help="List available presets and exit")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the command-line tool.
+
+    Args:
+        argv: Command-line arguments (defaults to ``sys.argv[1:]``)
+
+    Returns:
+        Exit status: ``0`` on success, ``1`` if any item failed, ``2`` on usage errors
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.list_presets:
+        for name, description in ConfigPresets.list_presets().items():
+            print(f"{name:16} {description}")
+        return 0
+
+    if args.preset and args.preset not in ConfigPresets.list_presets():
+        parser.error(f"unknown preset '{args.preset}'")
+
+    shard_layout = None
+    if args.shard is not None:
+        if args.output == "-" or args.archive or _archive_format(args.output):
+            parser.error("--shard requires a directory output")
+        try:
+            shard_layout = ShardLayout(depth=args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+
+    intents = None
+    if args.intents:
+        intents = IntentsConfig.model_validate_json(Path(args.intents).read_bytes())
+
+    input_format = args.format
+    if input_format == "auto":
+        input_format = "jsonl" if args.input == "-" else _detect_format(args.input)
+
+    stream: IO[str]
+    if args.input == "-":
+        stream = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+    else:
+        stream = open(args.input, encoding="utf-8", newline="")
+
+    writer = _OutputWriter(args.output, args.archive, shard_layout)
+    latencies: List[float] = []
+    errors = 0
+    start = time.perf_counter()
+    try:
+        records = read_records(stream, input_format)
+        jobs = max(1, args.jobs or os.cpu_count() or 1)
+        # Archives take members in any order, so fill them as workers finish
+        ordered = writer.kind != "archive"
+        for result in render_records(
+            records, preset=args.preset, intents=intents, jobs=jobs, ordered=ordered
+        ):
+            latencies.append(result.elapsed_ms)
+            if result.error is not None:
+                errors += 1
+                print(f"segnomms: {result.name}: {result.error}", file=sys.stderr)
+            else:
+                writer.write(result)
+    except csv.Error as e:
+        print(f"segnomms: invalid input: {e}", file=sys.stderr)
+        return 2
+    finally:
+        writer.close()
+        if args.input != "-":
+            stream.close()
+
+    if not args.quiet:
+        print(format_stats(latencies, errors, time.perf_counter() - start), file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
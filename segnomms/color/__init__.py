@@ -9,7 +9,8 @@ Key Components:
     Color Analysis:
         - Contrast ratio calculations (WCAG standards)
         - Luminance calculations
-        - Color parsing from various formats
+        - Color parsing from various formats (interned, with cached luminance)
+        - Direct lightness solving for a target contrast ratio
 
     Palette Management:
         - Color palette validation
@@ -51,9 +52,12 @@ See Also:
 """
 
 from .color_analysis import (
+    Color,
     calculate_contrast_ratio,
     calculate_luminance,
+    get_color,
     parse_color,
+    solve_color_for_contrast,
 )
 from .palette import (
     ColorSpace,
@@ -65,9 +69,12 @@ from .palette import (
 
 __all__ = [
     # Color analysis
+    "Color",
     "calculate_contrast_ratio",
     "calculate_luminance",
+    "get_color",
     "parse_color",
+    "solve_color_for_contrast",
     # Palette management
     "PaletteConfig",
     "PaletteType",
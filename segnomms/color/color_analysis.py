@@ -2,11 +2,93 @@
 
 This module provides tools for analyzing color contrast ratios and other
 color-related scanability factors.
+
+Parsed colors are interned :class:`Color` values carrying their linear
+components and luminance, and contrast ratios are memoized, so repeated
+checks of the same configuration colors do not re-parse strings.
 """
 
 import re
+from dataclasses import dataclass
+from functools import lru_cache
 from math import sqrt
-from typing import Optional, Tuple
+from typing import Optional, Sequence, Tuple
+
+# Maximum number of interned colors and memoized contrast ratios
+COLOR_CACHE_SIZE = 1024
+CONTRAST_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class Color:
+    """Parsed sRGB color with precomputed linear components and luminance.
+
+    Instances are interned: parsing equal color strings, or strings that
+    resolve to the same RGB value, returns the same object.
+
+    Attributes:
+        rgb: RGB tuple (r, g, b) with values 0-255
+        linear: Gamma-expanded channels 0.0-1.0
+        luminance: Relative luminance 0.0-1.0
+    """
+
+    rgb: Tuple[int, int, int]
+    linear: Tuple[float, float, float]
+    luminance: float
+
+    @property
+    def hex(self) -> str:
+        """Get the color as a lowercase ``#rrggbb`` string."""
+        return "#{:02x}{:02x}{:02x}".format(*self.rgb)
+
+    @classmethod
+    def from_rgb(cls, rgb: Sequence[int]) -> "Color":
+        """Get the interned color for RGB values (clamped to 0-255)."""
+        r, g, b = (max(0, min(255, int(channel))) for channel in rgb)
+        return _color_from_rgb((r, g, b))
+
+
+def _to_linear(channel: int) -> float:
+    value = channel / 255.0
+    if value <= 0.03928:
+        return value / 12.92
+    return float(pow((value + 0.055) / 1.055, 2.4))
+
+
+def _from_linear(value: float) -> int:
+    value = max(0.0, min(1.0, value))
+    if value <= 0.0031308:
+        encoded = value * 12.92
+    else:
+        encoded = 1.055 * pow(value, 1 / 2.4) - 0.055
+    return max(0, min(255, round(encoded * 255)))
+
+
+@lru_cache(maxsize=COLOR_CACHE_SIZE)
+def _color_from_rgb(rgb: Tuple[int, int, int]) -> Color:
+    linear = (_to_linear(rgb[0]), _to_linear(rgb[1]), _to_linear(rgb[2]))
+    luminance = 0.2126 * linear[0] + 0.7152 * linear[1] + 0.0722 * linear[2]
+    return Color(rgb, linear, luminance)
+
+
+@lru_cache(maxsize=COLOR_CACHE_SIZE)
+def _get_color(color_str: str) -> Optional[Color]:
+    rgb = _parse_rgb(color_str)
+    return None if rgb is None else _color_from_rgb(rgb)
+
+
+def get_color(color_str: str) -> Optional[Color]:
+    """Parse a color string into an interned :class:`Color`.
+
+    Args:
+        color_str: Color string in any format accepted by :func:`parse_color`
+
+    Returns:
+        Interned color, or None if unparseable
+    """
+    if not color_str or not isinstance(color_str, str):
+        return None
+    return _get_color(color_str)
 
 
 def parse_color(color_str: str) -> Optional[Tuple[int, int, int]]:
@@ -23,9 +105,12 @@ def parse_color(color_str: str) -> Optional[Tuple[int, int, int]]:
     Returns:
         RGB tuple (r, g, b) with values 0-255, or None if unparseable
     """
-    if not color_str:
-        return None
+    color = get_color(color_str)
+    return None if color is None else color.rgb
 
+
+def _parse_rgb(color_str: str) -> Optional[Tuple[int, int, int]]:
+    """Parse a non-empty color string (uncached)."""
     color_str = color_str.strip().lower()
 
     # Named colors
@@ -111,28 +196,14 @@ def calculate_luminance(rgb: Tuple[int, int, int]) -> float:
     Returns:
         Relative luminance value 0.0-1.0
     """
-    r, g, b = rgb
-
-    # Convert to 0-1 range
-    r_norm = r / 255.0
-    g_norm = g / 255.0
-    b_norm = b / 255.0
-
-    # Apply gamma correction
-    def gamma_correct(channel: float) -> float:
-        if channel <= 0.03928:
-            return channel / 12.92
-        else:
-            return float(pow((channel + 0.055) / 1.055, 2.4))
-
-    r_linear = gamma_correct(r_norm)
-    g_linear = gamma_correct(g_norm)
-    b_linear = gamma_correct(b_norm)
+    return Color.from_rgb(rgb).luminance
 
-    # Calculate luminance using sRGB weights
-    luminance = 0.2126 * r_linear + 0.7152 * g_linear + 0.0722 * b_linear
 
-    return luminance
+def luminance_contrast_ratio(luminance1: float, luminance2: float) -> float:
+    """Calculate the WCAG contrast ratio between two relative luminances."""
+    lighter = max(luminance1, luminance2)
+    darker = min(luminance1, luminance2)
+    return (lighter + 0.05) / (darker + 0.05)
 
 
 def calculate_contrast_ratio(color1: str, color2: str) -> Optional[float]:
@@ -145,23 +216,90 @@ def calculate_contrast_ratio(color1: str, color2: str) -> Optional[float]:
     Returns:
         Contrast ratio (1.0-21.0), or None if colors can't be parsed
     """
-    rgb1 = parse_color(color1)
-    rgb2 = parse_color(color2)
+    return _contrast_ratio(color1, color2)
 
-    if rgb1 is None or rgb2 is None:
+
+@lru_cache(maxsize=CONTRAST_CACHE_SIZE)
+def _contrast_ratio(color1: str, color2: str) -> Optional[float]:
+    first = get_color(color1)
+    second = get_color(color2)
+    if first is None or second is None:
         return None
+    return luminance_contrast_ratio(first.luminance, second.luminance)
+
+
+def with_luminance(color: Color, luminance: float) -> Color:
+    """Get the color with the same hue and a given relative luminance.
 
-    lum1 = calculate_luminance(rgb1)
-    lum2 = calculate_luminance(rgb2)
+    Luminance is linear in the gamma-expanded channels, so darkening scales
+    them towards black and lightening mixes them towards white by exactly
+    the amount needed; no search is required. The result is rounded to
+    8-bit channels.
 
-    # Ensure lighter color is in numerator
-    lighter = max(lum1, lum2)
-    darker = min(lum1, lum2)
+    Args:
+        color: Color to adjust
+        luminance: Target relative luminance 0.0-1.0
+
+    Returns:
+        Adjusted color
+    """
+    luminance = max(0.0, min(1.0, luminance))
+    if luminance <= color.luminance:
+        factor = luminance / color.luminance if color.luminance > 0 else 0.0
+        linear = [channel * factor for channel in color.linear]
+    else:
+        mix = (luminance - color.luminance) / (1 - color.luminance)
+        linear = [channel + mix * (1 - channel) for channel in color.linear]
+    return Color.from_rgb((_from_linear(linear[0]), _from_linear(linear[1]), _from_linear(linear[2])))
+
+
+def solve_color_for_contrast(color: str, against: str, min_ratio: float) -> Optional[str]:
+    """Adjust the lightness of a color until it reaches a contrast ratio.
+
+    The target luminance is solved directly from the WCAG formula. The
+    color keeps its side of ``against`` (darker colors are darkened further,
+    lighter ones lightened) unless only the other side can reach the ratio.
+
+    Args:
+        color: Color to adjust
+        against: Color the contrast is measured against
+        min_ratio: Required contrast ratio (1.0-21.0)
+
+    Returns:
+        Hex color meeting the ratio, the color itself if it already does, or
+        None if the colors can't be parsed or the ratio is unreachable
+    """
+    base = get_color(color)
+    other = get_color(against)
+    if base is None or other is None:
+        return None
+    if luminance_contrast_ratio(base.luminance, other.luminance) >= min_ratio:
+        return base.hex
+
+    darker = (other.luminance + 0.05) / min_ratio - 0.05
+    lighter = (other.luminance + 0.05) * min_ratio - 0.05
+    targets = (darker, lighter) if base.luminance <= other.luminance else (lighter, darker)
+    for target in targets:
+        if not 0.0 <= target <= 1.0:
+            continue
+        adjusted = with_luminance(base, target)
+        # Rounding to 8-bit channels can land just short of the ratio
+        step = -1 if target < other.luminance else 1
+        while luminance_contrast_ratio(adjusted.luminance, other.luminance) < min_ratio:
+            nudged = Color.from_rgb([channel + step for channel in adjusted.rgb])
+            if nudged == adjusted:
+                break
+            adjusted = nudged
+        if luminance_contrast_ratio(adjusted.luminance, other.luminance) >= min_ratio:
+            return adjusted.hex
+    return None
 
-    # WCAG contrast ratio formula
-    contrast_ratio = (lighter + 0.05) / (darker + 0.05)
 
-    return contrast_ratio
+def clear_color_cache() -> None:
+    """Drop all interned colors and memoized contrast ratios."""
+    _get_color.cache_clear()
+    _color_from_rgb.cache_clear()
+    _contrast_ratio.cache_clear()
 
 
 def validate_qr_contrast(
@@ -210,14 +348,14 @@ def get_color_distance(color1: str, color2: str) -> Optional[float]:
     Returns:
         Color distance (0-441.67), or None if colors can't be parsed
     """
-    rgb1 = parse_color(color1)
-    rgb2 = parse_color(color2)
+    first = get_color(color1)
+    second = get_color(color2)
 
-    if rgb1 is None or rgb2 is None:
+    if first is None or second is None:
         return None
 
-    r1, g1, b1 = rgb1
-    r2, g2, b2 = rgb2
+    r1, g1, b1 = first.rgb
+    r2, g2, b2 = second.rgb
 
     # Euclidean distance in RGB space
     distance = sqrt((r2 - r1) ** 2 + (g2 - g1) ** 2 + (b2 - b1) ** 2)
@@ -15,7 +15,13 @@ from ..exceptions import (
     InvalidColorFormatError,
     PaletteValidationError,
 )
-from .color_analysis import calculate_contrast_ratio, calculate_luminance, parse_color
+from .color_analysis import (
+    calculate_contrast_ratio,
+    get_color,
+    parse_color,
+    solve_color_for_contrast,
+    with_luminance,
+)
 
 
 class ColorSpace(str, Enum):
@@ -59,20 +65,16 @@ class ColorInfo:
     @classmethod
     def from_string(cls, color_str: str) -> Optional["ColorInfo"]:
         """Create ColorInfo from a color string."""
-        rgb = parse_color(color_str)
-        if rgb is None:
+        color = get_color(color_str)
+        if color is None:
             return None
 
-        luminance = calculate_luminance(rgb)
-        hex_color = f"#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}"
-        is_dark = luminance < 0.18  # More accurate threshold for dark colors
-
         return cls(
             original=color_str,
-            rgb=rgb,
-            hex=hex_color,
-            luminance=luminance,
-            is_dark=is_dark,
+            rgb=color.rgb,
+            hex=color.hex,
+            luminance=color.luminance,
+            is_dark=color.luminance < 0.18,  # More accurate threshold for dark colors
         )
 
 
@@ -293,16 +295,15 @@ def validate_palette(palette: PaletteConfig) -> PaletteValidationResult:
                 warnings.append("Primary colors do not meet optimal QR contrast (8:1)")
                 suggestions.append("Consider using higher contrast colors for better scanability")
 
-    # Build contrast matrix for all color pairs
+    # Build contrast matrix for all color pairs (the ratio is symmetric)
+    for color in all_colors:
+        contrast_matrix.setdefault(color, {})
     for i, color1 in enumerate(all_colors):
-        if color1 not in contrast_matrix:
-            contrast_matrix[color1] = {}
-
-        for j, color2 in enumerate(all_colors):
-            if i != j:
-                ratio = calculate_contrast_ratio(color1, color2)
-                if ratio is not None:
-                    contrast_matrix[color1][color2] = ratio
+        for color2 in all_colors[i + 1 :]:
+            ratio = calculate_contrast_ratio(color1, color2)
+            if ratio is not None:
+                contrast_matrix[color1][color2] = ratio
+                contrast_matrix[color2][color1] = ratio
 
     # Check for similar colors
     if not palette.allow_similar_colors:
@@ -357,7 +358,9 @@ def validate_palette(palette: PaletteConfig) -> PaletteValidationResult:
 
 
 def generate_palette_suggestions(
-    base_color: str, palette_type: PaletteType = PaletteType.COMPLEMENTARY
+    base_color: str,
+    palette_type: PaletteType = PaletteType.COMPLEMENTARY,
+    min_contrast: Optional[float] = None,
 ) -> List[str]:
     """
     Generate palette suggestions based on a base color.
@@ -365,6 +368,9 @@ def generate_palette_suggestions(
     Args:
         base_color: Base color to build palette around
         palette_type: Type of palette to generate
+        min_contrast: If set, adjust the lightness of each suggestion to reach
+            this contrast ratio against the base color, dropping suggestions
+            that cannot reach it
 
     Returns:
         List of suggested colors
@@ -417,8 +423,14 @@ def generate_palette_suggestions(
         )
 
     # Remove duplicates and invalid colors
-    valid_suggestions = []
+    valid_suggestions: List[str] = []
     for color in suggestions:
+        if min_contrast is not None:
+            adjusted = solve_color_for_contrast(color, base_color, min_contrast)
+            if adjusted is None:
+                continue
+            if (calculate_contrast_ratio(color, base_color) or 0.0) < min_contrast:
+                color = adjusted
         if parse_color(color) is not None and color not in valid_suggestions:
             valid_suggestions.append(color)
 
@@ -448,19 +460,10 @@ def get_safe_color_alternatives(
     if target_luminance is None:
         target_luminance = 0.2 if info.luminance > 0.5 else 0.8
 
-    # Generate variations with target luminance
-    r, g, b = info.rgb
-
-    # Adjust brightness while maintaining hue
-    current_luminance = info.luminance
-    if current_luminance > 0:
-        factor = target_luminance / current_luminance
-        factor = max(0.1, min(2.0, factor))  # Clamp factor
-
-        new_r = max(0, min(255, int(r * factor)))
-        new_g = max(0, min(255, int(g * factor)))
-        new_b = max(0, min(255, int(b * factor)))
-
+    # Adjust brightness while maintaining hue, solved directly for the target
+    color = get_color(problematic_color)
+    if color is not None and color.luminance > 0:
+        new_r, new_g, new_b = with_luminance(color, target_luminance).rgb
         alternatives.append(f"rgb({new_r}, {new_g}, {new_b})")
 
     # Add standard safe colors
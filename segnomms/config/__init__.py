@@ -20,6 +20,7 @@ from .enums import (
 # Import all models for backward compatibility
 from .models import (
     AdvancedQRConfig,
+    AnimationConfig,
     CenterpieceConfig,
     DebugConfig,
     FinderConfig,
@@ -60,6 +61,7 @@ __all__ = [
     "CenterpieceConfig",
     "QuietZoneConfig",
     "StyleConfig",
+    "AnimationConfig",
     "Phase1Config",
     "Phase2Config",
     "Phase3Config",
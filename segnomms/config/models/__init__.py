@@ -18,6 +18,7 @@ from .phases import Phase1Config, Phase2Config, Phase3Config
 
 # Visual styling models
 from .visual import (
+    AnimationConfig,
     CenterpieceConfig,
     FrameConfig,
     PatternStyleConfig,
@@ -39,6 +40,7 @@ __all__ = [
     "CenterpieceConfig",
     "QuietZoneConfig",
     "StyleConfig",
+    "AnimationConfig",
     # Phase models
     "Phase1Config",
     "Phase2Config",
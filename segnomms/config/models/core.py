@@ -6,7 +6,9 @@ other configuration models into a comprehensive configuration system.
 
 from __future__ import annotations
 
+import copy
 import logging
+import threading
 import warnings
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
@@ -28,6 +30,7 @@ from .advanced import AdvancedQRConfig
 from .geometry import FinderConfig, GeometryConfig
 from .phases import Phase1Config, Phase2Config, Phase3Config
 from .visual import (
+    AnimationConfig,
     CenterpieceConfig,
     FrameConfig,
     PatternStyleConfig,
@@ -38,6 +41,10 @@ from .visual import (
 # Set up logger for configuration warnings
 logger = logging.getLogger(__name__)
 
+# Generated JSON schemas per model class (the models are static)
+_SCHEMA_CACHE: Dict[type, Dict[str, Any]] = {}
+_SCHEMA_CACHE_LOCK = threading.Lock()
+
 # Deprecated option mappings for backward compatibility
 # Format: {deprecated_name: current_name}
 DEPRECATED_CENTERPIECE_OPTIONS: dict[str, str] = {
@@ -132,6 +139,7 @@ class RenderingConfig(BaseModel):
         centerpiece: Central reserve area configuration
         quiet_zone: Quiet zone styling configuration
         style: General styling and CSS configuration
+        animation: CSS animation configuration
         phase1: Phase 1 processing configuration (enhanced shapes)
         phase2: Phase 2 processing configuration (clustering)
         phase3: Phase 3 processing configuration (contours)
@@ -206,6 +214,9 @@ class RenderingConfig(BaseModel):
     style: StyleConfig = Field(
         default_factory=StyleConfig, description="General styling and CSS configuration"
     )
+    animation: AnimationConfig = Field(
+        default_factory=AnimationConfig, description="CSS animation configuration"
+    )
 
     # Processing phases
     phase1: Phase1Config = Field(
@@ -480,6 +491,8 @@ class RenderingConfig(BaseModel):
             "custom_styles": "custom_styles",
             "css_classes": "css_classes",
             "style_css_classes": "css_classes",  # Alternative parameter name
+            "runtime_assets": "runtime_assets",
+            "asset_base_url": "asset_base_url",
         }
         for kwarg_key, config_key in style_mappings.items():
             if kwarg_key in kwargs:
@@ -487,6 +500,22 @@ class RenderingConfig(BaseModel):
         if style_data:
             config_data["style"] = style_data
 
+        # Animation configuration
+        animation_data = {}
+        animation_mappings = {
+            "animation_fade_in": "fade_in",
+            "animation_fade_duration": "fade_duration",
+            "animation_stagger": "stagger",
+            "animation_stagger_delay": "stagger_delay",
+            "animation_pulse": "pulse",
+            "animation_timing": "timing",
+        }
+        for kwarg_key, config_key in animation_mappings.items():
+            if kwarg_key in kwargs:
+                animation_data[config_key] = kwargs[kwarg_key]
+        if animation_data:
+            config_data["animation"] = animation_data
+
         # Accessibility configuration
         accessibility_data = {}
 
@@ -519,6 +548,7 @@ class RenderingConfig(BaseModel):
             "accessibility_root_description": "root_description",
             "accessibility_include_module_labels": "include_module_labels",
             "accessibility_include_pattern_labels": "include_pattern_labels",
+            "accessibility_compact_mode": "compact_mode",
             "accessibility_optimize_for_screen_readers": "optimize_for_screen_readers",
             "accessibility_group_similar_elements": "group_similar_elements",
             "accessibility_add_structural_markup": "add_structural_markup",
@@ -729,6 +759,15 @@ class RenderingConfig(BaseModel):
             # Style parameters
             "interactive": self.style.interactive,
             "tooltips": self.style.tooltips,
+            "runtime_assets": self.style.runtime_assets,
+            "asset_base_url": self.style.asset_base_url,
+            # Animation parameters
+            "animation_fade_in": self.animation.fade_in,
+            "animation_fade_duration": self.animation.fade_duration,
+            "animation_stagger": self.animation.stagger,
+            "animation_stagger_delay": self.animation.stagger_delay,
+            "animation_pulse": self.animation.pulse,
+            "animation_timing": self.animation.timing,
         }
 
         # Optional values
@@ -764,6 +803,7 @@ class RenderingConfig(BaseModel):
                     "accessibility_root_description": self.accessibility.root_description,  # noqa: E501
                     "accessibility_include_module_labels": self.accessibility.include_module_labels,  # noqa: E501
                     "accessibility_include_pattern_labels": self.accessibility.include_pattern_labels,  # noqa: E501
+                    "accessibility_compact_mode": self.accessibility.compact_mode,
                     "accessibility_optimize_for_screen_readers": self.accessibility.optimize_for_screen_readers,  # noqa: E501
                     "accessibility_group_similar_elements": self.accessibility.group_similar_elements,  # noqa: E501
                     "accessibility_add_structural_markup": self.accessibility.add_structural_markup,  # noqa: E501
@@ -780,10 +820,18 @@ class RenderingConfig(BaseModel):
     def json_schema(cls) -> Dict[str, Any]:
         """Generate JSON Schema for the configuration.
 
+        The schema is generated once per class; each call returns a copy.
+
         Returns:
             JSON Schema dictionary for external tools and documentation
         """
-        return cls.model_json_schema()
+        with _SCHEMA_CACHE_LOCK:
+            schema = _SCHEMA_CACHE.get(cls)
+        if schema is None:
+            schema = cls.model_json_schema()
+            with _SCHEMA_CACHE_LOCK:
+                _SCHEMA_CACHE[cls] = schema
+        return copy.deepcopy(schema)
 
     def to_json(self) -> str:
         """Serialize configuration to JSON string.
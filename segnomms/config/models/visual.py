@@ -270,6 +270,8 @@ class StyleConfig(BaseModel):
         interactive: Enable interactive hover effects
         tooltips: Show tooltips on module hover
         css_classes: Custom CSS classes for different QR elements
+        runtime_assets: How the shared stylesheet and script are delivered
+        asset_base_url: URL prefix for external runtime assets
     """
 
     model_config = ConfigDict(validate_default=True, extra="forbid")
@@ -279,6 +281,12 @@ class StyleConfig(BaseModel):
     css_classes: Optional[Dict[str, str]] = Field(
         default=None, description="Custom CSS classes for different QR elements"
     )
+    runtime_assets: Literal["inline", "external", "shared"] = Field(
+        default="inline",
+        description="Inline the runtime CSS/JS, reference versioned external files, "
+        "or omit them in favor of a block emitted once per page",
+    )
+    asset_base_url: str = Field(default="", description="URL prefix for external runtime assets")
 
     @field_validator("css_classes")
     @classmethod
@@ -317,3 +325,47 @@ class StyleConfig(BaseModel):
                 if key not in valid_keys:
                     raise ValueError(f"Invalid CSS class key '{key}'. Valid keys: {', '.join(valid_keys)}")
         return v
+
+
+class AnimationConfig(BaseModel):
+    """CSS animation configuration.
+
+    Animations are driven entirely by stylesheet rules; modules carry no
+    per-element animation data. Staggering is quantized into row bands
+    and expressed as ``nth-child`` rules per pattern group.
+
+    Attributes:
+        fade_in: Fade modules in when the SVG is displayed
+        fade_duration: Fade duration in seconds
+        stagger: Stagger the fade-in from top to bottom
+        stagger_delay: Delay added per module row in seconds
+        pulse: Pulse halos behind the finder patterns
+        timing: CSS timing function for animations
+    """
+
+    model_config = ConfigDict(validate_default=True, extra="forbid")
+
+    fade_in: bool = Field(default=False, description="Fade modules in when the SVG is displayed")
+    fade_duration: float = Field(default=0.5, ge=0.1, le=5.0, description="Fade duration in seconds")
+    stagger: bool = Field(default=False, description="Stagger the fade-in from top to bottom")
+    stagger_delay: float = Field(
+        default=0.02, ge=0.01, le=0.5, description="Delay added per module row in seconds"
+    )
+    pulse: bool = Field(default=False, description="Pulse halos behind the finder patterns")
+    timing: str = Field(default="ease", description="CSS timing function for animations")
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any animation is requested."""
+        return self.fade_in or self.pulse
+
+    def to_style_config(self) -> Dict[str, Any]:
+        """Convert to the flat dict consumed by the SVG style generator."""
+        return {
+            "animation_fade_in": self.fade_in,
+            "animation_fade_duration": self.fade_duration,
+            "animation_stagger": self.stagger,
+            "animation_stagger_delay": self.stagger_delay,
+            "animation_pulse": self.pulse,
+            "animation_timing": self.timing,
+        }
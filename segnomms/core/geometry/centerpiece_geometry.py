@@ -4,7 +4,8 @@ This module provides pure mathematical functions for calculating centerpiece
 bounds, placement offsets, containment checks, and safe reserve sizes.
 """
 
-from typing import List, Tuple
+import math
+from typing import Any, List, Tuple
 
 from ...config import CenterpieceConfig
 
@@ -146,6 +147,73 @@ class CenterpieceGeometry:
         # Safety fallback for unknown shapes
         return False  # type: ignore[unreachable]
 
+    def cache_key(self, config: CenterpieceConfig) -> Tuple[Any, ...]:
+        """Key identifying the centerpiece area of a configuration.
+
+        Two configurations with the same key cover exactly the same modules,
+        so results derived from the area can be cached under it.
+
+        Args:
+            config: CenterpieceConfig instance
+
+        Returns:
+            Hashable tuple of the matrix size and the geometric settings
+        """
+        return (
+            self.size,
+            config.shape,
+            config.size,
+            config.offset_x,
+            config.offset_y,
+            config.margin,
+            getattr(config, "placement", None),
+        )
+
+    def get_centerpiece_mask(self, config: CenterpieceConfig) -> Tuple[int, int, List[List[bool]]]:
+        """Calculate centerpiece membership for a whole bounding box at once.
+
+        The result agrees with :meth:`is_in_centerpiece` for every module;
+        modules outside the returned box are never in the centerpiece.
+
+        Args:
+            config: CenterpieceConfig instance
+
+        Returns:
+            Tuple of (row0, col0, mask) where ``mask[i][j]`` tells whether
+            module ``(row0 + i, col0 + j)`` is in the centerpiece
+        """
+        if config.shape == "rect":
+            x1, y1, x2, y2 = self.get_centerpiece_bounds(config)
+            if x2 <= x1 or y2 <= y1:
+                return 0, 0, []
+            return y1, x1, [[True] * (x2 - x1) for _ in range(y2 - y1)]
+
+        offset_x, offset_y = self.calculate_placement_offsets(config)
+        center_x = self.size / 2 + (offset_x * self.size)
+        center_y = self.size / 2 + (offset_y * self.size)
+        radius = config.size * self.size / 2 + config.margin
+        if radius <= 0 or config.shape not in ("circle", "squircle"):
+            return 0, 0, []
+
+        row0 = max(0, math.floor(center_y - radius))
+        row1 = min(self.size - 1, math.ceil(center_y + radius))
+        col0 = max(0, math.floor(center_x - radius))
+        col1 = min(self.size - 1, math.ceil(center_x + radius))
+        if row1 < row0 or col1 < col0:
+            return 0, 0, []
+
+        cols = range(col0, col1 + 1)
+        mask = []
+        for row in range(row0, row1 + 1):
+            # Same expressions as is_in_centerpiece, so rounding agrees exactly
+            if config.shape == "circle":
+                dy2 = (row - center_y) ** 2
+                mask.append([float(((col - center_x) ** 2 + dy2) ** 0.5) <= radius for col in cols])
+            else:
+                dy4 = (abs(row - center_y) / radius) ** 4
+                mask.append([(abs(col - center_x) / radius) ** 4 + dy4 <= 1 for col in cols])
+        return row0, col0, mask
+
     def is_edge_module(self, row: int, col: int, config: CenterpieceConfig) -> bool:
         """Check if a module is on the edge of the centerpiece area.
 
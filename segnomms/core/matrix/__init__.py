@@ -8,6 +8,7 @@ from .imprint_processor import ImprintProcessor
 from .knockout_processor import KnockoutProcessor
 from .manipulator import MatrixManipulator
 from .matrix_validator import MatrixValidator
+from .overlay import OverlayMatrix
 from .performance_monitor import CenterpiecePerformanceMonitor
 
 __all__ = [
@@ -15,5 +16,6 @@ __all__ = [
     "ImprintProcessor",
     "MatrixManipulator",
     "MatrixValidator",
+    "OverlayMatrix",
     "CenterpiecePerformanceMonitor",
 ]
@@ -0,0 +1,63 @@
+"""Bounded LRU cache shared by the centerpiece processors.
+
+Centerpiece masks and statistics only depend on the QR version and the
+centerpiece configuration, so they are computed once and shared across
+renders and threads. Cached values must be immutable.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class BoundedCache(Generic[T]):
+    """Thread-safe least-recently-used cache with a fixed capacity.
+
+    Values are built outside the lock, so two threads missing the same key
+    may both build it; the last one stored wins.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries; the least recently used
+                entries are evicted beyond this
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, T]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key: Hashable, build: Callable[[], T]) -> T:
+        """Get the entry for a key, building and storing it on a miss.
+
+        Args:
+            key: Cache key
+            build: Computes the value when the key is not cached
+
+        Returns:
+            The cached or newly built value
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        value = build()
+
+        with self._lock:
+            self._entries[key] = value
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -3,18 +3,90 @@
 This module handles imprint mode processing where QR modules are preserved
 for scanability but receive special visual treatment for rendering underneath
 centerpiece overlays.
+
+The treatment only depends on a module's distance from the centerpiece
+center, so it is expressed as a cached distance field quantized into a few
+treatment buckets. The renderer applies one shared CSS class per bucket
+instead of per-module attributes.
 """
 
 import logging
-from typing import Any, Dict, List
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
 
 from ...config import CenterpieceConfig
 from ..detector import ModuleDetector
 from ..geometry import CenterpieceGeometry
 from ..performance import measure_imprint_rendering
+from .cache import BoundedCache
+from .overlay import OverlayMatrix
 
 logger = logging.getLogger(__name__)
 
+# Number of quantized treatment levels between the centerpiece center and edge
+IMPRINT_BUCKETS = 4
+
+# Maximum number of cached imprint fields
+FIELD_CACHE_SIZE = 128
+
+
+@dataclass(frozen=True)
+class ImprintTreatment:
+    """Visual treatment shared by all imprinted modules in one bucket.
+
+    Attributes:
+        bucket: Bucket index, 0 at the centerpiece center
+        opacity: Module opacity
+        size_ratio: Module size multiplier
+        blur_radius: Blur radius in modules
+        color_shift: Distance-based color adjustment parameters
+        distance_from_center: Representative normalized distance of the bucket
+    """
+
+    bucket: int
+    opacity: float
+    size_ratio: float
+    blur_radius: float
+    color_shift: Dict[str, float]
+    distance_from_center: float
+
+    @property
+    def css_class(self) -> str:
+        """CSS class applied to the modules of this bucket."""
+        return f"qr-imprint-{self.bucket}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the visual treatment dictionary used in metadata."""
+        return {
+            "bucket": self.bucket,
+            "css_class": self.css_class,
+            "opacity": self.opacity,
+            "size_ratio": self.size_ratio,
+            "color_shift": dict(self.color_shift),
+            "blur_radius": self.blur_radius,
+            "distance_from_center": self.distance_from_center,
+        }
+
+
+@dataclass(frozen=True)
+class ImprintField:
+    """Quantized distance field of the imprint area for one version and configuration.
+
+    Attributes:
+        in_centerpiece: Number of modules inside the centerpiece shape
+        protected: Number of function pattern modules left untreated
+        buckets: Treatment bucket of every imprintable position, in row-major order
+        treatments: Treatment of each bucket, indexed by bucket
+    """
+
+    in_centerpiece: int
+    protected: int
+    buckets: Tuple[Tuple[int, int, int], ...]
+    treatments: Tuple[ImprintTreatment, ...]
+
+
+_FIELD_CACHE: BoundedCache[ImprintField] = BoundedCache(FIELD_CACHE_SIZE)
+
 
 class ImprintProcessor:
     """Handles imprint mode processing and visual treatment calculations.
@@ -71,83 +143,127 @@ class ImprintProcessor:
         Returns:
             Original matrix (modules preserved for scanability)
         """
-        # Create a deep copy of the matrix (preserving scanability)
-        preserved_matrix = [row[:] for row in self.matrix]
+        # Return an unchanged copy of the matrix for full scanability
+        return self.get_imprint_overlay(config).to_list()
+
+    def get_imprint_overlay(self, config: CenterpieceConfig) -> OverlayMatrix:
+        """Apply imprint mode as an overlay on the unmodified matrix.
+
+        No module changes value; imprinted modules are marked with their
+        treatment bucket. Also stores the imprint metadata.
+
+        Args:
+            config: CenterpieceConfig instance
+
+        Returns:
+            Overlay marking the imprinted modules
+        """
+        overlay = OverlayMatrix(self.matrix)
+        field = self.get_imprint_field(config)
 
         # Track imprint statistics
         stats = {
-            "total_checked": 0,
-            "in_centerpiece": 0,
-            "function_patterns_preserved": 0,
+            "total_checked": self.size * self.size,
+            "in_centerpiece": field.in_centerpiece,
+            "function_patterns_preserved": field.protected,
             "data_modules_imprinted": 0,
-            "protected_modules": 0,
+            "protected_modules": field.protected,
         }
 
-        # Collect modules for visual imprinting without modifying the matrix
-        imprinted_modules = self._collect_imprinted_modules(config, stats)
+        # Collect dark modules for visual imprinting without modifying the matrix
+        imprinted_modules = []
+        for row, col, bucket in field.buckets:
+            if self.matrix[row][col]:
+                overlay.mark(row, col, bucket)
+                imprinted_modules.append(
+                    {
+                        "row": row,
+                        "col": col,
+                        "type": self.detector.get_module_type(row, col),
+                        "original_state": True,  # Was dark
+                        "bucket": bucket,
+                    }
+                )
+        stats["data_modules_imprinted"] = len(overlay.marks)
 
         # Store comprehensive imprint metadata for rendering system
-        self._store_imprint_metadata(imprinted_modules, stats, config)
+        self._store_imprint_metadata(imprinted_modules, stats, config, field.treatments)
 
         # Log results and warnings
         self._log_imprint_results(stats)
 
-        # Return original matrix unchanged for full scanability
-        return preserved_matrix
+        return overlay
 
-    def _collect_imprinted_modules(
-        self, config: CenterpieceConfig, stats: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
-        """Collect modules that need visual imprinting treatment.
+    def get_imprint_field(self, config: CenterpieceConfig) -> ImprintField:
+        """Get the quantized imprint distance field for a configuration (cached).
 
         Args:
             config: CenterpieceConfig instance
-            stats: Statistics tracking dictionary
 
         Returns:
-            List of imprinted module information dictionaries
+            Treatment bucket of every imprintable module and the bucket treatments
         """
-        imprinted_modules = []
+        key = (type(self.detector), self.detector.get_version(), self.geometry.cache_key(config))
+        return _FIELD_CACHE.get_or_build(key, lambda: self._build_imprint_field(config))
 
-        for row in range(self.size):
-            for col in range(self.size):
-                stats["total_checked"] += 1
-
-                if self.geometry.is_in_centerpiece(row, col, config):
-                    stats["in_centerpiece"] += 1
-                    module_type = self.detector.get_module_type(row, col)
-
-                    # Check if this is a protected pattern
-                    if module_type in self._protected_patterns:
-                        stats["function_patterns_preserved"] += 1
-                        stats["protected_modules"] += 1
-                        continue
-
-                    # Only track dark modules for imprinting
-                    # (preserve light modules as-is)
-                    if self.matrix[row][col]:  # Dark module
-                        stats["data_modules_imprinted"] += 1
-
-                        # Store module information for rendering system
-                        imprinted_modules.append(
-                            {
-                                "row": row,
-                                "col": col,
-                                "type": module_type,
-                                "original_state": True,  # Was dark
-                                "visual_treatment": self._get_imprint_visual_treatment(
-                                    row, col, config, module_type
-                                ),
-                            }
-                        )
-
-        return imprinted_modules
+    def _build_imprint_field(self, config: CenterpieceConfig) -> ImprintField:
+        """Compute the normalized distance of every imprintable module and bucket it.
+
+        Distances use the same center and radius as
+        :meth:`_get_imprint_visual_treatment`; each bucket is treated as if
+        all its modules were at the bucket's mid distance.
+        """
+        row0, col0, inside = self.geometry.get_centerpiece_mask(config)
+        offset_x, offset_y = self.geometry.calculate_placement_offsets(config)
+        center_x = self.size / 2 + (offset_x * self.size)
+        center_y = self.size / 2 + (offset_y * self.size)
+        max_radius = config.size * self.size / 2
+
+        in_count = protected = 0
+        buckets: List[Tuple[int, int, int]] = []
+        for i, mask_row in enumerate(inside):
+            row = row0 + i
+            for j, member in enumerate(mask_row):
+                if not member:
+                    continue
+                col = col0 + j
+                in_count += 1
+                if self.detector.get_module_type(row, col) in self._protected_patterns:
+                    protected += 1
+                    continue
+
+                distance = ((col - center_x) ** 2 + (row - center_y) ** 2) ** 0.5
+                normalized = min(distance / max_radius, 1.0) if max_radius > 0 else 0.0
+                buckets.append((row, col, min(int(normalized * IMPRINT_BUCKETS), IMPRINT_BUCKETS - 1)))
+
+        treatments = tuple(self._get_bucket_treatment(bucket) for bucket in range(IMPRINT_BUCKETS))
+        return ImprintField(in_count, protected, tuple(buckets), treatments)
+
+    def _get_bucket_treatment(self, bucket: int) -> ImprintTreatment:
+        """Calculate the shared visual treatment of a distance bucket.
+
+        Args:
+            bucket: Bucket index
+
+        Returns:
+            Treatment evaluated at the bucket's mid distance
+        """
+        normalized_distance = (bucket + 0.5) / IMPRINT_BUCKETS
+        return ImprintTreatment(
+            bucket=bucket,
+            opacity=round(min(0.3 + normalized_distance * 0.4, 1.0), 3),
+            size_ratio=1.0,
+            blur_radius=round(max(0, (1.0 - normalized_distance) * 0.5), 3),
+            color_shift=self._calculate_color_shift_for_distance(normalized_distance),
+            distance_from_center=normalized_distance,
+        )
 
     def _store_imprint_metadata(
         self,
         imprinted_modules: List[Dict[str, Any]],
         stats: Dict[str, Any],
         config: CenterpieceConfig,
+        treatments: Optional[Tuple[ImprintTreatment, ...]] = None,
     ) -> None:
         """Store imprint metadata for later use by rendering system.
 
@@ -155,9 +271,16 @@ class ImprintProcessor:
             imprinted_modules: List of modules needing visual treatment
             stats: Processing statistics
             config: CenterpieceConfig instance
+            treatments: Shared treatment of each bucket
         """
+        buckets = [treatment.to_dict() for treatment in treatments or ()]
+        for module in imprinted_modules:
+            if "bucket" in module and module["bucket"] < len(buckets):
+                module["visual_treatment"] = buckets[module["bucket"]]
+
         self._imprint_metadata = {
             "imprinted_modules": imprinted_modules,
+            "imprint_buckets": buckets,
             "statistics": stats,
             "centerpiece_bounds": self.geometry.get_centerpiece_bounds(config),
             "preserve_scanability": True,
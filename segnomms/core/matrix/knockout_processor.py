@@ -5,15 +5,41 @@ refinement and statistical tracking for optimal scanability preservation.
 """
 
 import logging
+from dataclasses import dataclass
 from typing import Any, Dict, List, Tuple
 
 from ...config import CenterpieceConfig
 from ..detector import ModuleDetector
 from ..geometry import CenterpieceGeometry
 from ..performance import measure_centerpiece_operation
+from .cache import BoundedCache
+from .overlay import OverlayMatrix
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of cached knockout masks
+MASK_CACHE_SIZE = 128
+
+
+@dataclass(frozen=True)
+class KnockoutMask:
+    """Modules cleared by knockout mode for one version and configuration.
+
+    Attributes:
+        in_centerpiece: Number of modules inside the centerpiece shape
+        protected: Number of function pattern modules that are preserved
+        interior: Positions cleared inside the centerpiece
+        edges: Edge positions cleared after edge refinement
+    """
+
+    in_centerpiece: int
+    protected: int
+    interior: Tuple[Tuple[int, int], ...]
+    edges: Tuple[Tuple[int, int], ...]
+
+
+_MASK_CACHE: BoundedCache[KnockoutMask] = BoundedCache(MASK_CACHE_SIZE)
+
 
 class KnockoutProcessor:
     """Handles knockout mode centerpiece clearing operations.
@@ -57,8 +83,9 @@ class KnockoutProcessor:
     def apply_knockout_mode(self, config: CenterpieceConfig) -> List[List[bool]]:
         """Apply knockout mode - clear modules completely from reserve area.
 
-        This implementation provides enhanced edge handling and statistical tracking
-        for better centerpiece clearing with optimal scanability preservation.
+        The modules to clear are taken from a cached :class:`KnockoutMask`,
+        so repeated symbols of the same version and centerpiece configuration
+        only pay for applying the mask.
 
         Args:
             config: CenterpieceConfig instance
@@ -66,106 +93,116 @@ class KnockoutProcessor:
         Returns:
             Modified matrix with centerpiece area cleared
         """
-        # Create a deep copy of the matrix
-        modified = [row[:] for row in self.matrix]
-
-        # Track clearing statistics
-        stats = {
-            "total_checked": 0,
-            "in_centerpiece": 0,
-            "function_patterns_preserved": 0,
-            "data_modules_cleared": 0,
-            "edge_modules_refined": 0,
-        }
-
-        # First pass: identify all modules in centerpiece area
-        centerpiece_modules, edge_modules = self._collect_centerpiece_modules(config, stats)
-
-        # Second pass: clear modules with edge refinement
-        modified = self._clear_modules_with_refinement(
-            modified, centerpiece_modules, edge_modules, config, stats
-        )
-
-        # Log statistics and performance warnings
-        self._log_clearing_results(stats)
+        return self.get_knockout_overlay(config).to_list()
 
-        return modified
+    def get_knockout_overlay(self, config: CenterpieceConfig) -> OverlayMatrix:
+        """Apply knockout mode as an overlay on the unmodified matrix.
 
-    def _collect_centerpiece_modules(
-        self, config: CenterpieceConfig, stats: Dict[str, Any]
-    ) -> Tuple[List[Tuple[int, int, str]], List[Tuple[int, int, str]]]:
-        """Collect centerpiece and edge modules for processing.
+        Only the cleared modules are recorded, so the statistics of the
+        change are available without copying the matrix.
 
         Args:
             config: CenterpieceConfig instance
-            stats: Statistics tracking dictionary
 
         Returns:
-            Tuple of (centerpiece_modules, edge_modules) lists
+            Overlay with the centerpiece area cleared
         """
-        centerpiece_modules = []
-        edge_modules = []
-
-        for row in range(self.size):
-            for col in range(self.size):
-                stats["total_checked"] += 1
-
-                if self.geometry.is_in_centerpiece(row, col, config):
-                    stats["in_centerpiece"] += 1
-                    module_type = self.detector.get_module_type(row, col)
+        overlay = OverlayMatrix(self.matrix)
+        mask = self.get_knockout_mask(config)
 
-                    # Check if this is a protected pattern
-                    if module_type in self._protected_patterns:
-                        stats["function_patterns_preserved"] += 1
-                        continue
+        # Track clearing statistics
+        stats = {
+            "total_checked": self.size * self.size,
+            "in_centerpiece": mask.in_centerpiece,
+            "function_patterns_preserved": mask.protected,
+            "data_modules_cleared": 0,
+            "edge_modules_refined": 0,
+        }
 
-                    # Check if this is an edge module (for refinement)
-                    is_edge = self.geometry.is_edge_module(row, col, config)
+        for row, col in mask.interior:
+            overlay.clear(row, col)
+        edges_cleared = sum(1 for row, col in mask.edges if overlay.clear(row, col))
+        stats["data_modules_cleared"] = overlay.cleared_count
+        stats["edge_modules_refined"] = edges_cleared
 
-                    if is_edge:
-                        edge_modules.append((row, col, module_type))
-                    else:
-                        centerpiece_modules.append((row, col, module_type))
+        # Log statistics and performance warnings
+        self._log_clearing_results(stats)
 
-        return centerpiece_modules, edge_modules
+        return overlay
 
-    def _clear_modules_with_refinement(
-        self,
-        modified: List[List[bool]],
-        centerpiece_modules: List[Tuple[int, int, str]],
-        edge_modules: List[Tuple[int, int, str]],
-        config: CenterpieceConfig,
-        stats: Dict[str, Any],
-    ) -> List[List[bool]]:
-        """Clear centerpiece modules with edge refinement.
+    def get_knockout_mask(self, config: CenterpieceConfig) -> "KnockoutMask":
+        """Get the clearing mask for a configuration (cached).
 
         Args:
-            modified: Matrix to modify
-            centerpiece_modules: List of centerpiece modules to clear
-            edge_modules: List of edge modules to process
             config: CenterpieceConfig instance
-            stats: Statistics tracking dictionary
 
         Returns:
-            Modified matrix with cleared modules
+            Positions to clear and centerpiece statistics
         """
-        # Clear all centerpiece modules (non-edge)
-        for row, col, module_type in centerpiece_modules:
-            if modified[row][col]:  # Only count if it was dark
-                stats["data_modules_cleared"] += 1
-            modified[row][col] = False
-
-        # Edge refinement: apply smart edge handling for smoother boundaries
-        for row, col, module_type in edge_modules:
-            should_clear = self.geometry.should_clear_edge_module(row, col, config, modified)
+        key = (
+            type(self.detector),
+            self.detector.get_version(),
+            self.geometry.cache_key(config),
+            getattr(config, "edge_refinement", None),
+        )
+        return _MASK_CACHE.get_or_build(key, lambda: self._build_knockout_mask(config))
 
-            if should_clear:
-                if modified[row][col]:  # Only count if it was dark
-                    stats["data_modules_cleared"] += 1
-                    stats["edge_modules_refined"] += 1
-                modified[row][col] = False
+    def _build_knockout_mask(self, config: CenterpieceConfig) -> "KnockoutMask":
+        """Compute the clearing mask within the centerpiece bounding box.
 
-        return modified
+        Combines the centerpiece shape (with placement offsets and margin),
+        function pattern protection and edge refinement. Edge refinement
+        only depends on the geometry, so the result is independent of the
+        matrix contents.
+        """
+        row0, col0, inside = self.geometry.get_centerpiece_mask(config)
+        size = self.size
+        refinement = getattr(config, "edge_refinement", None) or None
+
+        def in_centerpiece(row: int, col: int) -> bool:
+            i, j = row - row0, col - col0
+            return 0 <= i < len(inside) and 0 <= j < len(inside[i]) and inside[i][j]
+
+        in_count = protected = 0
+        interior: List[Tuple[int, int]] = []
+        edges: List[Tuple[int, int]] = []
+
+        for i, mask_row in enumerate(inside):
+            row = row0 + i
+            for j, member in enumerate(mask_row):
+                if not member:
+                    continue
+                col = col0 + j
+                in_count += 1
+
+                if self.detector.get_module_type(row, col) in self._protected_patterns:
+                    protected += 1
+                    continue
+
+                neighbors = [
+                    (row + dr, col + dc)
+                    for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+                    if 0 <= row + dr < size and 0 <= col + dc < size
+                ]
+                inside_neighbors = sum(1 for position in neighbors if in_centerpiece(*position))
+                if inside_neighbors == len(neighbors):
+                    interior.append((row, col))
+                    continue
+
+                # Edge refinement (see CenterpieceGeometry.should_clear_edge_module)
+                if refinement is None or refinement not in ("preserve_data", "smooth_edges"):
+                    clear = refinement is None or not self.geometry._is_critical_pattern_module(row, col, [])
+                elif self.geometry._is_critical_pattern_module(row, col, []):
+                    clear = False
+                elif refinement == "smooth_edges":
+                    clear = inside_neighbors < len(neighbors) / 2
+                else:
+                    # "preserve_data" only clears modules that are already light
+                    clear = False
+                if clear:
+                    edges.append((row, col))
+
+        return KnockoutMask(in_count, protected, tuple(interior), tuple(edges))
 
     def _log_clearing_results(self, stats: Dict[str, Any]) -> None:
         """Log clearing statistics and performance warnings.
@@ -191,24 +228,11 @@ class KnockoutProcessor:
         Returns:
             Dictionary with clearing statistics
         """
-        stats = {
-            "total_checked": 0,
-            "in_centerpiece": 0,
-            "function_patterns_preserved": 0,
-            "data_modules_would_clear": 0,
-            "edge_modules_would_refine": 0,
+        mask = self.get_knockout_mask(config)
+        return {
+            "total_checked": self.size * self.size,
+            "in_centerpiece": mask.in_centerpiece,
+            "function_patterns_preserved": mask.protected,
+            "data_modules_would_clear": sum(1 for row, col in mask.interior if self.matrix[row][col]),
+            "edge_modules_would_refine": sum(1 for row, col in mask.edges if self.matrix[row][col]),
         }
-
-        centerpiece_modules, edge_modules = self._collect_centerpiece_modules(config, stats)
-
-        # Count what would be cleared
-        for row, col, module_type in centerpiece_modules:
-            if self.matrix[row][col]:  # Only count if it's currently dark
-                stats["data_modules_would_clear"] += 1
-
-        for row, col, module_type in edge_modules:
-            if self.geometry.should_clear_edge_module(row, col, config, self.matrix):
-                if self.matrix[row][col]:  # Only count if it's currently dark
-                    stats["data_modules_would_refine"] += 1
-
-        return stats
@@ -6,6 +6,7 @@ maintaining backward compatibility with the existing API.
 """
 
 import logging
+from functools import cached_property, lru_cache
 from typing import Any, Dict, List, Tuple
 
 from ...config.models.visual import CenterpieceConfig
@@ -14,11 +15,18 @@ from ..geometry import CenterpieceGeometry
 from .imprint_processor import ImprintProcessor
 from .knockout_processor import KnockoutProcessor
 from .matrix_validator import MatrixValidator, PatternAnalysis, ScanabilityAssessment
+from .overlay import MatrixLike, OverlayMatrix
 from .performance_monitor import CenterpiecePerformanceMonitor
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _get_geometry(size: int) -> CenterpieceGeometry:
+    """Get the shared geometry calculator for a matrix size."""
+    return CenterpieceGeometry(size)
+
+
 class MatrixManipulator:
     """Handles matrix modifications for centerpiece reserve using composition.
 
@@ -74,12 +82,29 @@ class MatrixManipulator:
         self.detector = detector
         self.size = len(matrix)
 
-        # Initialize specialized components
-        self.geometry = CenterpieceGeometry(self.size)
-        self.knockout_processor = KnockoutProcessor(matrix, detector, self.geometry)
-        self.imprint_processor = ImprintProcessor(matrix, detector, self.geometry)
-        self.validator = MatrixValidator(matrix, detector, self.geometry)
-        self.performance_monitor = CenterpiecePerformanceMonitor(matrix_size=self.size)
+        # Geometry only depends on the size and is shared; the other
+        # components are created on first use and then reused
+        self.geometry = _get_geometry(self.size)
+
+    @cached_property
+    def knockout_processor(self) -> KnockoutProcessor:
+        """Knockout mode processor."""
+        return KnockoutProcessor(self.matrix, self.detector, self.geometry)
+
+    @cached_property
+    def imprint_processor(self) -> ImprintProcessor:
+        """Imprint mode processor."""
+        return ImprintProcessor(self.matrix, self.detector, self.geometry)
+
+    @cached_property
+    def validator(self) -> MatrixValidator:
+        """Matrix validator."""
+        return MatrixValidator(self.matrix, self.detector, self.geometry)
+
+    @cached_property
+    def performance_monitor(self) -> CenterpiecePerformanceMonitor:
+        """Centerpiece performance monitor."""
+        return CenterpiecePerformanceMonitor(matrix_size=self.size)
 
     # Geometry delegation methods (maintain original API)
 
@@ -263,6 +288,25 @@ class MatrixManipulator:
             logger.error(f"Error during imprint processing: {e}")
             raise
 
+    def get_centerpiece_overlay(self, config: CenterpieceConfig) -> OverlayMatrix:
+        """Process the centerpiece area as an overlay on the unmodified matrix.
+
+        Unlike :meth:`clear_centerpiece_area`, no matrix is copied: the
+        overlay records only the cleared (knockout) or marked (imprint)
+        modules and can be passed to the validation methods directly.
+
+        Args:
+            config: CenterpieceConfig instance
+
+        Returns:
+            Overlay with the centerpiece area processed
+        """
+        from ...config import ReserveMode
+
+        if hasattr(config, "mode") and config.mode == ReserveMode.IMPRINT:
+            return self.imprint_processor.get_imprint_overlay(config)
+        return self.knockout_processor.get_knockout_overlay(config)
+
     # Validation methods
 
     def validate_reserve_impact(self, config: CenterpieceConfig, error_level: str) -> Dict[str, Any]:
@@ -305,14 +349,15 @@ class MatrixManipulator:
     def _validate_reserve_impact_matrices(
         self,
         original_matrix: List[List[bool]],
-        modified_matrix: List[List[bool]],
+        modified_matrix: MatrixLike,
         error_level: str,
     ) -> Tuple[bool, str]:
         """Validate that reserve doesn't compromise QR functionality.
 
         Args:
             original_matrix: Original unmodified matrix
-            modified_matrix: Matrix with centerpiece cleared
+            modified_matrix: Matrix with centerpiece cleared, or an overlay on
+                ``original_matrix``
             error_level: Error correction level
 
         Returns:
@@ -357,7 +402,7 @@ class MatrixManipulator:
         return self.validator.analyze_pattern_preservation(config)
 
     def get_scanability_assessment(
-        self, config: CenterpieceConfig, modified_matrix: List[List[bool]]
+        self, config: CenterpieceConfig, modified_matrix: MatrixLike
     ) -> ScanabilityAssessment:
         """Provide comprehensive scanability assessment for the modified matrix.
 
@@ -426,6 +471,7 @@ class MatrixManipulator:
                         "imprinted_modules": imprint_metadata.get("imprinted_modules", []),
                         "preserve_scanability": True,
                         "visual_effects": imprint_metadata.get("visual_effects", {}),
+                        "imprint_buckets": imprint_metadata.get("imprint_buckets", []),
                         "imprint_treatments": [
                             {
                                 "x": module["col"],
@@ -433,6 +479,7 @@ class MatrixManipulator:
                                 "opacity": module.get("visual_treatment", {}).get("opacity", 0.7),
                                 "size_ratio": module.get("visual_treatment", {}).get("size_ratio", 1.0),
                                 "type": module.get("type", "data"),
+                                "bucket": module.get("bucket"),
                             }
                             for module in imprint_metadata.get("imprinted_modules", [])
                         ],
@@ -482,26 +529,26 @@ class MatrixManipulator:
         else:
             # Knockout mode - add cleared modules information
             cleared_modules = []
-            for row in range(self.size):
-                for col in range(self.size):
-                    if self.geometry.is_in_centerpiece(row, col, config):
-                        if self.matrix[row][col]:  # Only dark modules that would be cleared
-                            module_type = (
-                                self.detector.get_module_type(row, col) if self.detector else "unknown"
-                            )
-                            # Skip function patterns (they are preserved)
-                            protected_patterns = {
-                                "finder",
-                                "finder_inner",
-                                "timing",
-                                "alignment",
-                                "format",
-                                "version",
-                                "dark",
-                                "separator",
-                            }
-                            if module_type not in protected_patterns:
-                                cleared_modules.append({"row": row, "col": col, "type": module_type})
+            protected_patterns = {
+                "finder",
+                "finder_inner",
+                "timing",
+                "alignment",
+                "format",
+                "version",
+                "dark",
+                "separator",
+            }
+            row0, col0, mask = self.geometry.get_centerpiece_mask(config)
+            for i, mask_row in enumerate(mask):
+                row = row0 + i
+                for j, member in enumerate(mask_row):
+                    col = col0 + j
+                    if member and self.matrix[row][col]:  # Only dark modules that would be cleared
+                        module_type = self.detector.get_module_type(row, col) if self.detector else "unknown"
+                        # Skip function patterns (they are preserved)
+                        if module_type not in protected_patterns:
+                            cleared_modules.append({"row": row, "col": col, "type": module_type})
 
             metadata.update({"cleared_modules": cleared_modules, "preserve_scanability": False})
 
@@ -5,10 +5,13 @@ QR code functionality while providing detailed feedback about validation results
 """
 
 import logging
-from typing import Any, List, Tuple, TypedDict
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple, TypedDict
 
 from ..detector import ModuleDetector
 from ..geometry import CenterpieceGeometry
+from .cache import BoundedCache
+from .overlay import MatrixLike, OverlayMatrix
 
 
 class PatternStats(TypedDict):
@@ -54,6 +57,36 @@ class ScanabilityAssessment(TypedDict):
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of cached region statistics
+REGION_CACHE_SIZE = 128
+
+
+@dataclass(frozen=True)
+class RegionStatistics:
+    """Overlap of a centerpiece with the QR code regions.
+
+    Computed in one pass over the centerpiece area and the module types,
+    and shared by all analyses of the same version and configuration.
+
+    Attributes:
+        in_centerpiece: Number of modules inside the centerpiece shape
+        affected_finders: Origins of the finder patterns the centerpiece overlaps
+        horizontal_timing_affected: Whether the centerpiece covers part of row 6
+        vertical_timing_affected: Whether the centerpiece covers part of column 6
+        estimated_area: Area of the centerpiece bounding box in modules
+        conflicts_with_finders: Whether the bounding box overlaps a finder pattern
+    """
+
+    in_centerpiece: int
+    affected_finders: Tuple[Tuple[int, int], ...]
+    horizontal_timing_affected: bool
+    vertical_timing_affected: bool
+    estimated_area: int
+    conflicts_with_finders: bool
+
+
+_REGION_CACHE: BoundedCache[RegionStatistics] = BoundedCache(REGION_CACHE_SIZE)
+
 
 class MatrixValidator:
     """Validates matrix modifications for QR code functionality preservation.
@@ -87,31 +120,45 @@ class MatrixValidator:
         self.detector = detector
         self.geometry = geometry
         self.size = len(matrix)
+        self._dark_modules: Optional[int] = None
+
+    def _count_dark_modules(self, matrix: MatrixLike) -> int:
+        """Count dark modules, remembering the count for the validator's own matrix."""
+        if matrix is not self.matrix:
+            return sum(sum(row) for row in matrix)
+        if self._dark_modules is None:
+            self._dark_modules = sum(sum(row) for row in matrix)
+        return self._dark_modules
 
     def validate_reserve_impact(
         self,
         original_matrix: List[List[bool]],
-        modified_matrix: List[List[bool]],
+        modified_matrix: MatrixLike,
         error_level: str,
     ) -> Tuple[bool, str]:
         """Validate that reserve doesn't compromise QR functionality.
 
         Args:
             original_matrix: Original unmodified matrix
-            modified_matrix: Matrix with centerpiece cleared
+            modified_matrix: Matrix with centerpiece cleared, or an overlay on
+                ``original_matrix`` (counted without comparing every module)
             error_level: Error correction level
 
         Returns:
             Tuple of (is_valid, message) indicating validation result
         """
         # Count total data modules and cleared modules
-        total_modules = sum(sum(row) for row in original_matrix)
-        cleared_modules = 0
+        total_modules = self._count_dark_modules(original_matrix)
 
-        for row in range(self.size):
-            for col in range(self.size):
-                if original_matrix[row][col] and not modified_matrix[row][col]:
-                    cleared_modules += 1
+        if isinstance(modified_matrix, OverlayMatrix) and modified_matrix.base is original_matrix:
+            cleared_modules = modified_matrix.cleared_count
+        else:
+            cleared_modules = 0
+            for row in range(self.size):
+                original_row, modified_row = original_matrix[row], modified_matrix[row]
+                for col in range(self.size):
+                    if original_row[col] and not modified_row[col]:
+                        cleared_modules += 1
 
         # Calculate percentage cleared
         if total_modules > 0:
@@ -199,11 +246,12 @@ class MatrixValidator:
         }
 
         # Check each critical pattern type
-        self._analyze_finder_patterns(config, analysis)
-        self._analyze_timing_patterns(config, analysis)
-        self._analyze_alignment_patterns(config, analysis)
-        self._analyze_format_info(config, analysis)
-        self._analyze_version_info(config, analysis)
+        stats = self.get_region_statistics(config)
+        self._analyze_finder_patterns(stats, analysis)
+        self._analyze_timing_patterns(stats, analysis)
+        self._analyze_alignment_patterns(stats, analysis)
+        self._analyze_format_info(stats, analysis)
+        self._analyze_version_info(stats, analysis)
 
         # Calculate overall preservation score
         total_critical = (
@@ -223,7 +271,7 @@ class MatrixValidator:
 
         return analysis
 
-    def validate_matrix_integrity(self, modified_matrix: List[List[bool]]) -> Tuple[bool, IntegrityReport]:
+    def validate_matrix_integrity(self, modified_matrix: MatrixLike) -> Tuple[bool, IntegrityReport]:
         """Validate the structural integrity of a modified matrix.
 
         Args:
@@ -269,9 +317,7 @@ class MatrixValidator:
 
         return is_valid, integrity_report
 
-    def get_scanability_assessment(
-        self, config: Any, modified_matrix: List[List[bool]]
-    ) -> ScanabilityAssessment:
+    def get_scanability_assessment(self, config: Any, modified_matrix: MatrixLike) -> ScanabilityAssessment:
         """Provide comprehensive scanability assessment for the modified matrix.
 
         Args:
@@ -323,45 +369,74 @@ class MatrixValidator:
 
         return assessment
 
+    def get_region_statistics(self, config: Any) -> RegionStatistics:
+        """Get the overlap of a centerpiece with the QR code regions (cached).
+
+        Args:
+            config: CenterpieceConfig instance
+
+        Returns:
+            Region statistics shared by all analyses of the configuration
+        """
+        key = (type(self.detector), self.detector.get_version(), self.geometry.cache_key(config))
+        return _REGION_CACHE.get_or_build(key, lambda: self._compute_region_statistics(config))
+
+    def _finder_origins(self) -> List[Tuple[int, int]]:
+        """Top-left corners of the three finder patterns."""
+        return [(0, 0), (0, self.size - 7), (self.size - 7, 0)]
+
+    def _compute_region_statistics(self, config: Any) -> RegionStatistics:
+        """Scan the centerpiece area once and classify every module in it."""
+        row0, col0, mask = self.geometry.get_centerpiece_mask(config)
+        finders = self._finder_origins()
+
+        in_count = 0
+        affected = set()
+        row_affected = col_affected = False
+        for i, mask_row in enumerate(mask):
+            row = row0 + i
+            for j, member in enumerate(mask_row):
+                if not member:
+                    continue
+                col = col0 + j
+                in_count += 1
+                row_affected = row_affected or row == 6
+                col_affected = col_affected or col == 6
+                for finder_row, finder_col in finders:
+                    if finder_row <= row < finder_row + 7 and finder_col <= col < finder_col + 7:
+                        affected.add((finder_row, finder_col))
+
+        x1, y1, x2, y2 = self.geometry.get_centerpiece_bounds(config)
+        conflicts = any(
+            not (x2 <= fx1 or x1 >= fx2 or y2 <= fy1 or y1 >= fy2)
+            for fx1, fy1, fx2, fy2 in (
+                (0, 0, 7, 7),  # Top-left
+                (0, self.size - 7, 7, self.size),  # Top-right
+                (self.size - 7, 0, self.size, 7),  # Bottom-left
+            )
+        )
+
+        return RegionStatistics(
+            in_centerpiece=in_count,
+            affected_finders=tuple(origin for origin in finders if origin in affected),
+            horizontal_timing_affected=row_affected,
+            vertical_timing_affected=col_affected,
+            estimated_area=(x2 - x1) * (y2 - y1),
+            conflicts_with_finders=conflicts,
+        )
+
     def _estimate_centerpiece_area(self, config: Any) -> int:
         """Estimate the area covered by the centerpiece."""
-        x1, y1, x2, y2 = self.geometry.get_centerpiece_bounds(config)
-        return (x2 - x1) * (y2 - y1)
+        return self.get_region_statistics(config).estimated_area
 
     def _conflicts_with_finder_patterns(self, config: Any) -> bool:
         """Check if centerpiece conflicts with finder patterns."""
-        # Finder pattern positions (approximate)
-        finder_positions = [
-            (0, 0, 7, 7),  # Top-left
-            (0, self.size - 7, 7, self.size),  # Top-right
-            (self.size - 7, 0, self.size, 7),  # Bottom-left
-        ]
-
-        centerpiece_bounds = self.geometry.get_centerpiece_bounds(config)
-        cp_x1, cp_y1, cp_x2, cp_y2 = centerpiece_bounds
-
-        for fx1, fy1, fx2, fy2 in finder_positions:
-            # Check for overlap
-            if not (cp_x2 <= fx1 or cp_x1 >= fx2 or cp_y2 <= fy1 or cp_y1 >= fy2):
-                return True
+        return self.get_region_statistics(config).conflicts_with_finders
 
-        return False
-
-    def _analyze_finder_patterns(self, config: Any, analysis: PatternAnalysis) -> None:
+    def _analyze_finder_patterns(self, stats: RegionStatistics, analysis: PatternAnalysis) -> None:
         """Analyze finder pattern preservation."""
-        finder_positions = [(0, 0), (0, self.size - 7), (self.size - 7, 0)]
-
-        for finder_row, finder_col in finder_positions:
-            affected = False
-            for row in range(finder_row, min(finder_row + 7, self.size)):
-                for col in range(finder_col, min(finder_col + 7, self.size)):
-                    if self.geometry.is_in_centerpiece(row, col, config):
-                        affected = True
-                        break
-                if affected:
-                    break
-
-            if affected:
+        for finder_row, finder_col in self._finder_origins():
+            if (finder_row, finder_col) in stats.affected_finders:
                 analysis["finder_patterns"]["affected"] += 1
                 analysis["critical_violations"].append(
                     f"Finder pattern at ({finder_row}, {finder_col}) affected"
@@ -369,33 +444,27 @@ class MatrixValidator:
             else:
                 analysis["finder_patterns"]["preserved"] += 1
 
-    def _analyze_timing_patterns(self, config: Any, analysis: PatternAnalysis) -> None:
+    def _analyze_timing_patterns(self, stats: RegionStatistics, analysis: PatternAnalysis) -> None:
         """Analyze timing pattern preservation."""
-        # Check row 6 (horizontal timing)
-        row_affected = any(self.geometry.is_in_centerpiece(6, col, config) for col in range(self.size))
-
-        # Check column 6 (vertical timing)
-        col_affected = any(self.geometry.is_in_centerpiece(row, 6, config) for row in range(self.size))
-
-        if row_affected:
+        if stats.horizontal_timing_affected:
             analysis["timing_patterns"]["affected"] += 1
             analysis["critical_violations"].append("Horizontal timing pattern (row 6) affected")
         else:
             analysis["timing_patterns"]["preserved"] += 1
 
-        if col_affected:
+        if stats.vertical_timing_affected:
             analysis["timing_patterns"]["affected"] += 1
             analysis["critical_violations"].append("Vertical timing pattern (column 6) affected")
         else:
             analysis["timing_patterns"]["preserved"] += 1
 
-    def _analyze_alignment_patterns(self, config: Any, analysis: PatternAnalysis) -> None:
+    def _analyze_alignment_patterns(self, stats: RegionStatistics, analysis: PatternAnalysis) -> None:
         """Analyze alignment pattern preservation (for larger QR codes)."""
         # Simplified - would need actual QR version to determine alignment positions
         # For now, assume no alignment patterns in smaller codes
         analysis["alignment_patterns"]["preserved"] = 1
 
-    def _analyze_format_info(self, config: Any, analysis: PatternAnalysis) -> None:
+    def _analyze_format_info(self, stats: RegionStatistics, analysis: PatternAnalysis) -> None:
         """Analyze format information preservation."""
         # Format info is around finder patterns - if finders are OK, format should be too
         if analysis["finder_patterns"]["affected"] == 0:
@@ -403,16 +472,16 @@ class MatrixValidator:
         else:
             analysis["format_info"]["affected"] = 1
 
-    def _analyze_version_info(self, config: Any, analysis: PatternAnalysis) -> None:
+    def _analyze_version_info(self, stats: RegionStatistics, analysis: PatternAnalysis) -> None:
         """Analyze version information preservation."""
         # Version info only exists in QR codes version 7 and above
         # For simplicity, assume preserved unless centerpiece is very large
-        if self._estimate_centerpiece_area(config) > 300:
+        if stats.estimated_area > 300:
             analysis["version_info"]["affected"] = 1
         else:
             analysis["version_info"]["preserved"] = 1
 
-    def _verify_finder_patterns(self, modified_matrix: List[List[bool]]) -> bool:
+    def _verify_finder_patterns(self, modified_matrix: MatrixLike) -> bool:
         """Verify finder patterns are structurally intact."""
         finder_positions = [(0, 0), (0, self.size - 7), (self.size - 7, 0)]
 
@@ -425,7 +494,7 @@ class MatrixValidator:
 
         return True
 
-    def _verify_timing_patterns(self, modified_matrix: List[List[bool]]) -> bool:
+    def _verify_timing_patterns(self, modified_matrix: MatrixLike) -> bool:
         """Verify timing patterns have sufficient alternation."""
         # Check that row 6 and column 6 still have some alternating pattern
         row_6_changes = 0
@@ -441,10 +510,16 @@ class MatrixValidator:
         # Need at least some alternation to be functional
         return row_6_changes >= 3 and col_6_changes >= 3
 
-    def _verify_data_accessibility(self, modified_matrix: List[List[bool]]) -> bool:
+    def _verify_data_accessibility(self, modified_matrix: MatrixLike) -> bool:
         """Verify sufficient data regions remain accessible."""
         total_modules = self.size * self.size
-        remaining_modules = sum(sum(row) for row in modified_matrix)
+        if isinstance(modified_matrix, OverlayMatrix) and modified_matrix.base is self.matrix:
+            cleared = modified_matrix.cleared_count
+            remaining_modules = (
+                self._count_dark_modules(self.matrix) - cleared + modified_matrix.changed_count - cleared
+            )
+        else:
+            remaining_modules = sum(sum(row) for row in modified_matrix)
 
         # Need at least 50% of modules to remain for basic functionality
         return remaining_modules >= (total_modules * 0.5)
@@ -464,10 +539,14 @@ class MatrixValidator:
 
         return recommendations
 
-    def _calculate_data_preservation_score(self, modified_matrix: List[List[bool]]) -> float:
+    def _calculate_data_preservation_score(self, modified_matrix: MatrixLike) -> float:
         """Calculate score based on how much data capacity is preserved."""
-        original_data_modules = sum(sum(row) for row in self.matrix)
-        remaining_data_modules = sum(sum(row) for row in modified_matrix)
+        original_data_modules = self._count_dark_modules(self.matrix)
+        if isinstance(modified_matrix, OverlayMatrix) and modified_matrix.base is self.matrix:
+            cleared = modified_matrix.cleared_count
+            remaining_data_modules = original_data_modules - cleared + modified_matrix.changed_count - cleared
+        else:
+            remaining_data_modules = sum(sum(row) for row in modified_matrix)
 
         if original_data_modules == 0:
             return 1.0
@@ -486,7 +565,7 @@ class MatrixValidator:
         else:
             return 0.2
 
-    def _calculate_visual_clarity_score(self, config: Any, modified_matrix: List[List[bool]]) -> float:
+    def _calculate_visual_clarity_score(self, config: Any, modified_matrix: MatrixLike) -> float:
         """Calculate score based on visual clarity of the result."""
         # Higher scores for configurations that create clear, well-defined centerpieces
         score = 1.0
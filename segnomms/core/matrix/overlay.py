@@ -0,0 +1,132 @@
+"""Copy-on-write overlay matrices for centerpiece modifications.
+
+An :class:`OverlayMatrix` records only the cells a reserve mode changes
+(cleared by knockout) or marks (imprinted) on top of a shared, unmodified
+base matrix. Diff statistics come straight from the overlay, so validating
+the impact of a centerpiece does not need full copies of the matrix.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+Position = Tuple[int, int]
+
+
+class OverlayRow(Sequence[bool]):
+    """Read-only view of one row of an overlay matrix."""
+
+    __slots__ = ("_base", "_overrides")
+
+    def __init__(self, base: Sequence[bool], overrides: Optional[Dict[int, bool]]) -> None:
+        self._base = base
+        self._overrides = overrides
+
+    def __len__(self) -> int:
+        return len(self._base)
+
+    def __getitem__(self, col: Any) -> Any:
+        if isinstance(col, slice):
+            return list(self)[col]
+        if self._overrides:
+            if col < 0:
+                col += len(self._base)
+            value = self._overrides.get(col)
+            if value is not None:
+                return value
+        return self._base[col]
+
+    def __iter__(self) -> Iterator[bool]:
+        if not self._overrides:
+            return iter(self._base)
+        return (self._overrides.get(col, value) for col, value in enumerate(self._base))
+
+
+class OverlayMatrix(Sequence[OverlayRow]):
+    """Matrix view storing only the modified cells on top of a shared base.
+
+    Indexing works like the nested lists used elsewhere
+    (``overlay[row][col]``), and :meth:`to_list` materializes a plain
+    matrix when one is needed.
+
+    Args:
+        base: Unmodified matrix; it is never written to
+    """
+
+    def __init__(self, base: List[List[bool]]) -> None:
+        self.base = base
+        self.size = len(base)
+        self._overrides: Dict[int, Dict[int, bool]] = {}
+        self._marks: Dict[Position, Any] = {}
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, row: Any) -> Any:
+        if isinstance(row, slice):
+            return [self[index] for index in range(*row.indices(self.size))]
+        if row < 0:
+            row += self.size
+        return OverlayRow(self.base[row], self._overrides.get(row))
+
+    def get(self, row: int, col: int) -> bool:
+        """Get the effective value of a cell."""
+        overrides = self._overrides.get(row)
+        if overrides and col in overrides:
+            return overrides[col]
+        return self.base[row][col]
+
+    def set(self, row: int, col: int, value: bool) -> None:
+        """Set a cell, recording it only if it differs from the base."""
+        if self.base[row][col] == value:
+            overrides = self._overrides.get(row)
+            if overrides:
+                overrides.pop(col, None)
+                if not overrides:
+                    del self._overrides[row]
+        else:
+            self._overrides.setdefault(row, {})[col] = value
+
+    def clear(self, row: int, col: int) -> bool:
+        """Clear a cell.
+
+        Returns:
+            True if the cell was dark
+        """
+        was_dark = self.get(row, col)
+        if was_dark:
+            self.set(row, col, False)
+        return was_dark
+
+    def mark(self, row: int, col: int, value: Any = True) -> None:
+        """Attach a marker (for example an imprint treatment) to a cell."""
+        self._marks[(row, col)] = value
+
+    @property
+    def marks(self) -> Dict[Position, Any]:
+        """Marked cells and their markers."""
+        return self._marks
+
+    def changed_positions(self) -> List[Position]:
+        """Positions whose value differs from the base, in row-major order."""
+        return [(row, col) for row in sorted(self._overrides) for col in sorted(self._overrides[row])]
+
+    @property
+    def changed_count(self) -> int:
+        """Number of cells that differ from the base."""
+        return sum(len(overrides) for overrides in self._overrides.values())
+
+    @property
+    def cleared_count(self) -> int:
+        """Number of dark base cells that are light in the overlay."""
+        return sum(1 for overrides in self._overrides.values() for value in overrides.values() if not value)
+
+    def to_list(self) -> List[List[bool]]:
+        """Materialize the overlay as a new nested list matrix."""
+        result = [row[:] for row in self.base]
+        for row, overrides in self._overrides.items():
+            for col, value in overrides.items():
+                result[row][col] = value
+        return result
+
+
+# Plain nested-list matrix or an overlay on one
+MatrixLike = Union[List[List[bool]], OverlayMatrix]
@@ -0,0 +1,211 @@
+"""Per-phase memory accounting with :mod:`tracemalloc`.
+
+:func:`profile_memory` records, for every tracing span opened while it is
+active (matrix extraction, detector, clustering, element tree building,
+serialization, formatting, ...), the peak and retained Python heap
+allocations of that phase, plus the allocation sites holding the most
+memory at the high-water mark of the whole operation.
+
+Profiling is opt-in and has a real cost (tracemalloc typically slows
+rendering down by 2-4x), so it is meant for sizing worker memory limits
+and investigating outliers, not for every request. ``tracemalloc`` traces
+the whole process: renders running concurrently in other threads are
+included in the numbers.
+
+Example:
+    >>> with profile_memory() as profiler:
+    ...     svg = generate_interactive_svg(qr, config)
+    >>> profile = profiler.profile
+    >>> profile.peak_bytes, [phase.name for phase in profile.phases]
+"""
+
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+from pydantic import BaseModel, Field
+
+from .tracing import Span, SpanListener, listen_spans
+
+DEFAULT_TOP_ALLOCATIONS = 10
+
+# Do not attribute the profiler's own bookkeeping to rendering
+_EXCLUDED_FILES = (tracemalloc.__file__, __file__)
+
+
+class MemoryPhase(BaseModel):
+    """Memory used by one rendering phase."""
+
+    name: str = Field(description="Phase (span) name")
+    depth: int = Field(description="Nesting depth, 0 for top-level phases")
+    peak_bytes: int = Field(description="Peak allocations above the phase start")
+    retained_bytes: int = Field(description="Allocations still alive when the phase ended")
+
+    model_config = {"frozen": True}
+
+
+class AllocationSite(BaseModel):
+    """Source line holding memory at the high-water mark."""
+
+    location: str = Field(description="File and line number")
+    size_bytes: int = Field(description="Bytes allocated by this line")
+    count: int = Field(description="Number of live allocations")
+
+    model_config = {"frozen": True}
+
+
+class MemoryProfile(BaseModel):
+    """Memory profile of one operation."""
+
+    peak_bytes: int = Field(description="Peak allocations above the start of profiling")
+    retained_bytes: int = Field(description="Allocations still alive when profiling ended")
+    phases: List[MemoryPhase] = Field(default_factory=list, description="Phases in start order")
+    top_allocations: List[AllocationSite] = Field(
+        default_factory=list, description="Largest allocation sites at the high-water mark"
+    )
+
+    model_config = {"frozen": True}
+
+    def get_phase(self, name: str) -> Optional[MemoryPhase]:
+        """Get the first phase with the given name."""
+        return next((phase for phase in self.phases if phase.name == name), None)
+
+
+@dataclass
+class _OpenPhase:
+    name: str
+    depth: int
+    start_bytes: int
+    peak_bytes: int = 0
+    index: int = 0
+
+
+class MemoryProfiler(SpanListener):
+    """Span listener recording tracemalloc statistics per phase.
+
+    Use :func:`profile_memory` rather than instantiating this directly.
+    """
+
+    def __init__(self, top: int = DEFAULT_TOP_ALLOCATIONS) -> None:
+        self.top = top
+        self.profile: Optional[MemoryProfile] = None
+        self._phases: List[Optional[MemoryPhase]] = []
+        self._open: Dict[str, _OpenPhase] = {}
+        self._stack: List[_OpenPhase] = []
+        self._start_bytes = 0
+        self._peak_bytes = 0
+        self._high_water = -1
+        # Bytes held by the high-water snapshot itself, excluded from all readings
+        self._overhead = 0
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._high_water_snapshot: Optional[tracemalloc.Snapshot] = None
+
+    def _absolute_peak(self) -> int:
+        """Peak since the last reset, folded into the enclosing phases."""
+        current, peak = (value - self._overhead for value in tracemalloc.get_traced_memory())
+        self._peak_bytes = max(self._peak_bytes, peak)
+        for phase in self._stack:
+            phase.peak_bytes = max(phase.peak_bytes, peak)
+        return current
+
+    def start(self) -> None:
+        """Take the baseline measurement."""
+        self._baseline = self._snapshot()
+        tracemalloc.reset_peak()
+        self._start_bytes = tracemalloc.get_traced_memory()[0]
+        self._peak_bytes = self._start_bytes
+
+    def span_started(self, span: Span) -> None:
+        current = self._absolute_peak()
+        tracemalloc.reset_peak()
+        phase = _OpenPhase(span.name, len(self._stack), current, current, len(self._phases))
+        self._phases.append(None)
+        self._open[span.span_id] = phase
+        self._stack.append(phase)
+
+    def span_finished(self, span: Span) -> None:
+        phase = self._open.pop(span.span_id, None)
+        if phase is None:
+            return
+        current = self._absolute_peak()
+        self._stack.remove(phase)
+        self._phases[phase.index] = MemoryPhase(
+            name=phase.name,
+            depth=phase.depth,
+            peak_bytes=phase.peak_bytes - phase.start_bytes,
+            retained_bytes=current - phase.start_bytes,
+        )
+        if current > self._high_water:
+            self._high_water = current
+            self._high_water_snapshot = None
+            before = tracemalloc.get_traced_memory()[0]
+            self._high_water_snapshot = self._snapshot()
+            self._overhead = tracemalloc.get_traced_memory()[0] - before
+            tracemalloc.reset_peak()
+
+    def stop(self) -> MemoryProfile:
+        """Finish profiling and build the profile."""
+        current = self._absolute_peak()
+        top_allocations: List[AllocationSite] = []
+        if self._baseline is not None and self._high_water_snapshot is not None:
+            stats = self._high_water_snapshot.compare_to(self._baseline, "lineno")
+            for stat in stats:
+                if len(top_allocations) >= self.top:
+                    break
+                if stat.size_diff <= 0:
+                    continue
+                frame = stat.traceback[0]
+                top_allocations.append(
+                    AllocationSite(
+                        location=f"{frame.filename}:{frame.lineno}",
+                        size_bytes=stat.size_diff,
+                        count=stat.count_diff,
+                    )
+                )
+
+        self.profile = MemoryProfile(
+            peak_bytes=self._peak_bytes - self._start_bytes,
+            retained_bytes=current - self._start_bytes,
+            phases=[phase for phase in self._phases if phase is not None],
+            top_allocations=top_allocations,
+        )
+        self._baseline = self._high_water_snapshot = None
+        return self.profile
+
+    @staticmethod
+    def _snapshot() -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, filename) for filename in _EXCLUDED_FILES]
+        )
+
+
+@contextmanager
+def profile_memory(top: int = DEFAULT_TOP_ALLOCATIONS) -> Iterator[MemoryProfiler]:
+    """Profile memory use per rendering phase.
+
+    Starts :mod:`tracemalloc` if it is not already tracing and stops it
+    again afterwards. The profile is available as ``profiler.profile``
+    once the block exits.
+
+    Args:
+        top: Number of allocation sites to report
+
+    Yields:
+        The profiler
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+
+    profiler = MemoryProfiler(top=top)
+    try:
+        with listen_spans(profiler):
+            profiler.start()
+            try:
+                yield profiler
+            finally:
+                profiler.stop()
+    finally:
+        if started:
+            tracemalloc.stop()
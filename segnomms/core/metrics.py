@@ -0,0 +1,422 @@
+"""Unified metrics registry with Prometheus text exposition.
+
+All renderer health metrics live in one :class:`MetricsRegistry`:
+
+* ``segnomms_operation_duration_seconds`` and
+  ``segnomms_operation_threshold_warnings_total``, fed by
+  :class:`~segnomms.core.performance.PerformanceMonitor` (which also
+  receives the centerpiece metrics from
+  :class:`~segnomms.core.matrix.performance_monitor.CenterpiecePerformanceMonitor`)
+* ``segnomms_degradation_rule_hits_total`` per degraded feature
+* ``segnomms_renders_total``, ``segnomms_phase_duration_seconds`` (per
+  phase and module shape), ``segnomms_output_bytes`` and
+  ``segnomms_cache_requests_total``, derived from the tracing spans once
+  :func:`enable_metrics` is called
+
+The registry renders itself in the Prometheus text exposition format
+(:meth:`MetricsRegistry.to_prometheus`) and as a plain dictionary
+(:meth:`MetricsRegistry.snapshot`).
+
+Example:
+    >>> enable_metrics()
+    >>> write(qr, out)
+    >>> print(get_metrics_registry().to_prometheus())
+"""
+
+import bisect
+import math
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .tracing import Span, SpanExporter, get_tracer
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Latency buckets in seconds
+DEFAULT_LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Output size buckets in bytes
+DEFAULT_SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape_label(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class MetricFamily(ABC):
+    """Base class of a named metric with a fixed set of label names."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Metric '{self.name}' expects labels {list(self.labelnames)}, got {sorted(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+    @abstractmethod
+    def expose(self) -> List[str]:
+        """Prometheus text lines of this family."""
+
+    @abstractmethod
+    def snapshot(self) -> Dict[str, Any]:
+        """Dictionary form of this family."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all samples."""
+
+
+class _ValueFamily(MetricFamily):
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def get(self, **labels: Any) -> float:
+        """Current value for the given labels (0 if never set)."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def expose(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = self._header()
+        lines.extend(
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in values
+        )
+        return lines
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return {
+            "type": self.type_name,
+            "help": self.documentation,
+            "samples": [{"labels": dict(zip(self.labelnames, key)), "value": value} for key, value in values],
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Counter(_ValueFamily):
+    """Monotonically increasing counter."""
+
+    type_name = "counter"
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        """Increase the counter.
+
+        Raises:
+            ValueError: If ``amount`` is negative or the labels do not match
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_ValueFamily):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set the gauge."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(MetricFamily):
+    """Cumulative bucket histogram."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: per-bucket counts (last one is +Inf), sum
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record one observation."""
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def _collect(self) -> List[Tuple[LabelValues, List[int], float]]:
+        with self._lock:
+            return [(key, list(counts), total[0]) for key, (counts, total) in sorted(self._series.items())]
+
+    def get_count(self, **labels: Any) -> int:
+        """Number of observations for the given labels."""
+        series = self._series.get(self._key(labels))
+        return sum(series[0]) if series else 0
+
+    def expose(self) -> List[str]:
+        lines = self._header()
+        for key, counts, total in self._collect():
+            cumulative = 0
+            for bound, count in zip(list(self.buckets) + [math.inf], counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+    def snapshot(self) -> Dict[str, Any]:
+        samples = []
+        for key, counts, total in self._collect():
+            cumulative = 0
+            buckets = {}
+            for bound, count in zip(list(self.buckets) + [math.inf], counts):
+                cumulative += count
+                buckets[_format_value(bound)] = cumulative
+            samples.append(
+                {
+                    "labels": dict(zip(self.labelnames, key)),
+                    "count": cumulative,
+                    "sum": total,
+                    "buckets": buckets,
+                }
+            )
+        return {"type": self.type_name, "help": self.documentation, "samples": samples}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+class MetricsRegistry:
+    """Collection of metric families."""
+
+    def __init__(self) -> None:
+        self._families: Dict[str, MetricFamily] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(
+        self, cls: type, name: str, documentation: str, labelnames: Sequence[str], **kwargs: Any
+    ) -> Any:
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = self._families[name] = cls(name, documentation, labelnames, **kwargs)
+            elif type(family) is not cls or family.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric '{name}' is already registered with a different type or labels")
+            return family
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or register a counter."""
+        counter: Counter = self._get_or_create(Counter, name, documentation, labelnames)
+        return counter
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or register a gauge."""
+        gauge: Gauge = self._get_or_create(Gauge, name, documentation, labelnames)
+        return gauge
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Get or register a histogram."""
+        histogram: Histogram = self._get_or_create(
+            Histogram, name, documentation, labelnames, buckets=buckets
+        )
+        return histogram
+
+    def get(self, name: str) -> Optional[MetricFamily]:
+        """Get a registered family by name."""
+        return self._families.get(name)
+
+    def _sorted_families(self) -> Iterable[MetricFamily]:
+        with self._lock:
+            return sorted(self._families.values(), key=lambda family: family.name)
+
+    def to_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for family in self._sorted_families():
+            lines.extend(family.expose())
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """All metrics as a JSON-serializable dictionary keyed by name."""
+        return {family.name: family.snapshot() for family in self._sorted_families()}
+
+    def reset(self) -> None:
+        """Clear all samples, keeping the registered families."""
+        for family in self._sorted_families():
+            family.clear()
+
+
+class RendererMetrics:
+    """Renderer metric families registered in a registry."""
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        self.operation_duration = registry.histogram(
+            "segnomms_operation_duration_seconds",
+            "Duration of monitored operations",
+            ["operation", "source"],
+        )
+        self.operation_warnings = registry.counter(
+            "segnomms_operation_threshold_warnings_total",
+            "Monitored operations exceeding a performance threshold",
+            ["operation", "source"],
+        )
+        self.degradation_rule_hits = registry.counter(
+            "segnomms_degradation_rule_hits_total",
+            "Graceful degradation rules applied, by feature",
+            ["feature"],
+        )
+        self.renders = registry.counter("segnomms_renders_total", "Rendered QR codes", ["shape"])
+        self.render_errors = registry.counter(
+            "segnomms_render_errors_total", "Renders that raised an error", ["shape"]
+        )
+        self.phase_duration = registry.histogram(
+            "segnomms_phase_duration_seconds",
+            "Duration of rendering phases",
+            ["phase", "shape"],
+        )
+        self.output_bytes = registry.histogram(
+            "segnomms_output_bytes",
+            "Size of rendered SVG documents",
+            ["shape"],
+            buckets=DEFAULT_SIZE_BUCKETS,
+        )
+        self.cache_requests = registry.counter(
+            "segnomms_cache_requests_total", "Cache lookups by cache and result", ["cache", "result"]
+        )
+
+
+class MetricsSpanExporter(SpanExporter):
+    """Span exporter deriving render metrics from finished traces."""
+
+    def __init__(self, metrics: RendererMetrics) -> None:
+        self.metrics = metrics
+
+    def export(self, spans: Sequence[Span]) -> None:
+        shape = "unknown"
+        for span in spans:
+            if span.name == "render":
+                shape = str(span.attributes.get("shape", shape))
+
+        metrics = self.metrics
+        for span in spans:
+            if span.name == "translate" and "cache_hit" in span.attributes:
+                result = "hit" if span.attributes["cache_hit"] else "miss"
+                metrics.cache_requests.inc(cache="intent_translation", result=result)
+            elif span.name == "render":
+                if "error" in span.attributes:
+                    metrics.render_errors.inc(shape=shape)
+                    continue
+                metrics.renders.inc(shape=shape)
+                metrics.output_bytes.observe(span.counters.get("bytes", 0), shape=shape)
+            metrics.phase_duration.observe(span.duration_ms / 1000, phase=span.name, shape=shape)
+
+
+_registry = MetricsRegistry()
+_renderer_metrics = RendererMetrics(_registry)
+_span_exporter: Optional[MetricsSpanExporter] = None
+_exporter_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the global metrics registry."""
+    return _registry
+
+
+def get_renderer_metrics() -> RendererMetrics:
+    """Get the renderer metric families of the global registry."""
+    return _renderer_metrics
+
+
+def enable_metrics() -> MetricsRegistry:
+    """Derive render, phase, size and cache metrics from tracing spans.
+
+    Operation and degradation metrics are always recorded; this enables
+    span collection for the per-render metrics as well. Calling it more
+    than once has no further effect.
+
+    Returns:
+        The global registry
+    """
+    global _span_exporter
+    with _exporter_lock:
+        if _span_exporter is None:
+            _span_exporter = MetricsSpanExporter(_renderer_metrics)
+        # disable_tracing() may have removed it
+        if _span_exporter not in get_tracer().exporters:
+            get_tracer().add_exporter(_span_exporter)
+    return _registry
+
+
+def disable_metrics() -> None:
+    """Stop deriving metrics from tracing spans."""
+    global _span_exporter
+    with _exporter_lock:
+        if _span_exporter is not None:
+            get_tracer().remove_exporter(_span_exporter)
+            _span_exporter = None
@@ -4,11 +4,18 @@ This module provides performance tracking, threshold monitoring, and warning
 generation for computationally intensive operations like reserve area processing.
 """
 
+import itertools
 import logging
+import math
+import threading
 import time
+import weakref
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from .metrics import get_renderer_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -70,8 +77,220 @@ class PerformanceMetric:
         return self.warning_level is not None
 
 
+class StreamingHistogram:
+    """Fixed-memory histogram with bounded relative error.
+
+    Values are counted in logarithmic buckets (as in DDSketch), so any
+    quantile is estimated within ``relative_accuracy`` of the true value
+    while memory stays bounded by ``max_buckets`` regardless of how many
+    values are recorded. Count, sum, minimum and maximum are exact.
+    """
+
+    def __init__(
+        self, relative_accuracy: float = 0.01, min_value: float = 0.001, max_buckets: int = 2048
+    ) -> None:
+        """Initialize the histogram.
+
+        Args:
+            relative_accuracy: Relative error bound of quantile estimates
+            min_value: Values at or below this share the lowest bucket
+            max_buckets: Upper bound on the number of buckets
+        """
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def _key(self, value: float) -> int:
+        if value <= self.min_value:
+            return 0
+        return min(self.max_buckets - 1, math.ceil(math.log(value / self.min_value) / self._log_gamma))
+
+    def record(self, value: float) -> None:
+        """Record one value."""
+        key = self._key(value)
+        self._buckets[key] = self._buckets.get(key, 0) + 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "StreamingHistogram") -> None:
+        """Add the values of another histogram with the same parameters."""
+        for key, count in other._buckets.items():
+            self._buckets[key] = self._buckets.get(key, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def copy(self) -> "StreamingHistogram":
+        """Independent copy of the histogram."""
+        histogram = StreamingHistogram(self.relative_accuracy, self.min_value, self.max_buckets)
+        histogram.merge(self)
+        return histogram
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Estimated value, or 0.0 if the histogram is empty
+        """
+        if self.count == 0:
+            return 0.0
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if seen > rank:
+                estimate = self.min_value * 2 * self._gamma**key / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        """Mean of all recorded values."""
+        return self.total / self.count if self.count else 0.0
+
+
+@dataclass(frozen=True)
+class OperationStats:
+    """Aggregated timings of one operation type."""
+
+    operation: str
+    count: int
+    warnings: int
+    total_time_ms: float
+    min_time_ms: float
+    max_time_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+    @property
+    def avg_time_ms(self) -> float:
+        """Mean operation time."""
+        return self.total_time_ms / self.count if self.count else 0.0
+
+    @property
+    def warning_rate(self) -> float:
+        """Fraction of operations that exceeded a threshold."""
+        return self.warnings / self.count if self.count else 0.0
+
+
+@dataclass(frozen=True)
+class PerformanceSnapshot:
+    """Point-in-time view of a :class:`PerformanceMonitor`."""
+
+    timestamp: float
+    operations: Dict[str, OperationStats]
+    recent_warnings: List[PerformanceMetric]
+
+    @property
+    def total_operations(self) -> int:
+        """Number of operations recorded since the last reset."""
+        return sum(stats.count for stats in self.operations.values())
+
+    @property
+    def total_warnings(self) -> int:
+        """Number of threshold warnings since the last reset."""
+        return sum(stats.warnings for stats in self.operations.values())
+
+
+# Global recording order; metrics from different sources use different clocks
+_sequence = itertools.count()
+
+# Recorded metric with its position in the global recording order
+_Entry = Tuple[int, PerformanceMetric]
+
+
+class _ThreadShard:
+    """Recording state owned by one thread.
+
+    Only the owning thread records into a shard, so its lock is uncontended
+    except while a snapshot is being taken.
+    """
+
+    __slots__ = ("lock", "thread", "histograms", "warning_counts", "recent", "warnings")
+
+    def __init__(self, thread: Optional[threading.Thread], max_recent: int, max_warnings: int) -> None:
+        self.lock = threading.Lock()
+        self.thread = weakref.ref(thread) if thread is not None else None
+        self.histograms: Dict[str, StreamingHistogram] = {}
+        self.warning_counts: Dict[str, int] = {}
+        self.recent: Deque[_Entry] = deque(maxlen=max_recent)
+        self.warnings: Deque[_Entry] = deque(maxlen=max_warnings)
+
+    @property
+    def alive(self) -> bool:
+        thread = self.thread() if self.thread is not None else None
+        return thread is not None and thread.is_alive()
+
+    def record(self, metric: PerformanceMetric) -> None:
+        entry = (next(_sequence), metric)
+        with self.lock:
+            histogram = self.histograms.get(metric.operation)
+            if histogram is None:
+                histogram = self.histograms[metric.operation] = StreamingHistogram()
+            histogram.record(metric.elapsed_ms)
+            self.recent.append(entry)
+            if metric.exceeded_threshold:
+                self.warning_counts[metric.operation] = self.warning_counts.get(metric.operation, 0) + 1
+                self.warnings.append(entry)
+
+    def absorb(self, other: "_ThreadShard") -> None:
+        """Merge another shard's state into this one."""
+        with self.lock:
+            for operation, histogram in other.histograms.items():
+                if operation in self.histograms:
+                    self.histograms[operation].merge(histogram)
+                else:
+                    self.histograms[operation] = histogram.copy()
+            for operation, count in other.warning_counts.items():
+                self.warning_counts[operation] = self.warning_counts.get(operation, 0) + count
+            self.recent.extend(other.recent)
+            self.warnings.extend(other.warnings)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.histograms.clear()
+            self.warning_counts.clear()
+            self.recent.clear()
+            self.warnings.clear()
+
+
+def _publish(metric: PerformanceMetric, source: str) -> None:
+    """Feed a metric into the global metrics registry."""
+    metrics = get_renderer_metrics()
+    metrics.operation_duration.observe(metric.elapsed_ms / 1000, operation=metric.operation, source=source)
+    if metric.exceeded_threshold:
+        metrics.operation_warnings.inc(operation=metric.operation, source=source)
+
+
 class PerformanceMonitor:
-    """Monitor and track performance of SegnoMMS operations."""
+    """Monitor and track performance of SegnoMMS operations.
+
+    Memory use is bounded: each operation type keeps a fixed-size
+    :class:`StreamingHistogram` for count, mean and p50/p95/p99 timings,
+    and only the most recent metrics and warnings are retained in ring
+    buffers. Each thread records into its own shard, so concurrent threads
+    never contend with each other; :meth:`snapshot` merges the shards.
+    """
 
     # Default performance thresholds
     DEFAULT_THRESHOLDS = {
@@ -107,16 +326,62 @@ class PerformanceMonitor:
         ),
     }
 
-    def __init__(self, enabled: bool = True):
+    def __init__(
+        self,
+        enabled: bool = True,
+        max_recent_metrics: int = 1000,
+        max_warnings: int = 100,
+        max_active_operations: int = 10000,
+    ):
         """Initialize performance monitor.
 
         Args:
             enabled: Whether performance monitoring is active
+            max_recent_metrics: Number of recent metrics kept per thread
+            max_warnings: Number of recent threshold warnings kept per thread
+            max_active_operations: Maximum number of started but unfinished
+                operations; the oldest are dropped beyond this
         """
         self.enabled = enabled
         self.thresholds: Dict[str, PerformanceThreshold] = self.DEFAULT_THRESHOLDS.copy()
-        self.metrics: List[PerformanceMetric] = []
-        self._active_operations: Dict[str, Tuple[float, str]] = {}
+        self.max_recent_metrics = max_recent_metrics
+        self.max_warnings = max_warnings
+        self.max_active_operations = max_active_operations
+        self._active_operations: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._active_lock = threading.Lock()
+        self._operation_ids = itertools.count()
+        self._local = threading.local()
+        self._shards: List[_ThreadShard] = []
+        self._shards_lock = threading.Lock()
+        # Holds the data of threads that have exited
+        self._retired = _ThreadShard(None, max_recent_metrics, max_warnings)
+
+    def _shard(self) -> _ThreadShard:
+        shard: Optional[_ThreadShard] = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _ThreadShard(threading.current_thread(), self.max_recent_metrics, self.max_warnings)
+            self._local.shard = shard
+            with self._shards_lock:
+                # Fold exited threads here too, so threads that never read do not leak shards
+                self._retire_dead_shards()
+                self._shards.append(shard)
+        return shard
+
+    def _retire_dead_shards(self) -> None:
+        """Fold shards of exited threads into the retired shard (``_shards_lock`` held)."""
+        live = []
+        for shard in self._shards:
+            if shard.alive:
+                live.append(shard)
+            else:
+                self._retired.absorb(shard)
+        self._shards = live
+
+    def _collect_shards(self) -> List[_ThreadShard]:
+        """Current shards, after folding exited threads into the retired shard."""
+        with self._shards_lock:
+            self._retire_dead_shards()
+            return self._shards + [self._retired]
 
     def set_threshold(self, threshold: PerformanceThreshold) -> None:
         """Set or update a performance threshold.
@@ -140,8 +405,11 @@ class PerformanceMonitor:
             return operation
 
         start_time = time.perf_counter()
-        operation_id = f"{operation}#{start_time}"
-        self._active_operations[operation_id] = (start_time, operation)
+        operation_id = f"{operation}#{next(self._operation_ids)}"
+        with self._active_lock:
+            self._active_operations[operation_id] = (start_time, operation)
+            while len(self._active_operations) > self.max_active_operations:
+                self._active_operations.popitem(last=False)
 
         logger.debug(f"Started performance monitoring for {operation}")
         return operation_id
@@ -159,11 +427,15 @@ class PerformanceMonitor:
         Returns:
             PerformanceMetric if monitoring enabled, None otherwise
         """
-        if not self.enabled or operation_id not in self._active_operations:
+        if not self.enabled:
             return None
 
         end_time = time.perf_counter()
-        start_time, operation = self._active_operations.pop(operation_id)
+        with self._active_lock:
+            active = self._active_operations.pop(operation_id, None)
+        if active is None:
+            return None
+        start_time, operation = active
         elapsed_ms = (end_time - start_time) * 1000
 
         # Create metric
@@ -196,7 +468,8 @@ class PerformanceMonitor:
             log_method = getattr(logger, metric.warning_level.value, logger.info)
             log_method(f"Performance warning: {metric.warning_message}")
 
-        self.metrics.append(metric)
+        self._shard().record(metric)
+        _publish(metric, "core")
         return metric
 
     def measure_operation(
@@ -240,48 +513,100 @@ class PerformanceMonitor:
             self.end_operation(operation_id, metadata={"error": str(e)})
             raise
 
+    @property
+    def metrics(self) -> List[PerformanceMetric]:
+        """Most recent metrics, oldest first (bounded per thread)."""
+        recent: List[_Entry] = []
+        for shard in self._collect_shards():
+            with shard.lock:
+                recent.extend(shard.recent)
+        return [metric for _, metric in sorted(recent, key=lambda entry: entry[0])]
+
+    def snapshot(self, reset: bool = False) -> PerformanceSnapshot:
+        """Take a consistent view of the aggregated statistics.
+
+        Args:
+            reset: Clear the statistics after taking the snapshot, so
+                consecutive snapshots cover disjoint intervals
+
+        Returns:
+            Per-operation statistics and recent warnings
+        """
+        histograms: Dict[str, StreamingHistogram] = {}
+        warning_counts: Dict[str, int] = {}
+        warnings: List[_Entry] = []
+
+        for shard in self._collect_shards():
+            with shard.lock:
+                for operation, histogram in shard.histograms.items():
+                    if operation in histograms:
+                        histograms[operation].merge(histogram)
+                    else:
+                        histograms[operation] = histogram.copy()
+                for operation, count in shard.warning_counts.items():
+                    warning_counts[operation] = warning_counts.get(operation, 0) + count
+                warnings.extend(shard.warnings)
+                if reset:
+                    shard.histograms.clear()
+                    shard.warning_counts.clear()
+                    shard.recent.clear()
+                    shard.warnings.clear()
+
+        warnings.sort(key=lambda entry: entry[0])
+        operations = {
+            operation: OperationStats(
+                operation=operation,
+                count=histogram.count,
+                warnings=warning_counts.get(operation, 0),
+                total_time_ms=histogram.total,
+                min_time_ms=histogram.min,
+                max_time_ms=histogram.max,
+                p50_ms=histogram.quantile(0.5),
+                p95_ms=histogram.quantile(0.95),
+                p99_ms=histogram.quantile(0.99),
+            )
+            for operation, histogram in histograms.items()
+        }
+        return PerformanceSnapshot(
+            timestamp=time.time(),
+            operations=operations,
+            recent_warnings=[metric for _, metric in warnings[-self.max_warnings :]],
+        )
+
+    def reset(self) -> None:
+        """Clear all statistics, recent metrics, warnings and active operations."""
+        for shard in self._collect_shards():
+            shard.clear()
+        with self._active_lock:
+            self._active_operations.clear()
+
     def get_performance_summary(self) -> Dict[str, Any]:
         """Get summary of performance metrics.
 
         Returns:
             Summary dictionary with performance statistics
         """
-        if not self.metrics:
+        snapshot = self.snapshot()
+        if not snapshot.operations:
             return {"enabled": self.enabled, "total_operations": 0}
 
-        # Group by operation
-        by_operation = {}
-        total_warnings = 0
-
-        for metric in self.metrics:
-            if metric.operation not in by_operation:
-                by_operation[metric.operation] = {
-                    "count": 0,
-                    "total_time_ms": 0.0,
-                    "avg_time_ms": 0.0,
-                    "max_time_ms": 0.0,
-                    "warnings": 0,
-                }
-
-            op_stats = by_operation[metric.operation]
-            op_stats["count"] += 1
-            op_stats["total_time_ms"] += metric.elapsed_ms
-            op_stats["max_time_ms"] = max(op_stats["max_time_ms"], metric.elapsed_ms)
-
-            if metric.exceeded_threshold:
-                op_stats["warnings"] += 1
-                total_warnings += 1
-
-        # Calculate averages
-        for stats in by_operation.values():
-            if stats["count"] > 0:
-                stats["avg_time_ms"] = stats["total_time_ms"] / stats["count"]
-
         return {
             "enabled": self.enabled,
-            "total_operations": len(self.metrics),
-            "total_warnings": total_warnings,
-            "operations": by_operation,
+            "total_operations": snapshot.total_operations,
+            "total_warnings": snapshot.total_warnings,
+            "operations": {
+                name: {
+                    "count": stats.count,
+                    "total_time_ms": stats.total_time_ms,
+                    "avg_time_ms": stats.avg_time_ms,
+                    "max_time_ms": stats.max_time_ms,
+                    "p50_ms": stats.p50_ms,
+                    "p95_ms": stats.p95_ms,
+                    "p99_ms": stats.p99_ms,
+                    "warnings": stats.warnings,
+                }
+                for name, stats in snapshot.operations.items()
+            },
             "thresholds": {
                 name: {
                     "max_time_ms": t.max_time_ms,
@@ -292,6 +617,13 @@ class PerformanceMonitor:
             },
         }
 
+    def _recent_warnings(self) -> List[PerformanceMetric]:
+        warnings: List[_Entry] = []
+        for shard in self._collect_shards():
+            with shard.lock:
+                warnings.extend(shard.warnings)
+        return [metric for _, metric in sorted(warnings, key=lambda entry: entry[0])]
+
     def get_recent_warnings(self, limit: int = 10) -> List[PerformanceMetric]:
         """Get recent performance warnings.
 
@@ -301,19 +633,19 @@ class PerformanceMonitor:
         Returns:
             List of recent metrics that exceeded thresholds
         """
-        warnings = [m for m in self.metrics if m.exceeded_threshold]
+        warnings = self._recent_warnings()
         return warnings[-limit:] if warnings else []
 
     def get_operation_warnings(self, operation: str) -> List[PerformanceMetric]:
-        """Get all warnings for a specific operation type.
+        """Get recent warnings for a specific operation type.
 
         Args:
             operation: Operation name to filter by
 
         Returns:
-            List of metrics with warnings for the specified operation
+            List of retained metrics with warnings for the specified operation
         """
-        return [m for m in self.metrics if m.operation == operation and m.exceeded_threshold]
+        return [m for m in self._recent_warnings() if m.operation == operation]
 
     def generate_performance_recommendations(self) -> List[str]:
         """Generate performance improvement recommendations based on metrics.
@@ -323,26 +655,14 @@ class PerformanceMonitor:
         """
         recommendations: List[str] = []
 
-        if not self.metrics:
-            return recommendations
-
-        # Analyze by operation type
-        by_operation: Dict[str, Any] = {}
-        for metric in self.metrics:
-            if metric.operation not in by_operation:
-                by_operation[metric.operation] = []
-            by_operation[metric.operation].append(metric)
-
         # Generate operation-specific recommendations
-        for operation, metrics in by_operation.items():
-            warnings = [m for m in metrics if m.exceeded_threshold]
-
-            if not warnings:
+        for operation, stats in self.snapshot().operations.items():
+            if not stats.warnings:
                 continue
 
-            avg_time = sum(m.elapsed_ms for m in metrics) / len(metrics)
-            max_time = max(m.elapsed_ms for m in metrics)
-            warning_rate = len(warnings) / len(metrics)
+            avg_time = stats.avg_time_ms
+            max_time = stats.max_time_ms
+            warning_rate = stats.warning_rate
 
             if operation == "imprint_preprocessing" and warning_rate > 0.3:
                 recommendations.append(
@@ -394,7 +714,8 @@ class PerformanceMonitor:
         )
 
         # Add to metrics collection
-        self.metrics.append(perf_metric)
+        self._shard().record(perf_metric)
+        _publish(perf_metric, "centerpiece")
 
         # Check thresholds and log warnings
         for threshold in self.thresholds.values():
@@ -413,8 +734,7 @@ class PerformanceMonitor:
 
     def clear_metrics(self) -> None:
         """Clear collected performance metrics."""
-        self.metrics.clear()
-        self._active_operations.clear()
+        self.reset()
 
 
 # Global performance monitor instance
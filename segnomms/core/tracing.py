@@ -0,0 +1,446 @@
+"""Lightweight tracing of rendering phases.
+
+Spans are nested timing records with attributes and counters. Rendering
+and intent processing open spans for every phase; when tracing is disabled
+(the default) :func:`trace_span` returns a shared no-op span, so the cost
+is one function call and one attribute check per phase.
+
+Finished traces (a root span and all of its descendants) are handed to
+the configured exporters as a batch.
+
+Example:
+    Collect spans in memory::
+
+        from segnomms.core.tracing import InMemoryExporter, enable_tracing
+
+        exporter = InMemoryExporter()
+        enable_tracing(exporter)
+        write(qr, out)
+        for span in exporter.get_finished_spans():
+            print(span.name, span.duration_ms, span.counters)
+
+    Write OpenTelemetry (OTLP/JSON) traces::
+
+        enable_tracing(OTLPJSONExporter("traces.jsonl"))
+"""
+
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "segnomms"
+
+AttributeValue = Union[str, int, float, bool]
+
+_current_span: "ContextVar[Optional[Span]]" = ContextVar("segnomms_current_span", default=None)
+_span_listener: "ContextVar[Optional[SpanListener]]" = ContextVar("segnomms_span_listener", default=None)
+_span_ids = itertools.count(1)
+
+
+def _new_span_id() -> str:
+    # Random high bits keep IDs unique across processes, the counter within one
+    return f"{(int.from_bytes(os.urandom(4), 'big') << 32) | (next(_span_ids) & 0xFFFFFFFF):016x}"
+
+
+class Span:
+    """A timed operation within a trace.
+
+    Attributes:
+        name: Span name, e.g. ``"render.modules"``
+        trace_id: 32 hex digit trace identifier shared by the whole trace
+        span_id: 16 hex digit span identifier
+        parent_id: Parent span identifier, ``None`` for the root span
+        start_ns: Start time (ns since the epoch)
+        end_ns: End time, ``None`` while the span is open
+        attributes: Descriptive attributes
+        counters: Numeric counters such as ``modules`` or ``elements``
+    """
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "counters",
+        "_tracer",
+        "_token",
+        "_trace_spans",
+    )
+
+    def __init__(self, tracer: "Tracer", name: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self.name = name
+        self.span_id: str = _new_span_id()
+        self.parent_id: Optional[str] = parent.span_id if parent else None
+        self.trace_id: str = parent.trace_id if parent else os.urandom(16).hex()
+        self.start_ns = 0
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, AttributeValue] = attributes
+        self.counters: Dict[str, float] = {}
+        self._tracer = tracer
+        self._token: Optional[Token[Optional[Span]]] = None
+        # All spans of a trace are collected on the root span
+        self._trace_spans: List[Span] = parent._trace_spans if parent else []
+
+    @property
+    def duration_ms(self) -> float:
+        """Span duration in milliseconds (up to now while open)."""
+        end = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end - self.start_ns) / 1e6
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        """Set a descriptive attribute."""
+        self.attributes[key] = value
+
+    def add(self, counter: str, amount: float = 1) -> None:
+        """Increment a counter."""
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def __enter__(self) -> "Span":
+        listener = _span_listener.get()
+        if listener is not None:
+            listener.span_started(self)
+        self.start_ns = time.time_ns()
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        self.end_ns = time.time_ns()
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        listener = _span_listener.get()
+        if listener is not None:
+            listener.span_finished(self)
+        if self._token is not None:
+            _current_span.reset(self._token)
+        self._trace_spans.append(self)
+        if self.parent_id is None:
+            self._tracer._export(self._trace_spans)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dictionary representation (used by the JSONL exporter)."""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round(self.duration_ms, 4),
+            "attributes": dict(self.attributes),
+            "counters": dict(self.counters),
+        }
+
+
+class _NoopSpan:
+    """Span stand-in used while tracing is disabled."""
+
+    __slots__ = ()
+
+    name = ""
+    attributes: Dict[str, AttributeValue] = {}
+    counters: Dict[str, float] = {}
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        pass
+
+    def add(self, counter: str, amount: float = 1) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class SpanExporter(ABC):
+    """Base class for exporters receiving finished traces."""
+
+    @abstractmethod
+    def export(self, spans: Sequence[Span]) -> None:
+        """Export the spans of one finished trace (children before parents)."""
+
+    def shutdown(self) -> None:
+        """Release resources held by the exporter."""
+
+
+class InMemoryExporter(SpanExporter):
+    """Collects finished spans in memory, mainly for tests and debugging."""
+
+    def __init__(self) -> None:
+        self._spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Span]) -> None:
+        with self._lock:
+            self._spans.extend(spans)
+
+    def get_finished_spans(self) -> List[Span]:
+        """Get all finished spans in completion order."""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        """Drop all collected spans."""
+        with self._lock:
+            self._spans.clear()
+
+
+class _FileExporter(SpanExporter):
+    def __init__(self, target: Union[str, "os.PathLike[str]", IO[str]]) -> None:
+        self._lock = threading.Lock()
+        if isinstance(target, (str, os.PathLike)):
+            self._file: IO[str] = open(Path(target), "a", encoding="utf-8")
+            self._owns_file = True
+        else:
+            self._file = target
+            self._owns_file = False
+
+    def _write(self, line: str) -> None:
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def shutdown(self) -> None:
+        if self._owns_file:
+            self._file.close()
+
+
+class JSONLExporter(_FileExporter):
+    """Writes one JSON object per span to a file."""
+
+    def export(self, spans: Sequence[Span]) -> None:
+        self._write("\n".join(json.dumps(span.to_dict(), separators=(",", ":")) for span in spans))
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(spans: Sequence[Span], service_name: str = SERVICE_NAME) -> Dict[str, Any]:
+    """Convert spans to an OTLP/JSON ``ExportTraceServiceRequest``.
+
+    Counters are exported as attributes prefixed with ``count.``.
+
+    Args:
+        spans: Finished spans
+        service_name: ``service.name`` resource attribute
+
+    Returns:
+        Dictionary in the OpenTelemetry protocol JSON encoding
+    """
+    otlp_spans = []
+    for span in spans:
+        attributes = [{"key": key, "value": _otlp_value(value)} for key, value in span.attributes.items()]
+        attributes += [
+            {"key": f"count.{key}", "value": _otlp_value(value)} for key, value in span.counters.items()
+        ]
+        otlp_span: Dict[str, Any] = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns),
+            "attributes": attributes,
+            "status": {"code": 2} if "error" in span.attributes else {},
+        }
+        if span.parent_id:
+            otlp_span["parentSpanId"] = span.parent_id
+        otlp_spans.append(otlp_span)
+
+    from .. import __version__
+
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]},
+                "scopeSpans": [{"scope": {"name": "segnomms", "version": __version__}, "spans": otlp_spans}],
+            }
+        ]
+    }
+
+
+class OTLPJSONExporter(_FileExporter):
+    """Writes one OTLP/JSON export request per trace to a file.
+
+    The output can be replayed to any OTLP/HTTP collector endpoint
+    (``/v1/traces``) or loaded by tools that read OTLP JSON files.
+    """
+
+    def __init__(
+        self, target: Union[str, "os.PathLike[str]", IO[str]], service_name: str = SERVICE_NAME
+    ) -> None:
+        super().__init__(target)
+        self.service_name = service_name
+
+    def export(self, spans: Sequence[Span]) -> None:
+        self._write(json.dumps(to_otlp(spans, self.service_name), separators=(",", ":")))
+
+
+class SpanListener:
+    """Receives span start and end events in the current context.
+
+    Unlike exporters, which see whole traces after the fact, a listener is
+    called synchronously around each phase (see :func:`listen_spans`).
+    """
+
+    def span_started(self, span: Span) -> None:
+        """Called before the span's start time is taken."""
+
+    def span_finished(self, span: Span) -> None:
+        """Called after the span's end time is taken."""
+
+
+class Tracer:
+    """Creates spans and dispatches finished traces to exporters."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._exporters: List[SpanExporter] = []
+        self._listeners = 0
+        self._lock = threading.Lock()
+
+    def _update_enabled(self) -> None:
+        self.enabled = bool(self._exporters) or self._listeners > 0
+
+    def add_exporter(self, exporter: SpanExporter) -> None:
+        """Register an exporter and enable tracing."""
+        with self._lock:
+            self._exporters.append(exporter)
+            self._update_enabled()
+
+    def remove_exporter(self, exporter: SpanExporter) -> None:
+        """Unregister an exporter without shutting it down."""
+        with self._lock:
+            if exporter in self._exporters:
+                self._exporters.remove(exporter)
+            self._update_enabled()
+
+    @property
+    def exporters(self) -> Tuple[SpanExporter, ...]:
+        """Registered exporters."""
+        with self._lock:
+            return tuple(self._exporters)
+
+    def shutdown(self) -> None:
+        """Remove and shut down all exporters."""
+        with self._lock:
+            exporters, self._exporters = self._exporters, []
+            self._update_enabled()
+        for exporter in exporters:
+            exporter.shutdown()
+
+    def start_span(self, name: str, **attributes: Any) -> Union[Span, _NoopSpan]:
+        """Create a span as a child of the current span (use as a context manager)."""
+        if not self.enabled:
+            return NOOP_SPAN
+        return Span(self, name, _current_span.get(), attributes)
+
+    def _export(self, spans: Sequence[Span]) -> None:
+        # A failing exporter must never fail the traced operation
+        for exporter in self.exporters:
+            try:
+                exporter.export(spans)
+            except Exception:
+                logger.exception("Span exporter %r failed", exporter)
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the global tracer."""
+    return _tracer
+
+
+def enable_tracing(*exporters: SpanExporter) -> Tracer:
+    """Enable tracing with the given exporters.
+
+    Args:
+        *exporters: Exporters receiving finished traces
+
+    Returns:
+        The global tracer
+    """
+    for exporter in exporters:
+        _tracer.add_exporter(exporter)
+    return _tracer
+
+
+def disable_tracing() -> None:
+    """Disable tracing and shut down all exporters."""
+    _tracer.shutdown()
+
+
+def trace_span(name: str, **attributes: Any) -> Union[Span, _NoopSpan]:
+    """Open a span under the current span, or a no-op span when disabled.
+
+    Args:
+        name: Span name
+        **attributes: Initial attributes
+
+    Returns:
+        Context manager yielding the span
+    """
+    if not _tracer.enabled:
+        return NOOP_SPAN
+    return Span(_tracer, name, _current_span.get(), attributes)
+
+
+def current_span() -> Union[Span, _NoopSpan]:
+    """Get the innermost open span, or the no-op span."""
+    return _current_span.get() or NOOP_SPAN
+
+
+@contextmanager
+def listen_spans(listener: SpanListener) -> Iterator[SpanListener]:
+    """Notify a listener of all spans opened in the current context.
+
+    Spans are created while any listener is active, even without exporters.
+
+    Args:
+        listener: Listener receiving span events
+
+    Yields:
+        The listener
+
+    Raises:
+        RuntimeError: If another listener is already active in this context
+    """
+    if _span_listener.get() is not None:
+        raise RuntimeError("Another span listener is already active in this context")
+
+    token = _span_listener.set(listener)
+    with _tracer._lock:
+        _tracer._listeners += 1
+        _tracer._update_enabled()
+    try:
+        yield listener
+    finally:
+        with _tracer._lock:
+            _tracer._listeners -= 1
+            _tracer._update_enabled()
+        _span_listener.reset(token)
@@ -16,6 +16,8 @@ Key Components:
     :class:`IntentsConfig`: Intent specification with graceful degradation
     :class:`RenderingResult`: Comprehensive output model
     :func:`render_with_intents`: Main intent-based rendering function
+    :class:`IntentProcessor`: Reusable processor with cached intent translation
+    :func:`stream_intents_jsonl`: Streaming JSONL request processing
 
 Example:
     Basic intent-based rendering:
@@ -40,6 +42,7 @@ Example:
 See Also:
     :mod:`segnomms.intents.models`: Intent and payload models
     :mod:`segnomms.intents.processor`: Intent processing logic
+    :mod:`segnomms.intents.stream`: Streaming JSONL pipeline
     :mod:`segnomms.intents.degradation`: Graceful degradation system
 """
 
@@ -53,6 +56,7 @@ try:
         CompatibilityInfo,
         DegradationDetail,
         FrameIntents,
+        IntentRequest,
         IntentsConfig,
         IntentTranslationReport,
         InteractivityIntents,
@@ -65,7 +69,13 @@ try:
         ValidationIntents,
         WarningInfo,
     )
-    from .processor import process_intents, render_with_intents  # noqa: F401
+    from .processor import (  # noqa: F401
+        IntentProcessor,
+        get_intent_processor,
+        process_intents,
+        render_with_intents,
+    )
+    from .stream import process_intents_jsonl, stream_intents_jsonl  # noqa: F401
 
     __all__ = [
         "PayloadConfig",
@@ -78,6 +88,11 @@ try:
         "IntentTranslationReport",
         "render_with_intents",
         "process_intents",
+        "IntentProcessor",
+        "get_intent_processor",
+        "IntentRequest",
+        "stream_intents_jsonl",
+        "process_intents_jsonl",
         # Intent categories
         "StyleIntents",
         "FrameIntents",
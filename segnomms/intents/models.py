@@ -8,6 +8,8 @@ from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from ..core.memory import MemoryProfile
+
 # Import existing models for integration
 
 
@@ -130,6 +132,9 @@ class AccessibilityIntents(BaseModel):
     title: Optional[str] = Field(default=None, description="SVG title")
     desc: Optional[str] = Field(default=None, description="SVG description")
     aria: Optional[bool] = Field(default=None, description="Enable ARIA attributes")
+    compact: Optional[bool] = Field(
+        default=None, description="Annotate root and pattern groups only, not individual modules"
+    )
 
 
 class ValidationIntents(BaseModel):
@@ -239,6 +244,20 @@ class IntentsConfig(BaseModel):
     model_config = {"extra": "ignore", "validate_default": True}  # Ignore unknown keys
 
 
+class IntentRequest(BaseModel):
+    """Single request of the intent-based JSON API.
+
+    One line of a JSONL stream: the payload to encode, optional intents and
+    an optional client identifier echoed back in the result.
+    """
+
+    id: Optional[str] = Field(default=None, description="Client request identifier echoed in the result")
+    payload: PayloadConfig = Field(description="Payload configuration")
+    intents: Optional[IntentsConfig] = Field(default=None, description="Intent configuration")
+
+    model_config = {"extra": "forbid", "validate_default": True}
+
+
 class TransformationStep(BaseModel):
     """Single transformation step in intent processing."""
 
@@ -309,6 +328,10 @@ class PerformanceMetrics(BaseModel):
     contrast_ratio: Optional[float] = Field(default=None, description="Actual contrast ratio")
     actual_quiet_zone: Optional[int] = Field(default=None, description="Actual quiet zone size")
 
+    memory_profile: Optional[MemoryProfile] = Field(
+        default=None, description="Per-phase memory profile (only when requested)"
+    )
+
     model_config = {"frozen": True}
 
 
@@ -5,8 +5,15 @@ intents into SegnoMMS configuration with graceful degradation and
 comprehensive result tracking.
 """
 
+import copy
+import hashlib
+import json
+import threading
 import time
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, List, Literal, Mapping, Optional, Tuple
 
 import segno
 
@@ -14,6 +21,8 @@ from ..capabilities import get_capability_manifest
 from ..color.color_analysis import validate_qr_contrast
 from ..config import AdvancedQRConfig, RenderingConfig
 from ..core.advanced_qr import AdvancedQRGenerator
+from ..core.memory import profile_memory as memory_profiler
+from ..core.tracing import current_span, trace_span
 from ..exceptions import (
     ConfigurationError,
     IntentValidationError,
@@ -42,33 +51,244 @@ from .models import (
     WarningInfo,
 )
 
+DEFAULT_TRANSLATION_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class IntentTranslation:
+    """Payload-independent result of translating an intents configuration.
+
+    Instances are cached by :class:`IntentProcessor` and shared between
+    requests, so they must be treated as read-only.
+
+    Attributes:
+        config: Degraded rendering configuration
+        config_kwargs: Processed kwargs (used for advanced QR generation)
+        warnings: Warnings produced while translating
+        unsupported_intents: Intent paths that could not be honoured
+        degradation_applied: Whether any degradation was applied
+        translation_report: Detailed translation report
+        requested_options: Originally requested options
+        used_options: Options of the final configuration
+        feature_impact: Performance/quality impact of features
+        scanability_prediction: Predicted scanability level
+        contrast_ratio: Dark/light contrast ratio of the configuration
+        validation_time_ms: Time spent building and validating the configuration
+    """
+
+    config: RenderingConfig
+    config_kwargs: Mapping[str, Any]
+    warnings: Tuple[WarningInfo, ...]
+    unsupported_intents: Tuple[str, ...]
+    degradation_applied: bool
+    translation_report: IntentTranslationReport
+    requested_options: Optional[Dict[str, Any]]
+    used_options: Dict[str, Any]
+    feature_impact: Dict[str, str]
+    scanability_prediction: str
+    contrast_ratio: Optional[float]
+    validation_time_ms: float
+
 
 class IntentProcessor:
-    """Main intent processing system with integrated degradation handling."""
+    """Main intent processing system with integrated degradation handling.
+
+    Translating intents into a :class:`RenderingConfig` does not depend on
+    the payload, so the processor memoizes each translation (configuration,
+    warnings and translation report) by a canonical hash of the intents. A
+    single long-lived processor can therefore be shared between requests and
+    threads; for repeated intents only QR encoding and SVG generation run.
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_TRANSLATION_CACHE_SIZE) -> None:
+        """Initialize the intent processor.
 
-    def __init__(self) -> None:
-        """Initialize the intent processor."""
+        Args:
+            cache_size: Maximum number of cached intent translations
+                (``0`` disables caching)
+        """
         self.manifest = get_capability_manifest()
         self.warnings: List[WarningInfo] = []
         self.transformation_steps: List[TransformationStep] = []
         self.degradation_details: List[DegradationDetail] = []
         self.compatibility_info: List[CompatibilityInfo] = []
         self.original_intents: Optional[Dict[str, Any]] = None
+        self.cache_size = cache_size
+        self._translation_cache: "OrderedDict[str, IntentTranslation]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # Translation uses the tracking lists above, so it is serialized
+        self._lock = threading.RLock()
 
     def process_intents(
-        self, payload: PayloadConfig, intents: Optional[IntentsConfig] = None
+        self,
+        payload: PayloadConfig,
+        intents: Optional[IntentsConfig] = None,
+        profile_memory: bool = False,
     ) -> RenderingResult:
         """Process payload and intents into rendering result.
 
         Args:
             payload: Payload configuration with content to encode
             intents: Optional intent configuration
+            profile_memory: Record per-phase memory use with tracemalloc into
+                ``metrics.memory_profile`` (slows rendering down considerably)
 
         Returns:
             RenderingResult with SVG, warnings, metrics, and used options
         """
+        if profile_memory:
+            with memory_profiler() as profiler:
+                result = self.process_intents(payload, intents)
+            metrics = result.metrics.model_copy(update={"memory_profile": profiler.profile})
+            return result.model_copy(update={"metrics": metrics})
+
+        with trace_span("process_intents") as span:
+            return self._process_intents(payload, intents, span)
+
+    def _process_intents(
+        self, payload: PayloadConfig, intents: Optional[IntentsConfig], span: Any
+    ) -> RenderingResult:
         start_time = time.time()
 
+        # Step 1: Translate intents (cached per distinct intents)
+        with trace_span("translate"):
+            translate_start = time.time()
+            translation, cache_hit = self._lookup_translation(intents)
+            translate_time = (time.time() - translate_start) * 1000
+        request_warnings: List[WarningInfo] = []
+
+        # Step 2: Check if advanced features are needed
+        needs_advanced = self._needs_advanced_features(translation.config_kwargs, payload)
+        span.set_attribute("advanced", needs_advanced)
+
+        # Step 3: Create QR code(s) based on requirements
+        with trace_span("encode") as phase:
+            if needs_advanced:
+                qr_codes, generation_metadata = self._create_advanced_qr(
+                    payload, translation.config_kwargs, request_warnings
+                )
+                # For now, use the first QR code for rendering
+                # NOTE: Future feature - structured append for multiple QR codes
+                qr_code = qr_codes[0] if qr_codes else self._create_qr_code(payload)
+            else:
+                qr_code = self._create_qr_code(payload)
+            phase.set_attribute("version", str(qr_code.version))
+
+        # Step 4: Generate SVG
+        svg_start = time.time()
+        # Degradation was applied when the translation was built
+        svg_content = generate_interactive_svg(qr_code, translation.config, apply_degradation=False)
+        svg_time = (time.time() - svg_start) * 1000
+
+        # Step 5: Calculate metrics
+        total_time = (time.time() - start_time) * 1000
+        metrics = PerformanceMetrics(
+            rendering_time_ms=total_time,
+            # A cache hit skips validation; report the time actually spent
+            validation_time_ms=translate_time if cache_hit else translation.validation_time_ms,
+            svg_generation_time_ms=svg_time,
+            estimated_scanability="pass",  # Basic assumption for now
+            min_module_px=translation.config.scale,
+            actual_quiet_zone=translation.config.border,
+            contrast_ratio=translation.contrast_ratio,
+        )
+
+        # Step 6: Build result; mutable parts are copied so callers cannot
+        # change the cached translation shared with later requests
+        return RenderingResult(
+            svg_content=svg_content,
+            warnings=request_warnings + [warning.model_copy(deep=True) for warning in translation.warnings],
+            metrics=metrics,
+            used_options=copy.deepcopy(translation.used_options),
+            degradation_applied=translation.degradation_applied,
+            unsupported_intents=list(translation.unsupported_intents),
+            translation_report=translation.translation_report.model_copy(deep=True),
+            requested_options=copy.deepcopy(translation.requested_options),
+            feature_impact=dict(translation.feature_impact),
+            scanability_prediction=translation.scanability_prediction,
+        )
+
+    @staticmethod
+    def intents_cache_key(intents: Optional[IntentsConfig]) -> str:
+        """Build the canonical cache key of an intents configuration.
+
+        Equal intents produce the same key regardless of how they were
+        constructed (field order, explicit ``None`` values, dict key order).
+
+        Args:
+            intents: Intent configuration, or ``None`` for no intents
+
+        Returns:
+            SHA-256 hex digest of the canonical JSON form
+        """
+        if intents is None:
+            return hashlib.sha256(b"null").hexdigest()
+        canonical = json.dumps(
+            intents.model_dump(mode="json", exclude_none=True),
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def translate_intents(self, intents: Optional[IntentsConfig] = None) -> "IntentTranslation":
+        """Translate intents into a rendering configuration, using the cache.
+
+        Args:
+            intents: Optional intent configuration
+
+        Returns:
+            Immutable translation shared by all requests with equal intents
+        """
+        return self._lookup_translation(intents)[0]
+
+    def _lookup_translation(self, intents: Optional[IntentsConfig]) -> Tuple["IntentTranslation", bool]:
+        """Translate intents using the cache and report whether it was a hit."""
+        key = self.intents_cache_key(intents)
+
+        with self._lock:
+            cached = self._translation_cache.get(key)
+            if cached is not None:
+                self._translation_cache.move_to_end(key)
+                self._cache_hits += 1
+                current_span().set_attribute("cache_hit", True)
+                return cached, True
+
+            self._cache_misses += 1
+            current_span().set_attribute("cache_hit", False)
+            translation = self._translate_intents(intents)
+
+            if self.cache_size > 0:
+                self._translation_cache[key] = translation
+                while len(self._translation_cache) > self.cache_size:
+                    self._translation_cache.popitem(last=False)
+
+            return translation, False
+
+    def clear_cache(self) -> None:
+        """Drop all cached intent translations."""
+        with self._lock:
+            self._translation_cache.clear()
+            self._cache_hits = 0
+            self._cache_misses = 0
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Get translation cache statistics.
+
+        Returns:
+            Dictionary with ``hits``, ``misses``, ``size`` and ``max_size``
+        """
+        with self._lock:
+            return {
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "size": len(self._translation_cache),
+                "max_size": self.cache_size,
+            }
+
+    def _translate_intents(self, intents: Optional[IntentsConfig]) -> "IntentTranslation":
+        """Run the full intent translation (caller must hold the lock)."""
         # Clear any previous state
         self.clear_state()
 
@@ -77,8 +297,8 @@ class IntentProcessor:
             self.original_intents = intents.model_dump(exclude_none=True)
 
         # Step 1: Process intents with degradation
-        config_kwargs = {}
-        unsupported_intents = []
+        config_kwargs: Dict[str, Any] = {}
+        unsupported_intents: List[str] = []
 
         if intents:
             processed_config, unsupported = self._process_all_intents(intents)
@@ -88,30 +308,18 @@ class IntentProcessor:
             # Apply performance optimizations if any were requested
             self._apply_performance_suggestions(config_kwargs)
 
-        # Step 2: Check if advanced features are needed
-        needs_advanced = self._needs_advanced_features(config_kwargs, payload)
-
-        # Step 3: Create QR code(s) based on requirements
-        if needs_advanced:
-            qr_codes, generation_metadata = self._create_advanced_qr(payload, config_kwargs)
-            # For now, use the first QR code for rendering
-            # NOTE: Future feature - structured append for multiple QR codes
-            qr_code = qr_codes[0] if qr_codes else self._create_qr_code(payload)
-        else:
-            qr_code = self._create_qr_code(payload)
-
-        # Step 4: Build RenderingConfig
+        # Step 2: Build RenderingConfig
         validation_start = time.time()
+        contrast_ratio = None
+        # Extract min contrast ratio if specified
+        min_contrast_ratio = config_kwargs.pop("_min_contrast_ratio", None)
         try:
-            # Extract min contrast ratio if specified
-            min_contrast_ratio = config_kwargs.pop("_min_contrast_ratio", None)
-
             config = RenderingConfig.from_kwargs(**config_kwargs)
             validation_time = (time.time() - validation_start) * 1000
 
-            # Step 4a: Validate contrast if requested
+            # Step 2a: Validate contrast if requested
             if min_contrast_ratio is not None:
-                self._validate_contrast(config, min_contrast_ratio)
+                contrast_ratio = self._validate_contrast(config, min_contrast_ratio)
 
         except ConfigurationError as e:
             # Add configuration error as warning and use defaults
@@ -134,7 +342,7 @@ class IntentProcessor:
             config = RenderingConfig()
             validation_time = (time.time() - validation_start) * 1000
 
-        # Step 4a: Apply degradation and capture warnings
+        # Step 3: Apply degradation and capture warnings
         from ..degradation import DegradationManager
 
         degradation_manager = DegradationManager()
@@ -149,40 +357,26 @@ class IntentProcessor:
                 warning.suggestion or "Configuration adjusted for optimal rendering",
             )
 
-        # Step 4b: Generate SVG
-        svg_start = time.time()
-        svg_content = generate_interactive_svg(qr_code, config)
-        svg_time = (time.time() - svg_start) * 1000
-
-        # Step 5: Calculate metrics
-        total_time = (time.time() - start_time) * 1000
-        metrics = self._calculate_metrics(config, total_time, validation_time, svg_time)
-
-        # Step 6: Build translation report
-        translation_report = self._build_translation_report()
-
-        # Step 7: Calculate feature impact
-        feature_impact = self._calculate_feature_impact(config)
-
-        # Step 8: Predict scanability
-        scanability_prediction = self._predict_scanability(config)
+        if contrast_ratio is None:
+            # Calculate contrast ratio if not already done
+            _, ratio, _ = validate_qr_contrast(config.dark, config.light)
+            contrast_ratio = ratio or None
 
-        # Step 9: Build result
-        result = RenderingResult(
-            svg_content=svg_content,
-            warnings=self.get_warnings(),
-            metrics=metrics,
-            used_options=config.to_kwargs(),
+        return IntentTranslation(
+            config=config,
+            config_kwargs=MappingProxyType(config_kwargs),
+            warnings=tuple(self.get_warnings()),
+            unsupported_intents=tuple(unsupported_intents),
             degradation_applied=len(unsupported_intents) > 0 or degradation_result.warning_count > 0,
-            unsupported_intents=unsupported_intents,
-            translation_report=translation_report,
+            translation_report=self._build_translation_report(),
             requested_options=self.original_intents,
-            feature_impact=feature_impact,
-            scanability_prediction=scanability_prediction,
+            used_options=config.to_kwargs(),
+            feature_impact=self._calculate_feature_impact(config),
+            scanability_prediction=self._predict_scanability(config),
+            contrast_ratio=contrast_ratio,
+            validation_time_ms=validation_time,
         )
 
-        return result
-
     def _process_all_intents(self, intents: IntentsConfig) -> tuple[Dict[str, Any], list[str]]:
         """Process all intent categories."""
         config_kwargs = {}
@@ -341,6 +535,18 @@ class IntentProcessor:
                 workarounds=[],
             )
 
+        # Compact group-level annotations
+        if accessibility.compact is not None:
+            config["accessibility_compact_mode"] = accessibility.compact
+            self._track_transformation(
+                "accessibility.compact",
+                accessibility.compact,
+                accessibility.compact,
+                "accepted",
+                reason="Group-level ARIA annotations via accessibility compact mode",
+                confidence=1.0,
+            )
+
         return config
 
     def _process_validation_intents(self, validation: Optional[ValidationIntents]) -> Dict[str, Any]:
@@ -507,7 +713,7 @@ class IntentProcessor:
                 "lazy_rendering": lazy_rendering,
             }
 
-    def _needs_advanced_features(self, config_kwargs: Dict[str, Any], payload: PayloadConfig) -> bool:
+    def _needs_advanced_features(self, config_kwargs: Mapping[str, Any], payload: PayloadConfig) -> bool:
         """Check if advanced QR generation is needed."""
         # Check for advanced features in config
         if config_kwargs.get("structured_append", False):
@@ -519,9 +725,16 @@ class IntentProcessor:
         return False
 
     def _create_advanced_qr(
-        self, payload: PayloadConfig, config_kwargs: Dict[str, Any]
+        self,
+        payload: PayloadConfig,
+        config_kwargs: Mapping[str, Any],
+        warnings: List[WarningInfo],
     ) -> Tuple[List[Any], Dict[str, Any]]:
-        """Create QR code(s) using advanced generator."""
+        """Create QR code(s) using advanced generator.
+
+        Generation warnings depend on the payload, so they are appended to
+        the per-request ``warnings`` list rather than the shared state.
+        """
         try:
             content = payload.get_content()
         except ValueError as e:
@@ -545,9 +758,10 @@ class IntentProcessor:
         result = generator.generate_qr(content, advanced_config, error=payload.error_correction or "M")
 
         # Track metadata
-        if result.warnings:
-            for warning in result.warnings:
-                self._add_warning("ADVANCED_QR_WARNING", "advanced", warning, None, "info")
+        for warning in result.warnings:
+            warnings.append(
+                WarningInfo(code="ADVANCED_QR_WARNING", path="advanced", detail=warning, severity="info")
+            )
 
         return result.qr_codes, result.metadata
 
@@ -581,8 +795,12 @@ class IntentProcessor:
         else:
             return segno.make(content)
 
-    def _validate_contrast(self, config: RenderingConfig, min_ratio: float) -> None:
-        """Validate color contrast meets minimum requirements."""
+    def _validate_contrast(self, config: RenderingConfig, min_ratio: float) -> float:
+        """Validate color contrast meets minimum requirements.
+
+        Returns:
+            Actual contrast ratio
+        """
         # Get colors from config
         dark_color = config.dark
         light_color = config.light
@@ -621,38 +839,7 @@ class IntentProcessor:
                 confidence=1.0,
             )
 
-        # Store actual contrast ratio in metrics
-        self._actual_contrast_ratio = actual_ratio
-
-    def _calculate_metrics(
-        self,
-        config: RenderingConfig,
-        total_time: float,
-        validation_time: float,
-        svg_time: float,
-    ) -> PerformanceMetrics:
-        """Calculate performance and quality metrics."""
-
-        # Basic performance metrics
-        metrics = PerformanceMetrics(
-            rendering_time_ms=total_time,
-            validation_time_ms=validation_time,
-            svg_generation_time_ms=svg_time,
-            estimated_scanability="pass",  # Basic assumption for now
-            min_module_px=config.scale,
-            actual_quiet_zone=config.border,
-        )
-
-        # Add actual contrast ratio if calculated
-        if hasattr(self, "_actual_contrast_ratio"):
-            metrics = metrics.model_copy(update={"contrast_ratio": self._actual_contrast_ratio})
-        elif hasattr(config, "dark") and hasattr(config, "light"):
-            # Calculate contrast ratio if not already done
-            _, ratio, _ = validate_qr_contrast(config.dark, config.light)
-            if ratio:
-                metrics = metrics.model_copy(update={"contrast_ratio": ratio})
-
-        return metrics
+        return actual_ratio
 
     def process_style_intents(self, style: Optional[StyleIntents]) -> tuple[Dict[str, Any], list[str]]:
         """Process style intents with degradation.
@@ -1951,14 +2138,42 @@ class IntentProcessor:
         return self.warnings.copy()
 
 
-def render_with_intents(payload: PayloadConfig, intents: Optional[IntentsConfig] = None) -> RenderingResult:
+_default_processor: Optional[IntentProcessor] = None
+_default_processor_lock = threading.Lock()
+
+
+def get_intent_processor() -> IntentProcessor:
+    """Get the shared, long-lived intent processor.
+
+    The processor is created on first use and caches intent translations
+    across calls to :func:`render_with_intents` and :func:`process_intents`.
+
+    Returns:
+        Shared IntentProcessor instance
+    """
+    global _default_processor
+
+    if _default_processor is None:
+        with _default_processor_lock:
+            if _default_processor is None:
+                _default_processor = IntentProcessor()
+    return _default_processor
+
+
+def render_with_intents(
+    payload: PayloadConfig, intents: Optional[IntentsConfig] = None, profile_memory: bool = False
+) -> RenderingResult:
     """Main function for intent-based rendering.
 
-    This is the primary entry point for the client's intent-based API.
+    This is the primary entry point for the client's intent-based API. It
+    uses the shared processor from :func:`get_intent_processor`, so repeated
+    intents are only translated once.
 
     Args:
         payload: Payload configuration specifying content to encode
         intents: Optional intent configuration for styling and behavior
+        profile_memory: Report peak and retained memory per phase and the top
+            allocation sites in ``metrics.memory_profile``
 
     Returns:
         RenderingResult with comprehensive output including SVG, warnings, and metrics
@@ -1973,8 +2188,7 @@ def render_with_intents(payload: PayloadConfig, intents: Optional[IntentsConfig]
         >>> print(f"Generated {len(result.svg_content)} character SVG")
         >>> print(f"Warnings: {result.warning_count}")
     """
-    processor = IntentProcessor()
-    return processor.process_intents(payload, intents)
+    return get_intent_processor().process_intents(payload, intents, profile_memory=profile_memory)
 
 
 def process_intents(intents_dict: Dict[str, Any]) -> RenderingResult:
@@ -0,0 +1,172 @@
+"""Streaming JSONL pipeline for the intent-based API.
+
+Processes newline-delimited JSON requests (one :class:`IntentRequest` per
+line) and yields one JSON result line per request. Input is consumed
+lazily and at most ``max_in_flight`` requests are pending at any time, so
+memory use stays flat regardless of the input size.
+
+Example:
+    Regenerate a file of requests with four worker processes::
+
+        from segnomms.intents.stream import process_intents_jsonl
+
+        count = process_intents_jsonl("requests.jsonl", "results.jsonl", workers=4, use_processes=True)
+
+Each output line contains the request ``index`` (zero-based line number of
+non-blank input lines), the request ``id`` if given, and either the client
+result format (``svg``, ``warnings``, ``metrics``, ``usedOptions``) or an
+``error`` object.
+"""
+
+import json
+import os
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from pathlib import Path
+from typing import IO, Any, Deque, Dict, Iterable, Iterator, Optional, Set, Union
+
+from pydantic import ValidationError as PydanticValidationError
+
+from ..exceptions import SegnoMMSError
+from .models import IntentRequest
+from .processor import get_intent_processor
+
+JSONLSource = Union[str, "os.PathLike[str]", IO[bytes], IO[str], Iterable[Union[bytes, str]]]
+
+
+def _iter_lines(source: JSONLSource) -> Iterator[Union[bytes, str]]:
+    """Lazily iterate over the non-blank lines of a JSONL source."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as handle:
+            yield from _iter_lines(handle)
+        return
+
+    for line in source:
+        if line.strip():
+            yield line
+
+
+def _dump(record: Dict[str, Any]) -> str:
+    return json.dumps(record, separators=(",", ":"), default=str) + "\n"
+
+
+def render_jsonl_line(index: int, line: Union[bytes, str]) -> str:
+    """Validate, render and serialize a single JSONL request.
+
+    Errors are reported in the result line instead of being raised so one
+    bad request does not abort a stream.
+
+    Args:
+        index: Position of the request in the stream
+        line: Raw JSON request
+
+    Returns:
+        JSON result line terminated by a newline
+    """
+    record: Dict[str, Any] = {"index": index}
+
+    try:
+        request = IntentRequest.model_validate_json(line)
+    except PydanticValidationError as e:
+        record["error"] = {
+            "error": "REQUEST_VALIDATION_ERROR",
+            "message": "Invalid intent request",
+            "details": {"errors": e.errors(include_url=False, include_context=False)},
+            "suggestion": "Each line must be a JSON object with 'payload' and optional 'intents'",
+        }
+        return _dump(record)
+
+    if request.id is not None:
+        record["id"] = request.id
+
+    try:
+        result = get_intent_processor().process_intents(request.payload, request.intents)
+    except SegnoMMSError as e:
+        record["error"] = e.to_dict()
+    except Exception as e:
+        record["error"] = {"error": type(e).__name__, "message": str(e), "details": {}, "suggestion": None}
+    else:
+        record.update(result.to_client_format())
+
+    return _dump(record)
+
+
+def stream_intents_jsonl(
+    source: JSONLSource,
+    workers: Optional[int] = None,
+    ordered: bool = True,
+    max_in_flight: Optional[int] = None,
+    use_processes: bool = False,
+) -> Iterator[str]:
+    """Process a stream of JSONL intent requests.
+
+    Args:
+        source: Path to a JSONL file, an open file, or an iterable of lines
+        workers: Number of workers (defaults to the CPU count)
+        ordered: Yield results in input order; otherwise in completion order
+        max_in_flight: Maximum number of pending requests
+            (defaults to four per worker)
+        use_processes: Render in worker processes instead of threads
+
+    Yields:
+        JSON result lines terminated by a newline
+    """
+    workers = max(1, workers or os.cpu_count() or 1)
+    max_in_flight = max(workers, max_in_flight or workers * 4)
+    lines = enumerate(_iter_lines(source))
+
+    executor: Executor = ProcessPoolExecutor(workers) if use_processes else ThreadPoolExecutor(workers)
+    with executor:
+        if ordered:
+            queue: Deque["Future[str]"] = deque()
+            for index, line in lines:
+                if len(queue) >= max_in_flight:
+                    yield queue.popleft().result()
+                queue.append(executor.submit(render_jsonl_line, index, line))
+            while queue:
+                yield queue.popleft().result()
+        else:
+            pending: Set["Future[str]"] = set()
+            for index, line in lines:
+                if len(pending) >= max_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+                pending.add(executor.submit(render_jsonl_line, index, line))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+
+def process_intents_jsonl(
+    source: JSONLSource,
+    destination: Union[str, "os.PathLike[str]", IO[str]],
+    **kwargs: Any,
+) -> int:
+    """Process JSONL intent requests and write JSONL results.
+
+    Args:
+        source: Path to a JSONL file, an open file, or an iterable of lines
+        destination: Output path or text file object
+        **kwargs: Options passed to :func:`stream_intents_jsonl`
+
+    Returns:
+        Number of results written
+    """
+    if isinstance(destination, (str, os.PathLike)):
+        with open(Path(destination), "w", encoding="utf-8") as handle:
+            return process_intents_jsonl(source, handle, **kwargs)
+
+    count = 0
+    for line in stream_intents_jsonl(source, **kwargs):
+        destination.write(line)
+        count += 1
+    return count
@@ -6,18 +6,25 @@ The plugin has been refactored into modular components for better maintainabilit
 Main API functions:
     - write(): Generate interactive SVG from QR code
     - write_advanced(): Generate QR code with advanced features
+    - write_archive(): Stream a batch of QR codes into a zip or tar.gz archive
+    - write_pack(): Render a batch of QR codes into an indexed pack file
     - register_with_segno(): Register plugin with Segno
 
 Modules:
     - interface: Main API functions
     - config: Configuration processing and validation
-    - export: File export and naming utilities
+    - export: File export, batch manifest and naming utilities
+    - archive: Streaming zip and tar.gz archive output
+    - pack: Indexed pack files with memory-mapped random access
     - rendering: SVG generation orchestration
     - patterns: Pattern-specific processing utilities
 """
 
 # Import main API functions
+from .archive import write_archive
+from .export import BatchManifest, ShardLayout
 from .interface import register_with_segno, write, write_advanced
+from .pack import PackReader, PackWriter, write_pack
 from .rendering import MAX_QR_SIZE, generate_interactive_svg
 
 # Public API only - internal functions are still importable via direct import
@@ -27,5 +34,11 @@ __all__ = [
     "write_advanced",
     "register_with_segno",
     "generate_interactive_svg",
+    "BatchManifest",
+    "ShardLayout",
+    "write_archive",
+    "write_pack",
+    "PackReader",
+    "PackWriter",
     "MAX_QR_SIZE",
 ]
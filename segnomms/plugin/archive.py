@@ -0,0 +1,316 @@
+"""Streaming archive output for the SegnoMMS plugin.
+
+This module writes rendered SVGs, and optionally their configurations and
+a batch manifest, straight into a zip or gzip-compressed tar archive on
+any writable binary stream. The stream does not need to be seekable, and
+at most a bounded number of rendered documents is held in memory at a
+time; the batch manifest is spooled to a temporary file until it is added.
+"""
+
+import io
+import json
+import shutil
+import tarfile
+import tempfile
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from types import TracebackType
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+from ..config import RenderingConfig
+from .export import (
+    _configuration_document,
+    _generate_matrix_digest,
+    _manifest_config_record,
+    _manifest_output_record,
+)
+from .rendering import prepare_rendering_config
+from .sequence import _render_symbol
+
+ArchiveFormat = Literal["zip", "tar.gz"]
+
+ARCHIVE_FORMATS = ("zip", "tar.gz")
+
+# Name of the batch manifest member added by write_archive
+MANIFEST_NAME = "manifest.jsonl"
+
+
+class ArchiveWriter:
+    """Append members to a zip or gzip-compressed tar archive on a stream.
+
+    Members are compressed and written as they are added, so the archive
+    can be sent to a socket, a pipe or an HTTP response without buffering
+    it. Zip archives on unseekable streams use data descriptors; tar
+    archives use the streaming ``w|gz`` mode.
+
+    Example:
+        >>> with open("codes.zip", "wb") as f, ArchiveWriter(f) as archive:
+        ...     archive.add("hello.svg", svg)
+    """
+
+    def __init__(
+        self, stream: BinaryIO, format: ArchiveFormat = "zip", mtime: Optional[float] = None
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            stream: Writable binary stream; it is not closed by the writer
+            format: Archive format, ``'zip'`` or ``'tar.gz'``
+            mtime: Modification time stored for members (default: now)
+
+        Raises:
+            ValueError: If the format is not supported
+        """
+        if format not in ARCHIVE_FORMATS:
+            raise ValueError(f"format must be one of {ARCHIVE_FORMATS}, got {format!r}")
+        self.format = format
+        self.mtime = time.time() if mtime is None else mtime
+        self.names: List[str] = []
+        self.bytes_written = 0
+        self._seen: Set[str] = set()
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._tar: Optional[tarfile.TarFile] = None
+        if format == "zip":
+            self._zip = zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_DEFLATED)
+        else:
+            self._tar = tarfile.open(fileobj=stream, mode="w|gz")
+
+    def add(self, name: str, data: Union[str, bytes]) -> int:
+        """Compress and write one member.
+
+        Args:
+            name: Member path inside the archive
+            data: Member content; text is encoded as UTF-8
+
+        Returns:
+            Uncompressed member size in bytes
+
+        Raises:
+            ValueError: If a member with the same name was already added
+        """
+        if name in self._seen:
+            raise ValueError(f"Duplicate archive member: {name}")
+        payload = data.encode("utf-8") if isinstance(data, str) else data
+
+        if self._zip is not None:
+            info = zipfile.ZipInfo(name, date_time=time.localtime(self.mtime)[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            self._zip.writestr(info, payload)
+        elif self._tar is not None:
+            tar_info = tarfile.TarInfo(name)
+            tar_info.size = len(payload)
+            tar_info.mtime = int(self.mtime)
+            tar_info.mode = 0o644
+            self._tar.addfile(tar_info, io.BytesIO(payload))
+
+        self._record(name, len(payload))
+        return len(payload)
+
+    def add_file(self, name: str, source: BinaryIO) -> int:
+        """Compress and write one member from a seekable binary file.
+
+        The content is copied in chunks, so large members such as a batch
+        manifest do not need to fit in memory.
+
+        Args:
+            name: Member path inside the archive
+            source: Seekable binary file; it is read from the start
+
+        Returns:
+            Uncompressed member size in bytes
+
+        Raises:
+            ValueError: If a member with the same name was already added
+        """
+        if name in self._seen:
+            raise ValueError(f"Duplicate archive member: {name}")
+        size = source.seek(0, io.SEEK_END)
+        source.seek(0)
+
+        if self._zip is not None:
+            info = zipfile.ZipInfo(name, date_time=time.localtime(self.mtime)[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            with self._zip.open(info, "w") as member:
+                shutil.copyfileobj(source, member)
+        elif self._tar is not None:
+            tar_info = tarfile.TarInfo(name)
+            tar_info.size = size
+            tar_info.mtime = int(self.mtime)
+            tar_info.mode = 0o644
+            self._tar.addfile(tar_info, source)
+
+        self._record(name, size)
+        return size
+
+    def _record(self, name: str, size: int) -> None:
+        self._seen.add(name)
+        self.names.append(name)
+        self.bytes_written += size
+
+    def close(self) -> None:
+        """Write the archive trailer; the underlying stream stays open."""
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+        if self._tar is not None:
+            self._tar.close()
+            self._tar = None
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def _archive_item(index: int, item: Any) -> Tuple[str, Any]:
+    """Split a batch item into its member name and QR code."""
+    if isinstance(item, tuple):
+        name, qr_code = item
+        return str(name), qr_code
+    return f"qr_{index + 1:06d}.svg", item
+
+
+def _render_batch(
+    items: Iterable[Tuple[str, Any]], config: RenderingConfig, workers: Optional[int] = None
+) -> Iterator[Tuple[str, Any, str]]:
+    """Render named QR codes, in completion order when using workers.
+
+    At most four symbols per worker are pending, so the input is consumed
+    lazily and memory stays bounded.
+
+    Args:
+        items: ``(name, qr_code)`` pairs
+        config: Configuration prepared with :func:`prepare_rendering_config`
+        workers: Number of worker processes; ``None`` or ``1`` renders serially
+
+    Yields:
+        ``(name, qr_code, svg_content)`` for every item
+    """
+    if not workers or workers <= 1:
+        for name, qr_code in items:
+            yield name, qr_code, _render_symbol(qr_code, config)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: Dict["Future[str]", Tuple[str, Any]] = {}
+        for name, qr_code in items:
+            if len(pending) >= workers * 4:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield (*pending.pop(future), future.result())
+            pending[pool.submit(_render_symbol, qr_code, config)] = (name, qr_code)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield (*pending.pop(future), future.result())
+
+
+def write_archive(
+    qr_codes: Iterable[Any],
+    out: BinaryIO,
+    format: ArchiveFormat = "zip",
+    workers: Optional[int] = None,
+    include_manifest: bool = True,
+    export_config: bool = False,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """Render a batch of QR codes straight into an archive stream.
+
+    Every symbol is rendered with one configuration built from ``kwargs``,
+    as accepted by :func:`~segnomms.plugin.write`. With workers, members
+    are added in the order rendering finishes, and at most four symbols per
+    worker are pending. The manifest is spooled to a temporary file, but
+    member names are kept for duplicate detection and the returned file
+    lists, so bookkeeping still grows by one name per member.
+
+    Args:
+        qr_codes: Segno QR code objects, or ``(name, qr_code)`` pairs naming
+            their archive member (default: ``qr_000001.svg``, ...)
+        out: Writable binary stream receiving the archive
+        format: Archive format, ``'zip'`` or ``'tar.gz'``
+        workers: Number of worker processes; ``None`` or ``1`` renders serially
+        include_manifest: Add a ``manifest.jsonl`` batch manifest member
+            recording the configuration once and every output
+        export_config: Add a ``<name>_config.json`` member per output
+        **kwargs: Rendering options
+
+    Returns:
+        dict: Result containing ``files`` (members in archive order),
+        ``config_files``, ``qr_count``, ``bytes`` (uncompressed size of all
+        members), ``format`` and ``manifest_file`` when a manifest is included
+
+    Raises:
+        ValueError: If the format is unsupported or member names collide
+
+    Example:
+        >>> codes = [segno.make(url) for url in urls]
+        >>> with open("campaign.zip", "wb") as f:
+        ...     write_archive(codes, f, workers=4, shape="circle")
+    """
+    config = RenderingConfig.from_kwargs(**kwargs)
+    prepared = prepare_rendering_config(config)
+    config_record = _manifest_config_record(config)
+    config_document = json.dumps(_configuration_document(config), indent=2, ensure_ascii=False)
+    svg_files: List[str] = []
+    config_files: List[str] = []
+    qr_count = 0
+
+    with ArchiveWriter(out, format) as archive, tempfile.TemporaryFile() as manifest:
+
+        def write_record(record: Dict[str, Any]) -> None:
+            manifest.write((json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8"))
+
+        def store(name: str, digest: str, svg_content: str) -> None:
+            size = archive.add(name, svg_content)
+            svg_files.append(name)
+            if include_manifest:
+                write_record(_manifest_output_record(name, config_record["ref"], digest, size))
+            if export_config:
+                config_name = f"{Path(name).with_suffix('').as_posix()}_config.json"
+                archive.add(config_name, config_document)
+                config_files.append(config_name)
+
+        if include_manifest:
+            write_record(config_record)
+        items = (_archive_item(index, item) for index, item in enumerate(qr_codes))
+        for name, qr_code, svg_content in _render_batch(items, prepared, workers):
+            store(name, _generate_matrix_digest(qr_code), svg_content)
+            qr_count += 1
+
+        if include_manifest:
+            archive.add_file(MANIFEST_NAME, manifest)
+
+    result: Dict[str, Any] = {
+        "success": True,
+        "format": format,
+        "files": svg_files,
+        "config_files": config_files,
+        "qr_count": qr_count,
+        "bytes": archive.bytes_written,
+    }
+    if include_manifest:
+        result["manifest_file"] = MANIFEST_NAME
+    return result
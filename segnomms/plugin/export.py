@@ -7,8 +7,13 @@ functionality for the plugin system.
 import hashlib
 import json
 import logging
+import os
+import secrets
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union
 
 from ..config import RenderingConfig
 
@@ -62,11 +67,402 @@ def _generate_config_hash(config: RenderingConfig) -> str:
     return hashlib.sha256(config_str.encode()).hexdigest()
 
 
+def _generate_full_config_hash(config: RenderingConfig) -> str:
+    """Generate a hash of the complete rendering configuration.
+
+    Unlike :func:`_generate_config_hash`, every field is included, so any
+    change that can affect the output changes the hash.
+
+    Args:
+        config: Rendering configuration
+
+    Returns:
+        Hexadecimal hash string
+    """
+    config_str = json.dumps(config.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(config_str.encode()).hexdigest()
+
+
+def _generate_matrix_digest(qr_code: Any) -> str:
+    """Generate a hash of the symbol a QR code encodes.
+
+    Args:
+        qr_code: Segno QR code object
+
+    Returns:
+        Hexadecimal hash of the version, error level and module matrix
+    """
+    digest = hashlib.sha256(f"{qr_code.version}:{qr_code.error}\n".encode())
+    for row in qr_code.matrix:
+        digest.update(bytes(1 if module else 0 for module in row))
+    return digest.hexdigest()
+
+
+def _generate_content_key(qr_code: Any, config: RenderingConfig) -> str:
+    """Generate the content address of a rendered QR code.
+
+    Combines the matrix digest, the full configuration hash and the
+    SegnoMMS version, so equal keys mean identical output and files
+    rendered by another version are not reused.
+
+    Args:
+        qr_code: Segno QR code object
+        config: Rendering configuration
+
+    Returns:
+        Hexadecimal content key
+    """
+    key_str = f"{_generate_matrix_digest(qr_code)}:{_generate_full_config_hash(config)}:{_package_version()}"
+    return hashlib.sha256(key_str.encode()).hexdigest()
+
+
+def _generate_payload_digest(content: str) -> str:
+    """Generate a hash of the payload text encoded in a QR code."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    """Write a text file atomically.
+
+    The content is written to a temporary file in the same directory and
+    renamed over the target, so readers never see a partial file.
+
+    Args:
+        path: Target file path
+        text: File content
+    """
+    # Created with mode 0o666 so the process umask applies like with open()
+    while True:
+        temp_name = str(path.parent / f".{path.name}.{secrets.token_hex(8)}.tmp")
+        try:
+            fd = os.open(temp_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            break
+        except FileExistsError:
+            continue
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _write_text(path: Path, text: str, atomic: bool = False) -> None:
+    """Write a text file, atomically if requested.
+
+    Plain writes go through ``open()``, so symlinks, file modes and special
+    files like ``/dev/stdout`` behave as usual.
+    """
+    if atomic:
+        _atomic_write_text(path, text)
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+def _config_sidecar_path(svg_path: Path, format: str = "json") -> Path:
+    """Get the configuration file path exported next to an SVG file."""
+    return svg_path.parent / (svg_path.stem + "_config." + format)
+
+
+@dataclass(frozen=True)
+class ShardLayout:
+    """Nested hash-prefix directory layout for hash-named outputs.
+
+    A key is stored ``depth`` directories deep, each directory named after
+    the next ``width`` characters of the key. With hexadecimal keys every
+    level fans out into at most ``16 ** width`` directories, so the default
+    layout spreads outputs over 65536 leaf directories::
+
+        root/ab/cd/qr_abcdef0123456789.svg
+
+    Paths are computed from the key alone, so :meth:`resolve` finds an
+    output without listing any directory.
+
+    Attributes:
+        depth: Number of nested shard directories (0 disables sharding)
+        width: Key characters used per directory level
+    """
+
+    depth: int = 2
+    width: int = 2
+
+    def __post_init__(self) -> None:
+        if self.depth < 0:
+            raise ValueError(f"depth must be >= 0, got {self.depth}")
+        if self.width < 1:
+            raise ValueError(f"width must be >= 1, got {self.width}")
+
+    def directory(self, root: Union[str, Path], key: str) -> Path:
+        """Get the shard directory of a key.
+
+        Args:
+            root: Root output directory
+            key: Hash key; must have at least ``depth * width`` characters
+
+        Returns:
+            Directory the key is stored in
+
+        Raises:
+            ValueError: If the key is too short for the layout
+        """
+        if len(key) < self.depth * self.width:
+            raise ValueError(f"Key {key!r} is too short for {self.depth} levels of {self.width} characters")
+        parts = [key[level * self.width : (level + 1) * self.width] for level in range(self.depth)]
+        return Path(root).joinpath(*parts)
+
+    def resolve(self, root: Union[str, Path], key: str, suffix: str = ".svg") -> Path:
+        """Map a key back to its output path.
+
+        Args:
+            root: Root output directory
+            key: Hash key as used in the output file name
+            suffix: File extension
+
+        Returns:
+            Path of ``qr_<key><suffix>`` within its shard directory
+        """
+        return self.directory(root, key) / f"qr_{key}{suffix}"
+
+    def resolve_name(self, root: Union[str, Path], name: str) -> Path:
+        """Map an arbitrary file name to its sharded path.
+
+        Names that are not hashes (such as caller IDs) are spread by the
+        SHA-256 of the name, so they can be found again the same way.
+
+        Args:
+            root: Root output directory
+            name: File name
+
+        Returns:
+            Path of ``name`` within its shard directory
+        """
+        return self.directory(root, hashlib.sha256(name.encode("utf-8")).hexdigest()) / name
+
+
+def _package_version() -> str:
+    try:
+        from .. import __version__
+    except ImportError:
+        return "unknown"
+    return __version__
+
+
+def _config_ref(config: RenderingConfig) -> str:
+    """Get the reference of a configuration in a batch manifest."""
+    return _generate_full_config_hash(config)[:16]
+
+
+def _manifest_config_record(config: RenderingConfig) -> Dict[str, Any]:
+    """Build the manifest record describing a configuration."""
+    return {
+        "type": "config",
+        "ref": _config_ref(config),
+        "segnomms_version": _package_version(),
+        "schema_version": "1.0",
+        "configuration": config.model_dump(exclude_none=True, mode="json"),
+    }
+
+
+def _manifest_output_record(
+    path: Union[str, Path],
+    config_ref: str,
+    payload_digest: str,
+    size: int,
+    sequence_index: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Build the manifest record describing one output."""
+    return {
+        "type": "output",
+        "path": str(path),
+        "payload_digest": payload_digest,
+        "config_ref": config_ref,
+        "sequence_index": sequence_index,
+        "bytes": size,
+    }
+
+
+class BatchManifest:
+    """JSONL manifest aggregating the configuration exports of a batch.
+
+    Instead of one configuration sidecar per output, each distinct
+    configuration is recorded once as a ``config`` line, and every output
+    adds an ``output`` line referencing it by ``config_ref``. Lines are
+    buffered and appended to the file in bulk every ``flush_every`` outputs
+    and on :meth:`flush`. Appending to an existing manifest reuses the
+    configurations it already records.
+
+    Output lines contain ``path``, ``payload_digest`` (SHA-256 of the
+    payload text, or of the encoded symbol when only the QR code is known),
+    ``config_ref``, ``sequence_index`` and ``bytes``.
+
+    Example:
+        >>> with BatchManifest("codes/manifest.jsonl") as manifest:
+        ...     for i, text in enumerate(texts):
+        ...         write(segno.make(text), f"codes/{i}.svg", manifest=manifest)
+    """
+
+    def __init__(self, path: Union[str, Path], flush_every: int = 256) -> None:
+        """Initialize the manifest.
+
+        Args:
+            path: Manifest file path; created or appended to
+            flush_every: Number of buffered lines that triggers a write
+        """
+        self.path = Path(path)
+        self.flush_every = max(1, flush_every)
+        self._lock = threading.Lock()
+        self._pending: List[str] = []
+        self._config_refs: Set[str] = self._read_config_refs(self.path) if self.path.exists() else set()
+
+    def add_config(self, config: RenderingConfig) -> str:
+        """Record a configuration if it is new to the manifest.
+
+        Args:
+            config: Rendering configuration
+
+        Returns:
+            Configuration reference used by output lines
+        """
+        ref = _config_ref(config)
+        with self._lock:
+            if ref not in self._config_refs:
+                self._config_refs.add(ref)
+                self._pending.append(json.dumps(_manifest_config_record(config), ensure_ascii=False))
+        return ref
+
+    def add(
+        self,
+        path: Union[str, Path],
+        config: RenderingConfig,
+        payload_digest: str,
+        size: int,
+        sequence_index: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Record one output file.
+
+        Args:
+            path: Output file path
+            config: Configuration the output was rendered with
+            payload_digest: Digest of the payload or encoded symbol
+            size: Output size in bytes
+            sequence_index: 1-based index within a structured append sequence
+
+        Returns:
+            The recorded output entry
+        """
+        entry = _manifest_output_record(path, self.add_config(config), payload_digest, size, sequence_index)
+        with self._lock:
+            self._pending.append(json.dumps(entry, ensure_ascii=False))
+            if len(self._pending) >= self.flush_every:
+                self._flush_locked()
+        return entry
+
+    def flush(self) -> None:
+        """Append all buffered lines to the manifest file."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        data = "\n".join(self._pending) + "\n"
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(data)
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Flush the manifest."""
+        self.flush()
+
+    def __enter__(self) -> "BatchManifest":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    @staticmethod
+    def _read_config_refs(path: Path) -> Set[str]:
+        """Stream a manifest and collect only its configuration references."""
+        refs: Set[str] = set()
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                # Quotes inside JSON strings are escaped, so output lines never contain this
+                if '"type": "config"' not in line:
+                    continue
+                record = json.loads(line)
+                if record.get("type") == "config":
+                    refs.add(record["ref"])
+        return refs
+
+    @staticmethod
+    def read(path: Union[str, Path]) -> Tuple[Dict[str, Dict[str, Any]], List[Dict[str, Any]]]:
+        """Read a manifest file.
+
+        Args:
+            path: Manifest file path
+
+        Returns:
+            Configurations by reference and output entries in file order
+        """
+        configs: Dict[str, Dict[str, Any]] = {}
+        outputs: List[Dict[str, Any]] = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record.get("type") == "config":
+                    configs[record["ref"]] = record
+                elif record.get("type") == "output":
+                    outputs.append(record)
+        return configs, outputs
+
+
+def _configuration_document(
+    config: RenderingConfig, additional_metadata: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Build the configuration document exported alongside an output.
+
+    Args:
+        config: Rendering configuration to export
+        additional_metadata: Extra metadata to include
+
+    Returns:
+        JSON-serializable configuration document
+    """
+    # Prepare configuration data
+    config_data = {
+        "segnomms_version": _package_version(),
+        "schema_version": "1.0",
+        "generation_timestamp": None,  # Could add timestamp if needed
+        "configuration": config.model_dump(exclude_none=True, mode="json"),
+    }
+
+    # Add additional metadata if provided
+    if additional_metadata:
+        config_data["metadata"] = additional_metadata
+
+    # Add JSON schema reference
+    config_data["$schema"] = "https://segnomms.io/schemas/v1/rendering-config.json"
+    return config_data
+
+
 def _export_configuration(
     config: RenderingConfig,
     svg_path: Path,
     format: str = "json",
     additional_metadata: Optional[Dict[str, Any]] = None,
+    atomic: bool = False,
 ) -> Optional[Path]:
     """Export rendering configuration alongside SVG file.
 
@@ -78,6 +474,7 @@ def _export_configuration(
         svg_path: Path to the SVG file
         format: Export format ('json' or 'yaml')
         additional_metadata: Extra metadata to include
+        atomic: Write through a temporary file that is renamed into place
 
     Returns:
         Path to the configuration file if created, None otherwise
@@ -85,51 +482,28 @@ def _export_configuration(
     try:
         # Determine config filename
         if format in ["json", "yaml"]:
-            config_filename = svg_path.stem + "_config." + format
+            config_path = _config_sidecar_path(svg_path, format)
         else:
             # Invalid format - return None
             return None
 
-        config_path = svg_path.parent / config_filename
-
-        # Prepare configuration data
-        try:
-            from .. import __version__
-
-            segnomms_version = __version__
-        except ImportError:
-            segnomms_version = "unknown"
-
-        config_data = {
-            "segnomms_version": segnomms_version,
-            "schema_version": "1.0",
-            "generation_timestamp": None,  # Could add timestamp if needed
-            "configuration": config.model_dump(exclude_none=True, mode="json"),
-        }
-
-        # Add additional metadata if provided
-        if additional_metadata:
-            config_data["metadata"] = additional_metadata
-
-        # Add JSON schema reference
-        config_data["$schema"] = "https://segnomms.io/schemas/v1/rendering-config.json"
+        config_data = _configuration_document(config, additional_metadata)
 
         # Export based on format
         if format == "json":
-            with open(config_path, "w", encoding="utf-8") as f:
-                json.dump(config_data, f, indent=2, ensure_ascii=False)
+            _write_text(config_path, json.dumps(config_data, indent=2, ensure_ascii=False), atomic)
         elif format == "yaml":
             # Optional YAML support
             try:
                 import yaml
 
-                with open(config_path, "w", encoding="utf-8") as f:
-                    yaml.dump(config_data, f, default_flow_style=False, allow_unicode=True)
+                _write_text(
+                    config_path, yaml.dump(config_data, default_flow_style=False, allow_unicode=True), atomic
+                )
             except ImportError:
                 # Fall back to JSON if yaml not available
-                config_path = svg_path.parent / (svg_path.stem + "_config.json")
-                with open(config_path, "w", encoding="utf-8") as f:
-                    json.dump(config_data, f, indent=2, ensure_ascii=False)
+                config_path = _config_sidecar_path(svg_path, "json")
+                _write_text(config_path, json.dumps(config_data, indent=2, ensure_ascii=False), atomic)
 
         return config_path
 
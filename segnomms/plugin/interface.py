@@ -6,14 +6,26 @@ This module contains the primary public functions that users interact with:
 - register_with_segno(): Register plugin with Segno
 """
 
+import hashlib
 import logging
 from pathlib import Path
-from typing import Any, BinaryIO, Dict, Optional, TextIO, Union
+from typing import Any, BinaryIO, Dict, List, Optional, TextIO, Union
 
 from ..config import RenderingConfig
 from .config import AdvancedQRConfig, create_advanced_qr_generator
-from .export import _export_configuration, _generate_config_hash
+from .export import (
+    BatchManifest,
+    ShardLayout,
+    _config_sidecar_path,
+    _export_configuration,
+    _generate_config_hash,
+    _generate_content_key,
+    _generate_matrix_digest,
+    _generate_payload_digest,
+    _write_text,
+)
 from .rendering import generate_interactive_svg
+from .sequence import compose_sequence_sheet, render_sequence
 
 # Maximum QR code size to prevent DoS attacks
 MAX_QR_SIZE = 1000  # ~1000x1000 modules is very large but still reasonable
@@ -35,6 +47,22 @@ def write(qr_code: Any, out: Union[TextIO, BinaryIO, str], **kwargs: Any) -> Opt
         and defaults:
         https://segnomms.readthedocs.io/en/latest/api/main.html
 
+        With ``content_addressed=True`` and a file path, the SVG is stored as
+        ``qr_<key>.svg`` in the target directory, where the key combines the
+        matrix digest and the full configuration hash. If that file (and its
+        configuration sidecar, when exported) already exists, rendering and
+        writing are skipped and the result has ``skipped=True``.
+
+        With ``manifest=BatchManifest(...)``, the output is recorded in the
+        batch manifest instead of a per-file configuration sidecar.
+
+        With ``shard_layout=ShardLayout(...)``, content-addressed outputs
+        are stored in nested hash-prefix directories below the target
+        directory instead of directly in it. Sharding requires
+        ``content_addressed=True``: ``use_hash_naming`` keys on the legacy
+        ``config_hash[:8]``, which ignores the payload, so every code
+        rendered with one configuration would share a single file.
+
     Raises:
         ValueError: If an invalid option combination is provided.
         TypeError: If the output type is not supported.
@@ -57,10 +85,11 @@ def write(qr_code: Any, out: Union[TextIO, BinaryIO, str], **kwargs: Any) -> Opt
     # Extract export configuration options
     export_config = kwargs.get("export_config", True)
     use_hash_naming = kwargs.get("use_hash_naming", False)
+    content_addressed = kwargs.get("content_addressed", False)
     config_format = kwargs.get("config_format", "json")  # json or yaml
-
-    # Generate the SVG content
-    svg_content = generate_interactive_svg(qr_code, config)
+    manifest: Optional[BatchManifest] = kwargs.get("manifest")
+    shard_layout: Optional[ShardLayout] = kwargs.get("shard_layout")
+    export_sidecar = export_config and manifest is None
 
     # Track files created
     files_created = []
@@ -71,29 +100,85 @@ def write(qr_code: Any, out: Union[TextIO, BinaryIO, str], **kwargs: Any) -> Opt
     if isinstance(out, str):
         # File path provided - handle new naming and config export
         output_path = Path(out)
+        content_key = None
+
+        if shard_layout is not None and not content_addressed:
+            raise ValueError("shard_layout requires content_addressed output")
+
+        if content_addressed:
+            content_key = _generate_content_key(qr_code, config)
+            if shard_layout is not None:
+                output_path = shard_layout.resolve(output_path.parent, content_key[:16])
+            else:
+                output_path = output_path.parent / f"qr_{content_key[:16]}.svg"
+
+            # Identical output already stored: skip rendering and writing
+            existing_config = _find_config_sidecar(output_path) if export_sidecar else None
+            if output_path.exists() and (existing_config or not export_sidecar):
+                if manifest is not None:
+                    manifest.add(
+                        output_path, config, _generate_matrix_digest(qr_code), output_path.stat().st_size
+                    )
+                result = {
+                    "files": [str(output_path)] + ([str(existing_config)] if existing_config else []),
+                    "svg_file": str(output_path),
+                    "config_files": [str(existing_config)] if existing_config else [],
+                    "files_created": [],
+                    "content_key": content_key[:16],
+                    "skipped": True,
+                }
+                if manifest is not None:
+                    result["manifest_file"] = str(manifest.path)
+                return result
 
         # Generate config hash if needed for naming or export
         if use_hash_naming or export_config:
             config_hash = _generate_config_hash(config)
 
         # Generate improved filename if requested
-        if use_hash_naming and config_hash:
+        if use_hash_naming and config_hash and not content_addressed:
             new_filename = f"qr_{config_hash[:8]}.svg"
             output_path = output_path.parent / new_filename
 
         # Write SVG file
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(svg_content)
+        svg_content = generate_interactive_svg(qr_code, config)
+        if shard_layout is not None:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Content-addressed files may be read concurrently, so they are
+        # replaced atomically; plain paths keep open() semantics
+        _write_text(output_path, svg_content, atomic=content_addressed)
         files_created.append(str(output_path))
 
-        # Export configuration if requested
-        if export_config:
-            config_path = _export_configuration(config, output_path, config_format)
+        # Record the output in the batch manifest or export a configuration sidecar
+        if manifest is not None:
+            manifest.add(
+                output_path, config, _generate_matrix_digest(qr_code), len(svg_content.encode("utf-8"))
+            )
+        elif export_config:
+            metadata = {"content_key": content_key} if content_key else None
+            config_path = _export_configuration(
+                config, output_path, config_format, metadata, atomic=content_addressed
+            )
             if config_path:
                 files_created.append(str(config_path))
 
-        # Return result information if hash naming or config export was used
-        if use_hash_naming or export_config:
+        if content_key:
+            result = {
+                "files": files_created,
+                "svg_file": str(output_path),
+                "config_files": [str(config_path)] if config_path else [],
+                "files_created": list(files_created),
+                "content_key": content_key[:16],
+                "skipped": False,
+            }
+            if config_path:
+                result["config_file"] = str(config_path)
+            if manifest is not None:
+                result["manifest_file"] = str(manifest.path)
+            return result
+
+        # Return result information if hash naming, config export or a manifest was used
+        if use_hash_naming or export_config or manifest is not None:
             result = {
                 "files": files_created,
                 "svg_file": str(output_path),
@@ -104,12 +189,16 @@ def write(qr_code: Any, out: Union[TextIO, BinaryIO, str], **kwargs: Any) -> Opt
                 result["config_hash"] = config_hash[:8]
             if export_config and config_path:
                 result["config_file"] = str(config_path)  # Backward compatibility
+            if manifest is not None:
+                result["manifest_file"] = str(manifest.path)
             return result
 
         # No special result needed for basic file output
         return None
 
     elif hasattr(out, "write"):
+        svg_content = generate_interactive_svg(qr_code, config)
+
         # Stream provided - use type: ignore for complex Union handling
         if hasattr(out, "mode") and "b" in getattr(out, "mode", ""):
             # Binary mode - write as UTF-8 bytes
@@ -128,6 +217,24 @@ def write(qr_code: Any, out: Union[TextIO, BinaryIO, str], **kwargs: Any) -> Opt
         raise TypeError(f"Unsupported output type: {type(out)}")
 
 
+def _find_config_sidecar(svg_path: Path) -> Optional[Path]:
+    """Find an exported configuration file next to an SVG file."""
+    for format in ("json", "yaml"):
+        config_path = _config_sidecar_path(svg_path, format)
+        if config_path.exists():
+            return config_path
+    return None
+
+
+def _content_addressed_path(root: Path, key: str, suffix: str, shard_layout: Optional[ShardLayout]) -> Path:
+    """Get the path of a content-addressed output, creating its shard directory."""
+    if shard_layout is None:
+        return root / f"qr_{key}{suffix}"
+    path = shard_layout.resolve(root, key, suffix)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 def write_advanced(content: str, out: Union[TextIO, BinaryIO, str], **kwargs: Any) -> Dict[str, Any]:
     """Write advanced QR code(s) with ECI, mask patterns, or structured append.
 
@@ -156,7 +263,20 @@ def write_advanced(content: str, out: Union[TextIO, BinaryIO, str], **kwargs: An
             Export Options:
             * export_config (bool): Export configuration file (default: True)
             * use_hash_naming (bool): Use content-based filenames (default: False)
+            * content_addressed (bool): Name outputs ``qr_<key>`` after the
+              symbol matrix, configuration and version, as write() does;
+              sequence items add their index (default: False)
             * config_format (str): Configuration format - 'json' or 'yaml' (default: 'json')
+            * manifest (BatchManifest): Record outputs in a batch manifest instead
+              of writing a configuration sidecar per file
+            * shard_layout (ShardLayout): Store content-addressed outputs in nested
+              hash-prefix directories (requires content_addressed)
+
+            Sequence Options:
+            * workers (int): Worker processes used to render sequence symbols
+              (default: None, render serially)
+            * sequence_sheet (str): Write the whole sequence as one 'svg' or 'html'
+              sheet with shared styles and definitions instead of one file per symbol
 
             Rendering Options:
             All standard rendering options from write() are supported
@@ -168,6 +288,8 @@ def write_advanced(content: str, out: Union[TextIO, BinaryIO, str], **kwargs: An
             - warnings (list): Any generation warnings
             - advanced_config (dict): Advanced QR configuration used
             - fallback_used (bool): Whether fallback generation was used
+            - content_keys (list): Keys of the written outputs, with
+              content_addressed
 
     Example:
         >>> result = write_advanced(
@@ -247,7 +369,23 @@ def write_advanced(content: str, out: Union[TextIO, BinaryIO, str], **kwargs: An
     # Extract export configuration options
     export_config = kwargs.get("export_config", True)
     use_hash_naming = kwargs.get("use_hash_naming", False)
+    content_addressed = kwargs.get("content_addressed", False)
     config_format = kwargs.get("config_format", "json")
+    manifest: Optional[BatchManifest] = kwargs.get("manifest")
+    shard_layout: Optional[ShardLayout] = kwargs.get("shard_layout")
+    if shard_layout is not None and not content_addressed:
+        raise ValueError("shard_layout requires content_addressed output")
+    content_keys: List[str] = []
+    payload_digest = _generate_payload_digest(content)
+
+    # Extract sequence options
+    workers = kwargs.get("workers")
+    sequence_sheet = kwargs.get("sequence_sheet")
+    if sequence_sheet not in (None, "svg", "html"):
+        raise ValueError(f"sequence_sheet must be 'svg' or 'html', got {sequence_sheet!r}")
+
+    # Serialize the advanced configuration once for all metadata
+    advanced_config_data = advanced_config.model_dump()
 
     # Handle output for single QR or sequence
     files_created = []
@@ -282,61 +420,122 @@ def write_advanced(content: str, out: Union[TextIO, BinaryIO, str], **kwargs: An
             base_name = base_path
             extension = ""
 
-        # Generate each QR in sequence
-        for i, qr in enumerate(result.qr_codes):
-            if use_hash_naming:
-                # Generate config with sequence metadata
-                seq_config = rendering_config.model_copy()
-                seq_config.metadata = seq_config.metadata or {}
-                seq_config.metadata["sequence_index"] = i + 1
-                seq_config.metadata["sequence_total"] = len(result.qr_codes)
-
-                config_hash = _generate_config_hash(seq_config)
-                sequence_filename = f"qr_{config_hash[:8]}_seq{i + 1:02d}{extension}"
-                sequence_path = Path(base_path).parent / sequence_filename
+        total = len(result.qr_codes)
+
+        if sequence_sheet:
+            # Symbols carry no runtime of their own; the sheet adds it once
+            symbol_config = rendering_config.model_copy(
+                update={"style": rendering_config.style.model_copy(update={"runtime_assets": "shared"})}
+            )
+            documents = render_sequence(result.qr_codes, symbol_config, workers)
+            sheet_content = compose_sequence_sheet(documents, rendering_config, sequence_sheet)
+
+            if content_addressed:
+                # The sheet is addressed by the keys of all its symbols
+                symbol_keys = ":".join(_generate_content_key(qr, rendering_config) for qr in result.qr_codes)
+                content_keys.append(hashlib.sha256(symbol_keys.encode()).hexdigest())
+                sheet_path = _content_addressed_path(
+                    Path(base_path).parent,
+                    content_keys[-1][:16],
+                    f"_seq{total:02d}.{sequence_sheet}",
+                    shard_layout,
+                )
+            elif use_hash_naming:
+                config_hash = _generate_config_hash(rendering_config)
+                sheet_path = Path(base_path).parent / f"qr_{config_hash[:8]}_seq{total:02d}.{sequence_sheet}"
             else:
-                # Standard sequence naming: base-03-01.svg, base-03-02.svg, etc.
-                total = len(result.qr_codes)
-                sequence_filename = f"{Path(base_name).name}-{total:02d}-{i + 1:02d}{extension}"
-                sequence_path = Path(base_path).parent / sequence_filename
-
-            # Generate SVG for this QR
-            svg_content = generate_interactive_svg(qr, rendering_config)
-
-            with open(sequence_path, "w", encoding="utf-8") as f:
-                f.write(svg_content)
-            files_created.append(str(sequence_path))
-
-            # Export config for each sequence item if requested
-            if export_config:
-                if use_hash_naming:
-                    # Add metadata to hash-named config
-                    hash_metadata = {
-                        "sequence_index": i + 1,
-                        "sequence_total": len(result.qr_codes),
-                        "content": content,
-                        "advanced_config": advanced_config.model_dump(),
-                    }
-                    config_path = _export_configuration(
-                        seq_config, sequence_path, config_format, hash_metadata
+                sheet_path = Path(f"{base_name}-{total:02d}.{sequence_sheet}")
+
+            _write_text(sheet_path, sheet_content, atomic=content_addressed)
+            files_created.append(str(sheet_path))
+
+            if manifest is not None:
+                manifest.add(sheet_path, rendering_config, payload_digest, len(sheet_content.encode("utf-8")))
+            elif export_config:
+                sheet_metadata = {
+                    "sequence_total": total,
+                    "sequence_sheet": sequence_sheet,
+                    "content": content,
+                    "advanced_config": advanced_config_data,
+                }
+                if content_addressed:
+                    sheet_metadata["content_key"] = content_keys[-1]
+                config_path = _export_configuration(
+                    rendering_config, sheet_path, config_format, sheet_metadata, atomic=content_addressed
+                )
+                if config_path:
+                    config_files_created.append(str(config_path))
+
+        else:
+            documents = render_sequence(result.qr_codes, rendering_config, workers)
+
+            # Write each QR in sequence
+            for i, svg_content in enumerate(documents):
+                if content_addressed:
+                    # Symbols of one sequence differ in their matrix; the index keeps names readable
+                    content_keys.append(_generate_content_key(result.qr_codes[i], rendering_config))
+                    sequence_path = _content_addressed_path(
+                        Path(base_path).parent, content_keys[-1][:16], f"_seq{i + 1:02d}.svg", shard_layout
                     )
+                elif use_hash_naming:
+                    # Generate config with sequence metadata
+                    seq_config = rendering_config.model_copy()
+                    seq_config.metadata = seq_config.metadata or {}
+                    seq_config.metadata["sequence_index"] = i + 1
+                    seq_config.metadata["sequence_total"] = total
+
+                    config_hash = _generate_config_hash(seq_config)
+                    sequence_filename = f"qr_{config_hash[:8]}_seq{i + 1:02d}{extension}"
+                    sequence_path = Path(base_path).parent / sequence_filename
                 else:
-                    # Add sequence metadata including content and advanced config
-                    sequence_metadata = {
-                        "sequence_index": i + 1,
-                        "sequence_total": len(result.qr_codes),
-                        "content": content,
-                        "advanced_config": advanced_config.model_dump(),
-                    }
-                    config_path = _export_configuration(
-                        rendering_config,
+                    # Standard sequence naming: base-03-01.svg, base-03-02.svg, etc.
+                    sequence_filename = f"{Path(base_name).name}-{total:02d}-{i + 1:02d}{extension}"
+                    sequence_path = Path(base_path).parent / sequence_filename
+
+                _write_text(sequence_path, svg_content, atomic=content_addressed)
+                files_created.append(str(sequence_path))
+
+                # Record each sequence item in the manifest or export its config if requested
+                if manifest is not None:
+                    manifest.add(
                         sequence_path,
-                        config_format,
-                        sequence_metadata,
+                        rendering_config,
+                        payload_digest,
+                        len(svg_content.encode("utf-8")),
+                        sequence_index=i + 1,
                     )
-
-                if config_path:
-                    config_files_created.append(str(config_path))
+                elif export_config:
+                    if use_hash_naming and not content_addressed:
+                        # Add metadata to hash-named config
+                        hash_metadata = {
+                            "sequence_index": i + 1,
+                            "sequence_total": total,
+                            "content": content,
+                            "advanced_config": advanced_config_data,
+                        }
+                        config_path = _export_configuration(
+                            seq_config, sequence_path, config_format, hash_metadata
+                        )
+                    else:
+                        # Add sequence metadata including content and advanced config
+                        sequence_metadata = {
+                            "sequence_index": i + 1,
+                            "sequence_total": total,
+                            "content": content,
+                            "advanced_config": advanced_config_data,
+                        }
+                        if content_addressed:
+                            sequence_metadata["content_key"] = content_keys[-1]
+                        config_path = _export_configuration(
+                            rendering_config,
+                            sequence_path,
+                            config_format,
+                            sequence_metadata,
+                            atomic=content_addressed,
+                        )
+
+                    if config_path:
+                        config_files_created.append(str(config_path))
 
     else:
         # Single QR code output
@@ -363,28 +562,38 @@ def write_advanced(content: str, out: Union[TextIO, BinaryIO, str], **kwargs: An
                     f"Output must be a file path (str/Path) or file-like object, " f"got {type(out).__name__}"
                 )
             output_path = Path(str(out))
-            if use_hash_naming:
+            if content_addressed:
+                content_keys.append(_generate_content_key(qr, rendering_config))
+                output_path = _content_addressed_path(
+                    output_path.parent, content_keys[-1][:16], ".svg", shard_layout
+                )
+            elif use_hash_naming:
                 config_hash = _generate_config_hash(rendering_config)
                 new_filename = f"qr_{config_hash[:8]}.svg"
                 output_path = output_path.parent / new_filename
 
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(svg_content)
+            _write_text(output_path, svg_content, atomic=content_addressed)
             files_created.append(str(output_path))
 
-            # Export configuration if requested
-            if export_config:
+            # Record the output in the manifest or export its configuration if requested
+            if manifest is not None:
+                manifest.add(output_path, rendering_config, payload_digest, len(svg_content.encode("utf-8")))
+            elif export_config:
                 # Create metadata with content and advanced config
                 metadata = {
                     "content": content,
-                    "advanced_config": advanced_config.model_dump(),
+                    "advanced_config": advanced_config_data,
                 }
-                config_path = _export_configuration(rendering_config, output_path, config_format, metadata)
+                if content_addressed:
+                    metadata["content_key"] = content_keys[-1]
+                config_path = _export_configuration(
+                    rendering_config, output_path, config_format, metadata, atomic=content_addressed
+                )
                 if config_path:
                     config_files_created.append(str(config_path))
 
     # Return comprehensive result
-    return {
+    response = {
         "success": True,
         "files_created": files_created,
         "config_files_created": config_files_created,
@@ -394,10 +603,15 @@ def write_advanced(content: str, out: Union[TextIO, BinaryIO, str], **kwargs: An
         "qr_count": len(result.qr_codes),
         "is_sequence": result.is_sequence,
         "metadata": result.metadata,
-        "advanced_config": advanced_config.model_dump(),
+        "advanced_config": advanced_config_data,
         "fallback_used": getattr(result, "fallback_used", False),
         "export_config": export_config,
     }
+    if content_addressed:
+        response["content_keys"] = [key[:16] for key in content_keys]
+    if manifest is not None:
+        response["manifest_file"] = str(manifest.path)
+    return response
 
 
 def register_with_segno() -> bool:
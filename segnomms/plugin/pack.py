@@ -0,0 +1,384 @@
+"""Indexed pack files for serving pre-rendered QR codes.
+
+A pack stores many rendered SVGs in one append-only file, optionally
+gzip-compressed, followed by an offset index and a fixed-size footer::
+
+    header | record | record | ... | index | footer
+
+Appending to a pack writes new records after the old footer and then a new
+index covering all records, so existing bytes are never rewritten. Readers
+use the last complete index; if a writer died before writing its footer,
+the pack falls back to the index of the last closed session.
+:class:`PackReader` memory-maps the file and
+returns zero-copy ``memoryview`` slices, so a lookup is a dictionary access
+without any filesystem calls.
+"""
+
+import gzip
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+from ..config import RenderingConfig
+from .archive import _render_batch
+from .export import _generate_content_key
+from .rendering import prepare_rendering_config
+
+PACK_MAGIC = b"SMMSPACK"
+PACK_VERSION = 1
+
+# Header: magic, format version, reserved
+_HEADER = struct.Struct("<8sB3x")
+# Index entry after its UTF-8 key: key length precedes the key
+_KEY_LENGTH = struct.Struct("<H")
+_ENTRY = struct.Struct("<QIIB")
+# Footer: index offset, entry count, magic
+_FOOTER = struct.Struct("<QQ8s")
+_FOOTER_MAGIC = b"SMMSIDX1"
+
+# Entry flag: the stored bytes are a gzip member
+FLAG_GZIP = 1
+
+
+@dataclass(frozen=True)
+class PackEntry:
+    """Location of one record in a pack.
+
+    Attributes:
+        offset: Byte offset of the stored data
+        size: Stored size in bytes
+        raw_size: Uncompressed size in bytes
+        flags: Record flags (``FLAG_GZIP``)
+    """
+
+    offset: int
+    size: int
+    raw_size: int
+    flags: int = 0
+
+    @property
+    def content_encoding(self) -> Optional[str]:
+        """HTTP content encoding of the stored bytes, if compressed."""
+        return "gzip" if self.flags & FLAG_GZIP else None
+
+
+def _parse_index(data: Union[bytes, mmap.mmap], end: int) -> Optional[Dict[str, PackEntry]]:
+    """Parse the index whose footer ends at ``end``, if it is intact."""
+    if end < _HEADER.size + _FOOTER.size:
+        return None
+    footer_start = end - _FOOTER.size
+    index_offset, count, footer_magic = _FOOTER.unpack_from(data, footer_start)
+    if footer_magic != _FOOTER_MAGIC or not _HEADER.size <= index_offset <= footer_start:
+        return None
+
+    index: Dict[str, PackEntry] = {}
+    position = index_offset
+    try:
+        for _ in range(count):
+            (key_length,) = _KEY_LENGTH.unpack_from(data, position)
+            position += _KEY_LENGTH.size
+            key = bytes(data[position : position + key_length]).decode("utf-8")
+            position += key_length
+            entry = PackEntry(*_ENTRY.unpack_from(data, position))
+            position += _ENTRY.size
+            if position > footer_start or entry.offset + entry.size > index_offset:
+                return None
+            index[key] = entry
+    except (struct.error, UnicodeDecodeError):
+        return None
+    return index if position == footer_start else None
+
+
+def _read_index(data: Union[bytes, mmap.mmap]) -> Dict[str, PackEntry]:
+    """Parse the header and the last complete index of a pack.
+
+    Records appended by a session that never wrote its footer are ignored;
+    a pack without any complete index is empty.
+
+    Raises:
+        ValueError: If the data is not a pack
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("File is too small to be a pack")
+    magic, version = _HEADER.unpack_from(data, 0)
+    if magic != PACK_MAGIC:
+        raise ValueError("Not a SegnoMMS pack file")
+    if version != PACK_VERSION:
+        raise ValueError(f"Unsupported pack version: {version}")
+
+    index = _parse_index(data, len(data))
+    search_end = len(data)
+    while index is None:
+        # Fall back to the footer of the last closed session
+        position = data.rfind(_FOOTER_MAGIC, _HEADER.size, search_end)
+        if position < 0:
+            return {}
+        index = _parse_index(data, position + len(_FOOTER_MAGIC))
+        search_end = position + len(_FOOTER_MAGIC) - 1
+    return index
+
+
+class PackWriter:
+    """Append records to an indexed pack file.
+
+    Records are keyed by a caller ID, or by the SHA-256 of their content
+    when no key is given; content-keyed records already in the pack are
+    not stored again. Adding a caller key again points it at the new
+    record. The index is written on :meth:`close`.
+
+    Example:
+        >>> with PackWriter("codes.pack", compress=True) as pack:
+        ...     pack.add(svg, key="order-1234")
+    """
+
+    def __init__(self, path: Union[str, Path], compress: bool = False) -> None:
+        """Open a pack for appending, creating it if needed.
+
+        Args:
+            path: Pack file path
+            compress: Store records as gzip members
+
+        Raises:
+            ValueError: If an existing file is not a pack
+        """
+        self.path = Path(path)
+        self.compress = compress
+        self._lock = threading.Lock()
+        self.index: Dict[str, PackEntry] = {}
+        self.bytes_written = 0
+
+        if self.path.exists() and self.path.stat().st_size:
+            with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                self.index = _read_index(data)
+            self._file = open(self.path, "ab")
+        else:
+            self._file = open(self.path, "wb")
+            self._file.write(_HEADER.pack(PACK_MAGIC, PACK_VERSION))
+        self._offset = self._file.tell()
+
+    def add(self, data: Union[str, bytes], key: Optional[str] = None) -> str:
+        """Append one record.
+
+        Args:
+            data: Record content; text is encoded as UTF-8
+            key: Caller ID (default: SHA-256 hex digest of the content)
+
+        Returns:
+            The record key
+
+        Raises:
+            ValueError: If the key is longer than 65535 bytes
+        """
+        raw = data.encode("utf-8") if isinstance(data, str) else data
+        content_keyed = key is None
+        if key is None:
+            key = hashlib.sha256(raw).hexdigest()
+        elif len(key.encode("utf-8")) > 0xFFFF:
+            raise ValueError("Pack keys are limited to 65535 bytes")
+
+        stored, flags = (gzip.compress(raw, mtime=0), FLAG_GZIP) if self.compress else (raw, 0)
+        with self._lock:
+            if content_keyed and key in self.index:
+                return key
+            self._file.write(stored)
+            self.index[key] = PackEntry(self._offset, len(stored), len(raw), flags)
+            self._offset += len(stored)
+            self.bytes_written += len(stored)
+        return key
+
+    def close(self) -> None:
+        """Write the index and footer and close the file.
+
+        Records and index are synced to disk before the footer, so a
+        footer on disk always describes complete data.
+        """
+        with self._lock:
+            if self._file.closed:
+                return
+            index_offset = self._offset
+            for key, entry in self.index.items():
+                encoded = key.encode("utf-8")
+                self._file.write(_KEY_LENGTH.pack(len(encoded)) + encoded)
+                self._file.write(_ENTRY.pack(entry.offset, entry.size, entry.raw_size, entry.flags))
+            self._sync()
+            self._file.write(_FOOTER.pack(index_offset, len(self.index), _FOOTER_MAGIC))
+            self._sync()
+            self._file.close()
+
+    def _sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def __enter__(self) -> "PackWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+class PackReader:
+    """Memory-mapped random access to an indexed pack file.
+
+    Lookups are dictionary accesses on the index loaded at open time, and
+    :meth:`view` returns the stored bytes as a zero-copy slice of the
+    mapping. Release all views before calling :meth:`close`.
+
+    Example:
+        >>> with PackReader("codes.pack") as pack:
+        ...     entry = pack.entry("order-1234")
+        ...     body = pack.view("order-1234")  # send with entry.content_encoding
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Map a pack file.
+
+        Args:
+            path: Pack file path
+
+        Raises:
+            ValueError: If the file is not a pack
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.index = _read_index(self._mmap)
+        except Exception:
+            self._mmap.close()
+            raise
+        self._view = memoryview(self._mmap)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.index
+
+    def keys(self) -> Iterator[str]:
+        """Iterate over the record keys."""
+        return iter(self.index)
+
+    def entry(self, key: str) -> PackEntry:
+        """Get the location of a record.
+
+        Raises:
+            KeyError: If the key is not in the pack
+        """
+        return self.index[key]
+
+    def view(self, key: str) -> memoryview:
+        """Get the stored bytes of a record without copying.
+
+        The bytes are gzip-compressed when ``entry(key).content_encoding``
+        is ``'gzip'``.
+
+        Raises:
+            KeyError: If the key is not in the pack
+        """
+        entry = self.index[key]
+        return self._view[entry.offset : entry.offset + entry.size]
+
+    def read(self, key: str) -> bytes:
+        """Get the uncompressed content of a record.
+
+        Raises:
+            KeyError: If the key is not in the pack
+        """
+        entry = self.index[key]
+        data = self.view(key)
+        try:
+            return gzip.decompress(data) if entry.flags & FLAG_GZIP else bytes(data)
+        finally:
+            data.release()
+
+    def close(self) -> None:
+        """Unmap the pack."""
+        self._view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "PackReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def write_pack(
+    qr_codes: Iterable[Any],
+    path: Union[str, Path],
+    compress: bool = False,
+    workers: Optional[int] = None,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """Render a batch of QR codes into an indexed pack file.
+
+    Every symbol is rendered with one configuration built from ``kwargs``,
+    as accepted by :func:`~segnomms.plugin.write`. Records are appended in
+    the order rendering finishes. Content-keyed symbols already in the pack
+    are skipped without rendering.
+
+    Args:
+        qr_codes: Segno QR code objects, keyed by the same content key
+            ``write(..., content_addressed=True)`` uses, or ``(key, qr_code)``
+            pairs with caller IDs
+        path: Pack file path; an existing pack is appended to
+        compress: Store records as gzip members
+        workers: Number of worker processes; ``None`` or ``1`` renders serially
+        **kwargs: Rendering options
+
+    Returns:
+        dict: Result containing ``pack_file``, ``keys`` (added, in pack order),
+        ``qr_count``, ``skipped`` (content keys already packed) and ``bytes``
+        (stored size of the added records)
+
+    Example:
+        >>> write_pack(((order.id, segno.make(order.url)) for order in orders),
+        ...            "orders.pack", compress=True, workers=4)
+    """
+    config = RenderingConfig.from_kwargs(**kwargs)
+    prepared = prepare_rendering_config(config)
+
+    keys: List[str] = []
+    skipped: List[str] = []
+
+    with PackWriter(path, compress=compress) as pack:
+
+        def pending_items() -> Iterator[Tuple[str, Any]]:
+            for item in qr_codes:
+                if isinstance(item, tuple):
+                    key, qr_code = item
+                    yield str(key), qr_code
+                    continue
+                content_key = _generate_content_key(item, config)[:16]
+                if content_key in pack.index:
+                    skipped.append(content_key)
+                else:
+                    yield content_key, item
+
+        for key, _, svg_content in _render_batch(pending_items(), prepared, workers):
+            keys.append(pack.add(svg_content, key=key))
+
+    return {
+        "success": True,
+        "pack_file": str(path),
+        "keys": keys,
+        "qr_count": len(keys),
+        "skipped": skipped,
+        "bytes": pack.bytes_written,
+    }
@@ -13,10 +13,14 @@ from ..algorithms.clustering import ConnectedComponentAnalyzer
 from ..config import ConnectivityMode, FinderShape, MergeStrategy, RenderingConfig
 from ..core.detector import ModuleDetector
 from ..core.matrix import MatrixManipulator
+from ..core.metrics import get_renderer_metrics
+from ..core.tracing import current_span, trace_span
 from ..degradation import DegradationManager
 from ..shapes.factory import get_shape_factory
 from ..svg import InteractiveSVGBuilder, PathClipper
 from ..validation.composition import CompositionValidator
+from ..validation.models import GeometryVerificationResult
+from ..validation.verification import verify_rendered_geometry
 from .patterns import _get_pattern_specific_render_kwargs, _get_pattern_specific_style
 
 # Maximum QR code size to prevent DoS attacks
@@ -30,24 +34,44 @@ NON_STYLED_MODULES = [
     "timing",  # Important for scanning alignment - should remain square
 ]
 
+# Number of row bands used to quantize staggered fade-in delays
+STAGGER_BANDS = 12
+
+# Pattern layer for each module type; anything else renders as data
+MODULE_TYPE_LAYERS = {
+    "finder": "finder",
+    "finder_inner": "finder",
+    "timing": "timing",
+    "timing_horizontal": "timing",
+    "timing_vertical": "timing",
+    "alignment": "alignment",
+    "format": "format",
+    "version": "version",
+}
+
 
 class QRCodeRenderer:
     """Encapsulates the QR code rendering logic with better organization."""
 
-    def __init__(self, qr_code: Any, config: RenderingConfig) -> None:
+    def __init__(self, qr_code: Any, config: RenderingConfig, apply_degradation: bool = True) -> None:
         """Initialize the renderer with QR code and configuration.
 
         Args:
             qr_code: Segno QR code object
             config: Rendering configuration
+            apply_degradation: Run graceful degradation on the configuration.
+                Pass False when the configuration was already prepared with
+                :func:`prepare_rendering_config` and is reused across symbols.
         """
         self.qr_code = qr_code
-        self.config = self._apply_degradation(config)
-        self.matrix = self._extract_matrix()
+        self.config = self._apply_degradation(config) if apply_degradation else config
+        with trace_span("matrix"):
+            self.matrix = self._extract_matrix()
         self._validate_size()
 
         # Initialize components
-        self.detector = ModuleDetector(self.matrix, qr_code.version)
+        with trace_span("detector"):
+            self.detector = ModuleDetector(self.matrix, qr_code.version)
         self.svg_builder = InteractiveSVGBuilder(accessibility_config=self.config.accessibility)
         self.shape_factory = get_shape_factory()
         self.logger = logging.getLogger(__name__)
@@ -56,21 +80,12 @@ class QRCodeRenderer:
         self.composition_validator = self._init_composition_validator()
         self.path_clipper: Optional[Any] = None
         self.centerpiece_metadata: Optional[Dict[str, Any]] = None
+        self.imprint_classes: Dict[Tuple[int, int], str] = {}
+        self.svg_root: Optional[ET.Element] = None
 
     def _apply_degradation(self, config: RenderingConfig) -> RenderingConfig:
         """Apply graceful degradation to the configuration."""
-        degradation_manager = DegradationManager()
-        degraded_config, degradation_result = degradation_manager.apply_degradation(config)
-
-        # Log degradation warnings
-        if degradation_result.warning_count > 0:
-            logger = logging.getLogger(__name__)
-            logger.info(f"Graceful degradation applied " f"{degradation_result.warning_count} warnings")
-
-            for warning in degradation_result.warnings:
-                logger.warning(f"Degradation: {warning}")
-
-        return degraded_config
+        return prepare_rendering_config(config)
 
     def _extract_matrix(self) -> List[List[bool]]:
         """Extract boolean matrix from QR code."""
@@ -123,49 +138,98 @@ class QRCodeRenderer:
         Returns:
             SVG content as string
         """
-        # Apply centerpiece clearing if enabled
-        self._apply_centerpiece()
-
-        # Setup SVG structure
-        svg = self._create_svg_structure()
-
-        # Get modules group for rendering
-        layers = self.svg_builder.create_layered_structure(svg)
-        modules_group = layers["modules"]
-
-        # Apply frame clipping if needed
-        self._apply_frame_clipping(svg, modules_group)
-
-        # Set default fill color
-        if not self.config.patterns.enabled:
-            modules_group.set("fill", self.config.dark)
-
-        # Process different rendering phases
-        processed_positions = set()
-
-        # Phase 1: Island detection and removal
-        if self.config.geometry.min_island_modules > 1:
-            island_positions = self._detect_islands()
-            processed_positions.update(island_positions)
-
-        # Phase 2: Connected component clustering
-        if self._should_use_clustering():
-            cluster_positions = self._render_clusters(modules_group)
-            processed_positions.update(cluster_positions)
+        shape = self.config.geometry.shape
+        with trace_span("render", modules=len(self.matrix), shape=getattr(shape, "value", shape)) as span:
+            # Apply centerpiece clearing if enabled
+            with trace_span("render.centerpiece"):
+                self._apply_centerpiece()
+
+            # Setup SVG structure
+            with trace_span("render.structure"):
+                svg = self._create_svg_structure()
+
+                # Get modules group for rendering
+                layers = self.svg_builder.create_layered_structure(svg)
+                modules_group = layers["modules"]
+
+                # Apply frame clipping if needed
+                self._apply_frame_clipping(svg, modules_group)
+
+            # Set default fill color
+            if not self.config.patterns.enabled:
+                modules_group.set("fill", self.config.dark)
+
+            # Process different rendering phases
+            processed_positions = set()
+
+            # Phase 1: Island detection and removal
+            if self.config.geometry.min_island_modules > 1:
+                with trace_span("render.islands") as phase:
+                    island_positions = self._detect_islands()
+                    phase.add("modules_removed", len(island_positions))
+                processed_positions.update(island_positions)
+
+            # Phase 2: Connected component clustering
+            if self._should_use_clustering():
+                with trace_span("render.clustering") as phase:
+                    cluster_positions = self._render_clusters(modules_group)
+                    phase.add("modules_processed", len(cluster_positions))
+                processed_positions.update(cluster_positions)
+
+            # Phase 3: Regular module rendering
+            with trace_span("render.modules"):
+                band_starts = self._render_individual_modules(layers, processed_positions)
+
+            # Phase 3.5: Animation rules and finder halos
+            animation = self.config.animation
+            if (animation.fade_in and animation.stagger) or animation.pulse:
+                with trace_span("render.animation"):
+                    if animation.fade_in and animation.stagger:
+                        self.svg_builder.add_stagger_styles(
+                            svg, band_starts, animation.stagger_delay, self._rows_per_stagger_band()
+                        )
+                    if animation.pulse:
+                        self._add_finder_halos(svg, layers)
+
+            # Phase 4: Apply pattern group accessibility
+            with trace_span("render.pattern_groups"):
+                self._enhance_pattern_groups(layers)
+
+            self.svg_root = svg
+
+            # Convert to string and format
+            with trace_span("render.serialize"):
+                rough_string = ET.tostring(svg, encoding="unicode")
+            with trace_span("render.format"):
+                svg_string = _format_svg_string(rough_string)
+            span.add("bytes", len(svg_string))
+            return svg_string
+
+    def verify_geometry(self) -> GeometryVerificationResult:
+        """Verify the last rendered SVG against the encoded matrix.
+
+        Samples the rendered shapes at every module center, so flips caused
+        by frame clipping, centerpiece clearing or island removal are
+        reported without rasterizing or decoding the symbol. This costs a
+        quarter to half of the render time, the most for shapes drawn as
+        curved paths.
 
-        # Phase 3: Regular module rendering
-        self._render_individual_modules(layers, processed_positions)
-
-        # Phase 3.5: Add finder halos if pulse animation is enabled
-        if getattr(self.config, "animation_pulse", False):
-            self._add_finder_halos(svg, layers)
+        Returns:
+            Verification result
 
-        # Phase 4: Apply pattern group accessibility
-        self._enhance_pattern_groups(layers)
+        Raises:
+            RuntimeError: If :meth:`render` has not been called
+        """
+        if self.svg_root is None:
+            raise RuntimeError("render() must be called before verify_geometry()")
+        with trace_span("verify", modules=len(self.matrix)) as span:
+            result = verify_rendered_geometry(self.svg_root, self.qr_code, self.config, self.detector)
+            span.add("flipped", result.flipped_count)
+        return result
 
-        # Convert to string and format
-        rough_string = ET.tostring(svg, encoding="unicode")
-        return _format_svg_string(rough_string)
+    def _add_runtime_assets(self, svg: ET.Element) -> None:
+        """Add the runtime stylesheet and script according to the asset mode."""
+        add_runtime_assets(self.svg_builder, svg, self.config)
 
     def _apply_centerpiece(self) -> None:
         """Apply centerpiece clearing if enabled."""
@@ -176,6 +240,13 @@ class QRCodeRenderer:
         self.matrix = manipulator.clear_centerpiece_area(self.config.centerpiece)
         self.centerpiece_metadata = manipulator.get_centerpiece_metadata(self.config.centerpiece)
 
+        # Imprinted modules get their treatment bucket's shared class
+        buckets = self.centerpiece_metadata.get("imprint_buckets", [])
+        for treatment in self.centerpiece_metadata.get("imprint_treatments", []):
+            bucket = treatment.get("bucket")
+            if bucket is not None and bucket < len(buckets):
+                self.imprint_classes[(treatment["y"], treatment["x"])] = buckets[bucket]["css_class"]
+
     def _create_svg_structure(self) -> ET.Element:
         """Create the base SVG structure with accessibility features."""
         # Calculate dimensions
@@ -220,15 +291,13 @@ class QRCodeRenderer:
         # Add enhanced quiet zone background
         self.svg_builder.add_quiet_zone_with_style(svg, self.config.quiet_zone, svg_size, svg_size)
 
-        # Add styles
-        self.svg_builder.add_styles(svg, self.config.style.interactive)
-
-        # Add interactive handlers if enabled
-        if self.config.style.interactive:
-            self.svg_builder.add_interaction_handlers(svg)
+        # Add styles and interactive handlers
+        self._add_runtime_assets(svg)
 
         # Add centerpiece metadata if applicable
         if self.centerpiece_metadata:
+            if self.imprint_classes:
+                self.svg_builder.add_imprint_styles(svg, self.centerpiece_metadata["imprint_buckets"])
             bounds = self.centerpiece_metadata.get("bounds", {})
             self.svg_builder.add_centerpiece_metadata(
                 svg,
@@ -317,6 +386,7 @@ class QRCodeRenderer:
         )
 
         processed_positions = set()
+        current_span().add("clusters", len(clusters))
 
         # Render clusters based on merge strategy
         for cluster in clusters:
@@ -338,12 +408,25 @@ class QRCodeRenderer:
 
         return processed_positions
 
+    def _rows_per_stagger_band(self) -> int:
+        """Number of module rows that share one stagger delay."""
+        return max(1, -(-len(self.matrix) // STAGGER_BANDS))
+
     def _render_individual_modules(
         self, layers: Dict[str, ET.Element], processed_positions: Set[Tuple[int, int]]
-    ) -> None:
-        """Render individual modules that aren't part of clusters."""
+    ) -> Dict[str, List[Tuple[int, int]]]:
+        """Render individual modules that aren't part of clusters.
+
+        Returns:
+            For each pattern type, the ``(row band, 1-based child index)`` at
+            which each band starts in its group; empty unless staggering
+        """
         module_count = len(self.matrix)
-        module_index = 0
+        track_bands = self.config.animation.fade_in and self.config.animation.stagger
+        rows_per_band = self._rows_per_stagger_band()
+        band_starts: Dict[str, List[Tuple[int, int]]] = {}
+        span = current_span()
+        processed = emitted = 0
 
         for row in range(module_count):
             for col in range(module_count):
@@ -357,18 +440,8 @@ class QRCodeRenderer:
                 module_type = self.detector.get_module_type(row, col)
 
                 # Determine target group based on module type
-                if module_type in ["finder", "finder_inner"]:
-                    target_group = layers.get("pattern_finder", layers["modules"])
-                elif module_type in ["timing", "timing_horizontal", "timing_vertical"]:
-                    target_group = layers.get("pattern_timing", layers["modules"])
-                elif module_type in ["alignment"]:
-                    target_group = layers.get("pattern_alignment", layers["modules"])
-                elif module_type in ["format"]:
-                    target_group = layers.get("pattern_format", layers["modules"])
-                elif module_type in ["version"]:
-                    target_group = layers.get("pattern_version", layers["modules"])
-                else:
-                    target_group = layers.get("pattern_data", layers["modules"])
+                pattern_type = MODULE_TYPE_LAYERS.get(module_type, "data")
+                target_group = layers.get(f"pattern_{pattern_type}", layers["modules"])
 
                 # Render the module
                 module_renderer = ModuleRenderer(
@@ -378,11 +451,24 @@ class QRCodeRenderer:
                     self.path_clipper,
                     self.svg_builder,
                 )
-                element = module_renderer.render_module(row, col, module_index)
+                element = module_renderer.render_module(row, col)
+                processed += 1
 
                 if element is not None:
+                    emitted += 1
+                    imprint_class = self.imprint_classes.get((row, col))
+                    if imprint_class:
+                        element.set("class", f"{element.get('class', '')} {imprint_class}".strip())
+                    if track_bands:
+                        band = row // rows_per_band
+                        starts = band_starts.setdefault(pattern_type, [])
+                        if not starts or starts[-1][0] != band:
+                            starts.append((band, len(target_group) + 1))
                     target_group.append(element)
-                    module_index += 1
+
+        span.add("modules_processed", processed)
+        span.add("elements_emitted", emitted)
+        return band_starts
 
     def _add_finder_halos(self, svg: ET.Element, layers: Dict[str, ET.Element]) -> None:
         """Add decorative halo elements behind finder patterns for pulse animation."""
@@ -401,10 +487,9 @@ class QRCodeRenderer:
         halos_group = ET.Element("g", attrib={"class": "finder-halos", "aria-hidden": "true"})
 
         # Insert halos group before the modules group
-        parent = svg.find(".//g[@class='qr-layer-modules']/..")
-        if parent is not None:
-            modules_index = list(parent).index(layers["modules"])
-            parent.insert(modules_index, halos_group)
+        children = list(svg)
+        if layers["modules"] in children:
+            svg.insert(children.index(layers["modules"]), halos_group)
 
         # Add halo for each finder pattern
         for idx, (row, col) in enumerate(finder_positions):
@@ -482,7 +567,9 @@ class ModuleRenderer:
         Args:
             row: Row position
             col: Column position
-            module_index: Optional module index for CSS animations
+            module_index: Optional index exposed as the ``--i`` CSS variable.
+                The renderer does not pass it; staggering uses generated
+                ``nth-child`` rules instead of per-module data.
 
         Returns:
             XML element for the module, or None if skipped
@@ -683,7 +770,7 @@ class ModuleRenderer:
         title.text = f"{module_type} module at ({row}, {col})"
 
 
-def generate_interactive_svg(qr_code: Any, config: RenderingConfig) -> str:
+def generate_interactive_svg(qr_code: Any, config: RenderingConfig, apply_degradation: bool = True) -> str:
     """
     Generate interactive SVG content for a QR code.
 
@@ -692,15 +779,97 @@ def generate_interactive_svg(qr_code: Any, config: RenderingConfig) -> str:
     Args:
         qr_code: Segno QR code object
         config: Rendering configuration
+        apply_degradation: Run graceful degradation on the configuration;
+            pass False when it has already been applied
 
     Returns:
         SVG content as string
 
     Raises:
         ValueError: If QR code size exceeds maximum allowed size
+
+    Example:
+        Measure memory per rendering phase::
+
+            from segnomms.core.memory import profile_memory
+
+            with profile_memory() as profiler:
+                svg = generate_interactive_svg(qr_code, config)
+            print(profiler.profile.peak_bytes)
     """
-    renderer = QRCodeRenderer(qr_code, config)
-    return renderer.render()
+    with trace_span("generate_interactive_svg"):
+        renderer = QRCodeRenderer(qr_code, config, apply_degradation=apply_degradation)
+        return renderer.render()
+
+
+def prepare_rendering_config(config: RenderingConfig) -> RenderingConfig:
+    """Apply graceful degradation once so the result can be reused.
+
+    Rendering several symbols with the same configuration (for example a
+    structured-append sequence) only needs to degrade the configuration
+    once; pass the result to ``QRCodeRenderer(..., apply_degradation=False)``.
+
+    Args:
+        config: Rendering configuration
+
+    Returns:
+        Degraded configuration ready for rendering
+    """
+    with trace_span("degradation") as span:
+        degradation_manager = DegradationManager()
+        degraded_config, degradation_result = degradation_manager.apply_degradation(config)
+        span.add("warnings", degradation_result.warning_count)
+
+    rule_hits = get_renderer_metrics().degradation_rule_hits
+    for warning in degradation_result.warnings:
+        rule_hits.inc(feature=warning.feature)
+
+    # Log degradation warnings
+    if degradation_result.warning_count > 0:
+        logger = logging.getLogger(__name__)
+        logger.info(f"Graceful degradation applied " f"{degradation_result.warning_count} warnings")
+
+        for warning in degradation_result.warnings:
+            logger.warning(f"Degradation: {warning}")
+
+    return degraded_config
+
+
+def add_runtime_assets(svg_builder: InteractiveSVGBuilder, svg: ET.Element, config: RenderingConfig) -> None:
+    """Add the runtime stylesheet and script according to the asset mode.
+
+    Args:
+        svg_builder: SVG builder used to add the elements
+        svg: SVG element receiving the runtime
+        config: Rendering configuration selecting the asset mode
+    """
+    with trace_span("css", mode=config.style.runtime_assets):
+        _add_runtime_assets(svg_builder, svg, config)
+
+
+def _add_runtime_assets(svg_builder: InteractiveSVGBuilder, svg: ET.Element, config: RenderingConfig) -> None:
+    style = config.style
+    animation_config = config.animation.to_style_config() if config.animation.enabled else None
+
+    if style.runtime_assets == "shared":
+        # The page emits the runtime once (see render_shared_assets_html)
+        return
+
+    if style.runtime_assets == "external":
+        from ..svg.assets import build_runtime_assets
+
+        assets = build_runtime_assets(style.interactive, animation_config)
+        js_asset = assets.get("js")
+        svg_builder.add_external_assets(
+            svg,
+            assets["css"].href(style.asset_base_url),
+            js_asset.href(style.asset_base_url) if js_asset else None,
+        )
+        return
+
+    svg_builder.add_styles(svg, style.interactive, animation_config)
+    if style.interactive:
+        svg_builder.add_interaction_handlers(svg)
 
 
 # Keep the existing helper functions unchanged for compatibility
@@ -0,0 +1,246 @@
+"""Structured-append sequence rendering for the SegnoMMS plugin.
+
+This module renders the symbols of a structured-append sequence from a
+single prepared configuration, optionally fanning the work out across a
+process pool, and can compose the rendered symbols into one multi-symbol
+SVG or HTML sheet that carries the runtime styles and the ``<defs>``
+shared by all symbols only once.
+"""
+
+import math
+import re
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Dict, List, Literal, Optional, Sequence
+
+from ..config import RenderingConfig
+from ..svg import InteractiveSVGBuilder
+from .rendering import QRCodeRenderer, add_runtime_assets, prepare_rendering_config
+
+SVG_NS = "http://www.w3.org/2000/svg"
+
+SheetFormat = Literal["svg", "html"]
+
+# Attributes that hold a space-separated list of element IDs
+_IDREF_LIST_ATTRIBUTES = {"aria-labelledby", "aria-describedby"}
+_URL_REFERENCE = re.compile(r"url\(#([^)]+)\)")
+
+
+def _register_namespaces() -> None:
+    """Serialize SVG elements with the default and xlink prefixes."""
+    ET.register_namespace("", SVG_NS)
+    ET.register_namespace("xlink", "http://www.w3.org/1999/xlink")
+
+
+def _render_symbol(qr_code: Any, config: RenderingConfig) -> str:
+    """Render one symbol with an already prepared configuration."""
+    return QRCodeRenderer(qr_code, config, apply_degradation=False).render()
+
+
+def render_sequence(
+    qr_codes: Sequence[Any], config: RenderingConfig, workers: Optional[int] = None
+) -> List[str]:
+    """Render all symbols of a sequence with one prepared configuration.
+
+    Args:
+        qr_codes: Segno QR code objects making up the sequence
+        config: Rendering configuration shared by all symbols
+        workers: Number of worker processes; ``None`` or ``1`` renders serially
+
+    Returns:
+        SVG documents in sequence order
+    """
+    prepared = prepare_rendering_config(config)
+
+    if not workers or workers <= 1 or len(qr_codes) < 2:
+        return [_render_symbol(qr, prepared) for qr in qr_codes]
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(qr_codes))) as pool:
+        return list(pool.map(_render_symbol, qr_codes, repeat(prepared)))
+
+
+def _tag(element: ET.Element) -> str:
+    """Local tag name without namespace."""
+    return element.tag.rsplit("}", 1)[-1]
+
+
+def _rewrite_references(element: ET.Element, id_map: Dict[str, str]) -> None:
+    """Rewrite ID references in the attributes of an element tree."""
+
+    def replace_url(match: "re.Match[str]") -> str:
+        return f"url(#{id_map.get(match.group(1), match.group(1))})"
+
+    for node in element.iter():
+        for name, value in node.attrib.items():
+            if "url(#" in value:
+                node.set(name, _URL_REFERENCE.sub(replace_url, value))
+            elif value.startswith("#") and value[1:] in id_map:
+                node.set(name, f"#{id_map[value[1:]]}")
+            elif name in _IDREF_LIST_ATTRIBUTES:
+                node.set(name, " ".join(id_map.get(ref, ref) for ref in value.split()))
+
+
+def _prepare_sheet_symbol(
+    document: str,
+    index: int,
+    shared_defs: Dict[bytes, ET.Element],
+    shared_ids: Dict[bytes, str],
+) -> ET.Element:
+    """Parse a symbol, namespace its IDs and move its definitions to the sheet.
+
+    Definitions that are identical (apart from their ID) to one already
+    collected from an earlier symbol are dropped and references to them are
+    pointed at the shared copy.
+    """
+    root = ET.fromstring(document)
+    prefix = f"s{index + 1}-"
+    id_map: Dict[str, str] = {}
+
+    for defs in [child for child in root if _tag(child) == "defs"]:
+        for definition in list(defs):
+            old_id = definition.get("id")
+            if old_id is None:
+                continue
+            definition.attrib.pop("id")
+            key = ET.tostring(definition)
+            if key in shared_ids:
+                id_map[old_id] = shared_ids[key]
+            else:
+                new_id = f"{prefix}{old_id}"
+                definition.set("id", new_id)
+                shared_ids[key] = new_id
+                shared_defs[key] = definition
+                id_map[old_id] = new_id
+        root.remove(defs)
+
+    for node in root.iter():
+        old_id = node.get("id")
+        if old_id is not None and old_id not in id_map:
+            id_map[old_id] = f"{prefix}{old_id}"
+            node.set("id", id_map[old_id])
+
+    _rewrite_references(root, id_map)
+    for definition in shared_defs.values():
+        _rewrite_references(definition, id_map)
+
+    return root
+
+
+def compose_sequence_sheet(
+    documents: Sequence[str],
+    config: RenderingConfig,
+    sheet_format: SheetFormat = "svg",
+    columns: Optional[int] = None,
+    gap: Optional[int] = None,
+) -> str:
+    """Compose rendered symbols into a single multi-symbol sheet.
+
+    The symbols should be rendered with ``runtime_assets="shared"`` so they
+    carry no runtime of their own; the sheet adds it once according to
+    ``config.style.runtime_assets``. IDs are prefixed per symbol so they
+    stay unique, and identical definitions are emitted once.
+
+    Args:
+        documents: Rendered SVG documents in sequence order
+        config: Rendering configuration the symbols were rendered with
+        sheet_format: ``"svg"`` for one SVG document, ``"html"`` for a page
+        columns: Symbols per row (defaults to a near-square grid)
+        gap: Spacing between symbols in pixels (defaults to one border width)
+
+    Returns:
+        Sheet document as a string
+    """
+    if not documents:
+        raise ValueError("Cannot compose a sheet from an empty sequence")
+
+    # Symbols rendered in worker processes never registered the SVG
+    # namespace in this process; without it the sheet is written with ns0:
+    _register_namespaces()
+
+    shared_defs: Dict[bytes, ET.Element] = {}
+    shared_ids: Dict[bytes, str] = {}
+    symbols = [
+        _prepare_sheet_symbol(document, index, shared_defs, shared_ids)
+        for index, document in enumerate(documents)
+    ]
+
+    if sheet_format == "html":
+        return _compose_html_sheet(symbols, list(shared_defs.values()), config)
+    return _compose_svg_sheet(symbols, list(shared_defs.values()), config, columns, gap)
+
+
+def _compose_svg_sheet(
+    symbols: List[ET.Element],
+    definitions: List[ET.Element],
+    config: RenderingConfig,
+    columns: Optional[int],
+    gap: Optional[int],
+) -> str:
+    """Lay out symbols as nested ``<svg>`` elements on a grid."""
+    columns = columns or math.ceil(math.sqrt(len(symbols)))
+    rows = math.ceil(len(symbols) / columns)
+    gap = config.border * config.scale if gap is None else gap
+    cell_width = max(int(float(symbol.get("width", "0"))) for symbol in symbols)
+    cell_height = max(int(float(symbol.get("height", "0"))) for symbol in symbols)
+    width = columns * cell_width + (columns - 1) * gap
+    height = rows * cell_height + (rows - 1) * gap
+
+    builder = InteractiveSVGBuilder()
+    sheet = builder.core_builder.create_svg_root(width, height, id="qr-sequence", css_class="qr-sequence")
+    add_runtime_assets(builder, sheet, config)
+    # Re-parse so the builder's literal xmlns attributes become real namespaces
+    # and the parsed symbols can be appended without duplicate declarations
+    sheet = ET.fromstring(ET.tostring(sheet, encoding="unicode"))
+
+    if definitions:
+        defs = ET.SubElement(sheet, f"{{{SVG_NS}}}defs")
+        defs.extend(definitions)
+
+    for index, symbol in enumerate(symbols):
+        symbol.set("x", str((index % columns) * (cell_width + gap)))
+        symbol.set("y", str((index // columns) * (cell_height + gap)))
+        sheet.append(symbol)
+
+    return ET.tostring(sheet, encoding="unicode")
+
+
+def _compose_html_sheet(
+    symbols: List[ET.Element], definitions: List[ET.Element], config: RenderingConfig
+) -> str:
+    """Emit symbols as inline SVG in an HTML page with a shared runtime."""
+    from ..svg.assets import build_runtime_assets, render_shared_assets_html
+
+    style = config.style
+    animation_config = config.animation.to_style_config() if config.animation.enabled else None
+
+    head = ['<meta charset="utf-8">', "<title>QR Code Sequence</title>"]
+    if style.runtime_assets == "inline":
+        head.append(render_shared_assets_html(style.interactive, animation_config))
+    elif style.runtime_assets == "external":
+        assets = build_runtime_assets(style.interactive, animation_config)
+        head.append(f'<link rel="stylesheet" href="{assets["css"].href(style.asset_base_url)}">')
+        if "js" in assets:
+            head.append(f'<script src="{assets["js"].href(style.asset_base_url)}" defer></script>')
+
+    body = []
+    if definitions:
+        holder = ET.Element(
+            f"{{{SVG_NS}}}svg",
+            attrib={"width": "0", "height": "0", "aria-hidden": "true", "style": "position:absolute"},
+        )
+        defs = ET.SubElement(holder, f"{{{SVG_NS}}}defs")
+        defs.extend(definitions)
+        body.append(ET.tostring(holder, encoding="unicode"))
+
+    body.append('<div class="qr-sequence">')
+    body.extend(ET.tostring(symbol, encoding="unicode") for symbol in symbols)
+    body.append("</div>")
+
+    return (
+        "<!DOCTYPE html>\n<html>\n<head>\n"
+        + "\n".join(head)
+        + "\n</head>\n<body>\n"
+        + "\n".join(body)
+        + "\n</body>\n</html>\n"
+    )
@@ -0,0 +1,37 @@
+"""Local render service for the intent-based API.
+
+This package wraps :func:`segnomms.intents.render_with_intents` in a small
+HTTP service with a worker pool, per-request deadlines, ETag response
+caching, coalescing of identical in-flight requests, and health and
+metrics endpoints. It only uses the standard library and can be mounted
+in any WSGI or ASGI server.
+
+Key Components:
+
+    :class:`RenderService`: Protocol-independent service core
+    :func:`create_wsgi_app`: WSGI application factory
+    :func:`create_asgi_app`: ASGI application factory
+    :func:`make_local_server`: Threaded localhost server for development
+
+Example:
+    Serve on localhost with four worker processes::
+
+        from segnomms.service import make_local_server
+
+        server = make_local_server(port=8080, workers=4, backend="process")
+        server.serve_forever()
+
+    Then ``POST /render`` with ``{"payload": {"text": "..."}, "intents": {...}}``.
+"""
+
+from .asgi import create_asgi_app
+from .core import RenderService, ServiceResponse
+from .wsgi import create_wsgi_app, make_local_server
+
+__all__ = [
+    "RenderService",
+    "ServiceResponse",
+    "create_wsgi_app",
+    "create_asgi_app",
+    "make_local_server",
+]
@@ -0,0 +1,76 @@
+"""ASGI adapter for the render service."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, MutableMapping, Optional
+
+from .core import RenderService
+
+Scope = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+
+def create_asgi_app(service: Optional[RenderService] = None, **service_options: Any) -> ASGIApp:
+    """Create an ASGI application serving the intents JSON API.
+
+    Requests are handled in the default thread pool so the event loop never
+    blocks on rendering. The service pool is shut down on lifespan shutdown.
+
+    Args:
+        service: Existing render service to expose
+        **service_options: Options for a new :class:`RenderService`
+
+    Returns:
+        ASGI application callable
+    """
+    render_service = service or RenderService(**service_options)
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    render_service.close()
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        if scope["type"] != "http":
+            return
+
+        # Keep at most one byte over the limit, so the service still sees
+        # an oversized body and answers 413 without buffering all of it
+        limit = render_service.max_body_bytes + 1
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            chunk = message.get("body", b"")
+            if size < limit:
+                chunk = chunk[: limit - size]
+                chunks.append(chunk)
+                size += len(chunk)
+            if not message.get("more_body", False):
+                break
+
+        headers = {
+            name.decode("latin-1").lower(): value.decode("latin-1") for name, value in scope["headers"]
+        }
+        response = await asyncio.to_thread(
+            render_service.handle, scope["method"], scope["path"], headers, b"".join(chunks)
+        )
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status,
+                "headers": [
+                    (name.encode("latin-1"), value.encode("latin-1")) for name, value in response.headers
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": response.body})
+
+    return app
@@ -0,0 +1,375 @@
+"""Framework-independent render service behind the WSGI and ASGI apps.
+
+:class:`RenderService` owns the worker pool, the response cache and the
+in-flight request table. The web adapters only translate between their
+protocol and :meth:`RenderService.handle`.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any, Dict, List, Literal, Mapping, Optional, Tuple
+
+from pydantic import ValidationError as PydanticValidationError
+
+from ..core.metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    MetricsRegistry,
+    get_metrics_registry,
+)
+from ..exceptions import SegnoMMSError
+from ..intents.models import IntentRequest
+from ..intents.processor import get_intent_processor
+from ..plugin.export import _package_version
+
+JSON_CONTENT_TYPE = "application/json"
+
+# Worker result: HTTP status and JSON body
+WorkerResult = Tuple[int, bytes]
+
+
+@dataclass(frozen=True)
+class ServiceResponse:
+    """HTTP response produced by :class:`RenderService`.
+
+    Attributes:
+        status: HTTP status code
+        headers: Response headers
+        body: Response body
+    """
+
+    status: int
+    headers: List[Tuple[str, str]] = field(default_factory=list)
+    body: bytes = b""
+
+    @property
+    def status_line(self) -> str:
+        """Status line used by WSGI, e.g. ``"200 OK"``."""
+        return f"{self.status} {HTTPStatus(self.status).phrase}"
+
+
+def _json_bytes(data: Any) -> bytes:
+    return json.dumps(data, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _error_body(code: str, message: str, **details: Any) -> bytes:
+    return _json_bytes({"error": code, "message": message, "details": details, "suggestion": None})
+
+
+def _render_canonical_request(canonical: str) -> WorkerResult:
+    """Render a canonical request in a worker thread or process.
+
+    Errors are returned as response bodies rather than raised so results
+    cross process boundaries without pickling exception objects.
+    """
+    request = IntentRequest.model_validate_json(canonical)
+    try:
+        result = get_intent_processor().process_intents(request.payload, request.intents)
+    except SegnoMMSError as e:
+        return HTTPStatus.UNPROCESSABLE_ENTITY, _json_bytes(e.to_dict())
+    except Exception as e:
+        return HTTPStatus.INTERNAL_SERVER_ERROR, _error_body(type(e).__name__, str(e))
+    return HTTPStatus.OK, _json_bytes(result.to_client_format())
+
+
+def _warm_up() -> None:
+    """Initialize the intent processor in a freshly started worker."""
+    get_intent_processor()
+
+
+class RenderService:
+    """Render service exposing the intents JSON API.
+
+    Routes:
+        ``POST /render``: Render an :class:`IntentRequest` JSON body
+        ``GET /capabilities``: Capability manifest
+        ``GET /schema``: JSON schema of the rendering configuration
+        ``GET /health``: Liveness and pool status
+        ``GET /metrics``: Request, cache and latency counters (Prometheus
+        text format, including the renderer metrics, with ``Accept: text/plain``)
+
+    Identical render requests share one cached response (validated with a
+    weak ``ETag``) and, while rendering, one in-flight job. Each request
+    waits at most its deadline, taken from the ``X-Request-Timeout`` header
+    (seconds, capped at ``timeout``), and gets ``504`` when it expires; the
+    job keeps running and its result is still cached.
+
+    Example:
+        >>> with RenderService(workers=2) as service:
+        ...     response = service.handle("POST", "/render", {}, b'{"payload": {"text": "hi"}}')
+        >>> response.status
+        200
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        backend: Literal["thread", "process"] = "thread",
+        timeout: float = 10.0,
+        cache_size: int = 1024,
+        max_body_bytes: int = 1024 * 1024,
+        prefork: bool = True,
+    ) -> None:
+        """Initialize the render service.
+
+        Args:
+            workers: Number of worker threads or processes
+            backend: ``"thread"`` pool, or ``"process"`` pool for CPU parallelism
+            timeout: Default and maximum per-request deadline in seconds
+            cache_size: Maximum number of cached render responses
+            max_body_bytes: Maximum accepted request body size
+            prefork: Start all worker processes up front (process backend)
+        """
+        if backend not in ("thread", "process"):
+            raise ValueError(f"Unknown backend '{backend}', expected 'thread' or 'process'")
+
+        self.workers = max(1, workers)
+        self.backend = backend
+        self.timeout = timeout
+        self.cache_size = cache_size
+        self.max_body_bytes = max_body_bytes
+
+        self._executor: Executor
+        if backend == "process":
+            self._executor = ProcessPoolExecutor(self.workers)
+            if prefork:
+                for future in [self._executor.submit(_warm_up) for _ in range(self.workers)]:
+                    future.result()
+        else:
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="segnomms-render")
+
+        # Re-entrant: done callbacks may run immediately in the submitting thread
+        self._lock = threading.RLock()
+        self._cache: "OrderedDict[str, WorkerResult]" = OrderedDict()
+        self._in_flight: Dict[str, "Future[WorkerResult]"] = {}
+        self._started = time.time()
+        self._counters: Dict[str, float] = {
+            "requests_total": 0,
+            "render_requests_total": 0,
+            "renders_total": 0,
+            "cache_hits_total": 0,
+            "coalesced_total": 0,
+            "not_modified_total": 0,
+            "timeouts_total": 0,
+            "errors_total": 0,
+            "render_seconds_sum": 0.0,
+        }
+
+    def __enter__(self) -> "RenderService":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _count(self, name: str, amount: float = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+    def handle(
+        self, method: str, path: str, headers: Mapping[str, str], body: bytes = b""
+    ) -> ServiceResponse:
+        """Handle one HTTP request.
+
+        Args:
+            method: HTTP method
+            path: Request path
+            headers: Request headers with lower-case names
+            body: Request body
+
+        Returns:
+            Service response
+        """
+        self._count("requests_total")
+        routes = {
+            "/render": ("POST", self._handle_render),
+            "/capabilities": ("GET", self._handle_capabilities),
+            "/schema": ("GET", self._handle_schema),
+            "/health": ("GET", self._handle_health),
+            "/metrics": ("GET", self._handle_metrics),
+        }
+
+        route = routes.get(path.rstrip("/") or "/")
+        if route is None:
+            return self._json_response(HTTPStatus.NOT_FOUND, _error_body("NOT_FOUND", f"No route for {path}"))
+        allowed, handler = route
+        if method.upper() != allowed:
+            response = self._json_response(
+                HTTPStatus.METHOD_NOT_ALLOWED, _error_body("METHOD_NOT_ALLOWED", f"Use {allowed}")
+            )
+            return ServiceResponse(response.status, response.headers + [("Allow", allowed)], response.body)
+        return handler(headers, body)
+
+    def _json_response(
+        self, status: int, body: bytes, extra_headers: Optional[List[Tuple[str, str]]] = None
+    ) -> ServiceResponse:
+        if status >= 400:
+            self._count("errors_total")
+        headers = [("Content-Type", JSON_CONTENT_TYPE), ("Content-Length", str(len(body)))]
+        return ServiceResponse(status, headers + (extra_headers or []), body)
+
+    def _cacheable_response(
+        self, status: int, body: bytes, etag: str, headers: Mapping[str, str]
+    ) -> ServiceResponse:
+        if status == HTTPStatus.OK and etag in headers.get("if-none-match", ""):
+            self._count("not_modified_total")
+            return ServiceResponse(HTTPStatus.NOT_MODIFIED, [("ETag", etag)])
+        return self._json_response(status, body, [("ETag", etag)] if status == HTTPStatus.OK else None)
+
+    def _deadline(self, headers: Mapping[str, str]) -> float:
+        try:
+            requested = float(headers.get("x-request-timeout", self.timeout))
+        except ValueError:
+            return self.timeout
+        return max(0.0, min(requested, self.timeout))
+
+    def _handle_render(self, headers: Mapping[str, str], body: bytes) -> ServiceResponse:
+        self._count("render_requests_total")
+
+        if len(body) > self.max_body_bytes:
+            return self._json_response(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                _error_body("REQUEST_TOO_LARGE", f"Request body exceeds {self.max_body_bytes} bytes"),
+            )
+
+        try:
+            request = IntentRequest.model_validate_json(body)
+        except PydanticValidationError as e:
+            return self._json_response(
+                HTTPStatus.UNPROCESSABLE_ENTITY,
+                _error_body(
+                    "REQUEST_VALIDATION_ERROR",
+                    "Invalid intent request",
+                    errors=e.errors(include_url=False, include_context=False),
+                ),
+            )
+
+        # The client id does not affect rendering, so it is not part of the key
+        canonical = json.dumps(
+            request.model_dump(mode="json", exclude_none=True, exclude={"id"}),
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        # The version is part of the key so upgrades that change the output invalidate ETags
+        key = hashlib.sha256(f"{canonical}:{_package_version()}".encode("utf-8")).hexdigest()
+        etag = f'W/"{key[:32]}"'
+
+        if etag in headers.get("if-none-match", ""):
+            self._count("not_modified_total")
+            return ServiceResponse(HTTPStatus.NOT_MODIFIED, [("ETag", etag)])
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._counters["cache_hits_total"] += 1
+                return self._cacheable_response(*cached, etag, headers)
+
+            future = self._in_flight.get(key)
+            if future is None:
+                start = time.perf_counter()
+                future = self._executor.submit(_render_canonical_request, canonical)
+                self._in_flight[key] = future
+                self._counters["renders_total"] += 1
+                future.add_done_callback(lambda done: self._complete(key, done, start))
+            else:
+                self._counters["coalesced_total"] += 1
+
+        try:
+            status, response_body = future.result(timeout=self._deadline(headers))
+        except FutureTimeoutError:
+            self._count("timeouts_total")
+            return self._json_response(
+                HTTPStatus.GATEWAY_TIMEOUT,
+                _error_body("DEADLINE_EXCEEDED", "Rendering did not finish before the request deadline"),
+            )
+        except Exception as e:
+            return self._json_response(
+                HTTPStatus.INTERNAL_SERVER_ERROR, _error_body(type(e).__name__, str(e))
+            )
+
+        return self._cacheable_response(status, response_body, etag, headers)
+
+    def _complete(self, key: str, future: "Future[WorkerResult]", start: float) -> None:
+        """Record a finished render job and cache successful results."""
+        with self._lock:
+            self._in_flight.pop(key, None)
+            self._counters["render_seconds_sum"] += time.perf_counter() - start
+            if future.cancelled() or future.exception() is not None:
+                return
+            result = future.result()
+            if result[0] == HTTPStatus.OK and self.cache_size > 0:
+                self._cache[key] = result
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+    def _handle_capabilities(self, headers: Mapping[str, str], body: bytes) -> ServiceResponse:
+        from ..capabilities import get_capability_manifest_json
+
+        document = get_capability_manifest_json()
+        return self._cacheable_response(HTTPStatus.OK, document.body, document.etag, headers)
+
+    def _handle_schema(self, headers: Mapping[str, str], body: bytes) -> ServiceResponse:
+        from ..capabilities import get_config_schema_json
+
+        document = get_config_schema_json()
+        return self._cacheable_response(HTTPStatus.OK, document.body, document.etag, headers)
+
+    def _handle_health(self, headers: Mapping[str, str], body: bytes) -> ServiceResponse:
+        with self._lock:
+            in_flight = len(self._in_flight)
+        health = {
+            "status": "ok",
+            "backend": self.backend,
+            "workers": self.workers,
+            "in_flight": in_flight,
+            "uptime_seconds": round(time.time() - self._started, 3),
+        }
+        return self._json_response(HTTPStatus.OK, _json_bytes(health))
+
+    def _handle_metrics(self, headers: Mapping[str, str], body: bytes) -> ServiceResponse:
+        accept = headers.get("accept", "")
+        if "text/plain" in accept or "openmetrics" in accept:
+            text = self.get_prometheus_metrics().encode("utf-8")
+            return ServiceResponse(
+                HTTPStatus.OK,
+                [("Content-Type", PROMETHEUS_CONTENT_TYPE), ("Content-Length", str(len(text)))],
+                text,
+            )
+        return self._json_response(HTTPStatus.OK, _json_bytes(self.get_metrics()))
+
+    def get_prometheus_metrics(self) -> str:
+        """Get service counters and the global renderer metrics in Prometheus text format.
+
+        Returns:
+            Prometheus text exposition
+        """
+        service = MetricsRegistry()
+        for name, value in self.get_metrics().items():
+            metric_name = f"segnomms_service_{name}"
+            if name.endswith("_total") or name.endswith("_sum"):
+                service.counter(metric_name, f"Render service {name.replace('_', ' ')}").inc(value)
+            else:
+                service.gauge(metric_name, f"Render service {name.replace('_', ' ')}").set(value)
+        return service.to_prometheus() + get_metrics_registry().to_prometheus()
+
+    def get_metrics(self) -> Dict[str, float]:
+        """Get service counters.
+
+        Returns:
+            Counter values plus current cache size and in-flight jobs
+        """
+        with self._lock:
+            metrics = dict(self._counters)
+            metrics["cache_size"] = len(self._cache)
+            metrics["in_flight"] = len(self._in_flight)
+        return metrics
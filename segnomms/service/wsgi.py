@@ -0,0 +1,77 @@
+"""WSGI adapter for the render service."""
+
+from socketserver import ThreadingMixIn
+from typing import Any, Callable, Dict, Iterable, Optional
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+from .core import RenderService
+
+WSGIApp = Callable[[Dict[str, Any], Callable[..., Any]], Iterable[bytes]]
+
+
+def create_wsgi_app(service: Optional[RenderService] = None, **service_options: Any) -> WSGIApp:
+    """Create a WSGI application serving the intents JSON API.
+
+    Args:
+        service: Existing render service to expose
+        **service_options: Options for a new :class:`RenderService`
+
+    Returns:
+        WSGI application callable
+    """
+    render_service = service or RenderService(**service_options)
+
+    def app(environ: Dict[str, Any], start_response: Callable[..., Any]) -> Iterable[bytes]:
+        headers = {
+            key[5:].replace("_", "-").lower(): value
+            for key, value in environ.items()
+            if key.startswith("HTTP_")
+        }
+        if environ.get("CONTENT_TYPE"):
+            headers["content-type"] = environ["CONTENT_TYPE"]
+
+        try:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            length = 0
+        # Read at most one byte past the limit so oversized bodies are rejected
+        body = environ["wsgi.input"].read(min(length, render_service.max_body_bytes + 1)) if length else b""
+
+        response = render_service.handle(
+            environ["REQUEST_METHOD"], environ.get("PATH_INFO") or "/", headers, body
+        )
+        start_response(response.status_line, response.headers)
+        return [response.body]
+
+    return app
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def make_local_server(
+    host: str = "127.0.0.1", port: int = 8000, quiet: bool = False, **service_options: Any
+) -> WSGIServer:
+    """Create a threaded local HTTP server for the render service.
+
+    Intended for local use and tests; deploy :func:`create_wsgi_app` behind
+    a production WSGI server otherwise.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (``0`` picks a free port)
+        quiet: Suppress per-request logging
+        **service_options: Options for the :class:`RenderService`
+
+    Returns:
+        Server; call ``serve_forever()`` to start it
+    """
+    app = create_wsgi_app(**service_options)
+    handler = _QuietHandler if quiet else WSGIRequestHandler
+    return make_server(host, port, app, server_class=_ThreadingWSGIServer, handler_class=handler)
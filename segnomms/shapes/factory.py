@@ -55,11 +55,15 @@ class ShapeRendererFactory(RendererFactory):
 
     Attributes:
         _renderers: Internal registry mapping shape names to renderer classes
+        registry_version: Counter incremented by every custom registration,
+            used to invalidate data derived from the registry
     """
 
     def __init__(self) -> None:
         """Initialize factory and register all default renderers."""
         self._renderers: Dict[str, Type[ShapeRenderer]] = {}
+        self._custom_types: List[str] = []
+        self.registry_version = 0
         self._register_default_renderers()
 
     def _normalize_shape_type(self, shape_type: Any) -> str:
@@ -160,7 +164,11 @@ class ShapeRendererFactory(RendererFactory):
         Example:
             >>> factory.register_renderer('my-shape', MyShapeRenderer)
         """
-        self._renderers[self._normalize_shape_type(shape_type)] = renderer_class
+        normalized = self._normalize_shape_type(shape_type)
+        self._renderers[normalized] = renderer_class
+        if normalized not in self._custom_types:
+            self._custom_types.append(normalized)
+        self.registry_version += 1
 
     def create_renderer(self, shape_type: str, config: Dict[str, Any]) -> ShapeRenderer:
         """Create a renderer for the specified shape type.
@@ -202,6 +210,14 @@ class ShapeRendererFactory(RendererFactory):
         """
         return list(self._renderers.keys())
 
+    def list_custom_types(self) -> List[str]:
+        """Get shape types registered with :meth:`register_renderer`.
+
+        Returns:
+            List[str]: Custom shape type names in registration order
+        """
+        return list(self._custom_types)
+
     def is_supported(self, shape_type: str) -> bool:
         """Check if a shape type is supported.
 
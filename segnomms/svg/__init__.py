@@ -33,10 +33,17 @@ Example:
 See Also:
     :mod:`segnomms.svg.core`: Core SVG building implementation
     :mod:`segnomms.svg.interactivity`: Interactive features
+    :mod:`segnomms.svg.assets`: Shared, content-hashed runtime assets
     :mod:`segnomms.svg.path_clipper`: Path clipping utilities
 """
 
 from .accessibility import AccessibilityBuilder
+from .assets import (
+    RuntimeAsset,
+    build_runtime_assets,
+    export_runtime_assets,
+    render_shared_assets_html,
+)
 from .composite import InteractiveSVGBuilder
 from .core import CoreSVGBuilder
 from .definitions import DefinitionsBuilder
@@ -62,6 +69,11 @@ __all__ = [
     "FrameVisualBuilder",
     "AccessibilityBuilder",
     "PathClipper",
+    # Shared runtime assets
+    "RuntimeAsset",
+    "build_runtime_assets",
+    "export_runtime_assets",
+    "render_shared_assets_html",
     # SVG Models
     "SVGElementConfig",
     "BackgroundConfig",
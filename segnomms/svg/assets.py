@@ -0,0 +1,159 @@
+"""Shared runtime assets for interactive SVGs.
+
+Every interactive SVG normally embeds the same stylesheet and the same
+interaction script. When many codes are shown on one page this runtime is
+shipped once per code. This module builds those assets as standalone,
+content-hashed files so they can be served once and referenced from each
+SVG, or emitted a single time as an inline HTML block.
+
+Example:
+    Export the runtime and render codes that reference it::
+
+        from segnomms.svg.assets import export_runtime_assets
+
+        export_runtime_assets("static/qr", interactive=True)
+        qr.save("code.svg", kind="interactive_svg", interactive=True,
+                runtime_assets="external", asset_base_url="/static/qr")
+"""
+
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Literal, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from .core import CoreSVGBuilder
+from .interactivity import InteractivityBuilder
+
+ASSET_NAME_PREFIX = "segnomms-runtime"
+ASSET_HASH_LENGTH = 12
+
+
+class RuntimeAsset(BaseModel):
+    """A single versioned runtime asset (stylesheet or script).
+
+    Attributes:
+        kind: Asset type, ``"css"`` or ``"js"``
+        content: Asset source text
+        digest: SHA-256 hex digest of the content
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    kind: Literal["css", "js"] = Field(..., description="Asset type")
+    content: str = Field(..., description="Asset source text")
+    digest: str = Field(..., description="SHA-256 hex digest of the content")
+
+    @property
+    def filename(self) -> str:
+        """Content-hashed file name, e.g. ``segnomms-runtime.1a2b3c4d5e6f.css``."""
+        return f"{ASSET_NAME_PREFIX}.{self.digest[:ASSET_HASH_LENGTH]}.{self.kind}"
+
+    def href(self, base_url: str = "") -> str:
+        """Build the URL under which this asset is served.
+
+        Args:
+            base_url: URL prefix of the directory the asset was exported to
+
+        Returns:
+            URL referencing the content-hashed file name
+        """
+        if not base_url:
+            return self.filename
+        return f"{base_url.rstrip('/')}/{self.filename}"
+
+
+def _make_asset(kind: Literal["css", "js"], content: str) -> RuntimeAsset:
+    content = content.strip() + "\n"
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    return RuntimeAsset(kind=kind, content=content, digest=digest)
+
+
+def build_runtime_assets(
+    interactive: bool = True, animation_config: Optional[Dict[str, Any]] = None
+) -> Dict[str, RuntimeAsset]:
+    """Build the runtime assets used by rendered SVGs.
+
+    The stylesheet is produced by the same code that generates inline
+    styles, so external and inline rendering stay visually identical.
+
+    Args:
+        interactive: Include interactive styles and the interaction script
+        animation_config: Optional animation configuration dict
+
+    Returns:
+        Mapping with a ``"css"`` asset and, when interactive, a ``"js"`` asset
+    """
+    if not animation_config:
+        return dict(_default_runtime_assets(interactive))
+    return _generate_runtime_assets(interactive, animation_config)
+
+
+@lru_cache(maxsize=2)
+def _default_runtime_assets(interactive: bool) -> Dict[str, RuntimeAsset]:
+    return _generate_runtime_assets(interactive, None)
+
+
+def _generate_runtime_assets(
+    interactive: bool, animation_config: Optional[Dict[str, Any]]
+) -> Dict[str, RuntimeAsset]:
+    css = CoreSVGBuilder()._generate_css_styles(interactive, animation_config)
+    assets = {"css": _make_asset("css", css)}
+    if interactive:
+        assets["js"] = _make_asset("js", InteractivityBuilder().get_interaction_script())
+    return assets
+
+
+def export_runtime_assets(
+    directory: Union[str, Path],
+    interactive: bool = True,
+    animation_config: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Path]:
+    """Write the runtime assets to content-hashed files.
+
+    Files that already exist are left untouched; since names include the
+    content hash an existing file is guaranteed to be identical.
+
+    Args:
+        directory: Directory to write the assets to (created if missing)
+        interactive: Include interactive styles and the interaction script
+        animation_config: Optional animation configuration dict
+
+    Returns:
+        Mapping of asset kind to written file path
+    """
+    target = Path(directory)
+    target.mkdir(parents=True, exist_ok=True)
+
+    paths = {}
+    for kind, asset in build_runtime_assets(interactive, animation_config).items():
+        path = target / asset.filename
+        if not path.exists():
+            path.write_text(asset.content, encoding="utf-8")
+        paths[kind] = path
+    return paths
+
+
+def render_shared_assets_html(
+    interactive: bool = True, animation_config: Optional[Dict[str, Any]] = None
+) -> str:
+    """Render the runtime assets as an HTML block to emit once per page.
+
+    Use with ``runtime_assets="shared"`` so that inline SVGs on the page
+    carry no stylesheet or script of their own.
+
+    Args:
+        interactive: Include interactive styles and the interaction script
+        animation_config: Optional animation configuration dict
+
+    Returns:
+        HTML ``<style>`` (and ``<script>``) markup
+    """
+    tags = {"css": "style", "js": "script"}
+    parts = []
+    for kind, asset in build_runtime_assets(interactive, animation_config).items():
+        tag = tags[kind]
+        version = asset.digest[:ASSET_HASH_LENGTH]
+        parts.append(f'<{tag} data-segnomms-runtime="{version}">\n{asset.content}</{tag}>')
+    return "\n".join(parts)
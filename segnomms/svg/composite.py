@@ -5,7 +5,7 @@ from all specialized builders to maintain backward compatibility.
 """
 
 import xml.etree.ElementTree as ET
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from ..a11y.accessibility import AccessibilityConfig
 from ..core.interfaces import SVGBuilder
@@ -86,6 +86,26 @@ class InteractiveSVGBuilder(SVGBuilder):
         """Add CSS styles to the SVG."""
         self.core_builder.add_styles(svg, interactive, animation_config)
 
+    def add_external_assets(self, svg: ET.Element, css_href: str, js_href: Optional[str] = None) -> None:
+        """Reference shared runtime assets instead of inlining them."""
+        self.core_builder.add_external_stylesheet(svg, css_href)
+        if js_href:
+            self.interactivity_builder.add_external_script(svg, js_href)
+
+    def add_stagger_styles(
+        self,
+        svg: ET.Element,
+        band_starts: Dict[str, List[Tuple[int, int]]],
+        row_delay: float,
+        rows_per_band: int,
+    ) -> None:
+        """Add document-specific stagger rules for the fade-in animation."""
+        self.core_builder.add_stagger_styles(svg, band_starts, row_delay, rows_per_band)
+
+    def add_imprint_styles(self, svg: ET.Element, buckets: List[Dict[str, Any]]) -> None:
+        """Add the shared rules for imprinted centerpiece modules."""
+        self.core_builder.add_imprint_styles(svg, buckets)
+
     def add_background(self, svg: ET.Element, width: int, height: int, color: str, **kwargs: Any) -> None:
         """Add a background rectangle to the SVG."""
         self.core_builder.add_background(svg, width, height, color, **kwargs)
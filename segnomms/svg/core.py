@@ -4,8 +4,9 @@ This module provides the base SVG building operations including creating
 root elements, adding styles, and managing backgrounds.
 """
 
+import hashlib
 import xml.etree.ElementTree as ET
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..core.interfaces import SVGBuilder
 from .models import BackgroundConfig, SVGElementConfig
@@ -80,6 +81,95 @@ class CoreSVGBuilder(SVGBuilder):
             style = ET.SubElement(svg, "style", attrib={"type": "text/css"})
             style.text = f"\n<![CDATA[\n{style_content}\n]]>\n"
 
+    def add_external_stylesheet(self, svg: ET.Element, href: str) -> None:
+        """Reference an external stylesheet instead of inlining styles.
+
+        Args:
+            svg: SVG element to add the stylesheet reference to
+            href: URL of the stylesheet
+        """
+        existing_style = svg.find(".//style")
+        if existing_style is not None:
+            return
+
+        style = ET.SubElement(svg, "style", attrib={"type": "text/css"})
+        style.text = f'@import url("{href}");'
+
+    def add_stagger_styles(
+        self,
+        svg: ET.Element,
+        band_starts: Dict[str, List[Tuple[int, int]]],
+        row_delay: float,
+        rows_per_band: int,
+    ) -> None:
+        """Add document-specific stagger rules for the fade-in animation.
+
+        Modules carry no animation data. Instead, children of each pattern
+        group are in row-major order, so the first child of every row band
+        is known at render time and one ``nth-child(n+k)`` rule per band
+        assigns the delay to that child and everything after it.
+
+        Args:
+            svg: SVG element to add the rules to
+            band_starts: Pattern type to ``(band, 1-based child index)`` pairs,
+                ordered by band
+            row_delay: Delay added per module row in seconds
+            rows_per_band: Number of module rows sharing one delay
+        """
+        rules = []
+        for pattern_type, starts in band_starts.items():
+            for band, child_index in starts:
+                if band == 0:
+                    continue
+                delay = band * rows_per_band * row_delay
+                rules.append(
+                    f".qr-pattern-{pattern_type} > :nth-child(n+{child_index}) "
+                    f"{{ animation-delay: {delay:.3f}s; }}"
+                )
+
+        if rules:
+            style = ET.SubElement(svg, "style", attrib={"type": "text/css", "class": "qr-stagger"})
+            style.text = self._scope_rules(svg, "qr-stagger", rules)
+
+    def add_imprint_styles(self, svg: ET.Element, buckets: List[Dict[str, Any]]) -> None:
+        """Add the shared rules for imprinted centerpiece modules.
+
+        Imprinted modules only carry their bucket's ``qr-imprint-N`` class;
+        the treatment itself is defined once per bucket here.
+
+        Args:
+            svg: SVG element to add the rules to
+            buckets: Bucket treatments with ``css_class`` and ``opacity`` keys
+        """
+        rules = [f".{bucket['css_class']} {{ opacity: {bucket['opacity']:g}; }}" for bucket in buckets]
+        if rules:
+            style = ET.SubElement(svg, "style", attrib={"type": "text/css", "class": "qr-imprint"})
+            style.text = self._scope_rules(svg, "qr-imprints", rules)
+
+    @staticmethod
+    def _scope_rules(svg: ET.Element, prefix: str, rules: List[str]) -> str:
+        """Scope document-specific rules to a class on the root element.
+
+        Style rules apply to the whole page once SVGs are inlined in HTML,
+        and the root ID is the same for every document rendered without
+        accessibility. The scope class is derived from the rules, so
+        documents only share it when their rules are identical, and output
+        stays deterministic.
+
+        Args:
+            svg: Root SVG element receiving the scope class
+            prefix: Scope class prefix
+            rules: Unscoped CSS rules
+
+        Returns:
+            Scoped rules, one per line
+        """
+        digest = hashlib.sha256("\n".join(rules).encode("utf-8")).hexdigest()[:8]
+        scope_class = f"{prefix}-{digest}"
+        classes = svg.get("class")
+        svg.set("class", f"{classes} {scope_class}" if classes else scope_class)
+        return "\n".join(f".{scope_class} {rule}" for rule in rules)
+
     def add_background(self, svg: ET.Element, width: int, height: int, color: str, **kwargs: Any) -> None:
         """Add a background rectangle to the SVG.
 
@@ -121,8 +211,7 @@ class CoreSVGBuilder(SVGBuilder):
         styles = []
 
         # Base styles (matching original)
-        styles.append(
-            """
+        styles.append("""
         .qr-background {
             pointer-events: none;
         }
@@ -162,13 +251,11 @@ class CoreSVGBuilder(SVGBuilder):
             fill: currentColor;
             stroke: none;
         }
-        """
-        )
+        """)
 
         # Interactive styles (matching original)
         if interactive:
-            styles.append(
-                """
+            styles.append("""
             .qr-module:hover {
                 filter: brightness(1.2);
             }
@@ -208,8 +295,7 @@ class CoreSVGBuilder(SVGBuilder):
                     transform: none;
                 }
             }
-            """
-            )
+            """)
 
         # Animation styles
         if animation_config:
@@ -233,15 +319,12 @@ class CoreSVGBuilder(SVGBuilder):
         # Extract animation settings
         fade_in = config.get("animation_fade_in", False)
         fade_duration = config.get("animation_fade_duration", 0.5)
-        stagger = config.get("animation_stagger", False)
-        stagger_delay = config.get("animation_stagger_delay", 0.02)
         pulse = config.get("animation_pulse", False)
         timing = config.get("animation_timing", "ease")
 
         # Fade-in animation
         if fade_in:
-            animation_styles.append(
-                f"""
+            animation_styles.append(f"""
             @keyframes qrFadeIn {{
                 from {{
                     opacity: 0;
@@ -256,28 +339,14 @@ class CoreSVGBuilder(SVGBuilder):
             .qr-module {{
                 animation: qrFadeIn {fade_duration}s {timing} both;
             }}
-            """
-            )
-
-            # Stagger support using CSS variables
-            if stagger:
-                animation_styles.append(
-                    f"""
-            /* Staggered animation delays using CSS variables */
-            .qr-root {{
-                --stagger-step: {stagger_delay}s;
-            }}
+            """)
 
-            .qr-module {{
-                animation-delay: calc(var(--i, 0) * var(--stagger-step));
-            }}
-            """
-                )
+            # Stagger delays depend on the document's module layout and are
+            # emitted per SVG by add_stagger_styles()
 
         # Pulse effect for finder patterns (using halos)
         if pulse:
-            animation_styles.append(
-                f"""
+            animation_styles.append(f"""
             @keyframes qrPulse {{
                 0%, 100% {{
                     transform: scale(1);
@@ -304,12 +373,10 @@ class CoreSVGBuilder(SVGBuilder):
             .qr-finder {{
                 animation: none !important;
             }}
-            """
-            )
+            """)
 
         # Respect reduced motion preferences
-        animation_styles.append(
-            """
+        animation_styles.append("""
         @media (prefers-reduced-motion: reduce) {
             .qr-root * {
                 animation: none !important;
@@ -323,7 +390,6 @@ class CoreSVGBuilder(SVGBuilder):
                 transition: none !important;
             }
         }
-        """
-        )
+        """)
 
         return "\n".join(animation_styles)
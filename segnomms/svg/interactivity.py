@@ -44,7 +44,31 @@ class InteractivityBuilder:
         Args:
             svg: SVG element to add handlers to
         """
-        default_handlers = """
+        self.add_javascript(svg, self.get_interaction_script())
+
+    def add_external_script(self, svg: ET.Element, href: str) -> None:
+        """Reference an external JavaScript file instead of embedding code.
+
+        Both ``href`` (SVG 2) and ``xlink:href`` (SVG 1.1) are set so the
+        reference resolves in standalone and inline SVG alike.
+
+        Args:
+            svg: SVG element to add the script reference to
+            href: URL of the script
+        """
+        ET.SubElement(
+            svg,
+            "script",
+            attrib={"type": "text/javascript", "href": href, "xlink:href": href},
+        )
+
+    def get_interaction_script(self) -> str:
+        """Get the default interaction handler JavaScript.
+
+        Returns:
+            JavaScript source shared by all interactive SVGs
+        """
+        return """
         // Default interaction handlers
         document.addEventListener('DOMContentLoaded', function() {
             // Tooltip handling
@@ -124,8 +148,6 @@ class InteractivityBuilder:
         });
         """
 
-        self.add_javascript(svg, default_handlers)
-
     def add_custom_interaction(
         self, svg: ET.Element, element_selector: str, event_type: str, handler_code: str
     ) -> None:
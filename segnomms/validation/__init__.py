@@ -10,7 +10,12 @@ import warnings
 from typing import TYPE_CHECKING
 
 from .composition import CompositionValidator
-from .models import CompositionValidatorConfig, ValidationResult
+from .models import (
+    CompositionValidatorConfig,
+    GeometryVerificationResult,
+    ValidationResult,
+)
+from .verification import verify_rendered_geometry
 
 if TYPE_CHECKING:
     # For type checking, Phase4Validator is the same as CompositionValidator
@@ -19,9 +24,11 @@ if TYPE_CHECKING:
 __all__ = [
     "CompositionValidator",
     "CompositionValidatorConfig",
+    "GeometryVerificationResult",
     "Phase4Validator",  # Deprecated alias, kept for backward compatibility
     "Phase4ValidatorConfig",  # Deprecated alias, kept for backward compatibility
     "ValidationResult",
+    "verify_rendered_geometry",
 ]
 
 
@@ -4,7 +4,7 @@ This module provides data models for validation classes using Pydantic
 for automatic validation and type safety.
 """
 
-from typing import Any, Dict, Literal
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 
@@ -115,5 +115,56 @@ class ValidationResult(BaseModel):
         return self.model_dump()
 
 
+class GeometryVerificationResult(BaseModel):
+    """Result of sampling rendered geometry at every module center.
+
+    Module positions are ``(row, col)`` tuples in the intended matrix.
+
+    Example:
+        >>> result = verify_rendered_geometry(svg, qr_code, config)
+        >>> result.passed, result.error_correction_headroom
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    modules_checked: int = Field(..., description="Number of module centers sampled")
+
+    missing_modules: List[Tuple[int, int]] = Field(
+        default_factory=list, description="Modules that should be dark but render light"
+    )
+
+    extra_modules: List[Tuple[int, int]] = Field(
+        default_factory=list, description="Modules that should be light but render dark"
+    )
+
+    function_pattern_errors: List[Tuple[int, int]] = Field(
+        default_factory=list, description="Flipped modules in finder, timing, format or version patterns"
+    )
+
+    estimated_codeword_errors: int = Field(
+        default=0, description="Estimated number of data codewords affected by flipped modules"
+    )
+
+    correctable_codewords: Optional[int] = Field(
+        default=None, description="Codeword errors the error correction can repair, if known"
+    )
+
+    error_correction_headroom: Optional[float] = Field(
+        default=None,
+        description="Fraction of the error correction capacity left (negative when exceeded), if known",
+    )
+
+    passed: bool = Field(..., description="Whether the rendered geometry is expected to decode")
+
+    @property
+    def flipped_count(self) -> int:
+        """Get the number of modules that render differently from the matrix."""
+        return len(self.missing_modules) + len(self.extra_modules)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary format."""
+        return self.model_dump()
+
+
 # Deprecated alias for backward compatibility
 Phase4ValidatorConfig = CompositionValidatorConfig
@@ -0,0 +1,854 @@
+"""Dependency-free verification of rendered QR code geometry.
+
+Samples the painted geometry of a rendered SVG at every module center and
+compares it with the matrix the symbol encodes. Frame clipping, scale mode,
+centerpiece clearing and island removal all end up in the rendered shapes,
+so flipped modules are found without rasterizing the SVG or decoding it.
+
+Shapes (``rect``, ``circle``, ``ellipse``, ``polygon``, ``polyline`` and
+``path``) are evaluated in document order, so later shapes paint over
+earlier ones. Their ``transform``, ``fill``, ``fill-rule`` and opacity are
+honoured, as is any ``clip-path`` or ``mask`` referenced by an ancestor.
+Class rules in ``<style>`` elements are applied when their selector is a
+class, optionally scoped by ancestor classes or ids, such as the imprint
+treatment rules ``.qr-imprints-<id> .qr-imprint-0 { opacity: 0.35 }``.
+Rules with pseudo-classes, combinators or custom properties (animations,
+hover effects, themes) are not evaluated.
+
+Shapes whose transform keeps them axis-aligned, which covers everything
+the renderer emits, are mapped onto the module grid directly and plain
+rectangles are filled without a hit test, so verification costs a
+fraction of the render it checks.
+
+Example:
+    >>> svg = generate_interactive_svg(qr, config)
+    >>> result = verify_rendered_geometry(svg, qr, config)
+    >>> result.passed, result.missing_modules
+"""
+
+import math
+import re
+import xml.etree.ElementTree as ET
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from ..color.color_analysis import calculate_luminance, parse_color
+from ..config import RenderingConfig
+from ..core.detector import ModuleDetector
+from .models import GeometryVerificationResult
+
+Point = Tuple[float, float]
+Affine = Tuple[float, float, float, float, float, float]
+BBox = Tuple[float, float, float, float]
+
+IDENTITY: Affine = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+# Module types that error correction cannot repair
+FUNCTION_PATTERN_TYPES = frozenset(
+    {
+        "finder",
+        "finder_inner",
+        "separator",
+        "timing",
+        "alignment",
+        "alignment_center",
+        "dark",
+        "format",
+        "version",
+    }
+)
+
+# Straight segments used to approximate each curve or arc
+CURVE_SEGMENTS = 8
+
+# Paint more transparent than this does not change the perceived module color
+MIN_PAINT_ALPHA = 0.5
+
+# Elements whose content is never painted directly
+_NON_RENDERED = frozenset(
+    {
+        "defs",
+        "clipPath",
+        "mask",
+        "metadata",
+        "style",
+        "script",
+        "title",
+        "desc",
+        "pattern",
+        "linearGradient",
+        "radialGradient",
+        "symbol",
+        "marker",
+        "filter",
+    }
+)
+
+# Properties read from style attributes and <style> class rules
+_STYLE_PROPERTIES = ("fill", "fill-opacity", "fill-rule", "opacity")
+_RULE_PROPERTIES = _STYLE_PROPERTIES + ("display", "visibility")
+_PRESENTATION_ATTRIBUTES = _RULE_PROPERTIES + ("clip-path", "mask")
+
+# Values that depend on CSS state the sampler does not track
+_UNRESOLVED_VALUES = ("var(", "currentcolor", "inherit", "initial", "unset")
+
+_NUMBER_RE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_PATH_TOKEN_RE = re.compile(r"[MmLlHhVvCcSsQqTtAaZz]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_TRANSFORM_RE = re.compile(r"(matrix|translate|scale|rotate|skewX|skewY)\s*\(([^)]*)\)")
+_URL_RE = re.compile(r"url\(\s*['\"]?#([^'\")\s]+)['\"]?\s*\)")
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/|<!\[CDATA\[|\]\]>", re.S)
+_SIMPLE_SELECTOR_RE = re.compile(r"[.#]-?[A-Za-z_][\w-]*")
+
+
+def _local_name(tag: Any) -> str:
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def _multiply(m: Affine, n: Affine) -> Affine:
+    """Compose two affine transforms (``n`` is applied first)."""
+    a1, b1, c1, d1, e1, f1 = m
+    a2, b2, c2, d2, e2, f2 = n
+    return (
+        a1 * a2 + c1 * b2,
+        b1 * a2 + d1 * b2,
+        a1 * c2 + c1 * d2,
+        b1 * c2 + d1 * d2,
+        a1 * e2 + c1 * f2 + e1,
+        b1 * e2 + d1 * f2 + f1,
+    )
+
+
+def _apply(m: Affine, x: float, y: float) -> Point:
+    a, b, c, d, e, f = m
+    return a * x + c * y + e, b * x + d * y + f
+
+
+def _invert(m: Affine) -> Optional[Affine]:
+    a, b, c, d, e, f = m
+    det = a * d - b * c
+    if abs(det) < 1e-12:
+        return None
+    return (d / det, -b / det, -c / det, a / det, (c * f - d * e) / det, (b * e - a * f) / det)
+
+
+def parse_transform(value: Optional[str]) -> Affine:
+    """Parse an SVG ``transform`` attribute into an affine matrix.
+
+    Args:
+        value: Attribute value, e.g. ``"translate(10 0) scale(2)"``
+
+    Returns:
+        Matrix ``(a, b, c, d, e, f)``; the identity for empty values
+    """
+    result = IDENTITY
+    for name, args in _TRANSFORM_RE.findall(value or ""):
+        v = [float(number) for number in _NUMBER_RE.findall(args)]
+        if not v:
+            continue
+        if name == "matrix" and len(v) == 6:
+            m: Affine = (v[0], v[1], v[2], v[3], v[4], v[5])
+        elif name == "translate":
+            m = (1.0, 0.0, 0.0, 1.0, v[0], v[1] if len(v) > 1 else 0.0)
+        elif name == "scale":
+            m = (v[0], 0.0, 0.0, v[1] if len(v) > 1 else v[0], 0.0, 0.0)
+        elif name == "rotate":
+            angle = math.radians(v[0])
+            cos, sin = math.cos(angle), math.sin(angle)
+            m = (cos, sin, -sin, cos, 0.0, 0.0)
+            if len(v) == 3:
+                m = _multiply(
+                    _multiply((1.0, 0.0, 0.0, 1.0, v[1], v[2]), m), (1.0, 0.0, 0.0, 1.0, -v[1], -v[2])
+                )
+        elif name == "skewX":
+            m = (1.0, 0.0, math.tan(math.radians(v[0])), 1.0, 0.0, 0.0)
+        elif name == "skewY":
+            m = (1.0, math.tan(math.radians(v[0])), 0.0, 1.0, 0.0, 0.0)
+        else:
+            continue
+        result = _multiply(result, m)
+    return result
+
+
+def _cubic(p0: Point, p1: Point, p2: Point, p3: Point) -> Iterator[Point]:
+    for step in range(1, CURVE_SEGMENTS + 1):
+        t = step / CURVE_SEGMENTS
+        u = 1 - t
+        yield (
+            u**3 * p0[0] + 3 * u * u * t * p1[0] + 3 * u * t * t * p2[0] + t**3 * p3[0],
+            u**3 * p0[1] + 3 * u * u * t * p1[1] + 3 * u * t * t * p2[1] + t**3 * p3[1],
+        )
+
+
+def _quadratic(p0: Point, p1: Point, p2: Point) -> Iterator[Point]:
+    for step in range(1, CURVE_SEGMENTS + 1):
+        t = step / CURVE_SEGMENTS
+        u = 1 - t
+        yield (
+            u * u * p0[0] + 2 * u * t * p1[0] + t * t * p2[0],
+            u * u * p0[1] + 2 * u * t * p1[1] + t * t * p2[1],
+        )
+
+
+def _arc(
+    start: Point, rx: float, ry: float, rotation: float, large_arc: bool, sweep: bool, end: Point
+) -> Iterator[Point]:
+    """Approximate an elliptical arc (SVG endpoint parameterization)."""
+    (x1, y1), (x2, y2) = start, end
+    rx, ry = abs(rx), abs(ry)
+    if rx == 0 or ry == 0 or start == end:
+        yield end
+        return
+
+    phi = math.radians(rotation)
+    cos_phi, sin_phi = math.cos(phi), math.sin(phi)
+    dx, dy = (x1 - x2) / 2, (y1 - y2) / 2
+    x1p = cos_phi * dx + sin_phi * dy
+    y1p = -sin_phi * dx + cos_phi * dy
+
+    # Scale radii up if they cannot span the endpoints
+    scale = (x1p / rx) ** 2 + (y1p / ry) ** 2
+    if scale > 1:
+        rx, ry = rx * math.sqrt(scale), ry * math.sqrt(scale)
+
+    numerator = rx * rx * ry * ry - rx * rx * y1p * y1p - ry * ry * x1p * x1p
+    denominator = rx * rx * y1p * y1p + ry * ry * x1p * x1p
+    coefficient = math.sqrt(max(0.0, numerator / denominator)) if denominator else 0.0
+    if large_arc == sweep:
+        coefficient = -coefficient
+    cxp = coefficient * rx * y1p / ry
+    cyp = -coefficient * ry * x1p / rx
+    cx = cos_phi * cxp - sin_phi * cyp + (x1 + x2) / 2
+    cy = sin_phi * cxp + cos_phi * cyp + (y1 + y2) / 2
+
+    theta = math.atan2((y1p - cyp) / ry, (x1p - cxp) / rx)
+    delta = math.atan2((-y1p - cyp) / ry, (-x1p - cxp) / rx) - theta
+    if sweep and delta < 0:
+        delta += 2 * math.pi
+    elif not sweep and delta > 0:
+        delta -= 2 * math.pi
+
+    for step in range(1, CURVE_SEGMENTS + 1):
+        t = theta + delta * step / CURVE_SEGMENTS
+        yield (
+            cos_phi * rx * math.cos(t) - sin_phi * ry * math.sin(t) + cx,
+            sin_phi * rx * math.cos(t) + cos_phi * ry * math.sin(t) + cy,
+        )
+
+
+def flatten_path(data: str) -> List[List[Point]]:
+    """Flatten SVG path data into polygons.
+
+    Curves and arcs are approximated with :data:`CURVE_SEGMENTS` straight
+    segments each. Arc flags must be separated by whitespace or commas.
+
+    Args:
+        data: Path ``d`` attribute
+
+    Returns:
+        One point list per subpath
+    """
+    tokens = _PATH_TOKEN_RE.findall(data)
+    subpaths: List[List[Point]] = []
+    current: List[Point] = []
+    x = y = 0.0
+    start: Point = (0.0, 0.0)
+    command = ""
+    previous = ""
+    control: Optional[Point] = None
+    index = 0
+
+    def numbers(count: int) -> List[float]:
+        nonlocal index
+        values = [float(token) for token in tokens[index : index + count]]
+        index += count
+        if len(values) < count:
+            raise ValueError("truncated path data")
+        return values
+
+    def line_to(point: Point) -> None:
+        if not current:
+            current.append((x, y))
+        current.append(point)
+
+    try:
+        while index < len(tokens):
+            token = tokens[index]
+            if token.isalpha():
+                command = token
+                index += 1
+                if command in "Zz":
+                    if current:
+                        subpaths.append(current)
+                        current = []
+                    x, y = start
+                    previous, control = "Z", None
+                    continue
+            elif not command or command in "Zz":
+                break
+
+            relative = command.islower()
+            kind = command.upper()
+            ox, oy = (x, y) if relative else (0.0, 0.0)
+
+            if kind == "M":
+                px, py = numbers(2)
+                if current:
+                    subpaths.append(current)
+                x, y = px + ox, py + oy
+                current = [(x, y)]
+                start = (x, y)
+                # Further coordinate pairs are implicit line-tos
+                command = "l" if relative else "L"
+                control = None
+            elif kind == "L":
+                px, py = numbers(2)
+                line_to((px + ox, py + oy))
+                x, y = px + ox, py + oy
+                control = None
+            elif kind == "H":
+                (px,) = numbers(1)
+                line_to((px + ox, y))
+                x = px + ox
+                control = None
+            elif kind == "V":
+                (py,) = numbers(1)
+                line_to((x, py + oy))
+                y = py + oy
+                control = None
+            elif kind in "CS":
+                if kind == "C":
+                    x1, y1, x2, y2, px, py = numbers(6)
+                    c1 = (x1 + ox, y1 + oy)
+                else:
+                    x2, y2, px, py = numbers(4)
+                    c1 = (2 * x - control[0], 2 * y - control[1]) if control and previous in "CS" else (x, y)
+                c2 = (x2 + ox, y2 + oy)
+                end = (px + ox, py + oy)
+                for point in _cubic((x, y), c1, c2, end):
+                    line_to(point)
+                x, y = end
+                control = c2
+            elif kind in "QT":
+                if kind == "Q":
+                    x1, y1, px, py = numbers(4)
+                    c = (x1 + ox, y1 + oy)
+                else:
+                    px, py = numbers(2)
+                    c = (2 * x - control[0], 2 * y - control[1]) if control and previous in "QT" else (x, y)
+                end = (px + ox, py + oy)
+                for point in _quadratic((x, y), c, end):
+                    line_to(point)
+                x, y = end
+                control = c
+            elif kind == "A":
+                rx, ry, rotation, large_arc, sweep, px, py = numbers(7)
+                end = (px + ox, py + oy)
+                for point in _arc((x, y), rx, ry, rotation, bool(large_arc), bool(sweep), end):
+                    line_to(point)
+                x, y = end
+                control = None
+            previous = kind
+    except ValueError:
+        # Like browsers, render the path up to the first error
+        pass
+
+    if current:
+        subpaths.append(current)
+    return subpaths
+
+
+def _winding(x: float, y: float, subpaths: Sequence[Sequence[Point]]) -> Tuple[int, int]:
+    """Winding number and crossing count of a point (subpaths are implicitly closed)."""
+    winding = crossings = 0
+    for points in subpaths:
+        count = len(points)
+        for i in range(count):
+            x0, y0 = points[i]
+            x1, y1 = points[(i + 1) % count]
+            if (y0 <= y) != (y1 <= y):
+                cross_x = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
+                if cross_x > x:
+                    crossings += 1
+                    winding += 1 if y1 > y0 else -1
+    return winding, crossings
+
+
+class _Shape:
+    """Fill area of one SVG shape in its local coordinates."""
+
+    __slots__ = ("kind", "params", "subpaths", "evenodd", "bbox")
+
+    def __init__(self, kind: str, params: Tuple[float, ...], bbox: BBox, subpaths: Any = None) -> None:
+        self.kind = kind
+        self.params = params
+        self.subpaths: List[List[Point]] = subpaths or []
+        self.evenodd = False
+        self.bbox = bbox
+
+    def contains(self, x: float, y: float) -> bool:
+        x0, y0, x1, y1 = self.bbox
+        if not (x0 <= x <= x1 and y0 <= y <= y1):
+            return False
+        if self.kind == "rect":
+            rx, ry = self.params
+            if rx <= 0 or ry <= 0:
+                return True
+            cx = min(max(x, x0 + rx), x1 - rx)
+            cy = min(max(y, y0 + ry), y1 - ry)
+            return ((x - cx) / rx) ** 2 + ((y - cy) / ry) ** 2 <= 1
+        if self.kind == "ellipse":
+            cx, cy, rx, ry = self.params
+            return ((x - cx) / rx) ** 2 + ((y - cy) / ry) ** 2 <= 1
+        winding, crossings = _winding(x, y, self.subpaths)
+        return crossings % 2 == 1 if self.evenodd else winding != 0
+
+
+def _float(element: ET.Element, name: str, default: float = 0.0) -> float:
+    value = element.get(name)
+    if value is None:
+        return default
+    try:
+        number = float(value)
+    except ValueError:
+        # Values with units such as "10px"
+        match = _NUMBER_RE.match(value.strip())
+        return float(match.group()) if match else default
+    return number if math.isfinite(number) else default
+
+
+_ClassRules = Dict[str, List[Tuple[FrozenSet[str], Dict[str, str]]]]
+
+
+def _css_blocks(css: str) -> Iterator[Tuple[str, str]]:
+    """Top-level ``prelude { body }`` pairs of a style sheet."""
+    depth = start = 0
+    prelude = ""
+    for index, char in enumerate(css):
+        if char == "{":
+            if depth == 0:
+                prelude, start = css[start:index], index + 1
+            depth += 1
+        elif char == "}" and depth:
+            depth -= 1
+            if depth == 0:
+                yield prelude.strip(), css[start:index]
+                start = index + 1
+        elif char == ";" and depth == 0:
+            start = index + 1
+
+
+def parse_class_rules(css: str) -> _ClassRules:
+    """Collect the class rules of a style sheet that affect painting.
+
+    Only selectors made of classes and ids are kept, e.g. ``.module`` or
+    ``.scope #group .module``; the last part must be a class. At-rules,
+    pseudo-classes, combinators other than descendant and values using
+    custom properties or ``currentColor`` are skipped.
+
+    Args:
+        css: Style sheet text
+
+    Returns:
+        Per class name, the ancestor selectors (``".class"`` or ``"#id"``)
+        and declarations of each matching rule, in document order
+    """
+    rules: _ClassRules = {}
+    for prelude, body in _css_blocks(_CSS_COMMENT_RE.sub("", css)):
+        if prelude.startswith("@"):
+            continue
+        declarations = {}
+        for declaration in body.split(";"):
+            name, _, value = declaration.partition(":")
+            name = name.strip().lower()
+            value = value.replace("!important", "").strip()
+            if (
+                name in _RULE_PROPERTIES
+                and value
+                and not any(unresolved in value.lower() for unresolved in _UNRESOLVED_VALUES)
+            ):
+                declarations[name] = value
+        if not declarations:
+            continue
+        for selector in prelude.split(","):
+            parts = selector.split()
+            if not parts or not all(_SIMPLE_SELECTOR_RE.fullmatch(part) for part in parts):
+                continue
+            if not parts[-1].startswith("."):
+                continue
+            rules.setdefault(parts[-1][1:], []).append((frozenset(parts[:-1]), declarations))
+    return rules
+
+
+def _build_shape(element: ET.Element, kind: str) -> Optional[_Shape]:
+    """Build the fill area of a shape element, or None if it has none."""
+    if kind == "rect":
+        x, y = _float(element, "x"), _float(element, "y")
+        width, height = _float(element, "width"), _float(element, "height")
+        if width <= 0 or height <= 0:
+            return None
+        rx_attr, ry_attr = element.get("rx"), element.get("ry")
+        rx = _float(element, "rx") if rx_attr is not None else None
+        ry = _float(element, "ry") if ry_attr is not None else None
+        rx = rx if rx is not None else (ry or 0.0)
+        ry = ry if ry is not None else rx
+        return _Shape("rect", (min(rx, width / 2), min(ry, height / 2)), (x, y, x + width, y + height))
+    if kind in ("circle", "ellipse"):
+        cx, cy = _float(element, "cx"), _float(element, "cy")
+        if kind == "circle":
+            rx = ry = _float(element, "r")
+        else:
+            rx, ry = _float(element, "rx"), _float(element, "ry")
+        if rx <= 0 or ry <= 0:
+            return None
+        return _Shape("ellipse", (cx, cy, rx, ry), (cx - rx, cy - ry, cx + rx, cy + ry))
+    if kind in ("polygon", "polyline"):
+        values = [float(number) for number in _NUMBER_RE.findall(element.get("points") or "")]
+        subpaths = [list(zip(values[0::2], values[1::2]))]
+    elif kind == "path":
+        subpaths = flatten_path(element.get("d") or "")
+    else:
+        return None
+
+    points = [point for subpath in subpaths for point in subpath]
+    if len(points) < 3:
+        return None
+    xs = [point[0] for point in points]
+    ys = [point[1] for point in points]
+    shape = _Shape("polygon", (), (min(xs), min(ys), max(xs), max(ys)), subpaths)
+    return shape
+
+
+_Clip = List[Tuple[_Shape, Affine]]
+
+
+class _GeometrySampler:
+    """Paints shapes onto a grid of module centers in document order."""
+
+    def __init__(self, root: ET.Element, size: int, scale: float, border: float, dark: str, light: str):
+        self.root = root
+        self.size = size
+        self.scale = scale
+        self.border = border
+        self.painted: List[List[bool]] = [[False] * size for _ in range(size)]
+        self.ids = {element.get("id"): element for element in root.iter() if element.get("id")}
+        self.class_rules: _ClassRules = {}
+        for element in root.iter():
+            if _local_name(element.tag) == "style" and element.text:
+                for name, rules in parse_class_rules(element.text).items():
+                    self.class_rules.setdefault(name, []).extend(rules)
+
+        dark_rgb, light_rgb = parse_color(dark), parse_color(light)
+        if dark_rgb is not None and light_rgb is not None:
+            self.threshold = (calculate_luminance(dark_rgb) + calculate_luminance(light_rgb)) / 2
+        else:
+            self.threshold = 0.5
+        self._luminance: Dict[str, Optional[bool]] = {}
+
+    def run(self) -> List[List[bool]]:
+        self._visit(
+            self.root,
+            IDENTITY,
+            {"fill": "black", "fill-opacity": 1.0, "fill-rule": "nonzero"},
+            1.0,
+            [],
+            frozenset(),
+        )
+        return self.painted
+
+    def _is_dark(self, fill: str) -> Optional[bool]:
+        """Whether a fill paints dark, light, or (None) nothing."""
+        if fill in self._luminance:
+            return self._luminance[fill]
+        value = fill.strip().lower()
+        result: Optional[bool]
+        if value in ("none", "transparent"):
+            result = None
+        else:
+            rgb = parse_color(value)
+            # Gradients, patterns and unknown paints are taken to be dark
+            result = True if rgb is None else calculate_luminance(rgb) < self.threshold
+        self._luminance[fill] = result
+        return result
+
+    def _properties(self, element: ET.Element, ancestors: FrozenSet[str]) -> Dict[str, str]:
+        """Presentation attributes, then class rules, then the style attribute."""
+        attributes = element.attrib
+        values = {name: attributes[name] for name in _PRESENTATION_ATTRIBUTES if name in attributes}
+        classes = attributes.get("class")
+        if classes and self.class_rules:
+            for name in classes.split():
+                for scope, declarations in self.class_rules.get(name, ()):
+                    if scope <= ancestors:
+                        values.update(declarations)
+        style = attributes.get("style")
+        if style:
+            for declaration in style.split(";"):
+                name, _, value = declaration.partition(":")
+                name = name.strip()
+                if name in _STYLE_PROPERTIES:
+                    values[name] = value.strip()
+        return values
+
+    def _selectors(self, element: ET.Element, ancestors: FrozenSet[str]) -> FrozenSet[str]:
+        """Ancestor selectors seen by the children of an element."""
+        if not self.class_rules:
+            return ancestors
+        tokens = ["." + name for name in (element.get("class") or "").split()]
+        if element.get("id"):
+            tokens.append("#" + element.get("id", ""))
+        return ancestors.union(tokens) if tokens else ancestors
+
+    def _clip_shapes(self, reference: str, transform: Affine) -> Optional[_Clip]:
+        match = _URL_RE.search(reference)
+        target = self.ids.get(match.group(1)) if match else None
+        if target is None:
+            return None
+        clip: _Clip = []
+        base = _multiply(transform, parse_transform(target.get("transform")))
+        for child in target.iter():
+            kind = _local_name(child.tag)
+            if child is target:
+                continue
+            shape = _build_shape(child, kind)
+            if shape is not None:
+                clip.append((shape, _multiply(base, parse_transform(child.get("transform")))))
+        return clip
+
+    def _visit(
+        self,
+        element: ET.Element,
+        parent_transform: Affine,
+        inherited: Dict[str, Any],
+        opacity: float,
+        clips: List[_Clip],
+        ancestors: FrozenSet[str],
+    ) -> None:
+        kind = _local_name(element.tag)
+        if kind in _NON_RENDERED:
+            return
+
+        values = self._properties(element, ancestors)
+        if values.get("display") == "none":
+            return
+
+        transform_value = element.get("transform")
+        transform = (
+            _multiply(parent_transform, parse_transform(transform_value))
+            if transform_value
+            else parent_transform
+        )
+        state = inherited
+        if "fill" in values or "fill-rule" in values or "fill-opacity" in values:
+            state = dict(inherited)
+            for name in ("fill", "fill-rule"):
+                if name in values:
+                    state[name] = values[name]
+            if "fill-opacity" in values:
+                state["fill-opacity"] = _parse_opacity(values["fill-opacity"])
+        if "opacity" in values:
+            opacity *= _parse_opacity(values["opacity"])
+
+        for name in ("clip-path", "mask"):
+            if name in values:
+                clip = self._clip_shapes(values[name], transform)
+                if clip is not None:
+                    clips = clips + [clip]
+
+        shape = _build_shape(element, kind)
+        if shape is not None and values.get("visibility") not in ("hidden", "collapse"):
+            self._paint(shape, transform, state, opacity, clips)
+
+        if len(element):
+            ancestors = self._selectors(element, ancestors)
+            for child in element:
+                self._visit(child, transform, state, opacity, clips, ancestors)
+
+    def _paint(
+        self, shape: _Shape, transform: Affine, state: Dict[str, Any], opacity: float, clips: List[_Clip]
+    ) -> None:
+        dark = self._is_dark(str(state["fill"]))
+        if dark is None or opacity * state["fill-opacity"] < MIN_PAINT_ALPHA:
+            return
+        shape.evenodd = state["fill-rule"] == "evenodd"
+        a, b, c, d, _, _ = transform
+        if b == 0 and c == 0 and a != 0 and d != 0:
+            self._paint_aligned(shape, transform, dark, clips)
+            return
+
+        inverse = _invert(transform)
+        if inverse is None:
+            return
+        x0, y0, x1, y1 = shape.bbox
+        corners = [_apply(transform, x, y) for x, y in ((x0, y0), (x1, y0), (x0, y1), (x1, y1))]
+        offset = self.border + 0.5
+        col0 = max(0, math.ceil(min(x for x, _ in corners) / self.scale - offset))
+        col1 = min(self.size - 1, math.floor(max(x for x, _ in corners) / self.scale - offset))
+        row0 = max(0, math.ceil(min(y for _, y in corners) / self.scale - offset))
+        row1 = min(self.size - 1, math.floor(max(y for _, y in corners) / self.scale - offset))
+
+        for row in range(row0, row1 + 1):
+            center_y = (row + offset) * self.scale
+            painted_row = self.painted[row]
+            for col in range(col0, col1 + 1):
+                center_x = (col + offset) * self.scale
+                if shape.contains(*_apply(inverse, center_x, center_y)) and self._in_clips(
+                    center_x, center_y, clips
+                ):
+                    painted_row[col] = dark
+
+    def _paint_aligned(self, shape: _Shape, transform: Affine, dark: bool, clips: List[_Clip]) -> None:
+        """Paint a shape whose transform only scales and translates it."""
+        a, _, _, d, e, f = transform
+        x0, y0, x1, y1 = shape.bbox
+        left, right = sorted((a * x0 + e, a * x1 + e))
+        top, bottom = sorted((d * y0 + f, d * y1 + f))
+        offset = self.border + 0.5
+        col0 = max(0, math.ceil(left / self.scale - offset))
+        col1 = min(self.size - 1, math.floor(right / self.scale - offset))
+        row0 = max(0, math.ceil(top / self.scale - offset))
+        row1 = min(self.size - 1, math.floor(bottom / self.scale - offset))
+        if col0 > col1 or row0 > row1:
+            return
+
+        # A square-cornered rectangle covers every center inside its bounds
+        filled = shape.kind == "rect" and (shape.params[0] <= 0 or shape.params[1] <= 0) and not clips
+        for row in range(row0, row1 + 1):
+            painted_row = self.painted[row]
+            if filled:
+                painted_row[col0 : col1 + 1] = [dark] * (col1 - col0 + 1)
+                continue
+            center_y = (row + offset) * self.scale
+            local_y = (center_y - f) / d
+            for col in range(col0, col1 + 1):
+                center_x = (col + offset) * self.scale
+                if shape.contains((center_x - e) / a, local_y) and self._in_clips(center_x, center_y, clips):
+                    painted_row[col] = dark
+
+    @staticmethod
+    def _in_clips(x: float, y: float, clips: List[_Clip]) -> bool:
+        for clip in clips:
+            inside = False
+            for shape, transform in clip:
+                inverse = _invert(transform)
+                if inverse is not None and shape.contains(*_apply(inverse, x, y)):
+                    inside = True
+                    break
+            if not inside:
+                return False
+        return True
+
+
+def _parse_opacity(value: Any) -> float:
+    text = str(value).strip()
+    try:
+        return max(0.0, min(1.0, float(text[:-1]) / 100 if text.endswith("%") else float(text)))
+    except ValueError:
+        return 1.0
+
+
+def _codeword_block(row: int, col: int, size: int) -> Tuple[int, int]:
+    """Approximate codeword of a data module.
+
+    Codewords are placed in two-module-wide columns, four rows per byte in
+    the common case, so modules in the same 2x4 block mostly share one.
+    """
+    if size >= 21 and col < 6:
+        col += 1  # The vertical timing column is skipped by the placement
+    return (size - 1 - col) // 2, row // 4
+
+
+def correctable_codewords(version: Any, error: Optional[str]) -> Optional[int]:
+    """Number of codeword errors a symbol can correct.
+
+    Args:
+        version: QR version (``1``-``40``) or Micro QR version (``"M1"``-``"M4"``)
+        error: Error correction level (``"L"``, ``"M"``, ``"Q"``, ``"H"``)
+
+    Returns:
+        Sum of the correction capacity of all blocks, or None if unknown
+    """
+    try:
+        from segno import consts
+
+        if isinstance(version, str) and version.upper().startswith("M"):
+            key = int(version[1:]) - 4
+        else:
+            key = int(version)
+        level = consts.ERROR_MAPPING.get(error.upper()) if error else None
+        blocks: Any = consts.ECC[key][level]  # type: ignore[index]
+    except (ImportError, AttributeError, KeyError, TypeError, ValueError):
+        return None
+    return int(sum(block.num_blocks * ((block.num_total - block.num_data) // 2) for block in blocks))
+
+
+def verify_rendered_geometry(
+    svg: Union[str, ET.Element],
+    qr_code: Any,
+    config: RenderingConfig,
+    detector: Optional[ModuleDetector] = None,
+) -> GeometryVerificationResult:
+    """Verify that rendered geometry reproduces the encoded matrix.
+
+    Every module center is sampled in the rendered SVG. Flipped function
+    pattern modules always fail verification; flipped data modules are
+    mapped to an estimate of affected codewords and compared with the error
+    correction capacity of the symbol.
+
+    Args:
+        svg: Rendered SVG document or its root element
+        qr_code: Segno QR code that was rendered
+        config: Rendering configuration used (scale, border and colors)
+        detector: Module detector for the matrix (created if omitted)
+
+    Returns:
+        Verification result
+    """
+    root = ET.fromstring(svg) if isinstance(svg, str) else svg
+    matrix = [[bool(module) for module in row] for row in qr_code.matrix]
+    size = len(matrix)
+    detector = detector or ModuleDetector(matrix, qr_code.version)
+
+    painted = _GeometrySampler(root, size, config.scale, config.border, config.dark, config.light).run()
+
+    missing: List[Tuple[int, int]] = []
+    extra: List[Tuple[int, int]] = []
+    function_errors: List[Tuple[int, int]] = []
+    blocks = set()
+    for row in range(size):
+        expected_row, painted_row = matrix[row], painted[row]
+        for col in range(size):
+            if expected_row[col] == painted_row[col]:
+                continue
+            (missing if expected_row[col] else extra).append((row, col))
+            if detector.get_module_type(row, col) in FUNCTION_PATTERN_TYPES:
+                function_errors.append((row, col))
+            else:
+                blocks.add(_codeword_block(row, col, size))
+
+    capacity = correctable_codewords(qr_code.version, qr_code.error)
+    headroom = None
+    if capacity:
+        headroom = 1 - len(blocks) / capacity
+        passed = not function_errors and len(blocks) <= capacity
+    else:
+        passed = not function_errors and not blocks
+
+    return GeometryVerificationResult(
+        modules_checked=size * size,
+        missing_modules=missing,
+        extra_modules=extra,
+        function_pattern_errors=function_errors,
+        estimated_codeword_errors=len(blocks),
+        correctable_codewords=capacity,
+        error_correction_headroom=headroom,
+        passed=passed,
+    )
@@ -544,3 +544,25 @@ class TestRenderingIntegration:
         # Check that accessibility features are present
         assert 'role="img"' in svg_output
         assert "aria-label=" in svg_output
+
+    def test_compact_accessibility_rendering(self):
+        """Test compact mode annotates groups but not individual modules."""
+        import segno
+
+        from segnomms.a11y.accessibility import AccessibilityConfig
+        from segnomms.config import RenderingConfig
+        from segnomms.plugin.rendering import QRCodeRenderer
+
+        qr = segno.make("Compact test")
+        config = RenderingConfig(scale=8, accessibility=AccessibilityConfig(enabled=True, compact_mode=True))
+
+        renderer = QRCodeRenderer(qr, config)
+        svg_output = renderer.render()
+
+        assert 'id="qr-root"' in svg_output
+        assert 'role="img"' in svg_output
+        assert 'id="qr-finder"' in svg_output
+        assert 'aria-label="Data modules (' in svg_output
+        assert "data-module-type" not in svg_output
+        assert 'id="qr-data-' not in svg_output
+        assert renderer.svg_builder.validate_accessibility() == []
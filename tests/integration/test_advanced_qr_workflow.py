@@ -209,3 +209,95 @@ class TestWriteAdvanced:
             for file_path in result["files_created"]:
                 if os.path.exists(file_path):
                     os.unlink(file_path)
+
+
+class TestSequenceRendering:
+    """Test parallel sequence rendering and multi-symbol sheets."""
+
+    CONTENT = "Structured append sheet test content for several symbols. " * 30
+
+    def test_parallel_matches_serial(self, tmp_path):
+        """Test rendering with workers produces the same files as serial rendering."""
+        serial = write_advanced(
+            self.CONTENT, str(tmp_path / "serial.svg"), structured_append=True, symbol_count=3, error="L"
+        )
+        parallel = write_advanced(
+            self.CONTENT,
+            str(tmp_path / "parallel.svg"),
+            structured_append=True,
+            symbol_count=3,
+            error="L",
+            workers=2,
+        )
+
+        assert serial["qr_count"] == parallel["qr_count"] > 1
+        for serial_file, parallel_file in zip(serial["files_created"], parallel["files_created"]):
+            with open(serial_file) as a, open(parallel_file) as b:
+                assert a.read() == b.read()
+
+    @pytest.mark.parametrize("sheet_format", ["svg", "html"])
+    def test_sequence_sheet(self, tmp_path, sheet_format):
+        """Test the sequence is written as one sheet with a single runtime."""
+        result = write_advanced(
+            self.CONTENT,
+            str(tmp_path / "sheet.svg"),
+            structured_append=True,
+            symbol_count=3,
+            error="L",
+            interactive=True,
+            frame_shape="circle",
+            sequence_sheet=sheet_format,
+        )
+
+        assert len(result["files_created"]) == 1
+        sheet_path = result["files_created"][0]
+        assert sheet_path.endswith(f"sheet-{result['qr_count']:02d}.{sheet_format}")
+
+        with open(sheet_path) as f:
+            sheet = f.read()
+
+        assert sheet.count("qrModuleClick") == 1
+        assert sheet.count("<defs") == 1
+        assert 'id="s1-qr-code"' in sheet
+        assert f'id="s{result["qr_count"]}-qr-code"' in sheet
+        assert len(result["config_files_created"]) == 1
+
+    def test_parallel_html_sheet_uses_default_namespace(self, tmp_path, monkeypatch):
+        """Test sheets composed from worker output keep the SVG default namespace."""
+        import xml.etree.ElementTree as ET
+
+        from segnomms.plugin.sequence import SVG_NS
+
+        # Simulate a parent process that never rendered a symbol itself
+        monkeypatch.delitem(ET._namespace_map, SVG_NS, raising=False)
+        result = write_advanced(
+            self.CONTENT,
+            str(tmp_path / "sheet.svg"),
+            structured_append=True,
+            symbol_count=3,
+            error="L",
+            workers=2,
+            sequence_sheet="html",
+        )
+
+        with open(result["files_created"][0]) as f:
+            sheet = f.read()
+        assert "ns0:" not in sheet
+        assert "<svg" in sheet
+
+    def test_import_does_not_register_namespaces(self):
+        """Test importing the package leaves the global namespace registry alone."""
+        import subprocess
+        import sys
+
+        code = (
+            "import xml.etree.ElementTree as ET; import segnomms.plugin; "
+            "print('http://www.w3.org/2000/svg' in ET._namespace_map)"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert output.stdout.strip() == "False"
+
+    def test_invalid_sheet_format(self, tmp_path):
+        """Test unknown sheet formats are rejected."""
+        with pytest.raises(ValueError, match="sequence_sheet"):
+            write_advanced("test", str(tmp_path / "x.svg"), sequence_sheet="pdf")
@@ -0,0 +1,144 @@
+"""Tests for streaming batch output into zip and tar.gz archives."""
+
+import io
+import json
+import tarfile
+import zipfile
+
+import pytest
+import segno
+
+from segnomms.plugin import write_archive
+from segnomms.plugin.archive import ArchiveWriter
+
+
+class UnseekableStream(io.RawIOBase):
+    """Write-only stream that cannot seek or tell, like a socket or pipe."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.buffer += data
+        return len(data)
+
+
+def _codes(count):
+    return [segno.make(f"Campaign item {i}") for i in range(count)]
+
+
+class TestArchiveWriter:
+    """Test appending members to archive streams."""
+
+    def test_zip_on_unseekable_stream(self):
+        """Test zip archives can be written to streams without seek support."""
+        stream = UnseekableStream()
+        with ArchiveWriter(stream, "zip") as archive:
+            archive.add("a.svg", "<svg/>")
+            archive.add("dir/b.txt", b"bytes")
+
+        with zipfile.ZipFile(io.BytesIO(bytes(stream.buffer))) as result:
+            assert result.namelist() == ["a.svg", "dir/b.txt"]
+            assert result.read("dir/b.txt") == b"bytes"
+            assert result.testzip() is None
+
+    def test_tar_gz_on_unseekable_stream(self):
+        """Test tar.gz archives are streamed."""
+        stream = UnseekableStream()
+        with ArchiveWriter(stream, "tar.gz") as archive:
+            archive.add("a.svg", "<svg/>")
+
+        with tarfile.open(fileobj=io.BytesIO(bytes(stream.buffer)), mode="r:gz") as result:
+            assert result.getnames() == ["a.svg"]
+            assert result.extractfile("a.svg").read() == b"<svg/>"
+
+    @pytest.mark.parametrize("archive_format", ["zip", "tar.gz"])
+    def test_add_file_copies_in_chunks(self, archive_format, tmp_path):
+        """Test members can be added from a file without reading it into memory."""
+        payload = b"line\n" * 100_000
+        source = tmp_path / "spooled.jsonl"
+        source.write_bytes(payload)
+        stream = UnseekableStream()
+        with ArchiveWriter(stream, archive_format) as archive, open(source, "rb") as f:
+            f.read(10)
+            assert archive.add_file("spooled.jsonl", f) == len(payload)
+            assert archive.bytes_written == len(payload)
+            with pytest.raises(ValueError, match="Duplicate"):
+                archive.add_file("spooled.jsonl", f)
+
+        data = io.BytesIO(bytes(stream.buffer))
+        if archive_format == "zip":
+            with zipfile.ZipFile(data) as result:
+                assert result.read("spooled.jsonl") == payload
+        else:
+            with tarfile.open(fileobj=data, mode="r:gz") as result:
+                assert result.extractfile("spooled.jsonl").read() == payload
+
+    def test_invalid_format_and_duplicates(self):
+        """Test unsupported formats and duplicate names are rejected."""
+        with pytest.raises(ValueError):
+            ArchiveWriter(io.BytesIO(), "rar")
+        with ArchiveWriter(io.BytesIO()) as archive:
+            archive.add("a.svg", "x")
+            with pytest.raises(ValueError, match="Duplicate"):
+                archive.add("a.svg", "y")
+
+
+class TestWriteArchive:
+    """Test rendering batches straight into archives."""
+
+    def test_zip_with_manifest(self):
+        """Test each code becomes a member recorded in the manifest."""
+        stream = UnseekableStream()
+        result = write_archive(_codes(4), stream, shape="circle")
+
+        assert result["qr_count"] == 4
+        assert result["files"] == [f"qr_{i:06d}.svg" for i in range(1, 5)]
+        assert result["manifest_file"] == "manifest.jsonl"
+        with zipfile.ZipFile(io.BytesIO(bytes(stream.buffer))) as archive:
+            assert set(archive.namelist()) == set(result["files"]) | {"manifest.jsonl"}
+            assert "<circle" in archive.read("qr_000001.svg").decode()
+            lines = [json.loads(line) for line in archive.read("manifest.jsonl").decode().splitlines()]
+
+        configs = [line for line in lines if line["type"] == "config"]
+        outputs = [line for line in lines if line["type"] == "output"]
+        assert len(configs) == 1
+        assert configs[0]["configuration"]["geometry"]["shape"] == "circle"
+        assert [entry["path"] for entry in outputs] == result["files"]
+        assert all(entry["config_ref"] == configs[0]["ref"] for entry in outputs)
+
+    def test_tar_gz_with_configs_and_names(self):
+        """Test named items and per-output configuration members."""
+        items = [(f"codes/{i}.svg", qr) for i, qr in enumerate(_codes(2))]
+        stream = io.BytesIO()
+        result = write_archive(
+            items, stream, format="tar.gz", include_manifest=False, export_config=True, scale=6
+        )
+
+        assert "manifest_file" not in result
+        assert result["config_files"] == ["codes/0_config.json", "codes/1_config.json"]
+        stream.seek(0)
+        with tarfile.open(fileobj=stream, mode="r:gz") as archive:
+            names = archive.getnames()
+            config = json.load(archive.extractfile("codes/1_config.json"))
+        assert names == ["codes/0.svg", "codes/0_config.json", "codes/1.svg", "codes/1_config.json"]
+        assert config["configuration"]["scale"] == 6
+
+    def test_workers_fill_archive_in_completion_order(self):
+        """Test parallel rendering stores every item exactly once."""
+        stream = io.BytesIO()
+        result = write_archive(_codes(10), stream, workers=2)
+
+        assert sorted(result["files"]) == [f"qr_{i:06d}.svg" for i in range(1, 11)]
+        with zipfile.ZipFile(stream) as archive:
+            outputs = [
+                json.loads(line)
+                for line in archive.read("manifest.jsonl").decode().splitlines()
+                if '"output"' in line
+            ]
+            assert [entry["path"] for entry in outputs] == result["files"]
+            for entry in outputs:
+                assert entry["bytes"] == archive.getinfo(entry["path"]).file_size
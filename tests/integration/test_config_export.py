@@ -3,10 +3,12 @@
 import json
 from pathlib import Path
 
+import pytest
 import segno
 
 from segnomms import write, write_advanced
 from segnomms.config import RenderingConfig
+from segnomms.plugin import BatchManifest, ShardLayout
 
 
 class TestConfigurationExport:
@@ -327,3 +329,292 @@ class TestConfigurationReproducibility:
         qr = segno.make("Batch 0")
         result = write(qr, str(tmp_path / "batch_0_copy.svg"), use_hash_naming=True, **configs[0])
         assert result["config_hash"] == hashes[0]
+
+
+class TestContentAddressedOutput:
+    """Test content-addressed output with write deduplication."""
+
+    def test_key_includes_payload_and_full_config(self, tmp_path):
+        """Test different payloads and config details get different files."""
+        first = write(segno.make("Payload A"), str(tmp_path / "a.svg"), content_addressed=True)
+        second = write(segno.make("Payload B"), str(tmp_path / "b.svg"), content_addressed=True)
+        # The legacy hash ignores the fade-in animation; the full config hash does not
+        third = write(
+            segno.make("Payload A"), str(tmp_path / "c.svg"), content_addressed=True, animation_fade_in=True
+        )
+
+        keys = {first["content_key"], second["content_key"], third["content_key"]}
+        assert len(keys) == 3
+        assert Path(first["svg_file"]).name == f"qr_{first['content_key']}.svg"
+        with open(first["config_file"]) as f:
+            assert json.load(f)["metadata"]["content_key"].startswith(first["content_key"])
+
+    def test_existing_output_is_skipped(self, tmp_path):
+        """Test identical requests do not rewrite existing files."""
+        qr = segno.make("Nightly")
+        first = write(qr, str(tmp_path / "out.svg"), content_addressed=True, shape="circle")
+        assert first["skipped"] is False
+        svg_path = Path(first["svg_file"])
+        mtime = svg_path.stat().st_mtime_ns
+
+        second = write(qr, str(tmp_path / "other.svg"), content_addressed=True, shape="circle")
+
+        assert second["skipped"] is True
+        assert second["svg_file"] == first["svg_file"]
+        assert second["files_created"] == []
+        assert second["config_files"] == first["config_files"]
+        assert svg_path.stat().st_mtime_ns == mtime
+
+    def test_key_includes_package_version(self, tmp_path, monkeypatch):
+        """Test outputs rendered by another version are not reused."""
+        qr = segno.make("Upgrade")
+        first = write(qr, str(tmp_path / "out.svg"), content_addressed=True)
+
+        monkeypatch.setattr("segnomms.plugin.export._package_version", lambda: "999.0.0")
+        second = write(qr, str(tmp_path / "out.svg"), content_addressed=True)
+
+        assert second["content_key"] != first["content_key"]
+        assert second["skipped"] is False
+
+    def test_missing_sidecar_is_rewritten(self, tmp_path):
+        """Test an output without its configuration file is regenerated."""
+        qr = segno.make("Sidecar")
+        first = write(qr, str(tmp_path / "out.svg"), content_addressed=True)
+        Path(first["config_file"]).unlink()
+
+        second = write(qr, str(tmp_path / "out.svg"), content_addressed=True)
+
+        assert second["skipped"] is False
+        assert Path(second["config_file"]).exists()
+
+    def test_plain_path_writes_through_symlinks(self, tmp_path):
+        """Test default writes keep symlinks and file modes intact."""
+        target = tmp_path / "target.svg"
+        target.write_text("")
+        target.chmod(0o600)
+        link = tmp_path / "link.svg"
+        link.symlink_to(target)
+
+        write(segno.make("Linked"), str(link), export_config=False)
+
+        assert link.is_symlink()
+        assert "<svg" in target.read_text()
+        assert target.stat().st_mode & 0o777 == 0o600
+
+    def test_atomic_write_applies_umask(self, tmp_path):
+        """Test atomically written files get the mode open() would give them."""
+        import os
+
+        previous = os.umask(0o027)
+        try:
+            result = write(segno.make("Umask"), str(tmp_path / "out.svg"), content_addressed=True)
+        finally:
+            os.umask(previous)
+
+        assert Path(result["svg_file"]).stat().st_mode & 0o777 == 0o640
+
+    def test_atomic_write_leaves_no_temp_files(self, tmp_path):
+        """Test writes go through a temporary file that is renamed."""
+        write(segno.make("Atomic"), str(tmp_path / "out.svg"), content_addressed=True)
+        assert not [path for path in tmp_path.iterdir() if path.name.endswith(".tmp")]
+        assert len(list(tmp_path.iterdir())) == 2
+
+
+class TestBatchManifest:
+    """Test aggregated batch manifests replacing per-file sidecars."""
+
+    def test_batch_records_config_once(self, tmp_path):
+        """Test a batch writes one config record and one output line per file."""
+        manifest_path = tmp_path / "manifest.jsonl"
+        with BatchManifest(manifest_path) as manifest:
+            results = [
+                write(segno.make(f"Item {i}"), str(tmp_path / f"item{i}.svg"), manifest=manifest, scale=8)
+                for i in range(5)
+            ]
+
+        assert all(result["manifest_file"] == str(manifest_path) for result in results)
+        assert all(result["config_files"] == [] for result in results)
+        assert not list(tmp_path.glob("*_config.*"))
+
+        configs, outputs = BatchManifest.read(manifest_path)
+        assert len(configs) == 1
+        assert len(outputs) == 5
+        (ref,) = configs
+        assert configs[ref]["configuration"]["scale"] == 8
+        for i, entry in enumerate(outputs):
+            assert entry["path"] == str(tmp_path / f"item{i}.svg")
+            assert entry["config_ref"] == ref
+            assert entry["sequence_index"] is None
+            assert entry["bytes"] == (tmp_path / f"item{i}.svg").stat().st_size
+
+    def test_lines_are_buffered_until_flush(self, tmp_path):
+        """Test output lines are appended in bulk."""
+        manifest = BatchManifest(tmp_path / "manifest.jsonl", flush_every=4)
+        for i in range(3):
+            write(segno.make(str(i)), str(tmp_path / f"{i}.svg"), manifest=manifest)
+        # Config line plus three outputs reach the threshold on the third write
+        assert len(BatchManifest.read(manifest.path)[1]) == 3
+
+        write(segno.make("3"), str(tmp_path / "3.svg"), manifest=manifest)
+        assert len(BatchManifest.read(manifest.path)[1]) == 3
+
+        manifest.close()
+        assert len(BatchManifest.read(manifest.path)[1]) == 4
+
+    def test_write_advanced_leaves_flushing_to_the_manifest(self, tmp_path):
+        """Test write_advanced buffers lines like write() does."""
+        manifest = BatchManifest(tmp_path / "manifest.jsonl", flush_every=10)
+        write_advanced("Buffered", str(tmp_path / "buffered.svg"), manifest=manifest)
+        assert not manifest.path.exists() or BatchManifest.read(manifest.path)[1] == []
+
+        manifest.close()
+        assert len(BatchManifest.read(manifest.path)[1]) == 1
+
+    def test_appending_reuses_existing_configs(self, tmp_path):
+        """Test a reopened manifest does not record known configurations again."""
+        manifest_path = tmp_path / "manifest.jsonl"
+        with BatchManifest(manifest_path) as manifest:
+            write(segno.make("First"), str(tmp_path / "first.svg"), manifest=manifest)
+        with BatchManifest(manifest_path) as manifest:
+            write(segno.make("Second"), str(tmp_path / "second.svg"), manifest=manifest)
+            write(segno.make("Third"), str(tmp_path / "third.svg"), manifest=manifest, shape="circle")
+
+        configs, outputs = BatchManifest.read(manifest_path)
+        assert len(configs) == 2
+        assert len(outputs) == 3
+        assert outputs[0]["config_ref"] == outputs[1]["config_ref"] != outputs[2]["config_ref"]
+
+    def test_reopening_only_collects_config_refs(self, tmp_path, monkeypatch):
+        """Test reopening streams the file instead of reading every output."""
+        manifest_path = tmp_path / "manifest.jsonl"
+        with BatchManifest(manifest_path) as manifest:
+            write(segno.make("First"), str(tmp_path / "config"), manifest=manifest)
+            write(segno.make("Second"), str(tmp_path / "second.svg"), manifest=manifest, shape="circle")
+
+        def fail(path):
+            raise AssertionError("read() should not be used to reopen a manifest")
+
+        monkeypatch.setattr(BatchManifest, "read", staticmethod(fail))
+        reopened = BatchManifest(manifest_path)
+        monkeypatch.undo()
+
+        assert reopened._config_refs == set(BatchManifest.read(manifest_path)[0])
+        assert len(reopened._config_refs) == 2
+
+    def test_sequence_records_indices(self, tmp_path):
+        """Test structured append outputs record their sequence index."""
+        manifest_path = tmp_path / "manifest.jsonl"
+        content = "Sequence manifest " * 20
+        with BatchManifest(manifest_path) as manifest:
+            result = write_advanced(
+                content,
+                str(tmp_path / "seq.svg"),
+                structured_append=True,
+                symbol_count=2,
+                manifest=manifest,
+            )
+
+        assert result["manifest_file"] == str(manifest_path)
+        assert result["config_files"] == []
+        configs, outputs = BatchManifest.read(manifest_path)
+        assert len(configs) == 1
+        assert [entry["sequence_index"] for entry in outputs] == list(range(1, result["qr_count"] + 1))
+        assert {entry["path"] for entry in outputs} == set(result["files_created"])
+        assert len({entry["payload_digest"] for entry in outputs}) == 1
+
+
+class TestShardedOutput:
+    """Test nested hash-prefix directory layouts for hash-named output."""
+
+    def test_resolver_maps_key_to_path(self, tmp_path):
+        """Test the resolver derives the path from the key alone."""
+        layout = ShardLayout(depth=2, width=2)
+        assert layout.resolve(tmp_path, "abcdef01") == tmp_path / "ab" / "cd" / "qr_abcdef01.svg"
+        assert ShardLayout(depth=0).resolve(tmp_path, "abcdef01") == tmp_path / "qr_abcdef01.svg"
+
+    def test_invalid_layouts(self, tmp_path):
+        """Test invalid layouts and too short keys are rejected."""
+        with pytest.raises(ValueError):
+            ShardLayout(depth=-1)
+        with pytest.raises(ValueError):
+            ShardLayout(width=0)
+        with pytest.raises(ValueError):
+            ShardLayout(depth=3, width=3).resolve(tmp_path, "abcdef01")
+
+    def test_content_addressed_output_is_sharded(self, tmp_path):
+        """Test content-addressed writes land at the resolved path and dedupe."""
+        layout = ShardLayout()
+        qr = segno.make("Sharded")
+        first = write(qr, str(tmp_path / "out.svg"), content_addressed=True, shard_layout=layout)
+
+        svg_path = layout.resolve(tmp_path, first["content_key"])
+        assert first["svg_file"] == str(svg_path)
+        assert svg_path.exists()
+        assert Path(first["config_file"]).parent == svg_path.parent
+
+        second = write(qr, str(tmp_path / "out.svg"), content_addressed=True, shard_layout=layout)
+        assert second["skipped"] is True
+        assert second["svg_file"] == str(svg_path)
+
+    def test_sharding_requires_content_addressing(self, tmp_path):
+        """Test sharding plain or legacy hash-named file names is rejected."""
+        with pytest.raises(ValueError, match="shard_layout"):
+            write(segno.make("Plain"), str(tmp_path / "out.svg"), shard_layout=ShardLayout())
+        with pytest.raises(ValueError, match="shard_layout"):
+            write(
+                segno.make("Hash"),
+                str(tmp_path / "out.svg"),
+                use_hash_naming=True,
+                shard_layout=ShardLayout(),
+            )
+        with pytest.raises(ValueError, match="shard_layout"):
+            write_advanced(
+                "Hash", str(tmp_path / "out.svg"), use_hash_naming=True, shard_layout=ShardLayout()
+            )
+
+    def test_advanced_outputs_are_keyed_by_payload(self, tmp_path):
+        """Test codes sharing a configuration get their own content-addressed files."""
+        layout = ShardLayout(depth=1)
+        first = write_advanced(
+            "First payload", str(tmp_path / "a.svg"), content_addressed=True, shard_layout=layout
+        )
+        second = write_advanced(
+            "Second payload", str(tmp_path / "b.svg"), content_addressed=True, shard_layout=layout
+        )
+
+        (first_key,) = first["content_keys"]
+        (second_key,) = second["content_keys"]
+        assert first_key != second_key
+        assert first["files_created"][0] == str(layout.resolve(tmp_path, first_key))
+        assert second["files_created"][0] == str(layout.resolve(tmp_path, second_key))
+        assert all(Path(path).exists() for path in first["files_created"] + second["files_created"])
+        with open(first["config_files"][0]) as f:
+            assert json.load(f)["metadata"]["content_key"].startswith(first_key)
+
+    def test_advanced_sequence_is_sharded(self, tmp_path):
+        """Test structured append items are content-addressed with their index."""
+        layout = ShardLayout(depth=1)
+        result = write_advanced(
+            "Sharded sequence " * 20,
+            str(tmp_path / "seq.svg"),
+            structured_append=True,
+            symbol_count=2,
+            content_addressed=True,
+            shard_layout=layout,
+        )
+
+        assert result["qr_count"] > 1
+        assert len(set(result["content_keys"])) == result["qr_count"]
+        for index, (key, path) in enumerate(zip(result["content_keys"], map(Path, result["files_created"]))):
+            assert path == layout.resolve(tmp_path, key, f"_seq{index + 1:02d}.svg")
+            assert path.exists()
+
+    def test_advanced_sheet_is_content_addressed(self, tmp_path):
+        """Test a sequence sheet is keyed by all of its symbols."""
+        kwargs = dict(structured_append=True, symbol_count=2, content_addressed=True, sequence_sheet="svg")
+        first = write_advanced("Sheet one " * 20, str(tmp_path / "seq.svg"), **kwargs)
+        second = write_advanced("Sheet two " * 20, str(tmp_path / "seq.svg"), **kwargs)
+
+        assert first["content_keys"] != second["content_keys"]
+        assert first["files_created"] != second["files_created"]
+        assert all(Path(path).exists() for path in first["files_created"] + second["files_created"])
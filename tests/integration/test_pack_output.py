@@ -0,0 +1,154 @@
+"""Tests for indexed pack files with memory-mapped random access."""
+
+import gzip
+
+import pytest
+import segno
+
+from segnomms.config import RenderingConfig
+from segnomms.plugin import PackReader, PackWriter, write_pack
+from segnomms.plugin.export import _generate_content_key
+from segnomms.plugin.pack import FLAG_GZIP
+
+
+class TestPackFile:
+    """Test writing and reading pack files."""
+
+    def test_round_trip(self, tmp_path):
+        """Test records are found by caller ID and content hash."""
+        path = tmp_path / "codes.pack"
+        with PackWriter(path) as pack:
+            pack.add("<svg>first</svg>", key="order-1")
+            content_key = pack.add(b"<svg>second</svg>")
+
+        with PackReader(path) as pack:
+            assert len(pack) == 2
+            assert "order-1" in pack
+            assert pack.read("order-1") == b"<svg>first</svg>"
+            assert pack.read(content_key) == b"<svg>second</svg>"
+            view = pack.view("order-1")
+            assert isinstance(view, memoryview)
+            assert view.readonly
+            assert bytes(view) == b"<svg>first</svg>"
+            view.release()
+            with pytest.raises(KeyError):
+                pack.entry("missing")
+
+    def test_compressed_records_are_gzip_members(self, tmp_path):
+        """Test compressed records can be served with a gzip encoding."""
+        path = tmp_path / "codes.pack"
+        svg = "<svg>" + "<rect/>" * 200 + "</svg>"
+        with PackWriter(path, compress=True) as pack:
+            pack.add(svg, key="a")
+
+        with PackReader(path) as pack:
+            entry = pack.entry("a")
+            assert entry.flags == FLAG_GZIP
+            assert entry.content_encoding == "gzip"
+            assert entry.size < entry.raw_size == len(svg)
+            view = pack.view("a")
+            assert gzip.decompress(view) == svg.encode()
+            view.release()
+            assert pack.read("a") == svg.encode()
+
+    def test_append_only(self, tmp_path):
+        """Test reopening appends without rewriting existing bytes."""
+        path = tmp_path / "codes.pack"
+        with PackWriter(path) as pack:
+            pack.add("one", key="a")
+            first_key = pack.add("content")
+        original = path.read_bytes()
+
+        with PackWriter(path) as pack:
+            assert pack.add("content") == first_key
+            pack.add("two", key="a")
+            pack.add("three", key="b")
+
+        assert path.read_bytes().startswith(original)
+        with PackReader(path) as pack:
+            assert sorted(pack.keys()) == sorted(["a", "b", first_key])
+            assert pack.read("a") == b"two"
+            assert pack.read(first_key) == b"content"
+
+    def test_invalid_files(self, tmp_path):
+        """Test files that are not packs are rejected."""
+        path = tmp_path / "bad.pack"
+        path.write_bytes(b"not a pack file at all, just some bytes")
+        with pytest.raises(ValueError, match="Not a SegnoMMS pack"):
+            PackReader(path)
+        with pytest.raises(ValueError, match="Not a SegnoMMS pack"):
+            PackWriter(path)
+
+    def test_unclosed_session_keeps_earlier_records(self, tmp_path):
+        """Test a writer killed before close() does not lose committed records."""
+        path = tmp_path / "codes.pack"
+        with PackWriter(path) as pack:
+            pack.add("committed", key="a")
+
+        # Simulate a process killed mid-write: records reach the file, the index never does
+        crashed = PackWriter(path)
+        crashed.add("lost", key="b")
+        crashed.add("lost", key="a")
+        crashed._file.close()
+
+        with PackReader(path) as pack:
+            assert list(pack.keys()) == ["a"]
+            assert pack.read("a") == b"committed"
+
+        with PackWriter(path) as pack:
+            pack.add("appended", key="c")
+
+        with PackReader(path) as pack:
+            assert sorted(pack.keys()) == ["a", "c"]
+            assert pack.read("a") == b"committed"
+            assert pack.read("c") == b"appended"
+
+    def test_first_session_never_closed(self, tmp_path):
+        """Test a pack without any complete index reads as empty and can be reused."""
+        path = tmp_path / "codes.pack"
+        crashed = PackWriter(path)
+        crashed.add("lost", key="a")
+        crashed._file.close()
+
+        with PackReader(path) as pack:
+            assert len(pack) == 0
+
+        with PackWriter(path) as pack:
+            pack.add("kept", key="b")
+        with PackReader(path) as pack:
+            assert pack.read("b") == b"kept"
+
+
+class TestWritePack:
+    """Test rendering batches into pack files."""
+
+    def test_content_keys_match_content_addressed_output(self, tmp_path):
+        """Test default keys are the content keys and reruns skip rendering."""
+        codes = [segno.make(f"Pack item {i}") for i in range(3)]
+        path = tmp_path / "codes.pack"
+
+        result = write_pack(codes, path, compress=True, shape="circle")
+
+        assert result["qr_count"] == 3
+        assert result["keys"] == [
+            _generate_content_key(qr, RenderingConfig.from_kwargs(shape="circle"))[:16] for qr in codes
+        ]
+        with PackReader(path) as pack:
+            assert b"<circle" in pack.read(result["keys"][0])
+
+        rerun = write_pack(codes, path, compress=True, shape="circle")
+        assert rerun["keys"] == []
+        assert rerun["skipped"] == result["keys"]
+        assert rerun["bytes"] == 0
+
+    def test_caller_ids_with_workers(self, tmp_path):
+        """Test caller IDs and parallel rendering."""
+        items = [(f"id-{i}", segno.make(f"Worker item {i}")) for i in range(6)]
+        path = tmp_path / "codes.pack"
+
+        result = write_pack(items, path, workers=2)
+
+        assert sorted(result["keys"]) == sorted(key for key, _ in items)
+        with PackReader(path) as pack:
+            assert len(pack) == 6
+            assert all(b"<svg" in pack.read(key) for key in pack.keys())
@@ -0,0 +1,235 @@
+"""Integration tests for the local render service and its WSGI/ASGI apps."""
+
+import asyncio
+import json
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from segnomms.service import RenderService
+from segnomms.service import core as service_core
+from segnomms.service import create_asgi_app, make_local_server
+
+REQUEST = json.dumps(
+    {"payload": {"text": "https://example.com"}, "intents": {"style": {"module_shape": "circle"}}}
+).encode()
+
+
+@pytest.fixture
+def service():
+    """Create a thread-backed render service."""
+    with RenderService(workers=2, timeout=5.0) as render_service:
+        yield render_service
+
+
+def _slow_render(canonical):
+    time.sleep(0.3)
+    return 200, b'{"svg": "<svg/>"}'
+
+
+class TestRenderService:
+    """Test the protocol-independent service core."""
+
+    def test_render_returns_svg_with_etag(self, service):
+        """Test a render request returns the client format and an ETag."""
+        response = service.handle("POST", "/render", {}, REQUEST)
+
+        body = json.loads(response.body)
+        headers = dict(response.headers)
+        assert response.status == 200
+        assert "<svg" in body["svg"]
+        assert headers["ETag"].startswith('W/"')
+
+    def test_repeated_request_hits_cache(self, service):
+        """Test identical requests are served from the response cache."""
+        first = service.handle("POST", "/render", {}, REQUEST)
+        # Key order and the client id do not change the cache key
+        reordered = json.dumps({"id": "abc", **dict(reversed(list(json.loads(REQUEST).items())))}).encode()
+        second = service.handle("POST", "/render", {}, reordered)
+
+        assert second.body == first.body
+        assert service.get_metrics()["cache_hits_total"] == 1
+        assert service.get_metrics()["renders_total"] == 1
+
+    def test_if_none_match_returns_not_modified(self, service):
+        """Test a matching ETag short-circuits rendering."""
+        etag = dict(service.handle("POST", "/render", {}, REQUEST).headers)["ETag"]
+
+        response = service.handle("POST", "/render", {"if-none-match": etag}, REQUEST)
+
+        assert response.status == 304
+        assert response.body == b""
+
+    def test_etag_changes_with_package_version(self, service):
+        """Test clients holding an ETag from an older release get the new output."""
+        etag = dict(service.handle("POST", "/render", {}, REQUEST).headers)["ETag"]
+
+        with patch.object(service_core, "_package_version", lambda: "999.0.0"):
+            response = service.handle("POST", "/render", {"if-none-match": etag}, REQUEST)
+
+        assert response.status == 200
+        assert dict(response.headers)["ETag"] != etag
+
+    def test_identical_in_flight_requests_are_coalesced(self, service):
+        """Test concurrent identical requests share one render job."""
+        with patch.object(service_core, "_render_canonical_request", _slow_render):
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                responses = list(pool.map(lambda _: service.handle("POST", "/render", {}, REQUEST), range(4)))
+
+        assert all(response.status == 200 for response in responses)
+        metrics = service.get_metrics()
+        assert metrics["renders_total"] == 1
+        assert metrics["coalesced_total"] + metrics["cache_hits_total"] == 3
+
+    def test_deadline_exceeded(self, service):
+        """Test requests past their deadline get 504 and the result is still cached."""
+        with patch.object(service_core, "_render_canonical_request", _slow_render):
+            response = service.handle("POST", "/render", {"x-request-timeout": "0.01"}, REQUEST)
+            assert response.status == 504
+
+            time.sleep(0.5)
+            assert service.handle("POST", "/render", {}, REQUEST).status == 200
+
+        assert service.get_metrics()["timeouts_total"] == 1
+
+    def test_invalid_request(self, service):
+        """Test invalid bodies are rejected with 422."""
+        response = service.handle("POST", "/render", {}, b'{"payload": {}}')
+
+        assert response.status == 422
+        assert json.loads(response.body)["error"] == "REQUEST_VALIDATION_ERROR"
+
+    def test_body_size_limit(self):
+        """Test oversized bodies are rejected with 413."""
+        with RenderService(workers=1, max_body_bytes=16) as small:
+            assert small.handle("POST", "/render", {}, REQUEST).status == 413
+
+    def test_routing_errors(self, service):
+        """Test unknown routes and wrong methods."""
+        assert service.handle("GET", "/nope", {}).status == 404
+        response = service.handle("GET", "/render", {})
+        assert response.status == 405
+        assert ("Allow", "POST") in response.headers
+
+    def test_capabilities_with_etag(self, service):
+        """Test the manifest endpoint supports conditional requests."""
+        response = service.handle("GET", "/capabilities", {})
+        etag = dict(response.headers)["ETag"]
+
+        assert response.status == 200
+        assert "features" in json.loads(response.body)
+        assert service.handle("GET", "/capabilities", {"if-none-match": etag}).status == 304
+
+    def test_schema_with_etag(self, service):
+        """Test the schema endpoint serves the configuration schema with an ETag."""
+        response = service.handle("GET", "/schema", {})
+        etag = dict(response.headers)["ETag"]
+
+        assert response.status == 200
+        assert json.loads(response.body)["title"] == "RenderingConfig"
+        assert service.handle("GET", "/schema", {"if-none-match": etag}).status == 304
+
+    def test_health_and_metrics(self, service):
+        """Test health and metrics endpoints."""
+        health = json.loads(service.handle("GET", "/health", {}).body)
+        metrics = json.loads(service.handle("GET", "/metrics", {}).body)
+
+        assert health["status"] == "ok"
+        assert health["workers"] == 2
+        assert metrics["requests_total"] == 2
+
+    def test_prometheus_metrics(self, service):
+        """Test the Prometheus exposition of the metrics endpoint."""
+        service.handle("POST", "/render", {}, json.dumps({"payload": {"text": "prom"}}).encode())
+        response = service.handle("GET", "/metrics", {"accept": "text/plain"})
+        text = response.body.decode()
+
+        assert response.status == 200
+        assert dict(response.headers)["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE segnomms_service_renders_total counter" in text
+        assert "segnomms_service_renders_total 1" in text
+        assert "# TYPE segnomms_service_in_flight gauge" in text
+
+
+class TestServiceApps:
+    """Test the WSGI and ASGI adapters on localhost."""
+
+    def test_wsgi_local_server(self):
+        """Test rendering through a real localhost HTTP server."""
+        server = make_local_server(port=0, quiet=True, workers=1)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = f"http://127.0.0.1:{server.server_port}"
+            request = urllib.request.Request(
+                f"{url}/render", data=REQUEST, headers={"Content-Type": "application/json"}
+            )
+            with urllib.request.urlopen(request, timeout=10) as response:
+                assert response.status == 200
+                assert "<svg" in json.loads(response.read())["svg"]
+
+            with urllib.request.urlopen(f"{url}/health", timeout=10) as response:
+                assert json.loads(response.read())["status"] == "ok"
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_asgi_app(self):
+        """Test rendering through the ASGI app."""
+        app = create_asgi_app(workers=1)
+        sent = []
+
+        async def run():
+            messages = [{"type": "http.request", "body": REQUEST, "more_body": False}]
+
+            async def receive():
+                return messages.pop(0)
+
+            async def send(message):
+                sent.append(message)
+
+            scope = {"type": "http", "method": "POST", "path": "/render", "headers": []}
+            await app(scope, receive, send)
+
+            lifespan = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+
+            async def receive_lifespan():
+                return lifespan.pop(0)
+
+            await app({"type": "lifespan"}, receive_lifespan, send)
+
+        asyncio.run(run())
+
+        assert sent[0]["status"] == 200
+        assert "<svg" in json.loads(sent[1]["body"])["svg"]
+        assert sent[-1] == {"type": "lifespan.shutdown.complete"}
+
+    def test_asgi_body_size_limit(self):
+        """Test chunked bodies crossing the limit are rejected with 413."""
+        sent = []
+        middle = len(REQUEST) // 2
+
+        async def run():
+            messages = [
+                {"type": "http.request", "body": REQUEST[:middle], "more_body": True},
+                {"type": "http.request", "body": REQUEST[middle:], "more_body": False},
+            ]
+
+            async def receive():
+                return messages.pop(0)
+
+            async def send(message):
+                sent.append(message)
+
+            scope = {"type": "http", "method": "POST", "path": "/render", "headers": []}
+            await app(scope, receive, send)
+
+        with RenderService(workers=1, max_body_bytes=len(REQUEST) - 1) as service:
+            app = create_asgi_app(service)
+            asyncio.run(run())
+
+        assert sent[0]["status"] == 413
@@ -5,10 +5,13 @@ Tests for configuration validation, ID generation, and element accessibility
 without external dependencies.
 """
 
+import xml.etree.ElementTree as ET
+
 import pytest
 
 from segnomms.a11y.accessibility import (
     AccessibilityConfig,
+    AccessibilityEnhancer,
     AccessibilityLevel,
     ARIARole,
     ElementAccessibility,
@@ -247,3 +250,51 @@ class TestAccessibilityPresets:
         assert config.use_stable_ids is False  # Allow dynamic IDs
         assert config.target_compliance == AccessibilityLevel.A
         assert config.focus_visible_elements == ["root"]  # Only root focusable
+
+
+class TestCompactAccessibility:
+    """Test compact (group-level) accessibility mode."""
+
+    @pytest.fixture
+    def enhancer(self):
+        """Create an enhancer in compact mode."""
+        return AccessibilityEnhancer(AccessibilityConfig(compact_mode=True))
+
+    def test_compact_mode_defaults_off(self):
+        """Test compact mode is opt-in."""
+        assert AccessibilityConfig().compact_mode is False
+
+    def test_modules_are_not_annotated(self, enhancer):
+        """Test modules receive no attributes, IDs or registry entries."""
+        element = ET.Element("rect")
+        assert enhancer.enhance_module_element(element, 3, 4, "finder") is None
+
+        assert element.attrib == {}
+        assert enhancer.element_registry == {}
+        assert enhancer.id_generator.used_ids == set()
+
+    def test_pattern_groups_use_deterministic_ids(self, enhancer):
+        """Test pattern groups get stable IDs and summary labels."""
+        group = ET.Element("g")
+        enhancer.enhance_pattern_group(group, "finder", 75)
+
+        assert group.get("id") == "qr-finder"
+        assert group.get("role") == "group"
+        assert group.get("aria-label") == "Finder patterns (75 modules)"
+        assert enhancer.id_generator.used_ids == set()
+
+        # Re-enhancing yields the same ID rather than a uniquified one
+        other = ET.Element("g")
+        enhancer.enhance_pattern_group(other, "finder", 75)
+        assert other.get("id") == "qr-finder"
+
+    def test_compact_mode_passes_validation(self, enhancer):
+        """Test compact mode still satisfies accessibility validation."""
+        svg = ET.Element("svg")
+        enhancer.enhance_root_element(svg, title="Example")
+        enhancer.enhance_pattern_group(ET.Element("g"), "data", 200)
+        enhancer.enhance_module_element(ET.Element("rect"), 10, 10, "data")
+
+        assert enhancer.validate_accessibility() == []
+        assert enhancer.validate_accessibility(svg) == []
+        assert enhancer.generate_accessibility_report()["total_elements"] == 2
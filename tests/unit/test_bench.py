@@ -0,0 +1,108 @@
+"""Tests for the benchmark suite, baselines and regression gating."""
+
+import pytest
+
+from segnomms.bench import (
+    VARIANTS,
+    BenchmarkRun,
+    CaseResult,
+    build_cases,
+    compare_runs,
+    load_baseline,
+    machine_fingerprint,
+    mann_whitney_greater,
+    run_case,
+    save_baseline,
+)
+from segnomms.bench.__main__ import main
+from segnomms.shapes.factory import list_available_shapes
+
+
+def _run(samples):
+    return BenchmarkRun(
+        fingerprint=machine_fingerprint(),
+        created="2026-01-01T00:00:00+00:00",
+        segnomms_version="test",
+        repeats=len(next(iter(samples.values()))),
+        results={name: CaseResult(name=name, samples_ms=values) for name, values in samples.items()},
+    )
+
+
+class TestCases:
+    """Test the case matrix."""
+
+    def test_full_matrix_covers_everything(self):
+        """Test the full profile covers all versions, shapes and variants."""
+        cases = build_cases("full")
+
+        assert len(cases) == 44 * len(list_available_shapes()) * len(VARIANTS)
+        assert {case.version for case in cases if case.micro} == {"M1", "M2", "M3", "M4"}
+        assert len({case.name for case in cases}) == len(cases)
+
+    def test_filters(self):
+        """Test glob and variant filters."""
+        cases = build_cases("quick", pattern="v40/*", variants=["frame"])
+
+        assert cases
+        assert all(case.name.startswith("v40/") and case.name.endswith("/frame") for case in cases)
+
+
+class TestRunner:
+    """Test case execution."""
+
+    def test_run_case_records_phases(self):
+        """Test end-to-end samples and per-phase medians are recorded."""
+        case = build_cases("quick", pattern="M4/square/plain")[0]
+
+        result = run_case(case, repeats=2, warmup=0)
+
+        assert result.error is None
+        assert len(result.samples_ms) == 2
+        assert {"encode", "prepare", "modules", "serialize"} <= set(result.phases_ms)
+        assert result.svg_bytes > 0
+
+
+class TestRegressionGating:
+    """Test baseline storage and statistical comparison."""
+
+    def test_mann_whitney(self):
+        """Test the one-sided test separates slowdowns from noise."""
+        assert mann_whitney_greater([2.0, 2.1, 2.2, 2.3, 2.4], [1.0, 1.1, 1.2, 1.3, 1.4]) < 0.01
+        assert mann_whitney_greater([1.0, 1.1, 1.2, 1.3, 1.4], [2.0, 2.1, 2.2, 2.3, 2.4]) > 0.9
+        assert mann_whitney_greater([1.0] * 5, [1.0] * 5) == 1.0
+
+    def test_compare_runs(self):
+        """Test only significant slowdowns above threshold are regressions."""
+        baseline = _run({"slow": [10, 10.2, 10.1, 9.9, 10], "noisy": [10, 12, 9, 11, 10]})
+        current = _run({"slow": [13, 13.1, 12.9, 13.2, 13], "noisy": [11, 9, 12, 10, 10.5]})
+
+        comparisons = {c.name: c for c in compare_runs(baseline, current)}
+
+        assert comparisons["slow"].regression
+        assert comparisons["slow"].ratio == pytest.approx(1.3)
+        assert not comparisons["noisy"].regression
+
+    def test_baseline_roundtrip(self, tmp_path):
+        """Test baselines are stored per machine fingerprint."""
+        run = _run({"case": [1.0, 2.0]})
+
+        path = save_baseline(run, tmp_path)
+
+        assert path.name == f"{machine_fingerprint()}.json"
+        assert load_baseline(tmp_path) == run
+        assert load_baseline(tmp_path, "other-machine") is None
+
+    def test_cli_gates_on_baseline(self, tmp_path, capsys):
+        """Test the command records a baseline and fails on regressions."""
+        args = ["-k", "M4/square/plain", "--repeats", "5", "--warmup", "0", "--baseline-dir", str(tmp_path)]
+
+        assert main(args + ["--update-baseline"]) == 0
+
+        # Make the stored baseline implausibly fast
+        baseline = load_baseline(tmp_path)
+        result = baseline.results["M4/square/plain"]
+        fast = result.model_copy(update={"samples_ms": [value / 10 for value in result.samples_ms]})
+        save_baseline(baseline.model_copy(update={"results": {"M4/square/plain": fast}}), tmp_path)
+
+        assert main(args) == 1
+        assert "REGRESSION M4/square/plain" in capsys.readouterr().out
@@ -0,0 +1,83 @@
+"""
+Unit tests for the cached capability manifest and configuration schema.
+
+Tests that the documents are computed once, serialized with stable ETags
+and invalidated when the shape renderer registry changes.
+"""
+
+import json
+
+import pytest
+
+from segnomms.capabilities import (
+    clear_capability_cache,
+    get_capability_manifest,
+    get_capability_manifest_json,
+    get_config_schema_json,
+    get_supported_features,
+)
+from segnomms.capabilities import manifest as manifest_module
+from segnomms.config import RenderingConfig
+from segnomms.shapes import factory as factory_module
+from segnomms.shapes.basic import SquareRenderer
+
+
+@pytest.fixture
+def fresh_registry(monkeypatch):
+    """Use a fresh global shape factory so registrations do not leak."""
+    monkeypatch.setattr(factory_module, "_shape_factory", None)
+    clear_capability_cache()
+    yield factory_module.get_shape_factory()
+    clear_capability_cache()
+
+
+class TestCapabilityCache:
+    """Test caching and invalidation of the capability documents."""
+
+    def test_manifest_is_cached(self, fresh_registry, monkeypatch):
+        """Test repeated calls build the manifest once and share its serialized form."""
+        calls = []
+        build = manifest_module._build_capability_manifest
+        monkeypatch.setattr(manifest_module, "_build_capability_manifest", lambda: calls.append(1) or build())
+
+        assert get_capability_manifest() == get_capability_manifest()
+        assert len(calls) == 1
+        document = get_capability_manifest_json()
+        assert document is get_capability_manifest_json()
+        assert json.loads(document.body) == json.loads(get_capability_manifest().model_dump_json())
+        assert document.etag.startswith('"') and len(document.etag) == 34
+
+    def test_register_custom_renderer_invalidates(self, fresh_registry):
+        """Test registering a renderer rebuilds the manifest with a new ETag."""
+        manifest = get_capability_manifest()
+        etag = get_capability_manifest_json().etag
+        assert manifest.features.shapes.custom_renderers == []
+
+        factory_module.register_custom_renderer("my-shape", SquareRenderer)
+
+        assert get_capability_manifest() != manifest
+        assert get_capability_manifest().features.shapes.custom_renderers == ["my-shape"]
+        assert get_capability_manifest_json().etag != etag
+
+    def test_callers_cannot_modify_cached_manifest(self, fresh_registry):
+        """Test returned manifests and feature lists are copies."""
+        shapes = get_supported_features("shapes")
+        assert shapes
+
+        get_supported_features("shapes").clear()
+        get_capability_manifest().features.shapes.module_shapes.clear()
+
+        assert get_supported_features("shapes") == shapes
+        assert get_capability_manifest().features.shapes.module_shapes == shapes
+
+    def test_schema_document(self):
+        """Test the schema document matches the configuration schema."""
+        document = get_config_schema_json()
+        assert document is get_config_schema_json()
+        assert json.loads(document.body) == RenderingConfig.json_schema()
+
+    def test_json_schema_returns_copies(self):
+        """Test callers cannot modify the cached schema."""
+        schema = RenderingConfig.json_schema()
+        schema["title"] = "changed"
+        assert RenderingConfig.json_schema()["title"] == "RenderingConfig"
@@ -0,0 +1,153 @@
+"""Tests for the bulk generation command-line tool."""
+
+import io
+import json
+import tarfile
+import zipfile
+
+import pytest
+
+from segnomms.cli import format_stats, main, parse_record, read_records
+
+
+class TestRecords:
+    """Test input parsing."""
+
+    def test_csv_records(self):
+        """Test CSV rows become payload requests with ids."""
+        records = list(read_records(io.StringIO("id,text,url\na,hello,\nb,,https://example.com\n"), "csv"))
+        requests = [parse_record(record) for record in records]
+
+        assert [r.id for r in requests] == ["a", "b"]
+        assert requests[0].payload.text == "hello"
+        assert requests[1].payload.url == "https://example.com"
+
+    def test_jsonl_records(self):
+        """Test JSONL accepts intents requests and bare payloads."""
+        lines = (
+            '{"payload": {"text": "x"}, "intents": {"style": {"module_shape": "circle"}}}\n\n{"text": "y"}\n'
+        )
+        requests = [parse_record(record) for record in read_records(io.StringIO(lines), "jsonl")]
+
+        assert len(requests) == 2
+        assert requests[0].intents.style.module_shape == "circle"
+        assert requests[1].payload.text == "y"
+
+    def test_text_records(self):
+        """Test plain text input has one payload per line."""
+        records = list(read_records(io.StringIO("one\n\ntwo\n"), "text"))
+
+        assert [parse_record(record).payload.text for record in records] == ["one", "two"]
+
+    def test_invalid_record(self):
+        """Test invalid records raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_record('{"payload": {}}')
+
+
+class TestMain:
+    """Test end-to-end command-line runs."""
+
+    @pytest.fixture
+    def csv_input(self, tmp_path):
+        """Create a CSV input file."""
+        path = tmp_path / "payloads.csv"
+        path.write_text("id,text\nfirst,hello\nsecond,world\nsecond,again\n")
+        return path
+
+    def test_preset_to_directory(self, csv_input, tmp_path, capsys):
+        """Test rendering a preset into a directory with stats."""
+        output = tmp_path / "out"
+
+        assert main([str(csv_input), "--preset", "minimal", "-o", str(output)]) == 0
+
+        assert sorted(p.name for p in output.iterdir()) == ["first.svg", "second-2.svg", "second.svg"]
+        assert "<svg" in (output / "first.svg").read_text()
+        assert "Rendered 3/3 codes" in capsys.readouterr().err
+
+    def test_sharded_directory(self, csv_input, tmp_path):
+        """Test --shard spreads files over hash-prefix directories."""
+        from segnomms.plugin import ShardLayout
+
+        output = tmp_path / "out"
+
+        assert main([str(csv_input), "--preset", "minimal", "-q", "-o", str(output), "--shard"]) == 0
+
+        layout = ShardLayout()
+        for name in ("first.svg", "second.svg", "second-2.svg"):
+            path = layout.resolve_name(output, name)
+            assert path.parent != output
+            assert "<svg" in path.read_text()
+        assert not list(output.glob("*.svg"))
+
+    def test_shard_requires_directory(self, csv_input, tmp_path):
+        """Test --shard is rejected for archive and stdout output."""
+        with pytest.raises(SystemExit):
+            main([str(csv_input), "--shard", "-o", str(tmp_path / "codes.zip")])
+        with pytest.raises(SystemExit):
+            main([str(csv_input), "--shard", "-1", "-o", str(tmp_path / "out")])
+
+    def test_parallel_to_zip(self, csv_input, tmp_path):
+        """Test parallel rendering into a zip archive."""
+        output = tmp_path / "codes.zip"
+
+        assert main([str(csv_input), "-j", "2", "-q", "-o", str(output)]) == 0
+
+        with zipfile.ZipFile(output) as archive:
+            assert sorted(archive.namelist()) == ["first.svg", "second-2.svg", "second.svg"]
+
+    def test_parallel_to_tar_gz(self, csv_input, tmp_path):
+        """Test archives are detected from .tar.gz output names."""
+        output = tmp_path / "codes.tar.gz"
+
+        assert main([str(csv_input), "-j", "2", "-q", "-o", str(output)]) == 0
+
+        with tarfile.open(output, "r:gz") as archive:
+            assert sorted(archive.getnames()) == ["first.svg", "second-2.svg", "second.svg"]
+
+    def test_archive_to_stdout(self, csv_input, monkeypatch):
+        """Test --archive streams an archive to stdout."""
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+        monkeypatch.setattr("sys.stdout", stdout)
+
+        assert main([str(csv_input), "--preset", "minimal", "-q", "--archive", "zip"]) == 0
+
+        with zipfile.ZipFile(io.BytesIO(stdout.buffer.getvalue())) as archive:
+            assert sorted(archive.namelist()) == ["first.svg", "second-2.svg", "second.svg"]
+
+    def test_intents_to_stdout(self, tmp_path, capsys):
+        """Test default intents and JSONL output on stdout."""
+        source = tmp_path / "requests.jsonl"
+        source.write_text('{"id": "a", "text": "hello"}\n')
+        intents = tmp_path / "intents.json"
+        intents.write_text(json.dumps({"style": {"module_shape": "circle"}}))
+
+        assert main([str(source), "--intents", str(intents), "-q"]) == 0
+
+        record = json.loads(capsys.readouterr().out)
+        assert record["id"] == "a"
+        assert "<circle" in record["svg"]
+
+    def test_failures_set_exit_status(self, tmp_path, capsys):
+        """Test failed records are reported and do not stop the run."""
+        source = tmp_path / "requests.jsonl"
+        source.write_text('{"payload": {}}\n{"text": "ok"}\n')
+
+        assert main([str(source), "-o", str(tmp_path / "out")]) == 1
+
+        err = capsys.readouterr().err
+        assert "qr-000001" in err
+        assert "Rendered 1/2 codes" in err
+
+    def test_unknown_preset(self, csv_input):
+        """Test unknown presets are rejected."""
+        with pytest.raises(SystemExit):
+            main([str(csv_input), "--preset", "nope"])
+
+
+def test_format_stats():
+    """Test statistics summary."""
+    summary = format_stats([1.0, 2.0, 3.0, 10.0], errors=1, wall_seconds=2.0)
+
+    assert "Rendered 3/4 codes in 2.00s (2.0 codes/s), 1 failed" in summary
+    assert "max=10.0" in summary
@@ -2,7 +2,7 @@
 Comprehensive unit tests for visual configuration models.
 
 Tests PatternStyleConfig, FrameConfig, CenterpieceConfig, QuietZoneConfig,
-and StyleConfig validation, interactions, and complex scenarios.
+StyleConfig and AnimationConfig validation, interactions, and complex scenarios.
 """
 
 import pytest
@@ -10,6 +10,7 @@ from pydantic import ValidationError
 
 from segnomms.config.enums import PlacementMode, ReserveMode
 from segnomms.config.models.visual import (
+    AnimationConfig,
     CenterpieceConfig,
     FrameConfig,
     PatternStyleConfig,
@@ -677,6 +678,40 @@ class TestStyleConfig:
         assert config.css_classes == {}
 
 
+class TestAnimationConfig:
+    """Test AnimationConfig validation and functionality."""
+
+    def test_default_animation_config(self):
+        """Test animations are disabled by default."""
+        config = AnimationConfig()
+
+        assert config.enabled is False
+        assert config.stagger is False
+        assert config.stagger_delay == 0.02
+
+    def test_enabled_by_fade_or_pulse(self):
+        """Test fade-in or pulse enables animation; stagger alone does not."""
+        assert AnimationConfig(fade_in=True).enabled is True
+        assert AnimationConfig(pulse=True).enabled is True
+        assert AnimationConfig(stagger=True).enabled is False
+
+    def test_invalid_ranges(self):
+        """Test out-of-range durations are rejected."""
+        with pytest.raises(ValidationError):
+            AnimationConfig(fade_duration=10.0)
+        with pytest.raises(ValidationError):
+            AnimationConfig(stagger_delay=0.0)
+
+    def test_to_style_config(self):
+        """Test conversion to the style generator's flat keys."""
+        config = AnimationConfig(fade_in=True, stagger=True, timing="linear")
+        style_config = config.to_style_config()
+
+        assert style_config["animation_fade_in"] is True
+        assert style_config["animation_stagger"] is True
+        assert style_config["animation_timing"] == "linear"
+
+
 class TestVisualConfigIntegration:
     """Test integration between visual configuration models."""
 
@@ -0,0 +1,226 @@
+"""
+Unit tests for dependency-free verification of rendered geometry.
+
+Tests that module centers sampled from rendered SVGs match the encoded
+matrix, and that clearing, clipping and tampering are reported as flips.
+"""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+import segno
+
+from segnomms.config import RenderingConfig
+from segnomms.plugin.rendering import QRCodeRenderer
+from segnomms.validation import verify_rendered_geometry
+from segnomms.validation.verification import (
+    MIN_PAINT_ALPHA,
+    correctable_codewords,
+    flatten_path,
+    parse_class_rules,
+    parse_transform,
+)
+
+
+@pytest.fixture
+def qr_code():
+    """Create a version 3 QR code."""
+    return segno.make("https://example.com/verification", error="m", micro=False)
+
+
+def _render(qr_code, **config):
+    renderer = QRCodeRenderer(qr_code, RenderingConfig.model_validate({"scale": 10, "border": 4, **config}))
+    svg = renderer.render()
+    return renderer, svg
+
+
+class TestVerifyRenderedGeometry:
+    """Test sampling of rendered SVGs against the intended matrix."""
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            {},
+            {"geometry": {"shape": "circle"}},
+            {"geometry": {"shape": "dot"}},
+            {"geometry": {"shape": "squircle", "merge": "soft"}},
+            {"geometry": {"shape": "connected-extra-rounded"}},
+            {"finder": {"shape": "circle"}},
+        ],
+    )
+    def test_unmodified_renders_pass(self, qr_code, config):
+        """Test renders that keep every module produce no flips."""
+        renderer, _ = _render(qr_code, **config)
+        result = renderer.verify_geometry()
+
+        assert result.passed
+        assert result.flipped_count == 0
+        assert result.modules_checked == len(renderer.matrix) ** 2
+        assert result.error_correction_headroom == 1.0
+
+    def test_knockout_reports_missing_data_modules(self, qr_code):
+        """Test knockout clearing consumes error correction headroom."""
+        renderer, _ = _render(qr_code, centerpiece={"enabled": True, "size": 0.15})
+        result = renderer.verify_geometry()
+
+        original = [[bool(module) for module in row] for row in qr_code.matrix]
+        cleared = [
+            (row, col)
+            for row, values in enumerate(original)
+            for col, value in enumerate(values)
+            if value and not renderer.matrix[row][col]
+        ]
+        assert result.missing_modules == cleared
+        assert cleared
+        assert not result.extra_modules
+        assert not result.function_pattern_errors
+        assert 0 < result.estimated_codeword_errors <= result.correctable_codewords
+        assert 0 <= result.error_correction_headroom < 1
+        assert result.passed
+
+    def test_imprint_reports_faded_modules(self, qr_code):
+        """Test imprint opacity applied through class rules is evaluated."""
+        renderer, svg = _render(qr_code, centerpiece={"enabled": True, "size": 0.2, "mode": "imprint"})
+        result = renderer.verify_geometry()
+
+        root = ET.fromstring(svg)
+        rules = parse_class_rules(
+            "".join(element.text or "" for element in root.iter() if element.tag.endswith("style"))
+        )
+        faded = {
+            name
+            for name, entries in rules.items()
+            if name.startswith("qr-imprint-")
+            and any(float(declarations["opacity"]) < MIN_PAINT_ALPHA for _, declarations in entries)
+        }
+        expected = sorted(
+            (int(element.get("data-x")), int(element.get("data-y")))
+            for element in root.iter()
+            if faded & set((element.get("class") or "").split())
+        )
+
+        assert faded
+        assert expected
+        assert result.missing_modules == expected
+        assert not result.extra_modules
+        assert result.passed
+
+    def test_non_aligned_transform_is_hit_tested(self, qr_code):
+        """Test rotated content is sampled through its inverse transform."""
+        config = RenderingConfig.model_validate({"scale": 10, "border": 4})
+        root = ET.fromstring(QRCodeRenderer(qr_code, config).render())
+        size = (len(qr_code.matrix) + 8) * 10
+        group = ET.Element("{http://www.w3.org/2000/svg}g", transform=f"rotate(360 {size / 2} {size / 2})")
+        group.extend(list(root))
+        for child in list(root):
+            root.remove(child)
+        root.append(group)
+
+        result = verify_rendered_geometry(ET.tostring(root, encoding="unicode"), qr_code, config)
+
+        assert result.flipped_count == 0
+        assert result.passed
+
+    def test_frame_clipping_reports_function_pattern_errors(self, qr_code):
+        """Test a circle frame clipping the finder corners fails verification."""
+        renderer, _ = _render(qr_code, frame={"shape": "circle"})
+        result = renderer.verify_geometry()
+
+        assert (0, 0) in result.function_pattern_errors
+        assert not result.passed
+
+    def test_tampered_svg_reports_flips(self, qr_code):
+        """Test removing and adding shapes is detected from the SVG string."""
+        config = RenderingConfig.model_validate({"scale": 10, "border": 4})
+        renderer = QRCodeRenderer(qr_code, config)
+        root = ET.fromstring(renderer.render())
+        ns = {"svg": "http://www.w3.org/2000/svg"}
+        modules = root.find(".//svg:g[@id='segnomms-modules']", ns)
+
+        # Drop the first module shape and paint an extra one over a light data module
+        first = next(element for element in modules.iter() if element.tag.endswith("rect"))
+        for parent in modules.iter():
+            if first in list(parent):
+                parent.remove(first)
+                break
+        size = len(renderer.matrix)
+        light = [
+            (row, col)
+            for row in range(size)
+            for col in range(size)
+            if not renderer.matrix[row][col] and renderer.detector.get_module_type(row, col) == "data"
+        ][0]
+        ET.SubElement(
+            modules,
+            "{http://www.w3.org/2000/svg}rect",
+            x=str((light[1] + 4) * 10),
+            y=str((light[0] + 4) * 10),
+            width="10",
+            height="10",
+        )
+
+        result = verify_rendered_geometry(ET.tostring(root, encoding="unicode"), qr_code, config)
+
+        assert result.flipped_count == 2
+        assert light in result.extra_modules
+        assert len(result.missing_modules) == 1
+        assert result.function_pattern_errors == result.missing_modules
+        assert not result.passed
+
+    def test_micro_qr(self):
+        """Test Micro QR symbols are verified with their own capacity."""
+        qr_code = segno.make("12345", micro=True)
+        renderer, _ = _render(qr_code, geometry={"shape": "rounded"})
+        result = renderer.verify_geometry()
+
+        assert result.passed
+        assert result.correctable_codewords == correctable_codewords(qr_code.version, qr_code.error)
+
+    def test_verify_requires_render(self, qr_code):
+        """Test verification before rendering raises."""
+        renderer = QRCodeRenderer(qr_code, RenderingConfig())
+        with pytest.raises(RuntimeError):
+            renderer.verify_geometry()
+
+
+class TestGeometryHelpers:
+    """Test the path, transform and capacity helpers."""
+
+    def test_flatten_path_relative_commands(self):
+        """Test relative line and close commands produce a closed square."""
+        assert flatten_path("M1 1h2v2h-2z") == [[(1.0, 1.0), (3.0, 1.0), (3.0, 3.0), (1.0, 3.0)]]
+
+    def test_flatten_path_arc_endpoints(self):
+        """Test arcs end exactly at their endpoint."""
+        (points,) = flatten_path("M0 0 A5 5 0 0 1 10 0")
+        assert points[-1] == pytest.approx((10.0, 0.0))
+        assert min(y for _, y in points) == pytest.approx(-5.0)
+
+    def test_parse_class_rules_keeps_paint_declarations(self):
+        """Test scoped class rules are kept and unresolvable ones skipped."""
+        rules = parse_class_rules("""
+            /* comment */
+            .scope .faded, #group .faded { opacity: 0.3; transition: all 1s; }
+            .themed { fill: var(--qr-color, black); }
+            .faded:hover { opacity: 1; }
+            @media (prefers-color-scheme: dark) { .faded { fill: white; } }
+            .plain { fill: red !important; }
+            """)
+
+        assert rules == {
+            "faded": [
+                (frozenset({".scope"}), {"opacity": "0.3"}),
+                (frozenset({"#group"}), {"opacity": "0.3"}),
+            ],
+            "plain": [(frozenset(), {"fill": "red"})],
+        }
+
+    def test_parse_transform_composes_in_order(self):
+        """Test transform lists apply right to left."""
+        assert parse_transform("translate(10 5) scale(2)") == (2.0, 0.0, 0.0, 2.0, 10.0, 5.0)
+
+    def test_correctable_codewords(self):
+        """Test capacity matches the error correction tables."""
+        # Version 1-M has 10 error correction codewords in one block
+        assert correctable_codewords(1, "M") == 5
+        assert correctable_codewords(99, "M") is None
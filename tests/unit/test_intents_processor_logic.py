@@ -5,6 +5,7 @@ Tests for individual methods, processing logic, error handling,
 and performance metrics without external dependencies.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 import pytest
@@ -480,3 +481,122 @@ class TestIntentProcessingLogic:
         # Should have minimal warnings with empty intents
         # (Unless degradation processor adds default warnings)
         assert isinstance(result.warnings, list)
+
+
+class TestTranslationCache:
+    """Test memoization of intent translation."""
+
+    @pytest.fixture
+    def brand_intents(self):
+        """Create intents that produce a degradation warning."""
+        return IntentsConfig(
+            style=StyleIntents(module_shape="invalid-shape", palette={"fg": "#1a1a2e", "bg": "#ffffff"}),
+            accessibility=AccessibilityIntents(title="Brand QR"),
+        )
+
+    def test_repeated_intents_hit_cache(self, brand_intents):
+        """Test equal intents are translated once and reuse the result."""
+        processor = IntentProcessor()
+
+        with patch.object(processor, "_process_all_intents", wraps=processor._process_all_intents) as spy:
+            first = processor.process_intents(PayloadConfig(text="one"), brand_intents)
+            second = processor.process_intents(PayloadConfig(text="two"), brand_intents)
+
+        assert spy.call_count == 1
+        assert processor.get_cache_stats()["hits"] == 1
+        assert first.svg_content != second.svg_content
+        assert first.warnings == second.warnings
+        assert first.has_warnings
+        assert first.translation_report == second.translation_report
+        assert first.used_options == second.used_options
+
+    def test_results_do_not_share_cached_state(self, brand_intents):
+        """Test mutating one result does not leak into later cache hits."""
+        processor = IntentProcessor()
+        first = processor.process_intents(PayloadConfig(text="one"), brand_intents)
+        expected_shape = first.requested_options["style"]["module_shape"]
+        translation_summary = dict(first.translation_report.intent_summary)
+
+        first.requested_options["style"]["module_shape"] = "BROKEN"
+        first.used_options["scale"] = -1
+        first.translation_report.intent_summary.clear()
+        second = processor.process_intents(PayloadConfig(text="two"), brand_intents)
+
+        assert second.translation_report is not first.translation_report
+        assert second.requested_options["style"]["module_shape"] == expected_shape
+        assert second.used_options["scale"] != -1
+        assert second.translation_report.intent_summary == translation_summary
+
+    def test_cache_hit_reports_actual_validation_time(self, brand_intents):
+        """Test cache hits do not repeat the timing of the original translation."""
+        processor = IntentProcessor()
+        translation = processor.translate_intents(brand_intents)
+        object.__setattr__(translation, "validation_time_ms", 10_000.0)
+
+        result = processor.process_intents(PayloadConfig(text="hit"), brand_intents)
+
+        assert result.metrics.validation_time_ms < 10_000.0
+
+    def test_cached_translation_is_not_degraded_again(self, brand_intents):
+        """Test renders of a translation skip the degradation it already went through."""
+        from segnomms.degradation import DegradationManager
+
+        processor = IntentProcessor()
+        processor.translate_intents(brand_intents)
+
+        with patch.object(
+            DegradationManager, "apply_degradation", wraps=DegradationManager().apply_degradation
+        ) as spy:
+            processor.process_intents(PayloadConfig(text="one"), brand_intents)
+            processor.process_intents(PayloadConfig(text="two"), brand_intents)
+
+        assert spy.call_count == 0
+
+    def test_cache_key_is_canonical(self):
+        """Test equivalent intents built differently share a cache key."""
+        a = IntentsConfig(style=StyleIntents(palette={"fg": "#000000", "bg": "#ffffff"}, merge="soft"))
+        b = IntentsConfig(
+            style=StyleIntents(merge="soft", palette={"bg": "#ffffff", "fg": "#000000"}), frame=None
+        )
+        c = IntentsConfig(style=StyleIntents(merge="aggressive"))
+
+        assert IntentProcessor.intents_cache_key(a) == IntentProcessor.intents_cache_key(b)
+        assert IntentProcessor.intents_cache_key(a) != IntentProcessor.intents_cache_key(c)
+        assert IntentProcessor.intents_cache_key(None) != IntentProcessor.intents_cache_key(IntentsConfig())
+
+    def test_cache_is_bounded(self):
+        """Test least recently used translations are evicted."""
+        processor = IntentProcessor(cache_size=2)
+
+        for quiet_zone in (1, 2, 3):
+            processor.translate_intents(IntentsConfig(validation=ValidationIntents(quiet_zone=quiet_zone)))
+
+        stats = processor.get_cache_stats()
+        assert stats["size"] == 2
+        assert stats["misses"] == 3
+
+    def test_cache_can_be_disabled(self, brand_intents):
+        """Test a cache size of zero translates every request."""
+        processor = IntentProcessor(cache_size=0)
+
+        processor.translate_intents(brand_intents)
+        processor.translate_intents(brand_intents)
+
+        assert processor.get_cache_stats() == {"hits": 0, "misses": 2, "size": 0, "max_size": 0}
+
+    def test_concurrent_requests(self, brand_intents):
+        """Test a shared processor renders correctly from several threads."""
+        processor = IntentProcessor()
+        expected = processor.process_intents(PayloadConfig(text="payload-0"), brand_intents)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(
+                pool.map(
+                    lambda i: processor.process_intents(PayloadConfig(text=f"payload-{i}"), brand_intents),
+                    range(16),
+                )
+            )
+
+        assert results[0].svg_content == expected.svg_content
+        assert all(result.warnings == expected.warnings for result in results)
+        assert processor.get_cache_stats()["misses"] == 1
@@ -0,0 +1,104 @@
+"""Tests for the streaming JSONL intents pipeline."""
+
+import io
+import json
+
+import pytest
+
+from segnomms.intents import process_intents_jsonl, stream_intents_jsonl
+from segnomms.intents.stream import render_jsonl_line
+
+
+def _request(index, **extra):
+    request = {
+        "id": f"req-{index}",
+        "payload": {"text": f"https://example.com/{index}"},
+        "intents": {"style": {"module_shape": "squircle"}},
+    }
+    request.update(extra)
+    return json.dumps(request).encode("utf-8")
+
+
+class TestRenderLine:
+    """Test single line processing."""
+
+    def test_valid_request(self):
+        """Test a valid request renders to the client format."""
+        record = json.loads(render_jsonl_line(3, _request(3)))
+
+        assert record["index"] == 3
+        assert record["id"] == "req-3"
+        assert "<svg" in record["svg"]
+        assert "usedOptions" in record
+
+    def test_invalid_request_reports_error(self):
+        """Test validation errors are reported instead of raised."""
+        record = json.loads(render_jsonl_line(0, b'{"payload": {}}'))
+
+        assert record["error"]["error"] == "REQUEST_VALIDATION_ERROR"
+        assert "svg" not in record
+
+    def test_malformed_json_reports_error(self):
+        """Test malformed JSON is reported instead of raised."""
+        record = json.loads(render_jsonl_line(0, b"{not json"))
+
+        assert record["error"]["error"] == "REQUEST_VALIDATION_ERROR"
+
+
+class TestStream:
+    """Test stream processing."""
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_ordered_output(self, workers):
+        """Test results are yielded in input order."""
+        lines = [_request(i) for i in range(8)]
+
+        results = [json.loads(line) for line in stream_intents_jsonl(lines, workers=workers, max_in_flight=2)]
+
+        assert [r["index"] for r in results] == list(range(8))
+        assert [r["id"] for r in results] == [f"req-{i}" for i in range(8)]
+
+    def test_completion_order_output(self):
+        """Test unordered mode yields every result exactly once."""
+        lines = [_request(i) for i in range(8)]
+
+        results = [json.loads(line) for line in stream_intents_jsonl(lines, workers=3, ordered=False)]
+
+        assert sorted(r["index"] for r in results) == list(range(8))
+
+    def test_input_is_consumed_lazily(self):
+        """Test at most max_in_flight requests are read ahead."""
+        consumed = []
+
+        def source():
+            for i in range(20):
+                consumed.append(i)
+                yield _request(i)
+
+        stream = stream_intents_jsonl(source(), workers=2, max_in_flight=4)
+        next(stream)
+
+        assert len(consumed) <= 5
+        assert sum(1 for _ in stream) == 19
+
+    def test_blank_lines_and_text_input(self):
+        """Test text lines are accepted and blank lines skipped."""
+        text = io.StringIO(_request(0).decode() + "\n\n" + _request(1).decode() + "\n")
+
+        results = [json.loads(line) for line in stream_intents_jsonl(text, workers=1)]
+
+        assert [r["index"] for r in results] == [0, 1]
+
+    def test_file_to_file(self, tmp_path):
+        """Test processing a JSONL file into a JSONL file."""
+        source = tmp_path / "requests.jsonl"
+        source.write_bytes(b"\n".join([_request(0), b'{"payload": {}}', _request(2)]) + b"\n")
+        destination = tmp_path / "results.jsonl"
+
+        count = process_intents_jsonl(source, destination, workers=2)
+
+        records = [json.loads(line) for line in destination.read_text().splitlines()]
+        assert count == 3
+        assert "svg" in records[0]
+        assert "error" in records[1]
+        assert records[2]["id"] == "req-2"
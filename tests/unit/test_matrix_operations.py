@@ -10,6 +10,7 @@ import pytest
 from segnomms.config import CenterpieceConfig, ReserveMode
 from segnomms.core.detector import ModuleDetector
 from segnomms.core.matrix import MatrixManipulator
+from segnomms.core.matrix.cache import BoundedCache
 
 
 class TestMatrixManipulator:
@@ -338,3 +339,90 @@ class TestReserveModes:
 
         # Test edge cases
         assert 0 < treatment["opacity"] <= 1.0
+
+    @pytest.mark.parametrize("shape", ["rect", "circle", "squircle"])
+    def test_centerpiece_mask_matches_containment(self, manipulator, shape):
+        """Test the bulk centerpiece mask agrees with per-module containment."""
+        config = CenterpieceConfig(enabled=True, size=0.3, shape=shape, offset_x=0.1, margin=1)
+
+        row0, col0, mask = manipulator.geometry.get_centerpiece_mask(config)
+        inside = {
+            (row0 + i, col0 + j)
+            for i, mask_row in enumerate(mask)
+            for j, member in enumerate(mask_row)
+            if member
+        }
+
+        expected = {
+            (row, col)
+            for row in range(21)
+            for col in range(21)
+            if manipulator.is_in_centerpiece(row, col, config)
+        }
+        assert inside == expected
+
+    def test_knockout_mask_is_cached(self, manipulator):
+        """Test knockout masks are reused and statistics match the applied knockout."""
+        config = CenterpieceConfig(enabled=True, size=0.25, shape="circle")
+        processor = manipulator.get_knockout_processor()
+
+        mask = processor.get_knockout_mask(config)
+        assert processor.get_knockout_mask(config.model_copy()) is mask
+
+        stats = processor.get_clearing_statistics(config)
+        result = processor.apply_knockout_mode(config)
+        cleared = sum(1 for row in range(21) for col in range(21) if not result[row][col])
+
+        assert stats["in_centerpiece"] == mask.in_centerpiece
+        assert cleared == stats["data_modules_would_clear"] + stats["edge_modules_would_refine"]
+
+    def test_imprint_field_buckets(self, manipulator):
+        """Test imprinted modules share a few cached, quantized treatments."""
+        config = CenterpieceConfig(enabled=True, size=0.3, shape="circle", mode=ReserveMode.IMPRINT)
+        processor = manipulator.get_imprint_processor()
+
+        field = processor.get_imprint_field(config)
+        assert processor.get_imprint_field(config.model_copy()) is field
+
+        manipulator.apply_imprint_mode(config)
+        metadata = manipulator.get_centerpiece_metadata(config)
+        buckets = metadata["imprint_buckets"]
+        opacities = [bucket["opacity"] for bucket in buckets]
+
+        assert opacities == sorted(opacities)
+        assert len({treatment["bucket"] for treatment in metadata["imprint_treatments"]}) <= len(buckets)
+        for treatment in metadata["imprint_treatments"]:
+            assert treatment["opacity"] == buckets[treatment["bucket"]]["opacity"]
+
+    def test_region_statistics_are_shared(self, manipulator):
+        """Test region statistics are computed once per configuration and drive the analyses."""
+        config = CenterpieceConfig(enabled=True, size=0.3, shape="rect", offset_x=-0.4, offset_y=-0.4)
+        validator = manipulator.get_validator()
+
+        stats = validator.get_region_statistics(config)
+        assert validator.get_region_statistics(config.model_copy()) is stats
+
+        analysis = manipulator.analyze_pattern_preservation(config)
+        assert analysis["finder_patterns"]["affected"] == len(stats.affected_finders) > 0
+        assert "Finder pattern at (0, 0) affected" in analysis["critical_violations"]
+
+    def test_bounded_cache_evicts_least_recently_used(self):
+        """Test the shared cache builds once per key and stays within its size."""
+        cache = BoundedCache(2)
+        builds = []
+
+        def build(key):
+            builds.append(key)
+            return key.upper()
+
+        assert cache.get_or_build("a", lambda: build("a")) == "A"
+        assert cache.get_or_build("b", lambda: build("b")) == "B"
+        assert cache.get_or_build("a", lambda: build("a")) == "A"
+        cache.get_or_build("c", lambda: build("c"))
+        cache.get_or_build("a", lambda: build("a"))
+        cache.get_or_build("b", lambda: build("b"))
+
+        assert builds == ["a", "b", "c", "b"]
+        assert len(cache) == 2
+        cache.clear()
+        assert len(cache) == 0
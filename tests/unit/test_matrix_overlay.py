@@ -0,0 +1,95 @@
+"""
+Unit tests for copy-on-write overlay matrices.
+
+Tests that overlays record only modified cells, read like nested lists and
+give the same validation results as full matrix copies.
+"""
+
+import pytest
+
+from segnomms.config import CenterpieceConfig, ReserveMode
+from segnomms.core.detector import ModuleDetector
+from segnomms.core.matrix import MatrixManipulator
+from segnomms.core.matrix.overlay import OverlayMatrix
+
+
+@pytest.fixture
+def qr_matrix():
+    """Create a real version 3 QR matrix."""
+    import segno
+
+    qr = segno.make("Overlay matrix test", error="h", micro=False)
+    return [[bool(module) for module in row] for row in qr.matrix]
+
+
+@pytest.fixture
+def manipulator(qr_matrix):
+    """Create a MatrixManipulator for the QR matrix."""
+    return MatrixManipulator(qr_matrix, ModuleDetector(qr_matrix))
+
+
+class TestOverlayMatrix:
+    """Test the overlay matrix view."""
+
+    def test_records_only_changes(self):
+        """Test writes equal to the base are not recorded and the base is untouched."""
+        base = [[True, False], [False, True]]
+        overlay = OverlayMatrix(base)
+
+        assert overlay.clear(0, 0) is True
+        assert overlay.clear(0, 1) is False
+        overlay.set(1, 1, True)
+
+        assert base == [[True, False], [False, True]]
+        assert overlay.changed_positions() == [(0, 0)]
+        assert overlay.cleared_count == 1
+        assert overlay[0][0] is False
+        assert list(overlay[0]) == [False, False]
+        assert overlay.to_list() == [[False, False], [False, True]]
+
+        overlay.set(0, 0, True)
+        assert overlay.changed_count == 0
+
+    def test_knockout_overlay_matches_applied_matrix(self, manipulator):
+        """Test the knockout overlay materializes to the knockout result."""
+        config = CenterpieceConfig(enabled=True, size=0.25, shape="circle")
+
+        overlay = manipulator.get_centerpiece_overlay(config)
+        applied = manipulator.apply_knockout_mode(config)
+
+        assert overlay.base is manipulator.matrix
+        assert overlay.to_list() == applied
+        assert overlay.cleared_count == sum(
+            1
+            for row in range(manipulator.size)
+            for col in range(manipulator.size)
+            if manipulator.matrix[row][col] and not applied[row][col]
+        )
+
+    def test_imprint_overlay_marks_without_changes(self, manipulator):
+        """Test imprint overlays only mark modules."""
+        config = CenterpieceConfig(enabled=True, size=0.25, shape="circle", mode=ReserveMode.IMPRINT)
+
+        overlay = manipulator.get_centerpiece_overlay(config)
+
+        assert overlay.changed_count == 0
+        assert overlay.marks
+        assert all(manipulator.matrix[row][col] for row, col in overlay.marks)
+
+    def test_validation_agrees_with_full_copies(self, manipulator):
+        """Test overlay-based validation gives the same results as full matrices."""
+        config = CenterpieceConfig(enabled=True, size=0.3, shape="squircle")
+        overlay = manipulator.get_centerpiece_overlay(config)
+        modified = overlay.to_list()
+
+        for error_level in ("L", "H"):
+            assert manipulator._validate_reserve_impact_matrices(
+                manipulator.matrix, overlay, error_level
+            ) == manipulator._validate_reserve_impact_matrices(manipulator.matrix, modified, error_level)
+
+        assert manipulator.get_scanability_assessment(
+            config, overlay
+        ) == manipulator.get_scanability_assessment(config, modified)
+        assert manipulator.validator.validate_matrix_integrity(
+            overlay
+        ) == manipulator.validator.validate_matrix_integrity(modified)
@@ -0,0 +1,59 @@
+"""Tests for per-phase memory accounting."""
+
+import tracemalloc
+
+import pytest
+import segno
+
+from segnomms.config import RenderingConfig
+from segnomms.core.memory import MemoryProfile, profile_memory
+from segnomms.core.tracing import NOOP_SPAN, trace_span
+from segnomms.intents.models import PayloadConfig
+from segnomms.intents.processor import render_with_intents
+from segnomms.plugin.rendering import generate_interactive_svg
+
+
+class TestProfileMemory:
+    def test_phases_recorded(self):
+        config = RenderingConfig.from_kwargs(merge="soft")
+        qr = segno.make("Memory profile", error="m")
+        with profile_memory(top=5) as profiler:
+            svg = generate_interactive_svg(qr, config)
+
+        profile = profiler.profile
+        assert isinstance(profile, MemoryProfile)
+        for name in ("matrix", "detector", "render.clustering", "render.modules", "render.serialize"):
+            assert profile.get_phase(name) is not None, name
+
+        render = profile.get_phase("render")
+        modules = profile.get_phase("render.modules")
+        assert render.depth == modules.depth - 1
+        assert 0 < modules.peak_bytes <= render.peak_bytes <= profile.peak_bytes
+        assert profile.get_phase("render.format").retained_bytes >= len(svg) // 2
+        assert 0 < len(profile.top_allocations) <= 5
+        assert all(site.size_bytes > 0 for site in profile.top_allocations)
+
+    def test_tracemalloc_restored(self):
+        assert not tracemalloc.is_tracing()
+        with profile_memory():
+            assert tracemalloc.is_tracing()
+        assert not tracemalloc.is_tracing()
+        assert trace_span("after") is NOOP_SPAN
+
+    def test_nested_profiles_rejected(self):
+        with profile_memory():
+            with pytest.raises(RuntimeError):
+                with profile_memory():
+                    pass
+
+    def test_render_with_intents(self):
+        result = render_with_intents(PayloadConfig(text="profile me"), profile_memory=True)
+        profile = result.metrics.memory_profile
+        assert profile is not None
+        assert profile.phases[0].name == "process_intents"
+        assert profile.get_phase("generate_interactive_svg") is not None
+        assert "memory_profile" in result.to_client_format()["metrics"]
+
+        plain = render_with_intents(PayloadConfig(text="profile me"))
+        assert plain.metrics.memory_profile is None
+        assert plain.svg_content == result.svg_content
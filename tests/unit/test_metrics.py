@@ -0,0 +1,140 @@
+"""Tests for the unified metrics registry."""
+
+import pytest
+import segno
+
+from segnomms.config import RenderingConfig
+from segnomms.core.matrix.performance_monitor import CenterpiecePerformanceMonitor
+from segnomms.core.metrics import (
+    MetricFamily,
+    MetricsRegistry,
+    disable_metrics,
+    enable_metrics,
+    get_metrics_registry,
+    get_renderer_metrics,
+)
+from segnomms.core.performance import PerformanceMonitor
+from segnomms.core.tracing import NOOP_SPAN, trace_span
+from segnomms.intents.models import IntentsConfig, PayloadConfig, StyleIntents
+from segnomms.intents.processor import IntentProcessor
+from segnomms.plugin.rendering import generate_interactive_svg
+
+
+class TestMetricsRegistry:
+    def test_counter_and_gauge_exposition(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("test_requests_total", "Requests", ["route"])
+        counter.inc(route="/render")
+        counter.inc(2, route="/render")
+        counter.inc(route='a"b\\c')
+        registry.gauge("test_in_flight", "In flight").set(3)
+
+        text = registry.to_prometheus()
+        assert "# HELP test_requests_total Requests\n# TYPE test_requests_total counter\n" in text
+        assert 'test_requests_total{route="/render"} 3\n' in text
+        assert 'test_requests_total{route="a\\"b\\\\c"} 1\n' in text
+        assert "test_in_flight 3\n" in text
+        assert counter.get(route="/render") == 3
+
+    def test_histogram_exposition(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram("test_seconds", "Latency", ["phase"], buckets=[0.1, 1.0])
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value, phase="render")
+
+        lines = registry.to_prometheus().splitlines()
+        assert 'test_seconds_bucket{phase="render",le="0.1"} 2' in lines
+        assert 'test_seconds_bucket{phase="render",le="1"} 3' in lines
+        assert 'test_seconds_bucket{phase="render",le="+Inf"} 4' in lines
+        assert 'test_seconds_sum{phase="render"} 2.65' in lines
+        assert 'test_seconds_count{phase="render"} 4' in lines
+
+        sample = registry.snapshot()["test_seconds"]["samples"][0]
+        assert sample["labels"] == {"phase": "render"}
+        assert sample["count"] == 4
+        assert sample["buckets"] == {"0.1": 2, "1": 3, "+Inf": 4}
+
+    def test_incomplete_family_fails_at_instantiation(self):
+        class Incomplete(MetricFamily):
+            def expose(self):
+                return []
+
+        with pytest.raises(TypeError):
+            Incomplete("test_incomplete", "Incomplete")
+
+    def test_registration_conflicts_and_label_checks(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("test_total", "Total", ["a"])
+        assert registry.counter("test_total", "Total", ["a"]) is counter
+        with pytest.raises(ValueError):
+            registry.gauge("test_total", "Total", ["a"])
+        with pytest.raises(ValueError):
+            counter.inc(b="x")
+        with pytest.raises(ValueError):
+            counter.inc(-1, a="x")
+
+    def test_reset(self):
+        registry = MetricsRegistry()
+        registry.counter("test_total", "Total").inc()
+        registry.reset()
+        assert registry.snapshot()["test_total"]["samples"] == []
+
+
+class TestRendererMetrics:
+    @pytest.fixture(autouse=True)
+    def metrics(self):
+        get_metrics_registry().reset()
+        enable_metrics()
+        yield get_renderer_metrics()
+        disable_metrics()
+        get_metrics_registry().reset()
+
+    def test_render_metrics_from_spans(self, metrics):
+        config = RenderingConfig.from_kwargs(shape="circle", merge="soft")
+        svg = generate_interactive_svg(segno.make("Metrics"), config)
+
+        assert metrics.renders.get(shape="circle") == 1
+        assert metrics.output_bytes.get_count(shape="circle") == 1
+        assert metrics.phase_duration.get_count(phase="render.modules", shape="circle") == 1
+        assert metrics.phase_duration.get_count(phase="render.clustering", shape="circle") == 1
+
+        sample = get_metrics_registry().snapshot()["segnomms_output_bytes"]["samples"][0]
+        assert sample["sum"] == len(svg)
+
+    def test_cache_metrics(self, metrics):
+        processor = IntentProcessor()
+        intents = IntentsConfig(style=StyleIntents(module_shape="squircle"))
+        for text in ("a", "b", "c"):
+            processor.process_intents(PayloadConfig(text=text), intents)
+
+        assert metrics.cache_requests.get(cache="intent_translation", result="miss") == 1
+        assert metrics.cache_requests.get(cache="intent_translation", result="hit") == 2
+
+    def test_degradation_rule_hits(self, metrics):
+        config = RenderingConfig.from_kwargs(shape="star", merge="aggressive", connectivity="8-way")
+        generate_interactive_svg(segno.make("Degrade"), config)
+        samples = get_metrics_registry().snapshot()["segnomms_degradation_rule_hits_total"]["samples"]
+        assert samples
+        assert all(sample["value"] >= 1 for sample in samples)
+
+    def test_monitors_feed_registry(self, metrics):
+        monitor = PerformanceMonitor()
+        monitor.end_operation(monitor.start_operation("svg_generation"))
+        assert metrics.operation_duration.get_count(operation="svg_generation", source="core") == 1
+
+        centerpiece = CenterpiecePerformanceMonitor(matrix_size=25)
+        context = centerpiece.start_operation("knockout_processing", None)
+        centerpiece.end_operation(context)
+        assert (
+            metrics.operation_duration.get_count(operation="knockout_processing", source="centerpiece") == 1
+        )
+
+        text = get_metrics_registry().to_prometheus()
+        assert 'segnomms_operation_duration_seconds_count{operation="svg_generation",source="core"} 1' in text
+
+    def test_disable_metrics(self):
+        disable_metrics()
+        assert trace_span("render") is NOOP_SPAN
+        enable_metrics()
+        enable_metrics()
+        assert trace_span("render") is not NOOP_SPAN
@@ -4,6 +4,13 @@ Test suite for enhanced palette support.
 
 import pytest
 
+from segnomms.color.color_analysis import (
+    calculate_contrast_ratio,
+    get_color,
+    parse_color,
+    solve_color_for_contrast,
+    with_luminance,
+)
 from segnomms.color.palette import (
     ColorInfo,
     ContrastAnalysis,
@@ -275,6 +282,54 @@ class TestPaletteSuggestions:
         assert "black" in alternatives
         assert "white" in alternatives
 
+    def test_generate_suggestions_with_min_contrast(self):
+        """Test suggestions are adjusted to reach the requested contrast."""
+        suggestions = generate_palette_suggestions("#ffcc00", PaletteType.ANALOGOUS, min_contrast=4.5)
+        assert suggestions
+        for color in suggestions:
+            assert calculate_contrast_ratio(color, "#ffcc00") >= 4.5
+
+
+class TestColorValues:
+    """Test interned colors and direct contrast solving."""
+
+    def test_colors_are_interned(self):
+        """Test equal colors in different formats share one value."""
+        assert get_color("red") is get_color("#FF0000") is get_color("rgb(255, 0, 0)")
+        assert get_color("red").hex == "#ff0000"
+        assert parse_color("#f00") == (255, 0, 0)
+        assert get_color("") is None
+        assert get_color("not-a-color") is None
+
+    def test_with_luminance_keeps_hue(self):
+        """Test adjusting luminance scales channels towards black or white."""
+        color = get_color("#804020")
+        darker = with_luminance(color, color.luminance / 2)
+        assert darker.luminance == pytest.approx(color.luminance / 2, abs=0.005)
+        assert darker.rgb[0] > darker.rgb[1] > darker.rgb[2]
+        assert with_luminance(color, 1.0).rgb == (255, 255, 255)
+
+    @pytest.mark.parametrize(
+        "color,against,ratio",
+        [
+            ("#ff8800", "white", 4.5),
+            ("#333366", "black", 7.0),
+            ("#777777", "#888888", 3.0),
+            ("yellow", "white", 8.0),
+        ],
+    )
+    def test_solve_color_for_contrast(self, color, against, ratio):
+        """Test solved colors meet the ratio with a small margin."""
+        solved = solve_color_for_contrast(color, against, ratio)
+        achieved = calculate_contrast_ratio(solved, against)
+        assert ratio <= achieved < ratio + 0.25
+
+    def test_solve_color_for_contrast_unreachable(self):
+        """Test unreachable ratios and invalid colors return None."""
+        assert solve_color_for_contrast("gray", "gray", 21.0) is None
+        assert solve_color_for_contrast("invalid", "white", 4.5) is None
+        assert solve_color_for_contrast("black", "white", 4.5) == "#000000"
+
 
 class TestRenderingConfigIntegration:
     """Test integration with RenderingConfig."""
@@ -1,5 +1,7 @@
 """Test suite for Performance monitoring system."""
 
+import random
+import threading
 import time
 
 import pytest
@@ -8,6 +10,7 @@ from segnomms.core.performance import (
     PerformanceMetric,
     PerformanceMonitor,
     PerformanceThreshold,
+    StreamingHistogram,
     WarningLevel,
     get_performance_monitor,
     measure_centerpiece_operation,
@@ -359,3 +362,122 @@ class TestPerformanceMetric:
         )
 
         assert metric2.exceeded_threshold is True
+
+
+class TestStreamingHistogram:
+    """Test cases for the fixed-memory latency histogram."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Quantile estimates stay within the configured relative error."""
+        rng = random.Random(7)
+        values = sorted(rng.lognormvariate(1.0, 1.5) for _ in range(20000))
+        histogram = StreamingHistogram(relative_accuracy=0.01)
+        for value in values:
+            histogram.record(value)
+
+        for q in (0.5, 0.95, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            assert histogram.quantile(q) == pytest.approx(exact, rel=0.011)
+        assert histogram.count == len(values)
+        assert histogram.min == values[0]
+        assert histogram.max == values[-1]
+        assert histogram.mean == pytest.approx(sum(values) / len(values))
+
+    def test_memory_is_bounded(self):
+        """The number of buckets does not grow with the number of values."""
+        histogram = StreamingHistogram(max_buckets=64)
+        for exponent in range(-6, 12):
+            for _ in range(100):
+                histogram.record(10.0**exponent)
+        assert len(histogram._buckets) <= 64
+        assert histogram.quantile(1.0) == histogram.max
+
+    def test_merge(self):
+        """Merged histograms equal one histogram fed with all values."""
+        left, right, combined = StreamingHistogram(), StreamingHistogram(), StreamingHistogram()
+        for value in range(1, 101):
+            (left if value % 2 else right).record(value)
+            combined.record(value)
+        left.merge(right)
+        assert left.count == combined.count
+        assert left.quantile(0.9) == combined.quantile(0.9)
+
+    def test_empty(self):
+        """An empty histogram reports zeros."""
+        assert StreamingHistogram().quantile(0.99) == 0.0
+        assert StreamingHistogram().mean == 0.0
+
+
+class TestBoundedMonitor:
+    """Test cases for bounded, thread-safe recording."""
+
+    def test_ring_buffers_are_bounded(self):
+        """Only the most recent metrics and warnings are retained."""
+        monitor = PerformanceMonitor(max_recent_metrics=5, max_warnings=3)
+        monitor.set_threshold(PerformanceThreshold("op", max_time_ms=-1.0))
+        for _ in range(20):
+            monitor.end_operation(monitor.start_operation("op"))
+
+        assert len(monitor.metrics) == 5
+        assert len(monitor.get_recent_warnings(100)) == 3
+        stats = monitor.snapshot().operations["op"]
+        assert stats.count == 20
+        assert stats.warnings == 20
+
+    def test_concurrent_recording(self):
+        """Counts from many threads are exact."""
+        monitor = PerformanceMonitor(max_recent_metrics=10)
+
+        def work():
+            for _ in range(500):
+                monitor.end_operation(monitor.start_operation("threaded"))
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Data of exited threads is kept
+        stats = monitor.snapshot().operations["threaded"]
+        assert stats.count == 4000
+        assert stats.min_time_ms <= stats.p50_ms <= stats.p95_ms <= stats.p99_ms <= stats.max_time_ms
+        assert monitor.get_performance_summary()["total_operations"] == 4000
+
+    def test_short_lived_threads_do_not_accumulate_shards(self):
+        """Shards of exited threads are retired without any read."""
+        monitor = PerformanceMonitor()
+
+        def work():
+            monitor.end_operation(monitor.start_operation("request"))
+
+        for _ in range(200):
+            thread = threading.Thread(target=work)
+            thread.start()
+            thread.join()
+
+        assert len(monitor._shards) <= 1
+        assert monitor.snapshot().operations["request"].count == 200
+
+    def test_snapshot_reset(self):
+        """A resetting snapshot starts a new interval."""
+        monitor = PerformanceMonitor()
+        for _ in range(3):
+            monitor.end_operation(monitor.start_operation("op"))
+
+        first = monitor.snapshot(reset=True)
+        assert first.total_operations == 3
+        assert monitor.snapshot().total_operations == 0
+        assert monitor.metrics == []
+
+        monitor.end_operation(monitor.start_operation("op"))
+        assert monitor.snapshot().operations["op"].count == 1
+
+    def test_active_operations_are_bounded(self):
+        """Operations that are never ended are eventually dropped."""
+        monitor = PerformanceMonitor(max_active_operations=10)
+        ids = [monitor.start_operation("leak") for _ in range(50)]
+        assert len(monitor._active_operations) == 10
+        assert monitor.end_operation(ids[0]) is None
+        assert monitor.end_operation(ids[-1]) is not None
+        assert monitor.end_operation(ids[-1]) is None
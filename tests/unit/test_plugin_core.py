@@ -307,3 +307,92 @@ class TestGenerateConfigHash:
 
         # All hashes should be identical
         assert len(set(hashes)) == 1
+
+
+class TestAnimationRendering:
+    """Test CSS animation output of the renderer."""
+
+    def _render(self, **kwargs):
+        import segno
+
+        from segnomms.plugin.rendering import QRCodeRenderer
+
+        config = RenderingConfig.from_kwargs(scale=4, **kwargs)
+        return QRCodeRenderer(segno.make("Animation test"), config).render()
+
+    def test_no_animation_markup_by_default(self):
+        """Test modules carry no animation data when animation is off."""
+        svg = self._render()
+
+        assert "--i:" not in svg
+        assert "qrFadeIn" not in svg
+        assert "qr-stagger" not in svg
+
+    def test_stagger_uses_group_rules(self):
+        """Test staggering is expressed as nth-child rules, not per-module styles."""
+        svg = self._render(animation_fade_in=True, animation_stagger=True)
+
+        assert "qrFadeIn" in svg
+        assert "--i:" not in svg
+        assert 'class="qr-stagger"' in svg
+        assert ":nth-child(n+" in svg
+
+    def test_stagger_rules_are_scoped_per_document(self):
+        """Test rules of SVGs inlined on one page only match their own document."""
+        import segno
+
+        from segnomms.plugin.rendering import QRCodeRenderer
+
+        config = RenderingConfig.from_kwargs(scale=4, animation_fade_in=True, animation_stagger=True)
+        scopes = []
+        for data in ("Animation test", "A different and considerably longer payload"):
+            root = ET.fromstring(QRCodeRenderer(segno.make(data), config).render())
+            assert root.get("id") == "qr-code"
+            scope = root.get("class").split()[-1]
+            style = next(style for style in root.iter() if style.get("class") == "qr-stagger")
+            assert all(rule.startswith(f".{scope} ") for rule in style.text.splitlines())
+            scopes.append(scope)
+
+        assert scopes[0] != scopes[1]
+        # Identical documents share their (identical) rules and stay deterministic
+        again = ET.fromstring(QRCodeRenderer(segno.make("Animation test"), config).render())
+        assert again.get("class").split()[-1] == scopes[0]
+
+    def test_pulse_adds_finder_halos(self):
+        """Test pulse animation inserts halos before the modules layer."""
+        svg = self._render(animation_pulse=True)
+        root = ET.fromstring(svg)
+        ns = "{http://www.w3.org/2000/svg}"
+        children = [(child.tag, child.get("class")) for child in root]
+
+        halos_index = children.index((f"{ns}g", "finder-halos"))
+        assert children[halos_index + 1] == (f"{ns}g", "qr-modules")
+        assert "qrPulse" in svg
+
+
+class TestImprintRendering:
+    """Test imprint mode output of the renderer."""
+
+    def test_imprint_uses_bucket_classes(self):
+        """Test imprinted modules reference shared bucket rules instead of per-module attributes."""
+        import segno
+
+        from segnomms.plugin.rendering import QRCodeRenderer
+
+        config = RenderingConfig.from_kwargs(
+            scale=4, centerpiece_enabled=True, centerpiece_size=0.2, centerpiece_mode="imprint"
+        )
+        svg = QRCodeRenderer(segno.make("Imprint test", error="h"), config).render()
+        root = ET.fromstring(svg)
+
+        styles = [element for element in root.iter("{http://www.w3.org/2000/svg}style")]
+        imprint_styles = [style for style in styles if style.get("class") == "qr-imprint"]
+        assert len(imprint_styles) == 1
+        scope = root.get("class").split()[-1]
+        assert f".{scope} .qr-imprint-0 {{ opacity:" in imprint_styles[0].text
+
+        imprinted = [
+            element for element in root.iter() if "qr-imprint-" in (element.get("class") or "").split(" ")[-1]
+        ]
+        assert imprinted
+        assert all(element.get("opacity") is None for element in imprinted)
@@ -33,6 +33,12 @@ class TestPluginExports:
             "write_advanced",
             "register_with_segno",
             "generate_interactive_svg",
+            "BatchManifest",
+            "ShardLayout",
+            "write_archive",
+            "write_pack",
+            "PackReader",
+            "PackWriter",
             "MAX_QR_SIZE",
         }
         actual = set(plugin.__all__)
@@ -59,6 +65,12 @@ class TestPluginExports:
             "write_advanced",
             "register_with_segno",
             "generate_interactive_svg",
+            "BatchManifest",
+            "ShardLayout",
+            "write_archive",
+            "write_pack",
+            "PackReader",
+            "PackWriter",
             "MAX_QR_SIZE",
         }
         assert (
@@ -0,0 +1,107 @@
+"""Tests for shared, content-hashed runtime assets.
+
+Covers building and exporting the runtime stylesheet and script, and the
+``runtime_assets`` rendering modes that reference or omit them.
+"""
+
+import io
+
+import pytest
+import segno
+
+from segnomms import write
+from segnomms.svg.assets import (
+    build_runtime_assets,
+    export_runtime_assets,
+    render_shared_assets_html,
+)
+
+
+class TestRuntimeAssets:
+    """Test runtime asset construction and export."""
+
+    def test_interactive_assets_include_script(self):
+        """Test interactive runtime has both stylesheet and script."""
+        assets = build_runtime_assets(interactive=True)
+
+        assert set(assets) == {"css", "js"}
+        assert ".qr-module:hover" in assets["css"].content
+        assert "qrModuleClick" in assets["js"].content
+
+    def test_static_assets_have_no_script(self):
+        """Test non-interactive runtime only has a stylesheet."""
+        assets = build_runtime_assets(interactive=False)
+
+        assert set(assets) == {"css"}
+        assert ".qr-module:hover" not in assets["css"].content
+
+    def test_filenames_are_content_hashed(self):
+        """Test file names change with content and are stable otherwise."""
+        static_css = build_runtime_assets(interactive=False)["css"]
+        interactive_css = build_runtime_assets(interactive=True)["css"]
+
+        assert static_css.filename.startswith("segnomms-runtime.")
+        assert static_css.filename.endswith(".css")
+        assert static_css.filename != interactive_css.filename
+        assert static_css.filename == build_runtime_assets(interactive=False)["css"].filename
+
+    def test_href_joins_base_url(self):
+        """Test asset URLs are built from the base URL."""
+        css = build_runtime_assets(interactive=False)["css"]
+
+        assert css.href() == css.filename
+        assert css.href("/static/") == f"/static/{css.filename}"
+
+    def test_export_writes_files(self, tmp_path):
+        """Test assets are exported under their hashed names."""
+        paths = export_runtime_assets(tmp_path / "assets", interactive=True)
+        assets = build_runtime_assets(interactive=True)
+
+        for kind, path in paths.items():
+            assert path.name == assets[kind].filename
+            assert path.read_text(encoding="utf-8") == assets[kind].content
+
+    def test_shared_html_block(self):
+        """Test the once-per-page HTML block contains both assets."""
+        html = render_shared_assets_html(interactive=True)
+
+        assert html.startswith("<style data-segnomms-runtime=")
+        assert "<script data-segnomms-runtime=" in html
+
+
+class TestRuntimeAssetModes:
+    """Test rendering with the different runtime asset modes."""
+
+    @pytest.fixture
+    def qr(self):
+        """Create a test QR code."""
+        return segno.make("Runtime assets")
+
+    def _render(self, qr, **kwargs):
+        buffer = io.StringIO()
+        write(qr, buffer, scale=8, interactive=True, **kwargs)
+        return buffer.getvalue()
+
+    def test_inline_is_default(self, qr):
+        """Test runtime is embedded by default."""
+        svg = self._render(qr)
+
+        assert ".qr-module:hover" in svg
+        assert "qrModuleClick" in svg
+
+    def test_external_references_hashed_assets(self, qr):
+        """Test external mode references the exported files."""
+        svg = self._render(qr, runtime_assets="external", asset_base_url="/static/qr")
+        assets = build_runtime_assets(interactive=True)
+
+        assert f'@import url("/static/qr/{assets["css"].filename}")' in svg
+        assert f'href="/static/qr/{assets["js"].filename}"' in svg
+        assert ".qr-module:hover" not in svg
+        assert "qrModuleClick" not in svg
+
+    def test_shared_omits_runtime(self, qr):
+        """Test shared mode leaves the runtime to the page."""
+        svg = self._render(qr, runtime_assets="shared")
+
+        assert "<style" not in svg
+        assert "<script" not in svg
@@ -0,0 +1,190 @@
+"""Tests for per-phase tracing spans and exporters."""
+
+import io
+import json
+
+import pytest
+import segno
+
+from segnomms.config import RenderingConfig
+from segnomms.core.tracing import (
+    NOOP_SPAN,
+    InMemoryExporter,
+    JSONLExporter,
+    OTLPJSONExporter,
+    SpanExporter,
+    disable_tracing,
+    enable_tracing,
+    trace_span,
+)
+from segnomms.intents.models import IntentsConfig, PayloadConfig, StyleIntents
+from segnomms.intents.processor import IntentProcessor
+from segnomms.plugin.rendering import generate_interactive_svg
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemoryExporter()
+    enable_tracing(exporter)
+    yield exporter
+    disable_tracing()
+
+
+def _by_name(spans):
+    return {span.name: span for span in spans}
+
+
+class TestTracer:
+    def test_disabled_returns_noop_span(self):
+        span = trace_span("anything", key="value")
+        assert span is NOOP_SPAN
+        with span as entered:
+            entered.add("count")
+            entered.set_attribute("key", 1)
+        assert NOOP_SPAN.counters == {}
+
+    def test_nested_spans_share_trace(self, exporter):
+        with trace_span("root", kind="test") as root:
+            with trace_span("child") as child:
+                child.add("items", 2)
+                child.add("items")
+
+        spans = exporter.get_finished_spans()
+        assert [span.name for span in spans] == ["child", "root"]
+        assert child.parent_id == root.span_id
+        assert child.trace_id == root.trace_id
+        assert root.parent_id is None
+        assert child.counters == {"items": 3}
+        assert root.attributes == {"kind": "test"}
+        assert root.end_ns >= child.end_ns >= child.start_ns >= root.start_ns
+
+    def test_trace_exported_only_when_root_finishes(self, exporter):
+        with trace_span("root"):
+            with trace_span("child"):
+                pass
+            assert exporter.get_finished_spans() == []
+        assert len(exporter.get_finished_spans()) == 2
+
+    def test_error_recorded(self, exporter):
+        with pytest.raises(ValueError):
+            with trace_span("failing"):
+                raise ValueError("boom")
+        (span,) = exporter.get_finished_spans()
+        assert span.attributes["error"] == "ValueError"
+
+
+class TestRenderingSpans:
+    def test_render_phases(self, exporter):
+        config = RenderingConfig.from_kwargs(merge="soft", min_island_modules=2, animation_pulse=True)
+        svg = generate_interactive_svg(segno.make("Tracing test", error="h"), config)
+
+        spans = _by_name(exporter.get_finished_spans())
+        for name in (
+            "generate_interactive_svg",
+            "degradation",
+            "render",
+            "render.centerpiece",
+            "render.structure",
+            "css",
+            "render.islands",
+            "render.clustering",
+            "render.modules",
+            "render.animation",
+            "render.pattern_groups",
+            "render.serialize",
+            "render.format",
+        ):
+            assert name in spans, name
+
+        root = spans["generate_interactive_svg"]
+        assert spans["render"].parent_id == root.span_id
+        assert spans["degradation"].parent_id == root.span_id
+        assert spans["css"].parent_id == spans["render.structure"].span_id
+        assert spans["render.clustering"].counters["clusters"] >= 1
+        modules = spans["render.modules"].counters
+        assert 0 < modules["elements_emitted"] <= svg.count('class="qr-module')
+        assert modules["modules_processed"] >= modules["elements_emitted"]
+        assert spans["render"].counters["bytes"] == len(svg)
+
+    def test_intent_processing_spans(self, exporter):
+        processor = IntentProcessor()
+        intents = IntentsConfig(style=StyleIntents(module_shape="circle"))
+        processor.process_intents(PayloadConfig(text="one"), intents)
+        processor.process_intents(PayloadConfig(text="two"), intents)
+
+        spans = exporter.get_finished_spans()
+        roots = [span for span in spans if span.name == "process_intents"]
+        translations = [span for span in spans if span.name == "translate"]
+        assert len(roots) == 2
+        assert [span.attributes["cache_hit"] for span in translations] == [False, True]
+        for name in ("encode", "generate_interactive_svg"):
+            children = [span for span in spans if span.name == name]
+            assert {span.parent_id for span in children} == {root.span_id for root in roots}
+
+
+class TestExporters:
+    def test_jsonl_exporter(self):
+        buffer = io.StringIO()
+        enable_tracing(JSONLExporter(buffer))
+        try:
+            with trace_span("root"):
+                with trace_span("child") as child:
+                    child.add("n", 4)
+        finally:
+            disable_tracing()
+
+        records = [json.loads(line) for line in buffer.getvalue().splitlines()]
+        assert [record["name"] for record in records] == ["child", "root"]
+        assert records[0]["counters"] == {"n": 4}
+        assert records[0]["parent_id"] == records[1]["span_id"]
+
+    def test_otlp_exporter(self, tmp_path):
+        path = tmp_path / "traces.jsonl"
+        enable_tracing(OTLPJSONExporter(path))
+        try:
+            with trace_span("root", flag=True, ratio=0.5):
+                with trace_span("child") as child:
+                    child.add("elements", 7)
+        finally:
+            disable_tracing()
+
+        (request,) = [json.loads(line) for line in path.read_text().splitlines()]
+        resource_spans = request["resourceSpans"][0]
+        assert resource_spans["resource"]["attributes"][0]["value"] == {"stringValue": "segnomms"}
+        child_span, root_span = resource_spans["scopeSpans"][0]["spans"]
+        assert len(root_span["traceId"]) == 32
+        assert len(root_span["spanId"]) == 16
+        assert child_span["parentSpanId"] == root_span["spanId"]
+        assert "parentSpanId" not in root_span
+        assert int(root_span["endTimeUnixNano"]) >= int(root_span["startTimeUnixNano"])
+        assert {"key": "flag", "value": {"boolValue": True}} in root_span["attributes"]
+        assert {"key": "count.elements", "value": {"intValue": "7"}} in child_span["attributes"]
+
+    def test_failing_exporter_does_not_fail_rendering(self, exporter, caplog):
+        """Test a broken sink is logged and the remaining exporters still run."""
+
+        class FailingExporter(SpanExporter):
+            def export(self, spans):
+                raise RuntimeError("collector down")
+
+        failing = FailingExporter()
+        disable_tracing()
+        enable_tracing(failing, exporter)
+        try:
+            with caplog.at_level("ERROR", logger="segnomms.core.tracing"):
+                svg = generate_interactive_svg(segno.make("Telemetry"), RenderingConfig())
+        finally:
+            disable_tracing()
+
+        assert "<svg" in svg
+        assert exporter.get_finished_spans()
+        assert "collector down" in caplog.text
+
+    def test_exporter_requires_export(self):
+        """Test incomplete exporters fail at instantiation."""
+
+        class Incomplete(SpanExporter):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()